@@ -0,0 +1,28 @@
+# Precompiled parser tables, generated by 'python -m tables'. Don't edit!
+TABLES_VERSION = 1
+GRAMMARS = {
+    'boolean_parser': (
+        '24bdeaa2b395e7df0b4e39f44ce523361163437f9af0ce5d94c2e870e267bc1e',
+        '4b2efe30cd399f3e0d5e217f69eceb6f911c49eec8b622ae9442b8cc0fffb100',
+    ),
+    'dl_grammar': (
+        '1cdb69e65a2a7854e18585ec6fd7157984e1bfe88fbe7c7aa2b1bd8e9b2bb697',
+        '6c597c0b42f4504bab7dcf7fd21fb7e49b2afa4e5d671260e86d15104465f070',
+    ),
+    'formulas_parser': (
+        'dfad4d8d28f924de75daa33dd01d5eb87ca99da54355233e6f9efc727f6b1fb9',
+        'ee922643e531c823eb212a99cb2a05ea66f31525ae40866a0d94edeb53ef70ba',
+    ),
+    'hybrid_parser': (
+        '635adedd57b4a83140a0ff55f5994878b437d6adf98ceee449e9b954a590698a',
+        '24505180109e424e89b2bd003969f2621dd5d80ddb5488d4b266f942f8325023',
+    ),
+    'parser': (
+        'b22c03d045b81196ee9bcb59b4808337b61ab351385b2ff1c99fa31bd9d30885',
+        'c7b705ad8a9506ad2ace46584113559c04d4cb024e9051952e1a8606b05a0cdb',
+    ),
+    'terms_parser': (
+        '94f110fda420c03a9808c708710a888e17256e99c9838810390c551645ebef73',
+        '0552e54c26a6437ab4c57e1d9282109ec356a9230c2d66bf95d26dba4921ede2',
+    ),
+}
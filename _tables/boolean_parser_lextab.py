@@ -0,0 +1,10 @@
+# boolean_parser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'FALSE', 'NOT', 'OR', 'TRUE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_FALSE>False)|(?P<t_TRUE>True)|(?P<t_OR>[|])|(?P<t_AND>&)|(?P<t_NOT>!)', [None, (None, 'FALSE'), (None, 'TRUE'), (None, 'OR'), (None, 'AND'), (None, 'NOT')])]}
+_lexstateignore = {'INITIAL': ' '}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,37 @@
+
+# boolean_parser_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'rightORrightANDrightNOTAND FALSE NOT OR TRUE\n    string :\n    string : expression\n    \n    expression : NOT expression\n               | expression OR expression\n               | expression AND expression\n    \n    expression : TRUE\n               | FALSE\n    '
+    
+_lr_action_items = {'$end':([0,1,2,4,5,8,9,10,],[-1,0,-2,-6,-7,-3,-4,-5,]),'NOT':([0,3,6,7,],[3,3,3,3,]),'TRUE':([0,3,6,7,],[4,4,4,4,]),'FALSE':([0,3,6,7,],[5,5,5,5,]),'OR':([2,4,5,8,9,10,],[6,-6,-7,-3,6,-5,]),'AND':([2,4,5,8,9,10,],[7,-6,-7,-3,7,7,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'string':([0,],[1,]),'expression':([0,3,6,7,],[2,8,9,10,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> string","S'",1,None,None,None),
+  ('string -> <empty>','string',0,'p_string','boolean_parser.py',35),
+  ('string -> expression','string',1,'p_string','boolean_parser.py',36),
+  ('expression -> NOT expression','expression',2,'p_expression','boolean_parser.py',48),
+  ('expression -> expression OR expression','expression',3,'p_expression','boolean_parser.py',49),
+  ('expression -> expression AND expression','expression',3,'p_expression','boolean_parser.py',50),
+  ('expression -> TRUE','expression',1,'p_value','boolean_parser.py',58),
+  ('expression -> FALSE','expression',1,'p_value','boolean_parser.py',59),
+]
@@ -0,0 +1,92 @@
+
+# dl_grammar_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'startrightCOMMArightCHOICErightSEMICOLONrightREPETleftBIMPLYrightLIMPLYleftRIMPLYrightORrightANDrightNOTrightFORALLEXISTSLBOXRBOXleftEQNEQGREATERGEQLESSLEQleftPLUSMINUSrightUMINUSleftSTARDIVIDErightPOWERAND BIMPLY CHOICE COMMA DEFINE DIVIDE ELSE EQ EXISTS FALSE FORALL GEQ GREATER ID IF LBOX LCURL LEQ LESS LIMPLY LPAREN MINUS NEQ NOT NUM OR PLUS POWER PRIME RBOX RCURL RIMPLY RPAREN SEMICOLON STAR START_FORMULA START_TERM TEST TRUE\n    d_programs : d_program\n               | d_program COMMA d_program\n    \n    d_program : NUM\n              | ID PRIME EQ terms\n    \n    programs : program\n    \n    program : TEST formulas SEMICOLON\n            | LCURL d_programs AND formulas RCURL\n            | LCURL program RCURL STAR %prec REPET\n            | program CHOICE program\n    \n    program : program program\n            | LCURL program RCURL\n    \n    program : IF LPAREN formulas RPAREN LCURL program RCURL ELSE LCURL program RCURL\n            | IF LPAREN formulas RPAREN LCURL program RCURL\n    \n    program : ID SEMICOLON\n            | ID DEFINE term SEMICOLON\n            | ID PRIME DEFINE term SEMICOLON\n    \n    formulas : formula\n    \n    formula : arithmetic_formula\n            | LPAREN formula RPAREN\n    \n    arithmetic_formula : terms EQ terms\n                       | terms NEQ terms\n                       | terms GEQ terms\n                       | terms GREATER terms\n                       | terms LEQ terms\n                       | term LESS terms\n                       | function LESS terms\n    \n    formula : formula OR formula\n            | formula AND formula\n            | NOT formula\n    \n    formula : FORALL terms formula\n            | EXISTS terms formula\n    \n    formula : formula BIMPLY formula\n            | formula RIMPLY formula\n            | formula LIMPLY formula\n    \n    start : programs\n          | START_TERM terms\n          | START_FORMULA formulas\n    \n    formula : LPAREN formula RPAREN PRIME\n    \n    formula : LBOX programs RBOX formula\n            | LESS programs GREATER formula\n    \n    terms :\n          | term\n          | function\n    \n    function : ID LPAREN RPAREN\n             | ID LPAREN term RPAREN\n    \n    term : term PLUS term\n         | term MINUS term\n         | term STAR term\n         | term DIVIDE term\n         | term POWER term\n    \n    term : MINUS term %prec UMINUS\n    \n    term : LPAREN term RPAREN\n         | LPAREN term COMMA term RPAREN\n    \n    term : term PRIME\n         | LPAREN term RPAREN PRIME\n    \n    term : NUM\n    \n    term : ID\n    \n    formula : TRUE\n            | FALSE\n    \n    program : error SEMICOLON\n            | LCURL error RCURL\n    \n    formula : LPAREN error RPAREN\n    '
+    
+_lr_action_items = {'START_TERM':([0,],[3,]),'START_FORMULA':([0,],[4,]),'TEST':([0,5,7,26,27,32,33,36,42,45,76,77,79,80,114,119,127,130,131,133,134,136,137,138,],[6,6,6,6,6,6,6,6,-14,-60,-9,-6,-11,-61,-8,-15,-7,6,-16,6,-13,6,6,-12,]),'LCURL':([0,5,7,26,27,32,33,36,42,45,76,77,79,80,114,118,119,127,130,131,133,134,135,136,137,138,],[7,7,7,7,7,7,7,7,-14,-60,-9,-6,-11,-61,-8,130,-15,-7,7,-16,7,-13,136,7,7,-12,]),'IF':([0,5,7,26,27,32,33,36,42,45,76,77,79,80,114,119,127,130,131,133,134,136,137,138,],[8,8,8,8,8,8,8,8,-14,-60,-9,-6,-11,-61,-8,-15,-7,8,-16,8,-13,8,8,-12,]),'ID':([0,3,4,5,6,7,12,13,14,15,16,17,21,22,23,25,26,27,32,33,36,41,42,43,45,46,47,48,49,50,51,52,53,55,56,57,58,59,60,65,66,67,68,69,70,71,74,75,76,77,78,79,80,81,85,86,87,88,89,90,91,92,93,109,110,114,117,119,121,123,127,130,131,132,133,134,136,137,138,],[9,17,17,9,17,39,-42,-43,53,53,-56,-57,17,17,17,17,9,9,9,9,9,17,-14,53,-60,53,53,53,53,53,-54,-51,-57,53,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-9,-6,17,-11,-61,116,53,-46,-47,-48,-49,-50,-52,53,-44,17,17,-8,17,-15,-55,-45,-7,9,-16,-53,9,-13,9,9,-12,]),'error':([0,5,7,21,26,27,32,33,36,42,45,76,77,79,80,114,119,127,130,131,133,134,136,137,138,],[10,10,37,62,10,10,10,10,10,-14,-60,-9,-6,-11,-61,-8,-15,-7,10,-16,10,-13,10,10,-12,]),'$end':([1,2,3,5,11,12,13,16,17,18,19,20,28,29,32,42,45,51,52,53,64,66,67,68,69,70,74,75,76,77,79,80,86,87,88,89,90,91,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,114,119,121,123,124,125,126,127,131,132,134,138,],[0,-35,-41,-5,-36,-42,-43,-56,-57,-37,-17,-18,-58,-59,-10,-14,-60,-54,-51,-57,-29,-41,-41,-41,-41,-41,-41,-41,-9,-6,-11,-61,-46,-47,-48,-49,-50,-52,-44,-27,-28,-32,-33,-34,-19,-62,-30,-20,-21,-22,-23,-24,-31,-25,-26,-8,-15,-55,-45,-38,-39,-40,-7,-16,-53,-13,-12,]),'MINUS':([3,4,6,12,13,14,15,16,17,21,22,23,25,30,41,43,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,63,65,66,67,68,69,70,71,74,75,78,84,85,86,87,88,89,90,91,92,93,94,109,110,117,120,121,122,123,132,],[14,14,14,47,-43,14,14,-56,-57,14,14,14,14,47,14,14,14,14,14,14,14,-54,-51,-57,47,14,14,14,14,14,14,47,14,14,14,14,14,14,14,14,14,14,47,14,-46,-47,-48,-49,-50,-52,14,-44,47,14,14,14,47,-55,47,-45,-53,]),'LPAREN':([3,4,6,8,12,13,14,15,16,17,21,22,23,25,41,43,46,47,48,49,50,51,52,53,55,56,57,58,59,60,65,66,67,68,69,70,71,74,75,78,85,86,87,88,89,90,91,92,93,109,110,117,121,123,132,],[15,21,21,41,-42,-43,15,15,-56,55,21,21,15,15,21,15,15,15,15,15,15,-54,-51,-57,15,21,21,21,21,21,21,15,15,15,15,15,21,15,15,21,15,-46,-47,-48,-49,-50,-52,15,-44,21,21,15,-55,-45,-53,]),'NUM':([3,4,6,7,12,13,14,15,16,17,21,22,23,25,41,43,46,47,48,49,50,51,52,53,55,56,57,58,59,60,65,66,67,68,69,70,71,74,75,78,81,85,86,87,88,89,90,91,92,93,109,110,117,121,123,132,],[16,16,16,40,-42,-43,16,16,-56,-57,16,16,16,16,16,16,16,16,16,16,16,-54,-51,-57,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,40,16,-46,-47,-48,-49,-50,-52,16,-44,16,16,16,-55,-45,-53,]),'NOT':([4,6,12,13,16,17,21,22,23,25,41,51,52,53,56,57,58,59,60,65,71,78,86,87,88,89,90,91,93,109,110,121,123,132,],[22,22,-42,-43,-56,-57,22,22,-41,-41,22,-54,-51,-57,22,22,22,22,22,22,22,22,-46,-47,-48,-49,-50,-52,-44,22,22,-55,-45,-53,]),'FORALL':([4,6,12,13,16,17,21,22,23,25,41,51,52,53,56,57,58,59,60,65,71,78,86,87,88,89,90,91,93,109,110,121,123,132,],[23,23,-42,-43,-56,-57,23,23,-41,-41,23,-54,-51,-57,23,23,23,23,23,23,23,23,-46,-47,-48,-49,-50,-52,-44,23,23,-55,-45,-53,]),'EXISTS':([4,6,12,13,16,17,21,22,23,25,41,51,52,53,56,57,58,59,60,65,71,78,86,87,88,89,90,91,93,109,110,121,123,132,],[25,25,-42,-43,-56,-57,25,25,-41,-41,25,-54,-51,-57,25,25,25,25,25,25,25,25,-46,-47,-48,-49,-50,-52,-44,25,25,-55,-45,-53,]),'LBOX':([4,6,12,13,16,17,21,22,23,25,41,51,52,53,56,57,58,59,60,65,71,78,86,87,88,89,90,91,93,109,110,121,123,132,],[26,26,-42,-43,-56,-57,26,26,-41,-41,26,-54,-51,-57,26,26,26,26,26,26,26,26,-46,-47,-48,-49,-50,-52,-44,26,26,-55,-45,-53,]),'LESS':([4,6,12,13,16,17,21,22,23,25,30,31,41,51,52,53,56,57,58,59,60,63,65,71,78,86,87,88,89,90,91,93,109,110,121,123,132,],[27,27,-42,-43,-56,-57,27,27,-41,-41,74,75,27,-54,-51,-57,27,27,27,27,27,74,27,27,27,-46,-47,-48,-49,-50,-52,-44,27,27,-55,-45,-53,]),'TRUE':([4,6,12,13,16,17,21,22,23,25,41,51,52,53,56,57,58,59,60,65,71,78,86,87,88,89,90,91,93,109,110,121,123,132,],[28,28,-42,-43,-56,-57,28,28,-41,-41,28,-54,-51,-57,28,28,28,28,28,28,28,28,-46,-47,-48,-49,-50,-52,-44,28,28,-55,-45,-53,]),'FALSE':([4,6,12,13,16,17,21,22,23,25,41,51,52,53,56,57,58,59,60,65,71,78,86,87,88,89,90,91,93,109,110,121,123,132,],[29,29,-42,-43,-56,-57,29,29,-41,-41,29,-54,-51,-57,29,29,29,29,29,29,29,29,-46,-47,-48,-49,-50,-52,-44,29,29,-55,-45,-53,]),'EQ':([4,6,12,13,16,17,21,22,23,24,25,30,31,41,51,52,53,56,57,58,59,60,63,65,71,78,82,86,87,88,89,90,91,93,109,110,121,123,128,132,],[-41,-41,-42,-43,-56,-57,-41,-41,-41,66,-41,-42,-43,-41,-54,-51,-57,-41,-41,-41,-41,-41,-42,-41,-41,-41,117,-46,-47,-48,-49,-50,-52,-44,-41,-41,-55,-45,117,-53,]),'NEQ':([4,6,12,13,16,17,21,22,23,24,25,30,31,41,51,52,53,56,57,58,59,60,63,65,71,78,86,87,88,89,90,91,93,109,110,121,123,132,],[-41,-41,-42,-43,-56,-57,-41,-41,-41,67,-41,-42,-43,-41,-54,-51,-57,-41,-41,-41,-41,-41,-42,-41,-41,-41,-46,-47,-48,-49,-50,-52,-44,-41,-41,-55,-45,-53,]),'GEQ':([4,6,12,13,16,17,21,22,23,24,25,30,31,41,51,52,53,56,57,58,59,60,63,65,71,78,86,87,88,89,90,91,93,109,110,121,123,132,],[-41,-41,-42,-43,-56,-57,-41,-41,-41,68,-41,-42,-43,-41,-54,-51,-57,-41,-41,-41,-41,-41,-42,-41,-41,-41,-46,-47,-48,-49,-50,-52,-44,-41,-41,-55,-45,-53,]),'GREATER':([4,5,6,12,13,16,17,21,22,23,24,25,30,31,32,41,42,45,51,52,53,56,57,58,59,60,63,65,71,73,76,77,78,79,80,86,87,88,89,90,91,93,109,110,114,119,121,123,127,131,132,134,138,],[-41,-5,-41,-42,-43,-56,-57,-41,-41,-41,69,-41,-42,-43,-10,-41,-14,-60,-54,-51,-57,-41,-41,-41,-41,-41,-42,-41,-41,110,-9,-6,-41,-11,-61,-46,-47,-48,-49,-50,-52,-44,-41,-41,-8,-15,-55,-45,-7,-16,-53,-13,-12,]),'LEQ':([4,6,12,13,16,17,21,22,23,24,25,30,31,41,51,52,53,56,57,58,59,60,63,65,71,78,86,87,88,89,90,91,93,109,110,121,123,132,],[-41,-41,-42,-43,-56,-57,-41,-41,-41,70,-41,-42,-43,-41,-54,-51,-57,-41,-41,-41,-41,-41,-42,-41,-41,-41,-46,-47,-48,-49,-50,-52,-44,-41,-41,-55,-45,-53,]),'RBOX':([5,32,42,45,72,76,77,79,80,114,119,127,131,134,138,],[-5,-10,-14,-60,109,-9,-6,-11,-61,-8,-15,-7,-16,-13,-12,]),'CHOICE':([5,32,36,42,45,76,77,79,80,114,119,127,131,133,134,137,138,],[33,33,33,-14,-60,33,-6,-11,-61,-8,-15,-7,-16,33,-13,33,-12,]),'SEMICOLON':([9,10,12,13,16,17,19,20,28,29,34,37,39,51,52,53,64,66,67,68,69,70,74,75,84,86,87,88,89,90,91,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,120,121,123,124,125,126,132,],[42,45,-42,-43,-56,-57,-17,-18,-58,-59,77,45,42,-54,-51,-57,-29,-41,-41,-41,-41,-41,-41,-41,119,-46,-47,-48,-49,-50,-52,-44,-27,-28,-32,-33,-34,-19,-62,-30,-20,-21,-22,-23,-24,-31,-25,-26,131,-55,-45,-38,-39,-40,-53,]),'DEFINE':([9,39,44,82,],[43,43,85,85,]),'PRIME':([9,12,16,17,30,39,51,52,53,54,63,84,86,87,88,89,90,91,94,100,116,120,121,122,132,],[44,51,-56,-57,51,82,-54,-51,-57,51,51,51,-46,-47,-48,-49,-50,121,51,124,128,51,-55,51,-53,]),'OR':([12,13,16,17,19,20,28,29,51,52,53,61,64,66,67,68,69,70,74,75,86,87,88,89,90,91,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,121,123,124,125,126,132,],[-42,-43,-56,-57,56,-18,-58,-59,-54,-51,-57,56,-29,-41,-41,-41,-41,-41,-41,-41,-46,-47,-48,-49,-50,-52,-44,56,-28,56,56,56,-19,-62,-30,-20,-21,-22,-23,-24,-31,-25,-26,-55,-45,-38,-39,-40,-53,]),'AND':([12,13,16,17,19,20,28,29,35,38,40,51,52,53,61,64,66,67,68,69,70,74,75,86,87,88,89,90,91,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,115,117,121,123,124,125,126,129,132,],[-42,-43,-56,-57,57,-18,-58,-59,78,-1,-3,-54,-51,-57,57,-29,-41,-41,-41,-41,-41,-41,-41,-46,-47,-48,-49,-50,-52,-44,57,57,57,57,57,-19,-62,-30,-20,-21,-22,-23,-24,-31,-25,-26,-2,-41,-55,-45,-38,-39,-40,-4,-53,]),'BIMPLY':([12,13,16,17,19,20,28,29,51,52,53,61,64,66,67,68,69,70,74,75,86,87,88,89,90,91,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,121,123,124,125,126,132,],[-42,-43,-56,-57,58,-18,-58,-59,-54,-51,-57,58,-29,-41,-41,-41,-41,-41,-41,-41,-46,-47,-48,-49,-50,-52,-44,-27,-28,-32,-33,-34,-19,-62,-30,-20,-21,-22,-23,-24,-31,-25,-26,-55,-45,-38,-39,-40,-53,]),'RIMPLY':([12,13,16,17,19,20,28,29,51,52,53,61,64,66,67,68,69,70,74,75,86,87,88,89,90,91,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,121,123,124,125,126,132,],[-42,-43,-56,-57,59,-18,-58,-59,-54,-51,-57,59,-29,-41,-41,-41,-41,-41,-41,-41,-46,-47,-48,-49,-50,-52,-44,-27,-28,59,-33,59,-19,-62,-30,-20,-21,-22,-23,-24,-31,-25,-26,-55,-45,-38,-39,-40,-53,]),'LIMPLY':([12,13,16,17,19,20,28,29,51,52,53,61,64,66,67,68,69,70,74,75,86,87,88,89,90,91,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,121,123,124,125,126,132,],[-42,-43,-56,-57,60,-18,-58,-59,-54,-51,-57,60,-29,-41,-41,-41,-41,-41,-41,-41,-46,-47,-48,-49,-50,-52,-44,-27,-28,60,-33,60,-19,-62,-30,-20,-21,-22,-23,-24,-31,-25,-26,-55,-45,-38,-39,-40,-53,]),'RPAREN':([12,13,16,17,19,20,28,29,51,52,53,54,55,61,62,63,64,66,67,68,69,70,74,75,83,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,121,122,123,124,125,126,132,],[-42,-43,-56,-57,-17,-18,-58,-59,-54,-51,-57,91,93,100,101,91,-29,-41,-41,-41,-41,-41,-41,-41,118,-46,-47,-48,-49,-50,-52,-44,123,-27,-28,-32,-33,-34,-19,-62,-30,-20,-21,-22,-23,-24,-31,-25,-26,-55,132,-45,-38,-39,-40,-53,]),'RCURL':([12,13,16,17,19,20,28,29,32,36,37,42,45,51,52,53,64,66,67,68,69,70,74,75,76,77,79,80,86,87,88,89,90,91,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,119,121,123,124,125,126,127,131,132,133,134,137,138,],[-42,-43,-56,-57,-17,-18,-58,-59,-10,79,80,-14,-60,-54,-51,-57,-29,-41,-41,-41,-41,-41,-41,-41,-9,-6,-11,-61,-46,-47,-48,-49,-50,-52,-44,-27,-28,-32,-33,-34,-19,-62,-30,-20,-21,-22,-23,-24,-31,-25,-26,127,-8,-15,-55,-45,-38,-39,-40,-7,-16,-53,134,-13,138,-12,]),'COMMA':([12,13,16,17,38,40,51,52,53,54,63,86,87,88,89,90,91,93,117,121,123,129,132,],[-42,-43,-56,-57,81,-3,-54,-51,-57,92,92,-46,-47,-48,-49,-50,-52,-44,-41,-55,-45,-4,-53,]),'PLUS':([12,16,17,30,51,52,53,54,63,84,86,87,88,89,90,91,94,120,121,122,132,],[46,-56,-57,46,-54,-51,-57,46,46,46,-46,-47,-48,-49,-50,-52,46,46,-55,46,-53,]),'STAR':([12,16,17,30,51,52,53,54,63,79,84,86,87,88,89,90,91,94,120,121,122,132,],[48,-56,-57,48,-54,48,-57,48,48,114,48,48,48,-48,-49,-50,-52,48,48,-55,48,-53,]),'DIVIDE':([12,16,17,30,51,52,53,54,63,84,86,87,88,89,90,91,94,120,121,122,132,],[49,-56,-57,49,-54,49,-57,49,49,49,49,49,-48,-49,-50,-52,49,49,-55,49,-53,]),'POWER':([12,16,17,30,51,52,53,54,63,84,86,87,88,89,90,91,94,120,121,122,132,],[50,-56,-57,50,-54,50,-57,50,50,50,50,50,50,50,50,-52,50,50,-55,50,-53,]),'ELSE':([134,],[135,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'programs':([0,26,27,],[2,72,73,]),'program':([0,5,7,26,27,32,33,36,76,130,133,136,137,],[5,32,36,5,5,32,76,32,32,133,32,137,32,]),'terms':([3,4,6,21,22,23,25,41,56,57,58,59,60,65,66,67,68,69,70,71,74,75,78,109,110,117,],[11,24,24,24,24,65,71,24,24,24,24,24,24,24,103,104,105,106,107,24,111,112,24,24,24,129,]),'term':([3,4,6,14,15,21,22,23,25,41,43,46,47,48,49,50,55,56,57,58,59,60,65,66,67,68,69,70,71,74,75,78,85,92,109,110,117,],[12,30,30,52,54,63,30,12,12,30,84,86,87,88,89,90,94,30,30,30,30,30,30,12,12,12,12,12,30,12,12,30,120,122,30,30,12,]),'function':([3,4,6,21,22,23,25,41,56,57,58,59,60,65,66,67,68,69,70,71,74,75,78,109,110,117,],[13,31,31,31,31,13,13,31,31,31,31,31,31,31,13,13,13,13,13,31,13,13,31,31,31,13,]),'formulas':([4,6,41,78,],[18,34,83,113,]),'formula':([4,6,21,22,41,56,57,58,59,60,65,71,78,109,110,],[19,19,61,64,19,95,96,97,98,99,102,108,19,125,126,]),'arithmetic_formula':([4,6,21,22,41,56,57,58,59,60,65,71,78,109,110,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'d_programs':([7,],[35,]),'d_program':([7,81,],[38,115,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('d_programs -> d_program','d_programs',1,'p_differential_programs','hybrid_rules.py',14),
+  ('d_programs -> d_program COMMA d_program','d_programs',3,'p_differential_programs','hybrid_rules.py',15),
+  ('d_program -> NUM','d_program',1,'p_differential_program','hybrid_rules.py',22),
+  ('d_program -> ID PRIME EQ terms','d_program',4,'p_differential_program','hybrid_rules.py',23),
+  ('programs -> program','programs',1,'p_programs','hybrid_rules.py',30),
+  ('program -> TEST formulas SEMICOLON','program',3,'p_program','hybrid_rules.py',37),
+  ('program -> LCURL d_programs AND formulas RCURL','program',5,'p_program','hybrid_rules.py',38),
+  ('program -> LCURL program RCURL STAR','program',4,'p_program','hybrid_rules.py',39),
+  ('program -> program CHOICE program','program',3,'p_program','hybrid_rules.py',40),
+  ('program -> program program','program',2,'p_program_form','hybrid_rules.py',49),
+  ('program -> LCURL program RCURL','program',3,'p_program_form','hybrid_rules.py',50),
+  ('program -> IF LPAREN formulas RPAREN LCURL program RCURL ELSE LCURL program RCURL','program',11,'p_program_conditional','hybrid_rules.py',57),
+  ('program -> IF LPAREN formulas RPAREN LCURL program RCURL','program',7,'p_program_conditional','hybrid_rules.py',58),
+  ('program -> ID SEMICOLON','program',2,'p_program_assignment','hybrid_rules.py',69),
+  ('program -> ID DEFINE term SEMICOLON','program',4,'p_program_assignment','hybrid_rules.py',70),
+  ('program -> ID PRIME DEFINE term SEMICOLON','program',5,'p_program_assignment','hybrid_rules.py',71),
+  ('formulas -> formula','formulas',1,'p_formulas','hybrid_rules.py',80),
+  ('formula -> arithmetic_formula','formula',1,'p_formula','hybrid_rules.py',86),
+  ('formula -> LPAREN formula RPAREN','formula',3,'p_formula','hybrid_rules.py',87),
+  ('arithmetic_formula -> terms EQ terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',97),
+  ('arithmetic_formula -> terms NEQ terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',98),
+  ('arithmetic_formula -> terms GEQ terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',99),
+  ('arithmetic_formula -> terms GREATER terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',100),
+  ('arithmetic_formula -> terms LEQ terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',101),
+  ('arithmetic_formula -> term LESS terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',102),
+  ('arithmetic_formula -> function LESS terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',103),
+  ('formula -> formula OR formula','formula',3,'p_formula_logic','hybrid_rules.py',109),
+  ('formula -> formula AND formula','formula',3,'p_formula_logic','hybrid_rules.py',110),
+  ('formula -> NOT formula','formula',2,'p_formula_logic','hybrid_rules.py',111),
+  ('formula -> FORALL terms formula','formula',3,'p_formula_quantifier','hybrid_rules.py',118),
+  ('formula -> EXISTS terms formula','formula',3,'p_formula_quantifier','hybrid_rules.py',119),
+  ('formula -> formula BIMPLY formula','formula',3,'p_formula_implication','hybrid_rules.py',125),
+  ('formula -> formula RIMPLY formula','formula',3,'p_formula_implication','hybrid_rules.py',126),
+  ('formula -> formula LIMPLY formula','formula',3,'p_formula_implication','hybrid_rules.py',127),
+  ('start -> programs','start',1,'p_start','dl_grammar.py',129),
+  ('start -> START_TERM terms','start',2,'p_start','dl_grammar.py',130),
+  ('start -> START_FORMULA formulas','start',2,'p_start','dl_grammar.py',131),
+  ('formula -> LPAREN formula RPAREN PRIME','formula',4,'p_formula_differential','hybrid_rules.py',135),
+  ('formula -> LBOX programs RBOX formula','formula',4,'p_formula_modality','dl_grammar.py',139),
+  ('formula -> LESS programs GREATER formula','formula',4,'p_formula_modality','dl_grammar.py',140),
+  ('terms -> <empty>','terms',0,'p_terms','hybrid_rules.py',141),
+  ('terms -> term','terms',1,'p_terms','hybrid_rules.py',142),
+  ('terms -> function','terms',1,'p_terms','hybrid_rules.py',143),
+  ('function -> ID LPAREN RPAREN','function',3,'p_function','hybrid_rules.py',154),
+  ('function -> ID LPAREN term RPAREN','function',4,'p_function','hybrid_rules.py',155),
+  ('term -> term PLUS term','term',3,'p_term','hybrid_rules.py',162),
+  ('term -> term MINUS term','term',3,'p_term','hybrid_rules.py',163),
+  ('term -> term STAR term','term',3,'p_term','hybrid_rules.py',164),
+  ('term -> term DIVIDE term','term',3,'p_term','hybrid_rules.py',165),
+  ('term -> term POWER term','term',3,'p_term','hybrid_rules.py',166),
+  ('term -> MINUS term','term',2,'p_term_uminus','hybrid_rules.py',177),
+  ('term -> LPAREN term RPAREN','term',3,'p_term_group','hybrid_rules.py',183),
+  ('term -> LPAREN term COMMA term RPAREN','term',5,'p_term_group','hybrid_rules.py',184),
+  ('term -> term PRIME','term',2,'p_differential','hybrid_rules.py',191),
+  ('term -> LPAREN term RPAREN PRIME','term',4,'p_differential','hybrid_rules.py',192),
+  ('term -> NUM','term',1,'p_term_numeric_value','hybrid_rules.py',199),
+  ('term -> ID','term',1,'p_term_value','hybrid_rules.py',205),
+  ('formula -> TRUE','formula',1,'p_formula_value','hybrid_rules.py',211),
+  ('formula -> FALSE','formula',1,'p_formula_value','hybrid_rules.py',212),
+  ('program -> error SEMICOLON','program',2,'p_program_error','hybrid_rules.py',221),
+  ('program -> LCURL error RCURL','program',3,'p_program_error','hybrid_rules.py',222),
+  ('formula -> LPAREN error RPAREN','formula',3,'p_formula_error','hybrid_rules.py',229),
+]
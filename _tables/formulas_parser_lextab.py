@@ -0,0 +1,10 @@
+# formulas_parser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'BIMPLY', 'COMMA', 'DIVIDE', 'EQ', 'EXISTS', 'FALSE', 'FORALL', 'GEQ', 'GREATER', 'ID', 'LBOX', 'LDIA', 'LEQ', 'LESS', 'LIMPLY', 'LPAREN', 'MINUS', 'MULTIPLY', 'NEQ', 'NOT', 'NUM', 'OR', 'PLUS', 'POWER', 'PRIME', 'RBOX', 'RDIA', 'RIMPLY', 'RPAREN', 'TRUE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_newline>\\n+)|(?P<t_ID>[a-zA-Z][a-zA-Z0-9]*\\_?\\_?[0-9]*)|(?P<t_EXISTS>\\\\exists)|(?P<t_FORALL>\\\\forall)|(?P<t_FALSE>False)|(?P<t_GEQ>\\>\\=)|(?P<t_LEQ>\\<\\=)|(?P<t_TRUE>True)|(?P<t_BIMPLY><->)|(?P<t_NEQ>!\\=)|(?P<t_NUM>\\d+)|(?P<t_OR>[|])|(?P<t_EQ>\\=)|(?P<t_GREATER>\\>)|(?P<t_LBOX>\\[)|(?P<t_LDIA>\\<)|(?P<t_LESS>\\>)|(?P<t_LIMPLY>->)|(?P<t_LPAREN>\\()|(?P<t_MULTIPLY>\\*)|(?P<t_PLUS>\\+)|(?P<t_POWER>\\^)|(?P<t_PRIME>\\')|(?P<t_RBOX>\\])|(?P<t_RDIA>\\>)|(?P<t_RIMPLY><-)|(?P<t_RPAREN>\\))|(?P<t_AND>&)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_MINUS>-)|(?P<t_NOT>!)", [None, ('t_newline', 'newline'), (None, 'ID'), (None, 'EXISTS'), (None, 'FORALL'), (None, 'FALSE'), (None, 'GEQ'), (None, 'LEQ'), (None, 'TRUE'), (None, 'BIMPLY'), (None, 'NEQ'), (None, 'NUM'), (None, 'OR'), (None, 'EQ'), (None, 'GREATER'), (None, 'LBOX'), (None, 'LDIA'), (None, 'LESS'), (None, 'LIMPLY'), (None, 'LPAREN'), (None, 'MULTIPLY'), (None, 'PLUS'), (None, 'POWER'), (None, 'PRIME'), (None, 'RBOX'), (None, 'RDIA'), (None, 'RIMPLY'), (None, 'RPAREN'), (None, 'AND'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'MINUS'), (None, 'NOT')])]}
+_lexstateignore = {'INITIAL': ' '}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
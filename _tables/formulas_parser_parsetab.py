@@ -0,0 +1,70 @@
+
+# formulas_parser_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'nonassocBIMPLYrightLIMPLYleftRIMPLYrightORrightANDrightNOTrightFORALLEXISTSLBOXRBOXLDIARDIAleftEQNEQGREATERGEQLESSLEQleftPLUSMINUSrightUMINUSleftMULTIPLYDIVIDErightPOWERAND BIMPLY COMMA DIVIDE EQ EXISTS FALSE FORALL GEQ GREATER ID LBOX LDIA LEQ LESS LIMPLY LPAREN MINUS MULTIPLY NEQ NOT NUM OR PLUS POWER PRIME RBOX RDIA RIMPLY RPAREN TRUE\n    formulas : formula\n    \n    formula : arithmetic_formula\n            | LPAREN formula RPAREN\n    \n    arithmetic_formula : terms EQ terms\n                       | terms NEQ terms\n                       | terms GEQ terms\n                       | terms GREATER terms\n                       | terms LEQ terms\n                       | terms LESS terms\n    \n    formula : formula OR formula\n            | formula AND formula\n            | NOT formula\n    \n    formula : FORALL terms formula\n            | EXISTS terms formula\n    \n    formula : LBOX ID RBOX formula\n            | LDIA ID GREATER formula\n    \n    formula : formula BIMPLY formula\n            | formula RIMPLY formula\n            | formula LIMPLY formula\n    \n    formula : LPAREN formula RPAREN PRIME\n    \n    terms :\n          | term\n          | function\n    \n    function : ID LPAREN RPAREN\n             | ID LPAREN term RPAREN\n    \n    term : term PLUS term\n         | term MINUS term\n         | term MULTIPLY term\n         | term DIVIDE term\n         | term POWER term\n    \n    term : MINUS term %prec UMINUS\n    \n    term : LPAREN term RPAREN\n         | LPAREN term COMMA term RPAREN\n    \n    term : term PRIME\n         | LPAREN term RPAREN PRIME\n    \n    term : NUM\n    \n    term : ID\n    \n    formula : TRUE\n            | FALSE\n    \n    formula : LPAREN error RPAREN\n    '
+    
+_lr_action_items = {'LPAREN':([0,4,5,6,8,10,14,15,16,17,18,19,20,21,22,27,28,29,30,31,32,33,34,35,37,39,40,41,42,43,44,45,46,54,55,65,66,68,69,70,71,72,73,75,78,80,],[4,4,4,28,28,37,-22,-23,28,-36,4,4,4,4,4,4,28,28,28,28,28,28,28,4,28,28,28,28,28,28,-34,-31,-37,-32,28,4,-24,4,-26,-27,-28,-29,-30,-35,-25,-33,]),'NOT':([0,4,5,6,8,10,14,15,17,18,19,20,21,22,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[5,5,5,-21,-21,-37,-22,-23,-36,5,5,5,5,5,5,5,-34,-31,-37,-32,5,-24,5,-26,-27,-28,-29,-30,-35,-25,-33,]),'FORALL':([0,4,5,6,8,10,14,15,17,18,19,20,21,22,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[6,6,6,-21,-21,-37,-22,-23,-36,6,6,6,6,6,6,6,-34,-31,-37,-32,6,-24,6,-26,-27,-28,-29,-30,-35,-25,-33,]),'EXISTS':([0,4,5,6,8,10,14,15,17,18,19,20,21,22,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[8,8,8,-21,-21,-37,-22,-23,-36,8,8,8,8,8,8,8,-34,-31,-37,-32,8,-24,8,-26,-27,-28,-29,-30,-35,-25,-33,]),'LBOX':([0,4,5,6,8,10,14,15,17,18,19,20,21,22,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[9,9,9,-21,-21,-37,-22,-23,-36,9,9,9,9,9,9,9,-34,-31,-37,-32,9,-24,9,-26,-27,-28,-29,-30,-35,-25,-33,]),'LDIA':([0,4,5,6,8,10,14,15,17,18,19,20,21,22,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[11,11,11,-21,-21,-37,-22,-23,-36,11,11,11,11,11,11,11,-34,-31,-37,-32,11,-24,11,-26,-27,-28,-29,-30,-35,-25,-33,]),'TRUE':([0,4,5,6,8,10,14,15,17,18,19,20,21,22,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[12,12,12,-21,-21,-37,-22,-23,-36,12,12,12,12,12,12,12,-34,-31,-37,-32,12,-24,12,-26,-27,-28,-29,-30,-35,-25,-33,]),'FALSE':([0,4,5,6,8,10,14,15,17,18,19,20,21,22,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[13,13,13,-21,-21,-37,-22,-23,-36,13,13,13,13,13,13,13,-34,-31,-37,-32,13,-24,13,-26,-27,-28,-29,-30,-35,-25,-33,]),'EQ':([0,4,5,6,7,8,10,14,15,17,18,19,20,21,22,25,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[-21,-21,-21,-21,29,-21,-37,-22,-23,-36,-21,-21,-21,-21,-21,-22,-21,-21,-34,-31,-37,-32,-21,-24,-21,-26,-27,-28,-29,-30,-35,-25,-33,]),'NEQ':([0,4,5,6,7,8,10,14,15,17,18,19,20,21,22,25,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[-21,-21,-21,-21,30,-21,-37,-22,-23,-36,-21,-21,-21,-21,-21,-22,-21,-21,-34,-31,-37,-32,-21,-24,-21,-26,-27,-28,-29,-30,-35,-25,-33,]),'GEQ':([0,4,5,6,7,8,10,14,15,17,18,19,20,21,22,25,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[-21,-21,-21,-21,31,-21,-37,-22,-23,-36,-21,-21,-21,-21,-21,-22,-21,-21,-34,-31,-37,-32,-21,-24,-21,-26,-27,-28,-29,-30,-35,-25,-33,]),'GREATER':([0,4,5,6,7,8,10,14,15,17,18,19,20,21,22,25,27,35,38,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[-21,-21,-21,-21,32,-21,-37,-22,-23,-36,-21,-21,-21,-21,-21,-22,-21,-21,68,-34,-31,-37,-32,-21,-24,-21,-26,-27,-28,-29,-30,-35,-25,-33,]),'LEQ':([0,4,5,6,7,8,10,14,15,17,18,19,20,21,22,25,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[-21,-21,-21,-21,33,-21,-37,-22,-23,-36,-21,-21,-21,-21,-21,-22,-21,-21,-34,-31,-37,-32,-21,-24,-21,-26,-27,-28,-29,-30,-35,-25,-33,]),'LESS':([0,4,5,6,7,8,10,14,15,17,18,19,20,21,22,25,27,35,44,45,46,54,65,66,68,69,70,71,72,73,75,78,80,],[-21,-21,-21,-21,34,-21,-37,-22,-23,-36,-21,-21,-21,-21,-21,-22,-21,-21,-34,-31,-37,-32,-21,-24,-21,-26,-27,-28,-29,-30,-35,-25,-33,]),'MINUS':([0,4,5,6,8,10,14,15,16,17,18,19,20,21,22,25,27,28,29,30,31,32,33,34,35,37,39,40,41,42,43,44,45,46,54,55,57,65,66,67,68,69,70,71,72,73,75,76,78,80,],[16,16,16,16,16,-37,40,-23,16,-36,16,16,16,16,16,40,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-34,-31,-37,-32,16,40,16,-24,40,16,-26,-27,-28,-29,-30,-35,40,-25,-33,]),'NUM':([0,4,5,6,8,10,14,15,16,17,18,19,20,21,22,27,28,29,30,31,32,33,34,35,37,39,40,41,42,43,44,45,46,54,55,65,66,68,69,70,71,72,73,75,78,80,],[17,17,17,17,17,-37,-22,-23,17,-36,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-34,-31,-37,-32,17,17,-24,17,-26,-27,-28,-29,-30,-35,-25,-33,]),'ID':([0,4,5,6,8,9,10,11,14,15,16,17,18,19,20,21,22,27,28,29,30,31,32,33,34,35,37,39,40,41,42,43,44,45,46,54,55,65,66,68,69,70,71,72,73,75,78,80,],[10,10,10,10,10,36,-37,38,-22,-23,46,-36,10,10,10,10,10,10,46,10,10,10,10,10,10,10,46,46,46,46,46,46,-34,-31,-37,-32,46,10,-24,10,-26,-27,-28,-29,-30,-35,-25,-33,]),'$end':([1,2,3,10,12,13,14,15,17,26,29,30,31,32,33,34,44,45,46,47,48,49,50,51,52,53,54,56,58,59,60,61,62,63,64,66,69,70,71,72,73,74,75,77,78,79,80,],[0,-1,-2,-37,-38,-39,-22,-23,-36,-12,-21,-21,-21,-21,-21,-21,-34,-31,-37,-10,-11,-17,-18,-19,-3,-40,-32,-13,-4,-5,-6,-7,-8,-9,-14,-24,-26,-27,-28,-29,-30,-20,-35,-15,-25,-16,-33,]),'OR':([2,3,10,12,13,14,15,17,23,26,29,30,31,32,33,34,44,45,46,47,48,49,50,51,52,53,54,56,58,59,60,61,62,63,64,66,69,70,71,72,73,74,75,77,78,79,80,],[18,-2,-37,-38,-39,-22,-23,-36,18,-12,-21,-21,-21,-21,-21,-21,-34,-31,-37,18,-11,18,18,18,-3,-40,-32,-13,-4,-5,-6,-7,-8,-9,-14,-24,-26,-27,-28,-29,-30,-20,-35,-15,-25,-16,-33,]),'AND':([2,3,10,12,13,14,15,17,23,26,29,30,31,32,33,34,44,45,46,47,48,49,50,51,52,53,54,56,58,59,60,61,62,63,64,66,69,70,71,72,73,74,75,77,78,79,80,],[19,-2,-37,-38,-39,-22,-23,-36,19,-12,-21,-21,-21,-21,-21,-21,-34,-31,-37,19,19,19,19,19,-3,-40,-32,-13,-4,-5,-6,-7,-8,-9,-14,-24,-26,-27,-28,-29,-30,-20,-35,-15,-25,-16,-33,]),'BIMPLY':([2,3,10,12,13,14,15,17,23,26,29,30,31,32,33,34,44,45,46,47,48,49,50,51,52,53,54,56,58,59,60,61,62,63,64,66,69,70,71,72,73,74,75,77,78,79,80,],[20,-2,-37,-38,-39,-22,-23,-36,20,-12,-21,-21,-21,-21,-21,-21,-34,-31,-37,-10,-11,None,-18,-19,-3,-40,-32,-13,-4,-5,-6,-7,-8,-9,-14,-24,-26,-27,-28,-29,-30,-20,-35,-15,-25,-16,-33,]),'RIMPLY':([2,3,10,12,13,14,15,17,23,26,29,30,31,32,33,34,44,45,46,47,48,49,50,51,52,53,54,56,58,59,60,61,62,63,64,66,69,70,71,72,73,74,75,77,78,79,80,],[21,-2,-37,-38,-39,-22,-23,-36,21,-12,-21,-21,-21,-21,-21,-21,-34,-31,-37,-10,-11,21,-18,21,-3,-40,-32,-13,-4,-5,-6,-7,-8,-9,-14,-24,-26,-27,-28,-29,-30,-20,-35,-15,-25,-16,-33,]),'LIMPLY':([2,3,10,12,13,14,15,17,23,26,29,30,31,32,33,34,44,45,46,47,48,49,50,51,52,53,54,56,58,59,60,61,62,63,64,66,69,70,71,72,73,74,75,77,78,79,80,],[22,-2,-37,-38,-39,-22,-23,-36,22,-12,-21,-21,-21,-21,-21,-21,-34,-31,-37,-10,-11,22,-18,22,-3,-40,-32,-13,-4,-5,-6,-7,-8,-9,-14,-24,-26,-27,-28,-29,-30,-20,-35,-15,-25,-16,-33,]),'RPAREN':([3,10,12,13,14,15,17,23,24,25,26,29,30,31,32,33,34,37,44,45,46,47,48,49,50,51,52,53,54,56,57,58,59,60,61,62,63,64,66,67,69,70,71,72,73,74,75,76,77,78,79,80,],[-2,-37,-38,-39,-22,-23,-36,52,53,54,-12,-21,-21,-21,-21,-21,-21,66,-34,-31,-37,-10,-11,-17,-18,-19,-3,-40,-32,-13,54,-4,-5,-6,-7,-8,-9,-14,-24,78,-26,-27,-28,-29,-30,-20,-35,80,-15,-25,-16,-33,]),'error':([4,],[24,]),'PLUS':([10,14,17,25,44,45,46,54,57,67,69,70,71,72,73,75,76,80,],[-37,39,-36,39,-34,-31,-37,-32,39,39,-26,-27,-28,-29,-30,-35,39,-33,]),'MULTIPLY':([10,14,17,25,44,45,46,54,57,67,69,70,71,72,73,75,76,80,],[-37,41,-36,41,-34,41,-37,-32,41,41,41,41,-28,-29,-30,-35,41,-33,]),'DIVIDE':([10,14,17,25,44,45,46,54,57,67,69,70,71,72,73,75,76,80,],[-37,42,-36,42,-34,42,-37,-32,42,42,42,42,-28,-29,-30,-35,42,-33,]),'POWER':([10,14,17,25,44,45,46,54,57,67,69,70,71,72,73,75,76,80,],[-37,43,-36,43,-34,43,-37,-32,43,43,43,43,43,43,43,-35,43,-33,]),'PRIME':([10,14,17,25,44,45,46,52,54,57,67,69,70,71,72,73,75,76,80,],[-37,44,-36,44,-34,-31,-37,74,75,44,44,-26,-27,-28,-29,-30,-35,44,-33,]),'COMMA':([10,17,25,44,45,46,54,57,69,70,71,72,73,75,80,],[-37,-36,55,-34,-31,-37,-32,55,-26,-27,-28,-29,-30,-35,-33,]),'RBOX':([36,],[65,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'formulas':([0,],[1,]),'formula':([0,4,5,18,19,20,21,22,27,35,65,68,],[2,23,26,47,48,49,50,51,56,64,77,79,]),'arithmetic_formula':([0,4,5,18,19,20,21,22,27,35,65,68,],[3,3,3,3,3,3,3,3,3,3,3,3,]),'terms':([0,4,5,6,8,18,19,20,21,22,27,29,30,31,32,33,34,35,65,68,],[7,7,7,27,35,7,7,7,7,7,7,58,59,60,61,62,63,7,7,7,]),'term':([0,4,5,6,8,16,18,19,20,21,22,27,28,29,30,31,32,33,34,35,37,39,40,41,42,43,55,65,68,],[14,25,14,14,14,45,14,14,14,14,14,14,57,14,14,14,14,14,14,14,67,69,70,71,72,73,76,14,14,]),'function':([0,4,5,6,8,18,19,20,21,22,27,29,30,31,32,33,34,35,65,68,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> formulas","S'",1,None,None,None),
+  ('formulas -> formula','formulas',1,'p_formulas','formulas_parser.py',79),
+  ('formula -> arithmetic_formula','formula',1,'p_formula','formulas_parser.py',85),
+  ('formula -> LPAREN formula RPAREN','formula',3,'p_formula','formulas_parser.py',86),
+  ('arithmetic_formula -> terms EQ terms','arithmetic_formula',3,'p_formula_arithmetic','formulas_parser.py',93),
+  ('arithmetic_formula -> terms NEQ terms','arithmetic_formula',3,'p_formula_arithmetic','formulas_parser.py',94),
+  ('arithmetic_formula -> terms GEQ terms','arithmetic_formula',3,'p_formula_arithmetic','formulas_parser.py',95),
+  ('arithmetic_formula -> terms GREATER terms','arithmetic_formula',3,'p_formula_arithmetic','formulas_parser.py',96),
+  ('arithmetic_formula -> terms LEQ terms','arithmetic_formula',3,'p_formula_arithmetic','formulas_parser.py',97),
+  ('arithmetic_formula -> terms LESS terms','arithmetic_formula',3,'p_formula_arithmetic','formulas_parser.py',98),
+  ('formula -> formula OR formula','formula',3,'p_formula_logic','formulas_parser.py',104),
+  ('formula -> formula AND formula','formula',3,'p_formula_logic','formulas_parser.py',105),
+  ('formula -> NOT formula','formula',2,'p_formula_logic','formulas_parser.py',106),
+  ('formula -> FORALL terms formula','formula',3,'p_formula_quantifier','formulas_parser.py',113),
+  ('formula -> EXISTS terms formula','formula',3,'p_formula_quantifier','formulas_parser.py',114),
+  ('formula -> LBOX ID RBOX formula','formula',4,'p_formula_modality','formulas_parser.py',122),
+  ('formula -> LDIA ID GREATER formula','formula',4,'p_formula_modality','formulas_parser.py',123),
+  ('formula -> formula BIMPLY formula','formula',3,'p_formula_implication','formulas_parser.py',130),
+  ('formula -> formula RIMPLY formula','formula',3,'p_formula_implication','formulas_parser.py',131),
+  ('formula -> formula LIMPLY formula','formula',3,'p_formula_implication','formulas_parser.py',132),
+  ('formula -> LPAREN formula RPAREN PRIME','formula',4,'p_formula_differential','formulas_parser.py',140),
+  ('terms -> <empty>','terms',0,'p_terms','formulas_parser.py',146),
+  ('terms -> term','terms',1,'p_terms','formulas_parser.py',147),
+  ('terms -> function','terms',1,'p_terms','formulas_parser.py',148),
+  ('function -> ID LPAREN RPAREN','function',3,'p_function','formulas_parser.py',159),
+  ('function -> ID LPAREN term RPAREN','function',4,'p_function','formulas_parser.py',160),
+  ('term -> term PLUS term','term',3,'p_term','formulas_parser.py',167),
+  ('term -> term MINUS term','term',3,'p_term','formulas_parser.py',168),
+  ('term -> term MULTIPLY term','term',3,'p_term','formulas_parser.py',169),
+  ('term -> term DIVIDE term','term',3,'p_term','formulas_parser.py',170),
+  ('term -> term POWER term','term',3,'p_term','formulas_parser.py',171),
+  ('term -> MINUS term','term',2,'p_term_uminus','formulas_parser.py',182),
+  ('term -> LPAREN term RPAREN','term',3,'p_term_group','formulas_parser.py',188),
+  ('term -> LPAREN term COMMA term RPAREN','term',5,'p_term_group','formulas_parser.py',189),
+  ('term -> term PRIME','term',2,'p_differential','formulas_parser.py',196),
+  ('term -> LPAREN term RPAREN PRIME','term',4,'p_differential','formulas_parser.py',197),
+  ('term -> NUM','term',1,'p_term_numeric_value','formulas_parser.py',204),
+  ('term -> ID','term',1,'p_term_value','formulas_parser.py',210),
+  ('formula -> TRUE','formula',1,'p_formula_value','formulas_parser.py',216),
+  ('formula -> FALSE','formula',1,'p_formula_value','formulas_parser.py',217),
+  ('formula -> LPAREN error RPAREN','formula',3,'p_formula_error','formulas_parser.py',225),
+]
@@ -0,0 +1,10 @@
+# hybrid_parser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'BIMPLY', 'CHOICE', 'COMMA', 'DEFINE', 'DIVIDE', 'ELSE', 'EQ', 'EXISTS', 'FALSE', 'FORALL', 'GEQ', 'GREATER', 'ID', 'IF', 'LBOX', 'LCURL', 'LDIA', 'LEQ', 'LESS', 'LIMPLY', 'LPAREN', 'MINUS', 'NEQ', 'NOT', 'NUM', 'OR', 'PLUS', 'POWER', 'PRIME', 'RBOX', 'RCURL', 'RIMPLY', 'RPAREN', 'SEMICOLON', 'STAR', 'TEST', 'TRUE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_newline>\\n+)|(?P<t_ID>[a-zA-Z_]\\w*)|(?P<t_EXISTS>\\\\exists)|(?P<t_FORALL>\\\\forall)|(?P<t_CHOICE>\\+{2})|(?P<t_FALSE>False)|(?P<t_ELSE>else)|(?P<t_GEQ>\\>\\=)|(?P<t_LEQ>\\<\\=)|(?P<t_TRUE>True)|(?P<t_BIMPLY><->)|(?P<t_NEQ>!\\=)|(?P<t_NUM>\\d+)|(?P<t_OR>[|])|(?P<t_DEFINE>:=)|(?P<t_EQ>\\=)|(?P<t_GREATER>\\>)|(?P<t_IF>if)|(?P<t_LBOX>\\[)|(?P<t_LDIA>\\<)|(?P<t_LESS>\\>)|(?P<t_LIMPLY>->)|(?P<t_LPAREN>\\()|(?P<t_PLUS>\\+)|(?P<t_POWER>\\^)|(?P<t_PRIME>\\')|(?P<t_RBOX>\\])|(?P<t_RIMPLY><-)|(?P<t_RPAREN>\\))|(?P<t_STAR>\\*)|(?P<t_TEST>\\?)|(?P<t_AND>&)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_LCURL>{)|(?P<t_MINUS>-)|(?P<t_NOT>!)|(?P<t_RCURL>})|(?P<t_SEMICOLON>;)", [None, ('t_newline', 'newline'), (None, 'ID'), (None, 'EXISTS'), (None, 'FORALL'), (None, 'CHOICE'), (None, 'FALSE'), (None, 'ELSE'), (None, 'GEQ'), (None, 'LEQ'), (None, 'TRUE'), (None, 'BIMPLY'), (None, 'NEQ'), (None, 'NUM'), (None, 'OR'), (None, 'DEFINE'), (None, 'EQ'), (None, 'GREATER'), (None, 'IF'), (None, 'LBOX'), (None, 'LDIA'), (None, 'LESS'), (None, 'LIMPLY'), (None, 'LPAREN'), (None, 'PLUS'), (None, 'POWER'), (None, 'PRIME'), (None, 'RBOX'), (None, 'RIMPLY'), (None, 'RPAREN'), (None, 'STAR'), (None, 'TEST'), (None, 'AND'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'LCURL'), (None, 'MINUS'), (None, 'NOT'), (None, 'RCURL'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' '}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,89 @@
+
+# hybrid_parser_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programsrightCOMMArightCHOICErightSEMICOLONrightREPETleftBIMPLYrightLIMPLYleftRIMPLYrightORrightANDrightNOTrightFORALLEXISTSLBOXRBOXLDIAleftEQNEQGREATERGEQLESSLEQleftPLUSMINUSrightUMINUSleftSTARDIVIDErightPOWERAND BIMPLY CHOICE COMMA DEFINE DIVIDE ELSE EQ EXISTS FALSE FORALL GEQ GREATER ID IF LBOX LCURL LDIA LEQ LESS LIMPLY LPAREN MINUS NEQ NOT NUM OR PLUS POWER PRIME RBOX RCURL RIMPLY RPAREN SEMICOLON STAR TEST TRUE\n    d_programs : d_program\n               | d_program COMMA d_program\n    \n    d_program : NUM\n              | ID PRIME EQ terms\n    \n    programs : program\n    \n    program : TEST formulas SEMICOLON\n            | LCURL d_programs AND formulas RCURL\n            | LCURL program RCURL STAR %prec REPET\n            | program CHOICE program\n    \n    program : program program\n            | LCURL program RCURL\n    \n    program : IF LPAREN formulas RPAREN LCURL program RCURL ELSE LCURL program RCURL\n            | IF LPAREN formulas RPAREN LCURL program RCURL\n    \n    program : ID SEMICOLON\n            | ID DEFINE term SEMICOLON\n            | ID PRIME DEFINE term SEMICOLON\n    \n    formulas : formula\n    \n    formula : arithmetic_formula\n            | LPAREN formula RPAREN\n    \n    arithmetic_formula : terms EQ terms\n                       | terms NEQ terms\n                       | terms GEQ terms\n                       | terms GREATER terms\n                       | terms LEQ terms\n                       | term LESS terms\n                       | function LESS terms\n    \n    formula : LBOX programs RBOX formula\n            | LDIA programs GREATER formula\n    \n    formula : formula OR formula\n            | formula AND formula\n            | NOT formula\n    \n    formula : FORALL terms formula\n            | EXISTS terms formula\n    \n    formula : formula BIMPLY formula\n            | formula RIMPLY formula\n            | formula LIMPLY formula\n    \n    formula : LPAREN formula RPAREN PRIME\n    \n    terms :\n          | term\n          | function\n    \n    function : ID LPAREN RPAREN\n             | ID LPAREN term RPAREN\n    \n    term : term PLUS term\n         | term MINUS term\n         | term STAR term\n         | term DIVIDE term\n         | term POWER term\n    \n    term : MINUS term %prec UMINUS\n    \n    term : LPAREN term RPAREN\n         | LPAREN term COMMA term RPAREN\n    \n    term : term PRIME\n         | LPAREN term RPAREN PRIME\n    \n    term : NUM\n    \n    term : ID\n    \n    formula : TRUE\n            | FALSE\n    \n    program : error SEMICOLON\n            | LCURL error RCURL\n    \n    formula : LPAREN error RPAREN\n    '
+    
+_lr_action_items = {'TEST':([0,2,4,8,9,14,15,28,34,37,38,39,73,74,109,114,122,125,126,128,129,131,132,133,],[3,3,3,3,3,3,3,3,-14,-57,-9,-6,-11,-58,-8,-15,-7,3,-16,3,-13,3,3,-12,]),'LCURL':([0,2,4,8,9,14,15,28,34,37,38,39,73,74,109,113,114,122,125,126,128,129,130,131,132,133,],[4,4,4,4,4,4,4,4,-14,-57,-9,-6,-11,-58,-8,125,-15,-7,4,-16,4,-13,131,4,4,-12,]),'IF':([0,2,4,8,9,14,15,28,34,37,38,39,73,74,109,114,122,125,126,128,129,131,132,133,],[5,5,5,5,5,5,5,5,-14,-57,-9,-6,-11,-58,-8,-15,-7,5,-16,5,-13,5,5,-12,]),'ID':([0,2,3,4,8,9,13,14,15,16,17,19,24,25,26,28,33,34,35,37,38,39,40,41,42,43,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,79,87,88,89,90,100,101,102,103,104,106,109,112,114,117,121,122,125,126,127,128,129,131,132,133,],[6,6,26,31,6,6,26,6,6,26,26,26,70,-53,-54,6,26,-14,70,-57,-9,-6,26,26,26,26,26,26,-39,-40,70,26,26,26,26,26,26,26,70,70,70,70,70,-51,26,-48,-54,70,26,-11,-58,111,70,-49,70,26,26,-43,-44,-45,-46,-47,-41,-8,26,-15,-52,-42,-7,6,-16,-50,6,-13,6,6,-12,]),'error':([0,2,4,8,9,13,14,15,28,34,37,38,39,73,74,109,114,122,125,126,128,129,131,132,133,],[7,7,29,7,7,46,7,7,7,-14,-57,-9,-6,-11,-58,-8,-15,-7,7,-16,7,-13,7,7,-12,]),'$end':([1,2,8,34,37,38,39,73,74,109,114,122,126,129,133,],[0,-5,-10,-14,-57,-9,-6,-11,-58,-8,-15,-7,-16,-13,-12,]),'RBOX':([2,8,34,37,38,39,48,73,74,109,114,122,126,129,133,],[-5,-10,-14,-57,-9,-6,89,-11,-58,-8,-15,-7,-16,-13,-12,]),'GREATER':([2,3,8,13,16,17,18,19,22,23,25,26,33,34,37,38,39,40,41,42,43,44,47,49,51,52,53,60,67,69,70,72,73,74,87,89,90,100,101,102,103,104,106,109,114,117,121,122,126,127,129,133,],[-5,-38,-10,-38,-38,-38,58,-38,-39,-40,-53,-54,-38,-14,-57,-9,-6,-38,-38,-38,-38,-38,-39,90,-38,-39,-40,-38,-51,-48,-54,-38,-11,-58,-49,-38,-38,-43,-44,-45,-46,-47,-41,-8,-15,-52,-42,-7,-16,-50,-13,-12,]),'CHOICE':([2,8,28,34,37,38,39,73,74,109,114,122,126,128,129,132,133,],[9,9,9,-14,-57,9,-6,-11,-58,-8,-15,-7,-16,9,-13,9,-12,]),'LPAREN':([3,5,13,16,17,19,24,25,26,33,35,40,41,42,43,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,79,87,88,89,90,100,101,102,103,104,106,112,117,121,127,],[13,33,13,13,54,54,54,-53,71,13,54,13,13,13,13,13,13,-39,-40,54,54,54,54,54,54,13,54,54,54,54,54,54,-51,54,-48,-54,54,13,54,-49,54,13,13,-43,-44,-45,-46,-47,-41,54,-52,-42,-50,]),'LBOX':([3,13,16,17,19,25,26,33,40,41,42,43,44,51,52,53,60,67,69,70,72,87,89,90,100,101,102,103,104,106,117,121,127,],[14,14,14,-38,-38,-53,-54,14,14,14,14,14,14,14,-39,-40,14,-51,-48,-54,14,-49,14,14,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'LDIA':([3,13,16,17,19,25,26,33,40,41,42,43,44,51,52,53,60,67,69,70,72,87,89,90,100,101,102,103,104,106,117,121,127,],[15,15,15,-38,-38,-53,-54,15,15,15,15,15,15,15,-39,-40,15,-51,-48,-54,15,-49,15,15,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'NOT':([3,13,16,17,19,25,26,33,40,41,42,43,44,51,52,53,60,67,69,70,72,87,89,90,100,101,102,103,104,106,117,121,127,],[16,16,16,-38,-38,-53,-54,16,16,16,16,16,16,16,-39,-40,16,-51,-48,-54,16,-49,16,16,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'FORALL':([3,13,16,17,19,25,26,33,40,41,42,43,44,51,52,53,60,67,69,70,72,87,89,90,100,101,102,103,104,106,117,121,127,],[17,17,17,-38,-38,-53,-54,17,17,17,17,17,17,17,-39,-40,17,-51,-48,-54,17,-49,17,17,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'EXISTS':([3,13,16,17,19,25,26,33,40,41,42,43,44,51,52,53,60,67,69,70,72,87,89,90,100,101,102,103,104,106,117,121,127,],[19,19,19,-38,-38,-53,-54,19,19,19,19,19,19,19,-39,-40,19,-51,-48,-54,19,-49,19,19,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'TRUE':([3,13,16,17,19,25,26,33,40,41,42,43,44,51,52,53,60,67,69,70,72,87,89,90,100,101,102,103,104,106,117,121,127,],[20,20,20,-38,-38,-53,-54,20,20,20,20,20,20,20,-39,-40,20,-51,-48,-54,20,-49,20,20,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'FALSE':([3,13,16,17,19,25,26,33,40,41,42,43,44,51,52,53,60,67,69,70,72,87,89,90,100,101,102,103,104,106,117,121,127,],[21,21,21,-38,-38,-53,-54,21,21,21,21,21,21,21,-39,-40,21,-51,-48,-54,21,-49,21,21,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'EQ':([3,13,16,17,18,19,22,23,25,26,33,40,41,42,43,44,47,51,52,53,60,67,69,70,72,76,87,89,90,100,101,102,103,104,106,117,121,123,127,],[-38,-38,-38,-38,55,-38,-39,-40,-53,-54,-38,-38,-38,-38,-38,-38,-39,-38,-39,-40,-38,-51,-48,-54,-38,112,-49,-38,-38,-43,-44,-45,-46,-47,-41,-52,-42,112,-50,]),'NEQ':([3,13,16,17,18,19,22,23,25,26,33,40,41,42,43,44,47,51,52,53,60,67,69,70,72,87,89,90,100,101,102,103,104,106,117,121,127,],[-38,-38,-38,-38,56,-38,-39,-40,-53,-54,-38,-38,-38,-38,-38,-38,-39,-38,-39,-40,-38,-51,-48,-54,-38,-49,-38,-38,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'GEQ':([3,13,16,17,18,19,22,23,25,26,33,40,41,42,43,44,47,51,52,53,60,67,69,70,72,87,89,90,100,101,102,103,104,106,117,121,127,],[-38,-38,-38,-38,57,-38,-39,-40,-53,-54,-38,-38,-38,-38,-38,-38,-39,-38,-39,-40,-38,-51,-48,-54,-38,-49,-38,-38,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'LEQ':([3,13,16,17,18,19,22,23,25,26,33,40,41,42,43,44,47,51,52,53,60,67,69,70,72,87,89,90,100,101,102,103,104,106,117,121,127,],[-38,-38,-38,-38,59,-38,-39,-40,-53,-54,-38,-38,-38,-38,-38,-38,-39,-38,-39,-40,-38,-51,-48,-54,-38,-49,-38,-38,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'MINUS':([3,13,16,17,19,22,24,25,26,33,35,40,41,42,43,44,47,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,78,79,87,88,89,90,92,100,101,102,103,104,106,107,112,115,117,118,121,127,],[24,24,24,24,24,63,24,-53,-54,24,24,24,24,24,24,24,63,24,63,-40,24,24,24,24,24,24,24,24,24,24,24,24,24,-51,24,-48,-54,24,24,63,24,-49,24,24,24,63,-43,-44,-45,-46,-47,-41,63,24,63,-52,63,-42,-50,]),'NUM':([3,4,13,16,17,19,24,25,26,33,35,40,41,42,43,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,75,79,87,88,89,90,100,101,102,103,104,106,112,117,121,127,],[25,32,25,25,25,25,25,-53,-54,25,25,25,25,25,25,25,25,-39,-40,25,25,25,25,25,25,25,25,25,25,25,25,25,-51,25,-48,-54,25,25,32,25,-49,25,25,25,-43,-44,-45,-46,-47,-41,25,-52,-42,-50,]),'SEMICOLON':([6,7,10,11,12,20,21,25,26,29,31,50,52,53,55,56,57,58,59,61,67,68,69,70,78,80,81,82,83,84,85,86,87,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,115,116,117,119,120,121,127,],[34,37,39,-17,-18,-55,-56,-53,-54,37,34,-31,-39,-40,-38,-38,-38,-38,-38,-38,-51,-38,-48,-54,114,-29,-30,-34,-35,-36,-19,-59,-49,-32,-20,-21,-22,-23,-24,-33,-25,-43,-44,-45,-46,-47,-26,-41,126,-37,-52,-27,-28,-42,-50,]),'DEFINE':([6,31,36,76,],[35,35,79,79,]),'PRIME':([6,22,25,26,31,47,52,67,69,70,78,85,87,92,100,101,102,103,104,107,111,115,117,118,127,],[36,67,-53,-54,76,67,67,-51,-48,-54,67,116,117,67,-43,-44,-45,-46,-47,67,123,67,-52,67,-50,]),'RCURL':([8,11,12,20,21,25,26,28,29,34,37,38,39,50,52,53,55,56,57,58,59,61,67,68,69,70,73,74,80,81,82,83,84,85,86,87,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,109,114,116,117,119,120,121,122,126,127,128,129,132,133,],[-10,-17,-18,-55,-56,-53,-54,73,74,-14,-57,-9,-6,-31,-39,-40,-38,-38,-38,-38,-38,-38,-51,-38,-48,-54,-11,-58,-29,-30,-34,-35,-36,-19,-59,-49,-32,-20,-21,-22,-23,-24,-33,-25,-43,-44,-45,-46,-47,-26,-41,122,-8,-15,-37,-52,-27,-28,-42,-7,-16,-50,129,-13,133,-12,]),'RPAREN':([11,12,20,21,25,26,45,46,47,50,52,53,55,56,57,58,59,61,67,68,69,70,71,77,80,81,82,83,84,85,86,87,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,116,117,118,119,120,121,127,],[-17,-18,-55,-56,-53,-54,85,86,87,-31,-39,-40,-38,-38,-38,-38,-38,-38,-51,-38,-48,-54,106,113,-29,-30,-34,-35,-36,-19,-59,-49,-32,87,-20,-21,-22,-23,-24,-33,-25,-43,-44,-45,-46,-47,-26,-41,121,-37,-52,127,-27,-28,-42,-50,]),'OR':([11,12,20,21,25,26,45,50,52,53,55,56,57,58,59,61,67,68,69,70,80,81,82,83,84,85,86,87,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,116,117,119,120,121,127,],[40,-18,-55,-56,-53,-54,40,-31,-39,-40,-38,-38,-38,-38,-38,-38,-51,-38,-48,-54,40,-30,40,40,40,-19,-59,-49,-32,-20,-21,-22,-23,-24,-33,-25,-43,-44,-45,-46,-47,-26,-41,-37,-52,-27,-28,-42,-50,]),'AND':([11,12,20,21,25,26,27,30,32,45,50,52,53,55,56,57,58,59,61,67,68,69,70,80,81,82,83,84,85,86,87,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,116,117,119,120,121,124,127,],[41,-18,-55,-56,-53,-54,72,-1,-3,41,-31,-39,-40,-38,-38,-38,-38,-38,-38,-51,-38,-48,-54,41,41,41,41,41,-19,-59,-49,-32,-20,-21,-22,-23,-24,-33,-25,-43,-44,-45,-46,-47,-26,-41,-2,-38,-37,-52,-27,-28,-42,-4,-50,]),'BIMPLY':([11,12,20,21,25,26,45,50,52,53,55,56,57,58,59,61,67,68,69,70,80,81,82,83,84,85,86,87,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,116,117,119,120,121,127,],[42,-18,-55,-56,-53,-54,42,-31,-39,-40,-38,-38,-38,-38,-38,-38,-51,-38,-48,-54,-29,-30,-34,-35,-36,-19,-59,-49,-32,-20,-21,-22,-23,-24,-33,-25,-43,-44,-45,-46,-47,-26,-41,-37,-52,-27,-28,-42,-50,]),'RIMPLY':([11,12,20,21,25,26,45,50,52,53,55,56,57,58,59,61,67,68,69,70,80,81,82,83,84,85,86,87,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,116,117,119,120,121,127,],[43,-18,-55,-56,-53,-54,43,-31,-39,-40,-38,-38,-38,-38,-38,-38,-51,-38,-48,-54,-29,-30,43,-35,43,-19,-59,-49,-32,-20,-21,-22,-23,-24,-33,-25,-43,-44,-45,-46,-47,-26,-41,-37,-52,-27,-28,-42,-50,]),'LIMPLY':([11,12,20,21,25,26,45,50,52,53,55,56,57,58,59,61,67,68,69,70,80,81,82,83,84,85,86,87,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,116,117,119,120,121,127,],[44,-18,-55,-56,-53,-54,44,-31,-39,-40,-38,-38,-38,-38,-38,-38,-51,-38,-48,-54,-29,-30,44,-35,44,-19,-59,-49,-32,-20,-21,-22,-23,-24,-33,-25,-43,-44,-45,-46,-47,-26,-41,-37,-52,-27,-28,-42,-50,]),'LESS':([22,23,25,26,47,67,69,70,87,100,101,102,103,104,106,117,121,127,],[61,68,-53,-54,61,-51,-48,-54,-49,-43,-44,-45,-46,-47,-41,-52,-42,-50,]),'PLUS':([22,25,26,47,52,67,69,70,78,87,92,100,101,102,103,104,107,115,117,118,127,],[62,-53,-54,62,62,-51,-48,-54,62,-49,62,-43,-44,-45,-46,-47,62,62,-52,62,-50,]),'STAR':([22,25,26,47,52,67,69,70,73,78,87,92,100,101,102,103,104,107,115,117,118,127,],[64,-53,-54,64,64,-51,64,-54,109,64,-49,64,64,64,-45,-46,-47,64,64,-52,64,-50,]),'DIVIDE':([22,25,26,47,52,67,69,70,78,87,92,100,101,102,103,104,107,115,117,118,127,],[65,-53,-54,65,65,-51,65,-54,65,-49,65,65,65,-45,-46,-47,65,65,-52,65,-50,]),'POWER':([22,25,26,47,52,67,69,70,78,87,92,100,101,102,103,104,107,115,117,118,127,],[66,-53,-54,66,66,-51,66,-54,66,-49,66,66,66,66,66,66,66,66,-52,66,-50,]),'COMMA':([25,26,30,32,47,52,53,67,69,70,87,92,100,101,102,103,104,106,112,117,121,124,127,],[-53,-54,75,-3,88,-39,-40,-51,-48,-54,-49,88,-43,-44,-45,-46,-47,-41,-38,-52,-42,-4,-50,]),'ELSE':([129,],[130,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'programs':([0,14,15,],[1,48,49,]),'program':([0,2,4,8,9,14,15,28,38,125,128,131,132,],[2,8,28,8,38,2,2,8,8,128,8,132,8,]),'formulas':([3,33,72,],[10,77,108,]),'formula':([3,13,16,33,40,41,42,43,44,51,60,72,89,90,],[11,45,50,11,80,81,82,83,84,91,98,11,119,120,]),'arithmetic_formula':([3,13,16,33,40,41,42,43,44,51,60,72,89,90,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'terms':([3,13,16,17,19,33,40,41,42,43,44,51,55,56,57,58,59,60,61,68,72,89,90,112,],[18,18,18,51,60,18,18,18,18,18,18,18,93,94,95,96,97,18,99,105,18,18,18,124,]),'term':([3,13,16,17,19,24,33,35,40,41,42,43,44,51,54,55,56,57,58,59,60,61,62,63,64,65,66,68,71,72,79,88,89,90,112,],[22,47,22,52,52,69,22,78,22,22,22,22,22,22,92,52,52,52,52,52,22,52,100,101,102,103,104,52,107,22,115,118,22,22,52,]),'function':([3,13,16,17,19,33,40,41,42,43,44,51,55,56,57,58,59,60,61,68,72,89,90,112,],[23,23,23,53,53,23,23,23,23,23,23,23,53,53,53,53,53,23,53,53,23,23,23,53,]),'d_programs':([4,],[27,]),'d_program':([4,75,],[30,110,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> programs","S'",1,None,None,None),
+  ('d_programs -> d_program','d_programs',1,'p_differential_programs','hybrid_rules.py',14),
+  ('d_programs -> d_program COMMA d_program','d_programs',3,'p_differential_programs','hybrid_rules.py',15),
+  ('d_program -> NUM','d_program',1,'p_differential_program','hybrid_rules.py',22),
+  ('d_program -> ID PRIME EQ terms','d_program',4,'p_differential_program','hybrid_rules.py',23),
+  ('programs -> program','programs',1,'p_programs','hybrid_rules.py',30),
+  ('program -> TEST formulas SEMICOLON','program',3,'p_program','hybrid_rules.py',37),
+  ('program -> LCURL d_programs AND formulas RCURL','program',5,'p_program','hybrid_rules.py',38),
+  ('program -> LCURL program RCURL STAR','program',4,'p_program','hybrid_rules.py',39),
+  ('program -> program CHOICE program','program',3,'p_program','hybrid_rules.py',40),
+  ('program -> program program','program',2,'p_program_form','hybrid_rules.py',49),
+  ('program -> LCURL program RCURL','program',3,'p_program_form','hybrid_rules.py',50),
+  ('program -> IF LPAREN formulas RPAREN LCURL program RCURL ELSE LCURL program RCURL','program',11,'p_program_conditional','hybrid_rules.py',57),
+  ('program -> IF LPAREN formulas RPAREN LCURL program RCURL','program',7,'p_program_conditional','hybrid_rules.py',58),
+  ('program -> ID SEMICOLON','program',2,'p_program_assignment','hybrid_rules.py',69),
+  ('program -> ID DEFINE term SEMICOLON','program',4,'p_program_assignment','hybrid_rules.py',70),
+  ('program -> ID PRIME DEFINE term SEMICOLON','program',5,'p_program_assignment','hybrid_rules.py',71),
+  ('formulas -> formula','formulas',1,'p_formulas','hybrid_rules.py',80),
+  ('formula -> arithmetic_formula','formula',1,'p_formula','hybrid_rules.py',86),
+  ('formula -> LPAREN formula RPAREN','formula',3,'p_formula','hybrid_rules.py',87),
+  ('arithmetic_formula -> terms EQ terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',97),
+  ('arithmetic_formula -> terms NEQ terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',98),
+  ('arithmetic_formula -> terms GEQ terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',99),
+  ('arithmetic_formula -> terms GREATER terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',100),
+  ('arithmetic_formula -> terms LEQ terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',101),
+  ('arithmetic_formula -> term LESS terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',102),
+  ('arithmetic_formula -> function LESS terms','arithmetic_formula',3,'p_formula_arithmetic','hybrid_rules.py',103),
+  ('formula -> LBOX programs RBOX formula','formula',4,'p_formula_modality','hybrid_parser.py',103),
+  ('formula -> LDIA programs GREATER formula','formula',4,'p_formula_modality','hybrid_parser.py',104),
+  ('formula -> formula OR formula','formula',3,'p_formula_logic','hybrid_rules.py',109),
+  ('formula -> formula AND formula','formula',3,'p_formula_logic','hybrid_rules.py',110),
+  ('formula -> NOT formula','formula',2,'p_formula_logic','hybrid_rules.py',111),
+  ('formula -> FORALL terms formula','formula',3,'p_formula_quantifier','hybrid_rules.py',118),
+  ('formula -> EXISTS terms formula','formula',3,'p_formula_quantifier','hybrid_rules.py',119),
+  ('formula -> formula BIMPLY formula','formula',3,'p_formula_implication','hybrid_rules.py',125),
+  ('formula -> formula RIMPLY formula','formula',3,'p_formula_implication','hybrid_rules.py',126),
+  ('formula -> formula LIMPLY formula','formula',3,'p_formula_implication','hybrid_rules.py',127),
+  ('formula -> LPAREN formula RPAREN PRIME','formula',4,'p_formula_differential','hybrid_rules.py',135),
+  ('terms -> <empty>','terms',0,'p_terms','hybrid_rules.py',141),
+  ('terms -> term','terms',1,'p_terms','hybrid_rules.py',142),
+  ('terms -> function','terms',1,'p_terms','hybrid_rules.py',143),
+  ('function -> ID LPAREN RPAREN','function',3,'p_function','hybrid_rules.py',154),
+  ('function -> ID LPAREN term RPAREN','function',4,'p_function','hybrid_rules.py',155),
+  ('term -> term PLUS term','term',3,'p_term','hybrid_rules.py',162),
+  ('term -> term MINUS term','term',3,'p_term','hybrid_rules.py',163),
+  ('term -> term STAR term','term',3,'p_term','hybrid_rules.py',164),
+  ('term -> term DIVIDE term','term',3,'p_term','hybrid_rules.py',165),
+  ('term -> term POWER term','term',3,'p_term','hybrid_rules.py',166),
+  ('term -> MINUS term','term',2,'p_term_uminus','hybrid_rules.py',177),
+  ('term -> LPAREN term RPAREN','term',3,'p_term_group','hybrid_rules.py',183),
+  ('term -> LPAREN term COMMA term RPAREN','term',5,'p_term_group','hybrid_rules.py',184),
+  ('term -> term PRIME','term',2,'p_differential','hybrid_rules.py',191),
+  ('term -> LPAREN term RPAREN PRIME','term',4,'p_differential','hybrid_rules.py',192),
+  ('term -> NUM','term',1,'p_term_numeric_value','hybrid_rules.py',199),
+  ('term -> ID','term',1,'p_term_value','hybrid_rules.py',205),
+  ('formula -> TRUE','formula',1,'p_formula_value','hybrid_rules.py',211),
+  ('formula -> FALSE','formula',1,'p_formula_value','hybrid_rules.py',212),
+  ('program -> error SEMICOLON','program',2,'p_program_error','hybrid_rules.py',221),
+  ('program -> LCURL error RCURL','program',3,'p_program_error','hybrid_rules.py',222),
+  ('formula -> LPAREN error RPAREN','formula',3,'p_formula_error','hybrid_rules.py',229),
+]
@@ -0,0 +1,10 @@
+# parser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'COMMA', 'DIVIDE', 'EQ', 'FALSE', 'GEQ', 'GREATER', 'ID', 'LEQ', 'LESS', 'LPAREN', 'MINUS', 'MULTIPLY', 'NEQ', 'NOT', 'NUM', 'OR', 'PLUS', 'POWER', 'PRIME', 'RPAREN', 'TRUE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_ID>[a-zA-Z][a-zA-Z0-9]*\\_?\\_?[0-9]*)|(?P<t_newline>\\n+)|(?P<t_GEQ>\\>\\=)|(?P<t_LEQ>\\<\\=)|(?P<t_NEQ>!\\=)|(?P<t_NUM>\\d+)|(?P<t_OR>[|])|(?P<t_EQ>\\=)|(?P<t_GREATER>\\>)|(?P<t_LESS>\\>)|(?P<t_LPAREN>\\()|(?P<t_MULTIPLY>\\*)|(?P<t_PLUS>\\+)|(?P<t_POWER>\\^)|(?P<t_RPAREN>\\))|(?P<t_AND>&)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_MINUS>-)|(?P<t_NOT>!)|(?P<t_PRIME>')", [None, ('t_ID', 'ID'), ('t_newline', 'newline'), (None, 'GEQ'), (None, 'LEQ'), (None, 'NEQ'), (None, 'NUM'), (None, 'OR'), (None, 'EQ'), (None, 'GREATER'), (None, 'LESS'), (None, 'LPAREN'), (None, 'MULTIPLY'), (None, 'PLUS'), (None, 'POWER'), (None, 'RPAREN'), (None, 'AND'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'MINUS'), (None, 'NOT'), (None, 'PRIME')])]}
+_lexstateignore = {'INITIAL': ' '}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,54 @@
+
+# parser_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'rightORrightANDrightNOTleftEQNEQGREATERGEQLESSLEQleftPLUSMINUSrightUMINUSleftMULTIPLYDIVIDErightPOWERAND COMMA DIVIDE EQ FALSE FALSE GEQ GREATER ID LEQ LESS LPAREN MINUS MULTIPLY NEQ NOT NUM OR PLUS POWER PRIME RPAREN TRUE TRUE\n    formula : NOT formula\n            | formula OR formula\n            | formula AND formula\n    \n    formula : terms EQ terms\n            | terms NEQ terms\n            | terms GREATER terms\n            | terms GEQ terms\n            | terms LESS terms\n            | terms LEQ terms\n    \n    formula : TRUE\n            | FALSE\n    \n    terms :\n          | term\n    \n    term : term PLUS term\n         | term MINUS term\n         | term MULTIPLY term\n         | term DIVIDE term\n         | term POWER term\n    \n    term : MINUS term %prec UMINUS\n    \n    term : LPAREN term RPAREN PRIME\n    \n    term : LPAREN term RPAREN\n         | LPAREN term COMMA term RPAREN\n    \n    term : NUM\n    \n    term : ID\n    '
+    
+_lr_action_items = {'NOT':([0,2,11,12,],[2,2,2,2,]),'TRUE':([0,2,11,12,],[4,4,4,4,]),'FALSE':([0,2,11,12,],[5,5,5,5,]),'EQ':([0,2,3,6,9,10,11,12,25,35,36,37,38,39,40,42,44,],[-12,-12,14,-13,-23,-24,-12,-12,-19,-14,-15,-16,-17,-18,-21,-20,-22,]),'NEQ':([0,2,3,6,9,10,11,12,25,35,36,37,38,39,40,42,44,],[-12,-12,15,-13,-23,-24,-12,-12,-19,-14,-15,-16,-17,-18,-21,-20,-22,]),'GREATER':([0,2,3,6,9,10,11,12,25,35,36,37,38,39,40,42,44,],[-12,-12,16,-13,-23,-24,-12,-12,-19,-14,-15,-16,-17,-18,-21,-20,-22,]),'GEQ':([0,2,3,6,9,10,11,12,25,35,36,37,38,39,40,42,44,],[-12,-12,17,-13,-23,-24,-12,-12,-19,-14,-15,-16,-17,-18,-21,-20,-22,]),'LESS':([0,2,3,6,9,10,11,12,25,35,36,37,38,39,40,42,44,],[-12,-12,18,-13,-23,-24,-12,-12,-19,-14,-15,-16,-17,-18,-21,-20,-22,]),'LEQ':([0,2,3,6,9,10,11,12,25,35,36,37,38,39,40,42,44,],[-12,-12,19,-13,-23,-24,-12,-12,-19,-14,-15,-16,-17,-18,-21,-20,-22,]),'MINUS':([0,2,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,23,24,25,26,35,36,37,38,39,40,41,42,43,44,],[7,7,21,7,7,-23,-24,7,7,7,7,7,7,7,7,7,7,7,7,7,-19,21,-14,-15,-16,-17,-18,-21,7,-20,21,-22,]),'LPAREN':([0,2,7,8,11,12,14,15,16,17,18,19,20,21,22,23,24,41,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'NUM':([0,2,7,8,11,12,14,15,16,17,18,19,20,21,22,23,24,41,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'ID':([0,2,7,8,11,12,14,15,16,17,18,19,20,21,22,23,24,41,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'$end':([1,4,5,6,9,10,13,14,15,16,17,18,19,25,27,28,29,30,31,32,33,34,35,36,37,38,39,40,42,44,],[0,-10,-11,-13,-23,-24,-1,-12,-12,-12,-12,-12,-12,-19,-2,-3,-4,-5,-6,-7,-8,-9,-14,-15,-16,-17,-18,-21,-20,-22,]),'OR':([1,4,5,6,9,10,13,14,15,16,17,18,19,25,27,28,29,30,31,32,33,34,35,36,37,38,39,40,42,44,],[11,-10,-11,-13,-23,-24,-1,-12,-12,-12,-12,-12,-12,-19,11,-3,-4,-5,-6,-7,-8,-9,-14,-15,-16,-17,-18,-21,-20,-22,]),'AND':([1,4,5,6,9,10,13,14,15,16,17,18,19,25,27,28,29,30,31,32,33,34,35,36,37,38,39,40,42,44,],[12,-10,-11,-13,-23,-24,-1,-12,-12,-12,-12,-12,-12,-19,12,12,-4,-5,-6,-7,-8,-9,-14,-15,-16,-17,-18,-21,-20,-22,]),'PLUS':([6,9,10,25,26,35,36,37,38,39,40,42,43,44,],[20,-23,-24,-19,20,-14,-15,-16,-17,-18,-21,-20,20,-22,]),'MULTIPLY':([6,9,10,25,26,35,36,37,38,39,40,42,43,44,],[22,-23,-24,22,22,22,22,-16,-17,-18,-21,-20,22,-22,]),'DIVIDE':([6,9,10,25,26,35,36,37,38,39,40,42,43,44,],[23,-23,-24,23,23,23,23,-16,-17,-18,-21,-20,23,-22,]),'POWER':([6,9,10,25,26,35,36,37,38,39,40,42,43,44,],[24,-23,-24,24,24,24,24,24,24,24,-21,-20,24,-22,]),'RPAREN':([9,10,25,26,35,36,37,38,39,40,42,43,44,],[-23,-24,-19,40,-14,-15,-16,-17,-18,-21,-20,44,-22,]),'COMMA':([9,10,25,26,35,36,37,38,39,40,42,44,],[-23,-24,-19,41,-14,-15,-16,-17,-18,-21,-20,-22,]),'PRIME':([40,],[42,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'formula':([0,2,11,12,],[1,13,27,28,]),'terms':([0,2,11,12,14,15,16,17,18,19,],[3,3,3,3,29,30,31,32,33,34,]),'term':([0,2,7,8,11,12,14,15,16,17,18,19,20,21,22,23,24,41,],[6,6,25,26,6,6,6,6,6,6,6,6,35,36,37,38,39,43,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> formula","S'",1,None,None,None),
+  ('formula -> NOT formula','formula',2,'p_formula_logic','parser.py',81),
+  ('formula -> formula OR formula','formula',3,'p_formula_logic','parser.py',82),
+  ('formula -> formula AND formula','formula',3,'p_formula_logic','parser.py',83),
+  ('formula -> terms EQ terms','formula',3,'p_comparison','parser.py',89),
+  ('formula -> terms NEQ terms','formula',3,'p_comparison','parser.py',90),
+  ('formula -> terms GREATER terms','formula',3,'p_comparison','parser.py',91),
+  ('formula -> terms GEQ terms','formula',3,'p_comparison','parser.py',92),
+  ('formula -> terms LESS terms','formula',3,'p_comparison','parser.py',93),
+  ('formula -> terms LEQ terms','formula',3,'p_comparison','parser.py',94),
+  ('formula -> TRUE','formula',1,'p_boolean_value','parser.py',100),
+  ('formula -> FALSE','formula',1,'p_boolean_value','parser.py',101),
+  ('terms -> <empty>','terms',0,'p_term','parser.py',108),
+  ('terms -> term','terms',1,'p_term','parser.py',109),
+  ('term -> term PLUS term','term',3,'p_arithmetic','parser.py',116),
+  ('term -> term MINUS term','term',3,'p_arithmetic','parser.py',117),
+  ('term -> term MULTIPLY term','term',3,'p_arithmetic','parser.py',118),
+  ('term -> term DIVIDE term','term',3,'p_arithmetic','parser.py',119),
+  ('term -> term POWER term','term',3,'p_arithmetic','parser.py',120),
+  ('term -> MINUS term','term',2,'p_uminus','parser.py',133),
+  ('term -> LPAREN term RPAREN PRIME','term',4,'p_term_differential','parser.py',139),
+  ('term -> LPAREN term RPAREN','term',3,'p_term_group','parser.py',145),
+  ('term -> LPAREN term COMMA term RPAREN','term',5,'p_term_group','parser.py',146),
+  ('term -> NUM','term',1,'p_numeric_term','parser.py',153),
+  ('term -> ID','term',1,'p_variable_term','parser.py',159),
+]
@@ -0,0 +1,10 @@
+# terms_parser_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('COMMA', 'DIVIDE', 'ID', 'LPAREN', 'MINUS', 'MULTIPLY', 'NUM', 'PLUS', 'POWER', 'PRIME', 'RPAREN'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_newline>\\n+)|(?P<t_ID>[a-zA-Z][a-zA-Z0-9]*\\_?\\_?[0-9]*)|(?P<t_NUM>[0-9]+\\.?[0-9]*)|(?P<t_LPAREN>\\()|(?P<t_MULTIPLY>\\*)|(?P<t_PLUS>\\+)|(?P<t_POWER>\\^)|(?P<t_PRIME>\\')|(?P<t_RPAREN>\\))|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_MINUS>-)", [None, ('t_newline', 'newline'), (None, 'ID'), (None, 'NUM'), (None, 'LPAREN'), (None, 'MULTIPLY'), (None, 'PLUS'), (None, 'POWER'), (None, 'PRIME'), (None, 'RPAREN'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'MINUS')])]}
+_lexstateignore = {'INITIAL': ' '}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
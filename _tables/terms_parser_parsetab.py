@@ -0,0 +1,47 @@
+
+# terms_parser_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftPLUSMINUSrightUMINUSleftMULTIPLYDIVIDErightPOWERCOMMA DIVIDE ID LPAREN MINUS MULTIPLY NUM PLUS POWER PRIME RPAREN\n    terms :\n           | term\n           | function\n    \n    function : ID LPAREN RPAREN\n             | ID LPAREN term RPAREN\n    \n    term : term PLUS term\n         | term MINUS term\n         | term MULTIPLY term\n         | term DIVIDE term\n         | term POWER term\n    \n    term : MINUS term %prec UMINUS\n    \n    term : LPAREN term RPAREN\n         | LPAREN term COMMA term RPAREN\n    \n    term : term PRIME\n         | LPAREN term RPAREN PRIME\n    \n    term : NUM\n    \n    term : ID\n    '
+    
+_lr_action_items = {'$end':([0,1,2,3,6,7,13,14,15,18,19,20,21,22,23,25,27,29,30,],[-1,0,-2,-3,-16,-17,-14,-11,-17,-6,-7,-8,-9,-10,-12,-4,-15,-5,-13,]),'MINUS':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,26,27,28,30,],[4,9,4,4,-16,-17,4,4,4,4,4,-14,-11,-17,9,4,-6,-7,-8,-9,-10,-12,4,9,-15,9,-13,]),'LPAREN':([0,4,5,7,8,9,10,11,12,17,24,],[5,5,5,17,5,5,5,5,5,5,5,]),'NUM':([0,4,5,8,9,10,11,12,17,24,],[6,6,6,6,6,6,6,6,6,6,]),'ID':([0,4,5,8,9,10,11,12,17,24,],[7,15,15,15,15,15,15,15,15,15,]),'PLUS':([2,6,7,13,14,15,16,18,19,20,21,22,23,26,27,28,30,],[8,-16,-17,-14,-11,-17,8,-6,-7,-8,-9,-10,-12,8,-15,8,-13,]),'MULTIPLY':([2,6,7,13,14,15,16,18,19,20,21,22,23,26,27,28,30,],[10,-16,-17,-14,10,-17,10,10,10,-8,-9,-10,-12,10,-15,10,-13,]),'DIVIDE':([2,6,7,13,14,15,16,18,19,20,21,22,23,26,27,28,30,],[11,-16,-17,-14,11,-17,11,11,11,-8,-9,-10,-12,11,-15,11,-13,]),'POWER':([2,6,7,13,14,15,16,18,19,20,21,22,23,26,27,28,30,],[12,-16,-17,-14,12,-17,12,12,12,12,12,12,-12,12,-15,12,-13,]),'PRIME':([2,6,7,13,14,15,16,18,19,20,21,22,23,26,27,28,30,],[13,-16,-17,-14,-11,-17,13,-6,-7,-8,-9,-10,27,13,-15,13,-13,]),'RPAREN':([6,13,14,15,16,17,18,19,20,21,22,23,26,27,28,30,],[-16,-14,-11,-17,23,25,-6,-7,-8,-9,-10,-12,29,-15,30,-13,]),'COMMA':([6,13,14,15,16,18,19,20,21,22,23,27,30,],[-16,-14,-11,-17,24,-6,-7,-8,-9,-10,-12,-15,-13,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'terms':([0,],[1,]),'term':([0,4,5,8,9,10,11,12,17,24,],[2,14,16,18,19,20,21,22,26,28,]),'function':([0,],[3,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> terms","S'",1,None,None,None),
+  ('terms -> <empty>','terms',0,'p_terms','terms_parser.py',50),
+  ('terms -> term','terms',1,'p_terms','terms_parser.py',51),
+  ('terms -> function','terms',1,'p_terms','terms_parser.py',52),
+  ('function -> ID LPAREN RPAREN','function',3,'p_function','terms_parser.py',65),
+  ('function -> ID LPAREN term RPAREN','function',4,'p_function','terms_parser.py',66),
+  ('term -> term PLUS term','term',3,'p_term','terms_parser.py',73),
+  ('term -> term MINUS term','term',3,'p_term','terms_parser.py',74),
+  ('term -> term MULTIPLY term','term',3,'p_term','terms_parser.py',75),
+  ('term -> term DIVIDE term','term',3,'p_term','terms_parser.py',76),
+  ('term -> term POWER term','term',3,'p_term','terms_parser.py',77),
+  ('term -> MINUS term','term',2,'p_term_uminus','terms_parser.py',90),
+  ('term -> LPAREN term RPAREN','term',3,'p_term_group','terms_parser.py',96),
+  ('term -> LPAREN term COMMA term RPAREN','term',5,'p_term_group','terms_parser.py',97),
+  ('term -> term PRIME','term',2,'p_differential','terms_parser.py',104),
+  ('term -> LPAREN term RPAREN PRIME','term',4,'p_differential','terms_parser.py',105),
+  ('term -> NUM','term',1,'p_numeric_value','terms_parser.py',112),
+  ('term -> ID','term',1,'p_value','terms_parser.py',118),
+]
@@ -0,0 +1,173 @@
+# Memory-mapped model files and .kyx archives
+#
+# A file is mapped instead of read, and lexed straight over the mapping into
+# a tokenstream.TokenStream, so the source is never copied into a str. An
+# archive is split at its top level entries,
+#
+#     ArchiveEntry "name"
+#       ProgramVariables Real x; End.
+#       Problem
+#         x := 1; {x' = -x & x >= 0}
+#       End.
+#     End.
+#
+# by a single scan for the entry keywords. An Entry only holds offsets into
+# the mapping, its Problem block is lexed and parsed each time parse() is
+# called. Archive.parse_all() parses the entries one after the other, each
+# in a nodes.scope(), so the memory of a run stays roughly constant however
+# large the archive is.
+import mmap
+import re
+
+import nodes
+import symbols
+
+# start of a top level entry: keyword at the beginning of a line and name
+_ENTRY = re.compile(rb'^[ \t]*(ArchiveEntry|Lemma|Theorem|Exercise)[ \t]+"([^"]*)"', re.M)
+# start of a block of an entry, up to the next End.
+_BLOCK = re.compile(rb'\b(Definitions|ProgramVariables|Problem|Tactic)\b')
+_END = re.compile(rb'\bEnd\.')
+
+
+def map_file(path):
+    """ Read only memory map of the file at path, bytes for empty files """
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # an empty file cannot be mapped
+            return b''
+
+
+class Entry(object):
+    """ Top level entry of an Archive
+
+    - kind is ArchiveEntry, Lemma, Theorem or Exercise
+    - start and end are the offsets of the entry in the archive
+    """
+
+    def __init__(self, archive, kind, name, start, end):
+        self.archive = archive
+        self.kind = kind
+        self.name = name
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return '<%s %r at %d>' % (self.kind, self.name, self.start)
+
+    def block(self, name='Problem'):
+        """ (start, end) offsets of the contents of the named block, None
+        when the entry has no such block """
+        buf = self.archive.buffer
+        pos = self.start
+        while True:
+            m = _BLOCK.search(buf, pos, self.end)
+            if m is None:
+                return None
+            end = _END.search(buf, m.end(), self.end)
+            if end is None:
+                raise TypeError("%s block of %r without End." % (m.group(1).decode(), self.name))
+            if m.group(1).decode() == name:
+                return m.end(), end.start()
+            pos = end.end()
+
+    def source(self, name='Problem'):
+        """ memoryview of the contents of the named block """
+        span = self.block(name)
+        if span is None:
+            raise KeyError("%r has no %s block" % (self.name, name))
+        return memoryview(self.archive.buffer)[span[0]:span[1]]
+
+    def parse(self, name='Problem', trace=None):
+        """ Tree of the named block, parsed now """
+        view = self.source(name)
+        try:
+            return self.archive.parser.parse(self.archive.parser.lex(view, trace), trace)
+        finally:
+            view.release()
+
+
+class Archive(object):
+    """ Entries of a memory-mapped .kyx archive, parsed with parser on demand
+
+    Use it as a context manager or call close() to unmap the file.
+    """
+
+    def __init__(self, parser, path):
+        self.parser = parser
+        self.path = path
+        self.buffer = map_file(path)
+        self.entries = []
+        matches = list(_ENTRY.finditer(self.buffer))
+        for m, following in zip(matches, matches[1:] + [None]):
+            end = following.start() if following is not None else len(self.buffer)
+            self.entries.append(Entry(self, m.group(1).decode(), m.group(2).decode('utf-8'),
+                                      m.start(), end))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __getitem__(self, key):
+        """ Entry by index or by name """
+        if isinstance(key, str):
+            for entry in self.entries:
+                if entry.name == key:
+                    return entry
+            raise KeyError(key)
+        return self.entries[key]
+
+    def parse_all(self, name='Problem', trace=None):
+        """ (entry, tree) of the named block of every entry having one
+
+        Every tree is parsed in a nodes.scope() that is left when the next
+        one is asked for: the nodes of a tree are only interned, and shared
+        with other trees, until then.
+        """
+        for entry in self.entries:
+            if entry.block(name) is not None:
+                with nodes.scope():
+                    yield entry, entry.parse(name, trace)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+
+def parse_file(parser, path, trace=None):
+    """ Tree of the whole file at path, lexed over a memory map of it
+
+    With a disk cache (see Parser) a file whose content was parsed before
+    is loaded from the cache instead. A parser with limits parses every
+    time: the cached trees were not parsed under them.
+    """
+    buf = map_file(path)
+    try:
+        disk = parser.disk_cache
+        if disk is None or parser.limits is not None:
+            return parser.parse(parser.lex(buf, trace), trace)
+        key = disk.key(parser, buf)
+        tree = disk.get(key)
+        if tree is None:
+            tree = parser.parse(parser.lex(buf, trace), trace)
+            disk.put(key, tree)
+        else:
+            if parser.symbols:
+                # the actions did not run, like for a cached result of parse
+                symbols.symbols(tree)
+            trace = trace if trace is not None else parser.trace
+            if trace is not None:
+                trace('result', tree)
+        return tree
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
@@ -0,0 +1,51 @@
+# Peak memory of parsing every entry of generated .kyx archives of growing
+# size, each in a fresh process
+#
+#     python benchmarks/bench_archive.py [entries] [statements]
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate
+
+
+def write(path, entries, statements):
+    rng = random.Random(0)
+    with open(path, 'w') as f:
+        for i in range(entries):
+            f.write('ArchiveEntry "entry %d"\n  Problem\n%s\n  End.\nEnd.\n\n'
+                    % (i, generate.model(rng, statements)))
+
+def run(path):
+    # child: parse every entry, keeping none of the trees
+    import hybrid_parser
+    start = time.perf_counter()
+    with hybrid_parser.parser.parse_archive(path) as archive:
+        for entry, tree in archive.parse_all():
+            pass
+    print(len(archive), time.perf_counter() - start,
+          resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+def main(entries=400, statements=200):
+    print('%8s %12s %8s %14s' % ('entries', 'bytes', 'seconds', 'peak rss (KB)'))
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (entries // 4, entries // 2, entries):
+            path = os.path.join(tmp, 'archive%d.kyx' % n)
+            write(path, n, statements)
+            out = subprocess.check_output([sys.executable, __file__, 'run', path])
+            count, elapsed, rss = out.split()
+            print('%8s %12d %8.2f %14s' % (count.decode(), os.path.getsize(path),
+                                            float(elapsed), rss.decode()))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['run']:
+        run(sys.argv[2])
+    else:
+        main(*map(int, sys.argv[1:]))
@@ -0,0 +1,80 @@
+# Compression of parsed trees as DAGs of their distinct subtrees and the
+# time of walking every occurrence of every subtree against dag.unique, on
+# generated models and on invariants of a loop unrolled by substitution,
+# whose expanded size grows with the cube of the unrolled iterations
+#
+#     python benchmarks/bench_dag.py [models] [unrolled iterations]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dag
+import formulas_parser
+import generate
+import hybrid_parser
+import nodes
+
+
+def unrolled(iterations):
+    """ Invariant of {x := x + v*t; v := v - a*t;}* after each of the
+    iterations, with x and v substituted """
+    x, v = 'x', 'v'
+    invariant = []
+    for _ in range(iterations):
+        x, v = '(%s + (%s)*t)' % (x, v), '(%s - a*t)' % v
+        invariant.append('%s <= y & %s >= 0' % (x, v))
+    return ' & '.join(invariant)
+
+def walk(tree):
+    """ Every occurrence of every node and literal after its children, the
+    traversal of dag.unique without skipping the nodes seen before """
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node is dag._EXIT:
+            yield stack.pop()
+            continue
+        if not isinstance(node, (nodes.Node, nodes.Num)):
+            continue
+        if isinstance(node, (nodes.Num, nodes.Var)):
+            yield node
+            continue
+        stack.append(node)
+        stack.append(dag._EXIT)
+        for child in reversed(node.children):
+            if isinstance(child, (nodes.Node, nodes.Num)):
+                stack.append(child)
+
+def timed(function, tree):
+    start = time.perf_counter()
+    function(tree)
+    return time.perf_counter() - start
+
+def report(name, trees):
+    tree_size = dag_size = 0
+    slow = fast = 0.0
+    for tree in trees:
+        stats = dag.stats(tree)
+        tree_size += stats.tree
+        dag_size += stats.dag
+        slow += timed(lambda tree: sum(1 for _ in walk(tree)), tree)
+        fast += timed(lambda tree: sum(1 for _ in dag.unique(tree)), tree)
+    print('%-18s %12d %10d %8.2fx %10.1f %10.1f %8.2fx' % (
+        name, tree_size, dag_size, float(tree_size) / dag_size, 1e3 * slow, 1e3 * fast,
+        slow / fast))
+
+def main(models=200, iterations=40):
+    print('%-18s %12s %10s %9s %10s %10s %9s' % (
+        'corpus', 'tree nodes', 'dag nodes', 'ratio', 'walk ms', 'unique ms', 'speedup'))
+    report('models', [hybrid_parser.parser.parse(generate.model(random.Random(i), 20))
+                      for i in range(models)])
+    report('formulas', [formulas_parser.parser.parse(s)
+                        for s in generate.corpus(models * 10, depth=4, seed=3)])
+    for k in (iterations // 4, iterations // 2, iterations):
+        report('unrolled %d' % k, [formulas_parser.parser.parse(unrolled(k))])
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
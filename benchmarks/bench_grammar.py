@@ -0,0 +1,62 @@
+# Startup time and memory of a worker that parses terms, formulas and
+# programs: the separate terms_parser, formulas_parser and hybrid_parser
+# against the single table set of dl_grammar. Every measurement runs in a
+# new process, which loads the tables and parses one input of each kind; the
+# tables columns leave out what importing the parsing machinery costs.
+#
+#     python benchmarks/bench_grammar.py [repeat]
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER = '''
+import sys, time, tracemalloc
+sys.path.insert(0, %r)
+tracemalloc.start()
+start = time.perf_counter()
+%s
+seconds = time.perf_counter() - start
+print(seconds, tracemalloc.get_traced_memory()[0])
+'''
+
+# what both pay, the parsing machinery without tables
+BASE = '''
+import nodes, parsing
+'''
+
+SEPARATE = '''
+import terms_parser, formulas_parser, hybrid_parser
+terms_parser.parser.parse('x + 1')
+formulas_parser.parser.parse('x > 1')
+hybrid_parser.parser.parse('x := 1;')
+'''
+
+UNIFIED = '''
+import dl_grammar
+dl_grammar.parse_term('x + 1')
+dl_grammar.parse_formula('x > 1')
+dl_grammar.parse_program('x := 1;')
+'''
+
+
+def measure(code, repeat):
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, '-c', WORKER % (ROOT, code)])
+        seconds, size = out.split()
+        runs.append((float(seconds), int(size)))
+    return min(runs)
+
+def main(repeat=5):
+    base_seconds, base_size = measure(BASE, repeat)
+    print('%-10s %10s %12s %14s %12s' % ('grammars', 'ms', 'KiB', 'tables ms', 'tables KiB'))
+    for name, code in (('separate', SEPARATE), ('unified', UNIFIED)):
+        seconds, size = measure(code, repeat)
+        print('%-10s %10.1f %12.0f %14.1f %12.0f' % (
+            name, 1e3 * seconds, size / 1024.0, 1e3 * (seconds - base_seconds),
+            (size - base_size) / 1024.0))
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,55 @@
+# Latency of incremental reparsing after small edits of a large generated
+# model against parsing the edited model again
+#
+#     python benchmarks/bench_incremental.py [lines] [edits]
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate
+import hybrid_parser
+
+
+def edits(rng, src, n):
+    # replace a number, insert a statement and delete a line at random places
+    for _ in range(n):
+        kind = rng.choice(('replace', 'insert', 'delete'))
+        offset = src.index('\n', rng.randrange(len(src) // 2)) + 1
+        if kind == 'replace':
+            number = re.compile(r'\d+').search(src, offset)
+            yield kind, (number.start(), len(number.group()), str(rng.randint(1, 99)))
+        elif kind == 'insert':
+            yield kind, (offset, 0, 'x := %s;\n' % generate.term(rng, 2))
+        else:
+            yield kind, (offset, src.index('\n', offset) + 1 - offset, '')
+
+def main(lines=10000, n=30):
+    rng = random.Random(0)
+    src = generate.model(rng, lines)
+    parser = hybrid_parser.parser.load()
+
+    start = time.perf_counter()
+    doc = parser.parse_incremental(src)
+    full = time.perf_counter() - start
+    print('model: %d lines, %d bytes, %d top level units' % (lines, len(src), len(doc.trees)))
+    print('full parse: %.1f ms' % (1e3 * full))
+
+    times = {}
+    for kind, edit in edits(rng, src, n):
+        start = time.perf_counter()
+        edited = doc.edit(*edit)
+        times.setdefault(kind, []).append(time.perf_counter() - start)
+        assert edited.tree is parser.parse(edited.source)
+    print('%-8s %6s %12s %8s' % ('edit', 'count', 'median ms', 'speedup'))
+    for kind, values in sorted(times.items()):
+        median = statistics.median(values)
+        print('%-8s %6d %12.2f %7.0fx' % (kind, len(values), 1e3 * median, full / median))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,45 @@
+# Time to reject pathological models with limits, against parsing them
+# without, and what checking the limits costs on an ordinary model
+#
+#     python benchmarks/bench_limits.py [size]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate
+import hybrid_parser
+import limits
+
+LIMITS = limits.Limits(tokens=200000, depth=5000, seconds=0.1)
+
+
+def timed(function, repeat=3):
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            function()
+            outcome = 'parsed'
+        except limits.LimitError as e:
+            outcome = type(e).__name__
+        runs.append(time.perf_counter() - start)
+    return min(runs), outcome
+
+def main(size=20000):
+    parser = hybrid_parser.parser.load()
+    inputs = (
+        ('nested tests', '?' + '(' * size + 'x > 1' + ')' * size + ';'),
+        ('repetition', '{x := x + 1;}*' * size),
+        ('model', generate.model(random.Random(0), size // 10)),
+    )
+    print('%-14s %12s %12s  %s' % ('input', 'no limits ms', 'limits ms', 'outcome'))
+    for name, src in inputs:
+        unlimited, _ = timed(lambda: parser.parse(src))
+        limited, outcome = timed(lambda: parser.parse(src, limits=LIMITS))
+        print('%-14s %12.1f %12.1f  %s' % (name, 1e3 * unlimited, 1e3 * limited, outcome))
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
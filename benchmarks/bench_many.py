@@ -0,0 +1,30 @@
+# Throughput of parse_many against the number of worker processes
+#
+#     python benchmarks/bench_many.py [n] [max_workers]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bulk
+import generate
+
+
+def main(n=40000, max_workers=os.cpu_count()):
+    corpus = generate.corpus(n, generate.formula)
+    print('%8s %14s %8s' % ('workers', 'parses/s', 'speedup'))
+    base = None
+    workers = 0
+    while workers <= max_workers:
+        start = time.perf_counter()
+        errors = sum(res.error is not None for res in bulk.parse_many('parser', corpus, workers, 256))
+        rate = n / (time.perf_counter() - start)
+        base = base or rate
+        print('%8d %14.0f %7.1fx %s' % (workers, rate, rate / base, '(in process)' if workers == 0 else ''))
+        workers = workers * 2 or 1
+    assert errors == 0
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
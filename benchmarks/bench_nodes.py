@@ -0,0 +1,59 @@
+# Memory of the hash-consed AST of a large generated model against the same
+# AST built from plain tuples, with a new tuple and string for every
+# occurrence of a subterm or token as the parsers allocated them before
+#
+#     python benchmarks/bench_nodes.py [statements]
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate
+import hybrid_parser
+import nodes
+
+
+def tree_bytes(tree):
+    count = size = 0
+    stack = [tree]
+    while stack:
+        t = stack.pop()
+        if isinstance(t, tuple):
+            count += 1
+            size += sys.getsizeof(tuple(t))
+            # tags were string constants shared by all tuples
+            stack.extend(t[1:] if getattr(t, 'tag', None) else t)
+        elif isinstance(t, str):
+            size += sys.getsizeof(str(t))
+    return count, size
+
+def dag_bytes(tree):
+    seen = set()
+    size = 0
+    stack = [tree]
+    while stack:
+        t = stack.pop()
+        if id(t) in seen or not isinstance(t, (tuple, str)):
+            continue
+        seen.add(id(t))
+        size += sys.getsizeof(t)
+        if isinstance(t, tuple):
+            stack.extend(t)
+    return nodes.size(), size + sum(sys.getsizeof(table) for table in nodes._tables)
+
+def main(statements=20000):
+    src = generate.model(random.Random(0), statements)
+    nodes.clear()
+    tree = hybrid_parser.parser.parse(src)
+
+    tuples, tuple_size = tree_bytes(tree)
+    unique, node_size = dag_bytes(tree)
+    print('model:  %d statements, %d bytes of source' % (statements, len(src)))
+    print('tuples: %10d tuples %12d bytes' % (tuples, tuple_size))
+    print('nodes:  %10d nodes  %12d bytes (including the intern tables)' % (unique, node_size))
+    print('saved:  %.1f%%' % (100.0 * (tuple_size - node_size) / tuple_size))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
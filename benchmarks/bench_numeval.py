@@ -0,0 +1,90 @@
+# Time per row of compiled NumPy term and formula evaluation against the
+# per-row postfix.evaluate interpreter, of the chunk sizes of compiled terms,
+# and of short-circuit formulas against evaluating every comparison at
+# every row. The interpreter only runs over the first rows, its time per row
+# is the same for any number of rows.
+#
+#     python benchmarks/bench_numeval.py [rows] [interpreted rows]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import formulas_parser
+import nodes
+import numeval
+import postfix
+import terms_parser
+
+TERMS = (
+    'v^2 / (2*b) + x',
+    'x + v*t + a*t^2/2',
+    '(x - y)^2 + (v - a)^2 - (2*3 + 1)*z',
+    '-(a*x + b*y) / (1 + t*t) * (v - -z)',
+)
+
+# guards whose first comparisons decide most rows
+FORMULAS = (
+    '10*x > 14 & v^2 <= 2*b*(y - x) & a*t <= v',
+    '6 > 10*x | v^2 + a^2 >= 2*b*b*(y - x) + t | v - a > z*t',
+    '10*x > 14 -> (v^2 <= 2*b*(y - x) & a*t <= v)',
+    '10*x > 14 & (v^a + b^t) / (x^y + z^2) >= a^b - t^v',
+)
+
+
+def timed(run, rows):
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) / rows
+
+def interpreted_time(tree, env, interpreted):
+    code = postfix.encode(tree)
+    def run():
+        for i in range(interpreted):
+            postfix.evaluate(code, dict((name, column[i]) for name, column in env.items()))
+    return timed(run, interpreted)
+
+def comparisons_of(tree):
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, nodes.Compare):
+            yield node
+        elif isinstance(node, nodes.Node):
+            stack.extend(node.children)
+
+def main(rows=2000000, interpreted=20000):
+    rng = np.random.default_rng(0)
+    env = dict((name, rng.uniform(0.5, 1.5, rows)) for name in 'xyzvabt')
+    print('%-38s %12s %12s %8s' % ('term', 'row ns/row', 'numpy ns/row', 'speedup'))
+    for s in TERMS:
+        tree = terms_parser.parser.parse(s)
+        slow = interpreted_time(tree, env, interpreted)
+        program = numeval.compile_term(tree)
+        fast = timed(lambda: program(env), rows)
+        print('%-38s %12.0f %12.1f %7.0fx' % (s, 1e9 * slow, 1e9 * fast, slow / fast))
+
+    program = numeval.compile_term(terms_parser.parser.parse(TERMS[-1]))
+    print('\n%-10s %12s' % ('chunk', 'numpy ns/row'))
+    for chunk in (256, 1024, numeval.CHUNK, 65536, rows):
+        print('%-10d %12.1f' % (chunk, 1e9 * timed(lambda: program(env, chunk=chunk), rows)))
+
+    print('\n%-56s %10s %10s %10s' % ('formula', 'row ns/row', 'all ns/row',
+                                        'numpy ns/row'))
+    for s in FORMULAS:
+        tree = formulas_parser.parser.parse(s)
+        slow = interpreted_time(tree, env, interpreted)
+        # without short-circuits every comparison is evaluated at every row
+        comparisons = [numeval.compile_formula(node) for node in comparisons_of(tree)]
+        def every():
+            for comparison in comparisons:
+                comparison(env)
+        predicate = numeval.compile_formula(tree)
+        print('%-56s %10.0f %10.1f %10.1f' % (s, 1e9 * slow, 1e9 * timed(every, rows),
+                                              1e9 * timed(lambda: predicate(env), rows)))
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,58 @@
+# Time per token of the Pratt engine against the LALR engine, for whole
+# parses and for the parser alone on pre-lexed tokens (LexTokens for the LALR
+# engine, token streams for the Pratt engine)
+#
+#     python benchmarks/bench_pratt.py [n]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate
+import nodes
+import parser
+import pratt
+import terms_parser
+
+
+def timed(run, items):
+    # both engines start from empty intern tables
+    nodes.clear()
+    start = time.perf_counter()
+    for item in items:
+        run(item)
+    return time.perf_counter() - start
+
+def main(n=20000):
+    print('%-14s %-8s %9s %12s %12s %8s' % ('grammar', 'timing', 'tokens', 'lalr ns/tok',
+                                            'pratt ns/tok', 'speedup'))
+    for module, kind in ((terms_parser, generate.term), (parser, generate.formula)):
+        corpus = generate.corpus(n, kind, depth=5)
+        lalr = module.parser.load()
+        fast = lalr.clone(engine='pratt')
+
+        lexer = lalr.lexer.clone()
+        lexed = []
+        for s in corpus:
+            lexer.input(s)
+            lexed.append(list(lexer))
+        streams = [lalr.lex(s) for s in corpus]
+        count = sum(map(len, lexed))
+
+        yacc = lalr.yacc
+        def lalr_tokens(tokens):
+            it = iter(tokens)
+            yacc.parse(lexer=lexer, tokenfunc=lambda: next(it, None))
+        engine = pratt.engine(module, lalr.name)
+
+        for timing, slow, quick in (
+                ('parse', timed(lalr.parse, corpus), timed(fast.parse, corpus)),
+                ('parser', timed(lalr_tokens, lexed), timed(engine.parse, streams))):
+            print('%-14s %-8s %9d %12.0f %12.0f %7.1fx' % (module.__name__, timing, count,
+                                                         1e9 * slow / count, 1e9 * quick / count,
+                                                         slow / quick))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
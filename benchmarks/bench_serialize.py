@@ -0,0 +1,53 @@
+# Size of the binary tree file of a generated model against its source, and
+# the time of parse_file without and with a warm disk cache, of loading the
+# whole tree and of building only its first statement from the mapping. The
+# intern tables are cleared before every run, as in a new process.
+#
+#     python benchmarks/bench_serialize.py [statements]
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate
+import hybrid_parser
+import nodes
+import serialize
+
+
+def timed(function):
+    nodes.clear()
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+def first_statement(path):
+    with serialize.Loaded(path) as loaded:
+        loaded.root.children[0].node()
+
+def main(statements=20000):
+    src = generate.model(random.Random(0), statements)
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'model.txt')
+        with open(source, 'w') as f:
+            f.write(src)
+        binary = os.path.join(directory, 'model.kyb')
+        serialize.dump(hybrid_parser.parser.parse(src), binary)
+        cached = hybrid_parser.parser.clone(cache_dir=os.path.join(directory, 'cache'))
+        print('source:  %10d bytes' % len(src))
+        print('binary:  %10d bytes' % os.path.getsize(binary))
+        parse = timed(lambda: hybrid_parser.parser.parse_file(source))
+        print('parse_file:             %8.1f ms' % (1e3 * parse))
+        print('parse_file, cold cache: %8.1f ms' % (1e3 * timed(lambda: cached.parse_file(source))))
+        warm = timed(lambda: cached.parse_file(source))
+        print('parse_file, warm cache: %8.1f ms  %5.1fx' % (1e3 * warm, parse / warm))
+        load = timed(lambda: serialize.load(binary))
+        print('load:                   %8.1f ms  %5.1fx' % (1e3 * load, parse / load))
+        lazy = timed(lambda: first_statement(binary))
+        print('first statement:        %8.3f ms' % (1e3 * lazy))
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,82 @@
+# Requests per second of the parse service over a Unix socket, pipelined and
+# one request at a time, against starting a process per request that imports
+# the grammar and parses one input
+#
+#     python benchmarks/bench_server.py [requests] [workers]
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import generate
+import server
+
+
+async def clients(path, requests):
+    reader, writer = await asyncio.open_unix_connection(path, limit=server.LIMIT)
+    # pipelined: every request is written before the responses are read
+    start = time.perf_counter()
+    for request in requests:
+        writer.write(request)
+    await writer.drain()
+    for _ in requests:
+        await reader.readline()
+    pipelined = time.perf_counter() - start
+    start = time.perf_counter()
+    for request in requests:
+        writer.write(request)
+        await writer.drain()
+        await reader.readline()
+    sequential = time.perf_counter() - start
+    writer.close()
+    return pipelined, sequential
+
+async def serve(srv, requests):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'socket')
+        serving = asyncio.ensure_future(srv.serve_unix(path))
+        while not os.path.exists(path):
+            await asyncio.sleep(0.01)
+        # warm up the workers
+        await clients(path, requests[:10])
+        result = await clients(path, requests)
+        serving.cancel()
+        try:
+            await serving
+        except asyncio.CancelledError:
+            pass
+    return result
+
+def per_process(sources):
+    start = time.perf_counter()
+    for src in sources:
+        subprocess.check_output([sys.executable, '-c',
+                                 'import sys; sys.path.insert(0, %r); import dl_grammar; '
+                                 'dl_grammar.parse_program(%r)' % (ROOT, src)])
+    return (time.perf_counter() - start) / len(sources)
+
+def main(requests=2000, workers=1):
+    rng = random.Random(0)
+    sources = [generate.model(rng, 5) for _ in range(requests)]
+    lines = [(json.dumps({'id': i, 'kind': 'program', 'src': src}) + '\n').encode()
+             for i, src in enumerate(sources)]
+    srv = server.Server(workers=workers)
+    try:
+        pipelined, sequential = asyncio.run(serve(srv, lines))
+    finally:
+        srv.close()
+    process = per_process(sources[:5])
+    print('%d requests, %d workers' % (requests, workers))
+    print('pipelined:   %8.0f requests/s' % (requests / pipelined))
+    print('sequential:  %8.0f requests/s' % (requests / sequential))
+    print('per process: %8.1f requests/s' % (1 / process))
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
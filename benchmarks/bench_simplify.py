@@ -0,0 +1,70 @@
+# Node counts and per-row postfix.evaluate times of generated terms,
+# formulas and models before and after simplify.simplify, and the time of
+# simplifying them with a fresh memo and with a memo shared by the corpus.
+# Models are programs, they are not evaluated.
+#
+#     python benchmarks/bench_simplify.py [inputs] [rows]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import formulas_parser
+import generate
+import hybrid_parser
+import postfix
+import simplify
+import terms_parser
+
+
+def size(tree):
+    return len(postfix.encode(tree).ops)
+
+def evaluation_time(codes, envs):
+    start = time.perf_counter()
+    for code in codes:
+        for env in envs:
+            try:
+                postfix.evaluate(code, env)
+            except (ArithmeticError, ValueError):
+                pass
+    return (time.perf_counter() - start) / (len(codes) * len(envs))
+
+def main(inputs=2000, rows=20):
+    rng = random.Random(0)
+    envs = [dict((name, rng.uniform(0.5, 1.5)) for name in generate.VARIABLES)
+            for _ in range(rows)]
+    corpora = (
+        ('terms', terms_parser.parser, generate.corpus(inputs, generate.term, depth=5, seed=1)),
+        ('formulas', formulas_parser.parser, generate.corpus(inputs, depth=3, seed=2)),
+        ('models', hybrid_parser.parser,
+         [generate.model(random.Random(i), 5) for i in range(inputs // 10)]),
+    )
+    print('%-10s %10s %10s %7s %10s %10s %8s %10s %10s' % (
+        'corpus', 'nodes', 'simplified', 'ratio', 'eval us', 'simple us', 'speedup',
+        'fresh ms', 'shared ms'))
+    for name, parser, sources in corpora:
+        trees = [parser.parse(s) for s in sources]
+        start = time.perf_counter()
+        for tree in trees:
+            simplify.simplify(tree)
+        fresh = time.perf_counter() - start
+        memo = {}
+        start = time.perf_counter()
+        simple = [simplify.simplify(tree, memo) for tree in trees]
+        shared = time.perf_counter() - start
+        before = sum(map(size, trees))
+        after = sum(map(size, simple))
+        if name == 'models':
+            slow = fast = float('nan')
+        else:
+            slow = evaluation_time([postfix.encode(tree) for tree in trees], envs)
+            fast = evaluation_time([postfix.encode(tree) for tree in simple], envs)
+        print('%-10s %10d %10d %6.1f%% %10.2f %10.2f %7.2fx %10.1f %10.1f' % (
+            name, before, after, 100.0 * after / before, 1e6 * slow, 1e6 * fast, slow / fast,
+            1e3 * fresh, 1e3 * shared))
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
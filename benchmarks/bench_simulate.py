@@ -0,0 +1,41 @@
+# Runs per second of the batched simulator against simulating the runs one
+# at a time with the same simulator (n=1), which is what a per-run
+# interpreter costs at best
+#
+#     python benchmarks/bench_simulate.py [runs] [single runs]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hybrid_parser
+import simulate
+
+MODELS = (
+    # bouncing ball style: discrete choices around a continuous evolution
+    ("{{a := 2; ++ a := -2;} {x' = v, v' = a & v >= 0} ?x <= 100;}*",
+     {'x': 0.0, 'v': 1.0}),
+    # braking car: control, then physics with a clock
+    ("{{?v <= 10; a := 1; ++ a := -1;} t := 0; {v' = a, t' = 1 & v >= 0 & t <= 1}}*",
+     {'v': 5.0, 't': 0.0, 'a': 0.0}),
+)
+
+
+def main(runs=100000, single=200):
+    print('%-78s %12s %12s %8s' % ('model', 'single runs/s', 'batch runs/s', 'speedup'))
+    for src, initial in MODELS:
+        tree = hybrid_parser.parser.parse(src)
+        sim = simulate.Simulator(tree, seed=0, dt=0.01, horizon=1.0, max_loops=5)
+        start = time.perf_counter()
+        for _ in range(single):
+            sim.run(initial, n=1)
+        slow = single / (time.perf_counter() - start)
+        start = time.perf_counter()
+        sim.run(initial, n=runs)
+        fast = runs / (time.perf_counter() - start)
+        print('%-78s %12.0f %12.0f %7.0fx' % (src, slow, fast, fast / slow))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
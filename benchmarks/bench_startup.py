@@ -0,0 +1,37 @@
+# Startup time of the grammar modules: precompiled tables against the
+# previous import path, which analyzed the grammar with lex.lex()/yacc.yacc()
+#
+#     python benchmarks/bench_startup.py [repeat]
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+import tables
+
+
+def analyze(module):
+    # what every module did on import before the tables were shipped
+    lex.lex(module=module, errorlog=lex.NullLogger())
+    yacc.yacc(module=module, write_tables=False, debug=False, errorlog=yacc.NullLogger())
+
+def load(module, name):
+    tables.lexer(module, name)
+    tables.parser(module, name)
+
+def main(repeat=20):
+    modules = [(name, __import__(name)) for name in tables.GRAMMARS]
+
+    print('%-16s %12s %12s %8s' % ('grammar', 'analysis ms', 'tables ms', 'speedup'))
+    for name, module in modules:
+        slow = min(timeit.repeat(lambda: analyze(module), number=1, repeat=repeat))
+        fast = min(timeit.repeat(lambda: load(module, name), number=1, repeat=repeat))
+        print('%-16s %12.2f %12.2f %7.1fx' % (name, slow * 1e3, fast * 1e3, slow / fast))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,59 @@
+# Cost of computing the free, bound and assigned variables as part of the
+# parse of a generated model, and the time of a free_vars query on every
+# statement afterwards, against a walk of the statement per query. The
+# intern tables are cleared before every run, as in a new process.
+#
+#     python benchmarks/bench_symbols.py [statements]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate
+import hybrid_parser
+import nodes
+import symbols
+import visitor
+
+
+class Names(visitor.Visitor):
+    # the walk of a consumer without symbols: every variable read
+    def __init__(self):
+        self.names = set()
+
+    def enter_Var(self, node):
+        self.names.add(node.name)
+
+
+def statements(tree):
+    while isinstance(tree, nodes.Seq):
+        yield tree.first
+        tree = tree.second
+    yield tree
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+def main(statements_count=5000):
+    src = generate.model(random.Random(0), statements_count)
+    nodes.clear()
+    plain, tree = timed(lambda: hybrid_parser.parser.parse(src))
+    lazy, _ = timed(lambda: symbols.free_vars(tree))
+    nodes.clear()
+    parser = hybrid_parser.parser.clone(symbols=True)
+    parsed, tree = timed(lambda: parser.parse(src))
+    parts = list(statements(tree))
+    queries, _ = timed(lambda: [symbols.free_vars(part) for part in parts])
+    walks, _ = timed(lambda: [Names().visit(part).names for part in parts])
+    print('parse:                   %8.1f ms' % (1e3 * plain))
+    print('symbols after the parse: %8.1f ms' % (1e3 * lazy))
+    print('parse with symbols:      %8.1f ms' % (1e3 * parsed))
+    print('%d free_vars queries:   %8.3f ms' % (len(parts), 1e3 * queries))
+    print('%d walks:               %8.1f ms' % (len(parts), 1e3 * walks))
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,45 @@
+# Parse throughput against the number of threads sharing one Parser
+#
+#     python benchmarks/bench_threads.py [n] [max_threads]
+#
+# With the GIL the throughput stays flat, run it on a free-threaded build
+# (python3.13t and later) to see it scale with the number of threads.
+import os
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate
+import parser as dl
+
+
+def run(corpus, threads):
+    chunk = (len(corpus) + threads - 1) // threads
+    chunks = [corpus[i:i + chunk] for i in range(0, len(corpus), chunk)]
+
+    def work(chunk):
+        for s in chunk:
+            dl.parser.parse(s)
+
+    with ThreadPoolExecutor(threads) as pool:
+        start = time.perf_counter()
+        list(pool.map(work, chunks))
+        return time.perf_counter() - start
+
+def main(n=20000, max_threads=8):
+    corpus = generate.corpus(n, generate.formula)
+    dl.parser.load()
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('python %s, GIL %s' % (sys.version.split()[0], 'enabled' if gil else 'disabled'))
+    print('%8s %14s' % ('threads', 'parses/s'))
+    threads = 1
+    while threads <= max_threads:
+        print('%8d %14.0f' % (threads, n / run(corpus, threads)))
+        threads *= 2
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,47 @@
+# Time and memory of lexing a large generated model into a list of PLY
+# LexTokens against a compact token stream
+#
+#     python benchmarks/bench_tokens.py [statements]
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate
+import hybrid_parser
+import tokenstream
+
+
+def measure(lex):
+    start = time.perf_counter()
+    tokens = lex()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tokens = lex()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return len(tokens), elapsed, size
+
+def ply_tokens(lexer, src):
+    lexer.input(src)
+    return list(lexer)
+
+def main(statements=20000):
+    src = generate.model(random.Random(0), statements)
+    data = src.encode()
+    lexer = hybrid_parser.parser.lexer.clone()
+    print('model: %d statements, %d bytes of source' % (statements, len(src)))
+    print('%-10s %9s %8s %12s %10s' % ('lexer', 'tokens', 'seconds', 'bytes', 'bytes/tok'))
+    for name, lex in (('ply', lambda: ply_tokens(lexer, src)),
+                      ('stream', lambda: tokenstream.lex(lexer, src)),
+                      ('bytes', lambda: tokenstream.lex(lexer, data))):
+        count, elapsed, size = measure(lex)
+        print('%-10s %9d %8.2f %12d %10.1f' % (name, count, elapsed, size, size / count))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
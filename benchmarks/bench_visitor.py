@@ -0,0 +1,81 @@
+# Traversal rate of visitor.Visitor and visitor.Transformer on trees of a
+# million nodes, against a recursive walker, on a long ; sequence (as deep
+# as it is long) and on the same statements as a balanced tree of Seq
+#
+#     python benchmarks/bench_visitor.py [nodes]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nodes
+import visitor
+
+
+def statements(count):
+    """ Distinct assignments x<i> := x<i> + 4i + ... of 11 nodes each """
+    result = []
+    for i in range(count):
+        term = nodes.Var('x%d' % i)
+        for j in range(4):
+            term = nodes.BinOp('+', term, nodes.Num(str(4 * i + j)))
+        result.append(nodes.Assign('x%d' % i, term))
+    return result
+
+def sequence(items):
+    tree = items[-1]
+    for item in reversed(items[:-1]):
+        tree = nodes.Seq(item, tree)
+    return tree
+
+def balanced(items):
+    while len(items) > 1:
+        items = [nodes.Seq(*items[i:i + 2]) if i + 1 < len(items) else items[i]
+                 for i in range(0, len(items), 2)]
+    return items[0]
+
+def recursive(node):
+    # the walker a consumer writes by hand, counting the nodes
+    if isinstance(node, (nodes.Num, nodes.Var)):
+        return 1
+    return 1 + sum(recursive(child) for child in node.children
+                   if isinstance(child, (nodes.Node, nodes.Num)))
+
+
+class Count(visitor.Visitor):
+    def __init__(self):
+        self.count = 0
+
+    def enter(self, node):
+        self.count += 1
+
+
+class Rename(visitor.Transformer):
+    def leave_Var(self, node, children):
+        return nodes.Var(node.name + '_')
+
+
+def rate(function, tree, size):
+    start = time.perf_counter()
+    try:
+        function(tree)
+    except RecursionError:
+        return '%14s' % 'RecursionError'
+    return '%14.0f' % (size / (time.perf_counter() - start))
+
+def main(size=1000000):
+    items = statements(size // 11)
+    trees = (('sequence', sequence(items)), ('balanced', balanced(items)))
+    print('%-10s %9s %14s %14s %14s %14s' % ('tree', 'nodes', 'recursive/s', 'Visitor/s',
+                                              'Transformer/s', 'rename/s'))
+    for name, tree in trees:
+        count = Count().visit(tree).count
+        print('%-10s %9d %s %s %s %s' % (
+            name, count, rate(recursive, tree, count),
+            rate(lambda tree: Count().visit(tree), tree, count),
+            rate(lambda tree: visitor.Transformer().transform(tree), tree, count),
+            rate(lambda tree: Rename().transform(tree), tree, count)))
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -2,10 +2,11 @@
 # parse a given boolean expression
 # logic operator syntax from KeYmaera X
 
-import ply.lex as lex
-import ply.yacc as yacc
 import sys
 
+import nodes
+import parsing
+
 tokens = (
     'TRUE', 'FALSE',
     'OR', 'AND', 'NOT',
@@ -22,8 +23,6 @@ t_ignore = r' '
 def t_error(t):
     raise TypeError("unknown text '%s', boolean expression expected" % (t.value,))
 
-lex.lex()
-
 precedence = (
     ('right','OR'),
     ('right','AND'),
@@ -37,11 +36,9 @@ def p_string(p):
     """
     #when empty
     if len(p) == 1:
-        p[0] = []
+        p[0] = nodes.EMPTY
     else:
         p[0] = p[1]
-    #uncomment to test on terminal
-    print(p[0])
 
 def p_expression(p):
     """
@@ -49,9 +46,9 @@ def p_expression(p):
                | expression OR expression
                | expression AND expression
     """
-    if p[1] == '!':  p[0] = ('not', p[2])
-    if p[2] == '|': p[0] = ('or', p[1], p[3])
-    elif p[2] == '&':   p[0] = ('and', p[1], p[3])
+    if p[1] == '!':  p[0] = nodes.Not('not', p[2])
+    elif p[2] == '|': p[0] = nodes.Logic('or', p[1], p[3])
+    elif p[2] == '&':   p[0] = nodes.Logic('and', p[1], p[3])
 
 def p_value(p):
     """
@@ -63,15 +60,17 @@ def p_value(p):
 
 
 def p_error(p):
-    print("p_error {}".format(p))
-    raise TypeError("unknown text at %r" % (p.value))
-
-parser = yacc.yacc()
-
-#uncomment below to test on the terminal
-while True:
-    try:
-        s = input('')
-    except EOFError:
-        break
-    parser.parse(s)
+    raise parsing.syntax_error(p)
+
+parser = parsing.Parser(sys.modules[__name__], 'boolean_parser')
+
+
+def __getattr__(name):
+    # the lexer is loaded with the parser tables on first use
+    if name == 'lexer':
+        return parser.lexer
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if __name__ == '__main__':
+    parser.repl()
@@ -0,0 +1,98 @@
+# Bulk parsing of many inputs on a process pool
+#
+#     for res in parse_many('hybrid_parser', lines, workers=8):
+#         if res.error is not None:
+#             print(res.index, res.error)
+#
+# The inputs are sent to the workers in chunks, every worker loads the tables
+# of the grammar once when it starts. Syntax errors do not stop the run, they
+# are returned as the error of the failing item. A worker parses every chunk
+# in a nodes.scope(), the trees are interned again in the calling process.
+import collections
+import importlib
+import itertools
+import os
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import nodes
+
+# value is None when parsing the input at index raised error
+Result = collections.namedtuple('Result', 'index value error')
+
+# parser of the grammar in a worker process
+_parser = None
+
+
+def _init(name):
+    global _parser
+    _parser = importlib.import_module(name).parser.load()
+
+def _parse_chunk(start, chunk, parser=None):
+    parser = parser or _parser
+    results = []
+    for index, s in enumerate(chunk, start):
+        try:
+            results.append(Result(index, parser.parse(s), None))
+        except Exception as e:
+            results.append(Result(index, None, e))
+    return results
+
+def _work(start, chunk):
+    # results of a chunk in a worker, which keeps none of their nodes
+    with nodes.scope():
+        return _parse_chunk(start, chunk)
+
+def _chunks(iterable, chunksize):
+    it = iter(iterable)
+    start = 0
+    while True:
+        chunk = list(itertools.islice(it, chunksize))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+def parse_many(parser, iterable, workers=None, chunksize=64, ordered=True):
+    """ Parse every string of iterable, yielding a Result per string
+
+    - parser is a grammar module name or the Parser of a grammar module
+    - workers is the number of processes, os.cpu_count() by default and 0
+      to parse in the calling process
+    - with ordered=False results are yielded as soon as their chunk is done
+
+    The iterable is consumed lazily, at most a few chunks per worker are
+    pending at any time.
+    """
+    if isinstance(parser, str):
+        parser = importlib.import_module(parser).parser
+    chunks = _chunks(iterable, chunksize)
+
+    if workers == 0:
+        for start, chunk in chunks:
+            for res in _parse_chunk(start, chunk, parser):
+                yield res
+        return
+
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(workers, initializer=_init, initargs=(parser.name,))
+    try:
+        pending = collections.deque()
+        for start, chunk in chunks:
+            pending.append(pool.submit(_work, start, chunk))
+            while len(pending) >= 4 * workers:
+                for res in _next_done(pending, ordered):
+                    yield res
+        while pending:
+            for res in _next_done(pending, ordered):
+                yield res
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+def _next_done(pending, ordered):
+    if ordered:
+        return pending.popleft().result()
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    future = done.pop()
+    pending.remove(future)
+    return future.result()
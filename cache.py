@@ -0,0 +1,68 @@
+# Bounded LRU cache of parse results
+#
+# Parser(..., cache_size=n) keeps the results of the last n distinct inputs.
+# The key is the token stream of the input, so inputs that only differ in
+# whitespace, like 'x+1>=0' and 'x + 1 >= 0', share an entry. Results are
+# immutable nodes (see nodes.py), so handing out the same result to every
+# caller is safe.
+import collections
+import threading
+
+
+class LRUCache(object):
+    """ Mapping of at most size entries, dropping the least recently used
+
+    hits, misses and evictions count the lookups and dropped entries.
+    """
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError("cache size must be positive, got %r" % (size,))
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return {'size': len(self._data), 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
+
+
+def token_key(stream):
+    """ Cache key of a tokenstream.TokenStream, the source without whitespace
+    between tokens """
+    # no token contains a space, so the values joined by spaces identify the
+    # stream (the type of a token follows from its text)
+    return ' '.join(stream.values())
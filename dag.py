@@ -0,0 +1,157 @@
+# Traversal of parsed trees as DAGs of their distinct subtrees
+#
+#     for node in dag.unique(tree):        # every distinct subtree once
+#         ...
+#     sizes = dag.fold(tree, lambda node, children: 1 + sum(children))
+#     dag.stats(tree)                      # Stats(tree=..., dag=...)
+#
+# Nodes are interned (see nodes), so the parsers already build DAGs: all
+# occurrences of a subterm or subformula are one object. A walk following
+# every child still visits a subtree once per occurrence, and an unrolled
+# invariant or a term substituted into itself makes that exponential in the
+# number of distinct nodes. The functions below follow a child only the
+# first time they meet it, by identity, so they take time and memory in the
+# number of distinct nodes. They are iterative, deep trees do not hit the
+# recursion limit.
+#
+# Sharing only spans the nodes of one generation of the intern tables:
+# trees built before nodes.clear() share nothing with the ones built after
+# it. share() interns a tree again into the current tables, and turns the
+# plain tuples of nodes.to_tuple back into nodes.
+import collections
+
+import nodes
+
+# number of nodes and literals of the tree with every occurrence counted and
+# of the distinct ones
+Stats = collections.namedtuple('Stats', 'tree dag')
+
+# marks the end of the children of a node on the stack of unique
+_EXIT = object()
+
+
+def _items(node):
+    # children of a node that are nodes or literals
+    return [child for child in node.children if isinstance(child, (nodes.Node, nodes.Num))]
+
+def unique(tree):
+    """ Iterator over the distinct nodes and literals of tree, every one once
+    and after its children """
+    seen = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node is _EXIT:
+            # the children of the node below are done
+            yield stack.pop()
+            continue
+        if id(node) in seen or not isinstance(node, (nodes.Node, nodes.Num)):
+            continue
+        seen.add(id(node))
+        if isinstance(node, (nodes.Num, nodes.Var)):
+            yield node
+            continue
+        stack.append(node)
+        stack.append(_EXIT)
+        for child in reversed(node.children):
+            if id(child) not in seen and isinstance(child, (nodes.Node, nodes.Num)):
+                stack.append(child)
+
+def fold(tree, function):
+    """ Value of tree computed bottom-up as function(node, values of its
+    children), called once for every distinct node or literal """
+    values = {}
+    for node in unique(tree):
+        if isinstance(node, nodes.Num):
+            values[id(node)] = function(node, [])
+        else:
+            values[id(node)] = function(node, [values[id(child)] for child in _items(node)])
+    return values.get(id(tree))
+
+def stats(tree):
+    """ Stats of tree, tree / dag is its compression ratio """
+    distinct = 0
+    sizes = {}
+    for node in unique(tree):
+        distinct += 1
+        if isinstance(node, nodes.Num):
+            sizes[id(node)] = 1
+        else:
+            sizes[id(node)] = 1 + sum(sizes[id(child)] for child in _items(node))
+    return Stats(sizes.get(id(tree), 0), distinct)
+
+
+# plain tuples of nodes.to_tuple by their tag, the nodes without tag are
+# told apart by their operator and length
+_TAGS = {}
+for _cls in (nodes.Var, nodes.Differential, nodes.Func, nodes.Imply, nodes.Iff, nodes.Box,
+             nodes.Diamond, nodes.Test, nodes.Assign, nodes.ODE, nodes.Choice, nodes.Loop,
+             nodes.If, nodes.Error):
+    _TAGS[_cls.tag] = _cls
+_OPS = {'+': nodes.BinOp, '-': nodes.BinOp, '*': nodes.BinOp, '/': nodes.BinOp,
+        '^': nodes.BinOp, '=': nodes.Compare, '!=': nodes.Compare, '>': nodes.Compare,
+        '>=': nodes.Compare, '<': nodes.Compare, '<=': nodes.Compare, '&': nodes.Logic,
+        '|': nodes.Logic, 'and': nodes.Logic, 'or': nodes.Logic, '\\forall': nodes.Quantifier,
+        '\\exists': nodes.Quantifier}
+# nodes whose 2-tuple children are sequences, and the statements
+_SEQUENCES = (nodes.Seq, nodes.Loop, nodes.Choice, nodes.If, nodes.Box, nodes.Diamond)
+_STATEMENTS = _SEQUENCES + (nodes.Test, nodes.Assign, nodes.DiffAssign, nodes.ODE, nodes.Error)
+
+
+def _plain_class(value, parent):
+    # node class of the plain tuple value, a child of the class parent
+    head = value[0] if value else None
+    if isinstance(head, str):
+        if head == 'differential':
+            # d(x)' is a term, x' = t an equation and x' := t an assignment
+            if len(value) == 2:
+                return nodes.Differential
+            return nodes.DiffEq if parent in (nodes.ODE, nodes.Pair) else nodes.DiffAssign
+        if head in _TAGS:
+            return _TAGS[head]
+        if head in ('!', 'not') and len(value) == 2:
+            return nodes.Not
+        if len(value) == 3 and head in _OPS:
+            return _OPS[head]
+    if len(value) == 2:
+        # a pair of a program is a sequence, as is a pair starting with a statement
+        if parent in _SEQUENCES or parent is None and isinstance(value[0], tuple) and \
+                _plain_class(value[0], nodes.Seq) in _STATEMENTS:
+            return nodes.Seq
+        return nodes.Pair
+    return None
+
+def share(tree):
+    """ tree with its nodes interned into the current intern tables
+
+    tree can also be made of the plain tuples and strings of
+    nodes.to_tuple; numeric strings become Num and tuples that are no node
+    are kept as tuples.
+    """
+    done = {}
+    # (value, class of the node, class of its parent, expanded)
+    stack = [(tree, None, None, False)]
+    while stack:
+        value, cls, parent, expanded = stack.pop()
+        if id(value) in done:
+            continue
+        if not expanded:
+            if isinstance(value, nodes.Node):
+                cls = type(value)
+            elif isinstance(value, tuple):
+                cls = _plain_class(value, parent)
+            else:
+                if isinstance(value, str) and value.lstrip('-').isdigit():
+                    done[id(value)] = nodes.Num(value)
+                continue
+            stack.append((value, cls, parent, True))
+            stack.extend((child, None, cls, False) for child in value)
+            continue
+        children = [done.get(id(child), child) for child in value]
+        if cls is None:
+            done[id(value)] = tuple(children)
+        elif cls.tag is not None:
+            done[id(value)] = cls(*children[1:])
+        else:
+            done[id(value)] = cls(*children)
+    return done.get(id(tree), tree)
@@ -0,0 +1,169 @@
+# Unified grammar of KeYmaera X terms, formulas and hybrid programs using ply
+#
+#     dl_grammar.parse_term('v^2 / (2*b)')
+#     dl_grammar.parse_formula('x > 0 & [x := x + 1;]x > 1')
+#     dl_grammar.parse_program("x := 1; {x' = v & x >= 0}")
+#
+# terms_parser, formulas_parser and hybrid_parser each build their own lexer
+# and LALR tables for their own rules. This module parses all three with
+# one table set: the start symbol has one production per entry point,
+# selected by a sentinel token fed to the parser before the tokens of the
+# input (see Parser.parse). Input without sentinel is a program, so
+# parser.parse and the other Parser methods parse programs.
+#
+# The rules are those of hybrid_parser, imported from hybrid_rules, and the
+# language is the same with three changes: if, else, True
+# and False are reserved words instead of identifiers, numbers may have a
+# fractional part as in terms_parser, and < is lexed as LESS, which also
+# opens a diamond: the older modules lex it as LDIA only, so x < 1 is not a
+# formula there. They are kept as they are for their existing callers; code
+# that needs these changes calls the entry points below instead.
+import sys
+
+import nodes
+import parsing
+from hybrid_rules import (
+    p_differential_programs, p_differential_program, p_programs, p_program, p_program_form,
+    p_program_conditional, p_program_assignment, p_program_error,
+    p_formulas, p_formula, p_formula_arithmetic, p_formula_logic, p_formula_quantifier,
+    p_formula_implication, p_formula_differential, p_formula_value, p_formula_error,
+    p_terms, p_function, p_term, p_term_uminus, p_term_group, p_differential,
+    p_term_numeric_value, p_term_value, p_error)
+
+tokens = (
+    'START_TERM', 'START_FORMULA',
+    'TRUE', 'FALSE',
+    'OR', 'AND', 'NOT',
+    'ID', 'NUM',
+    'PLUS', 'MINUS', 'STAR', 'DIVIDE', 'POWER',
+    'LPAREN', 'RPAREN', 'LBOX', 'RBOX', 'LCURL', 'RCURL',
+    'EQ', 'NEQ', 'GREATER', 'GEQ', 'LESS', 'LEQ',
+    'FORALL', 'EXISTS',
+    'LIMPLY', 'RIMPLY', 'BIMPLY',
+    'PRIME',
+    'COMMA', 'SEMICOLON', 'DEFINE', 'TEST', 'CHOICE',
+    'IF', 'ELSE'
+)
+
+# sentinel token types of the entry points, never produced by the lexer
+START_TERM = 'START_TERM'
+START_FORMULA = 'START_FORMULA'
+
+reserved = {
+    'if': 'IF',
+    'else': 'ELSE',
+    'True': 'TRUE',
+    'False': 'FALSE',
+}
+
+def t_ID(t):
+    r'[a-zA-Z_]\w*'
+    t.type = reserved.get(t.value, 'ID')
+    return t
+
+t_OR = r'[|]'
+t_AND = r'&'
+t_NOT = r'!'
+t_PLUS = r'\+'
+t_MINUS = r'-'
+t_STAR = r'\*'
+t_DIVIDE = r'/'
+t_POWER = r'\^'
+t_EQ = r'\='
+t_NEQ = r'!\='
+t_GREATER = r'\>'
+t_GEQ = r'\>\='
+t_LESS = r'\<'
+t_LEQ = r'\<\='
+t_LPAREN = r'\('
+t_RPAREN = r'\)'
+t_NUM = r'\d+(?:\.\d+)?'
+t_LBOX = r'\['
+t_RBOX = r'\]'
+t_LCURL = r'{'
+t_RCURL = r'}'
+t_FORALL = r'\\forall'
+t_EXISTS = r'\\exists'
+t_LIMPLY = r'->'
+t_RIMPLY = r'<-'
+t_BIMPLY = r'<->'
+t_PRIME = r'\''
+t_COMMA = r','
+t_SEMICOLON = r';'
+t_DEFINE = r':='
+t_TEST = r'\?'
+t_CHOICE = r'\+{2}'
+
+t_ignore = r' '
+
+def t_newline(t):
+    r'\n+'
+    t.lexer.lineno += t.value.count('\n')
+
+def t_error(t):
+    parsing.trace(t.lexer, 'illegal', t.value[0])
+    t.lexer.skip(1)
+
+precedence = (
+    ('right', 'COMMA'),
+    ('right', 'CHOICE'),
+    ('right', 'SEMICOLON'),
+    ('right', 'REPET'),
+    ('left', 'BIMPLY'),
+    ('right', 'LIMPLY'), ('left', 'RIMPLY'),
+    ('right', 'OR'),
+    ('right', 'AND'),
+    ('right', 'NOT'),
+    ('right', 'FORALL', 'EXISTS', 'LBOX', 'RBOX'),
+    ('left', 'EQ', 'NEQ', 'GREATER', 'GEQ', 'LESS', 'LEQ'),
+    ('left', 'PLUS', 'MINUS'),
+    ('right', 'UMINUS'),
+    ('left', 'STAR', 'DIVIDE'),
+    ('right', 'POWER')
+)
+
+start = 'start'
+
+def p_start(p):
+    """
+    start : programs
+          | START_TERM terms
+          | START_FORMULA formulas
+    """
+    p[0] = p[len(p) - 1]
+
+# the rules are shared with hybrid_parser, see hybrid_rules; only the
+# modalities differ: a diamond opens with LESS here
+def p_formula_modality(p):
+    """
+    formula : LBOX programs RBOX formula
+            | LESS programs GREATER formula
+    """
+    if p[1] == '[': p[0] = nodes.Box(p[2], p[4])
+    else:   p[0] = nodes.Diamond(p[2], p[4])
+
+parser = parsing.Parser(sys.modules[__name__], 'dl_grammar')
+
+
+def parse_term(s, trace=None):
+    """ Tree of the term s """
+    return parser.parse(s, trace, START_TERM)
+
+def parse_formula(s, trace=None):
+    """ Tree of the formula s """
+    return parser.parse(s, trace, START_FORMULA)
+
+def parse_program(s, trace=None):
+    """ Tree of the hybrid program s """
+    return parser.parse(s, trace)
+
+
+def __getattr__(name):
+    # the lexer is loaded with the parser tables on first use
+    if name == 'lexer':
+        return parser.lexer
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if __name__ == '__main__':
+    parser.repl()
@@ -0,0 +1,223 @@
+# Falsification of box modalities by batched simulation
+#
+#     tree = ...                           # [program] post or pre -> [program] post
+#     result = falsify.falsify(tree, {'x': (0, 10), 'v': (-1, 1), 'b': 2},
+#                              budget=60, workers=None)
+#     if result.counterexample is not None:
+#         for state in result.counterexample.trace:
+#             ...
+#
+# Initial states are sampled uniformly from the given ranges (or fixed
+# values) in batches, the runs of a batch are simulated together with
+# simulate.Simulator, and the postcondition is checked in every state a
+# run may end in: at the end of the program, after every iteration of a
+# final loop and at every step of a final evolution (see the observers of
+# simulate). Runs whose initial state fails the precondition are dropped.
+#
+# The search stops at the first violation, when the wall clock budget is
+# spent or after max_runs runs. Every batch is seeded from the seed of the
+# search and its number, so the run that failed is replayed alone to record
+# its trace. With workers the batches run on a process pool, one batch per
+# task; a violation cancels the later batches and the earlier ones are
+# finished, so the counterexample is the same as without workers.
+import collections
+import os
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+import nodes
+import numeval
+import simulate
+
+# initial is the sampled initial state of the run, trace its states up to
+# state, the first one violating the postcondition
+Counterexample = collections.namedtuple('Counterexample', 'initial trace state')
+# runs simulated, batches, final states checked, runs that did not fail a
+# test, wall clock seconds and the (min, max) of every variable over the
+# checked states
+Coverage = collections.namedtuple('Coverage', 'runs batches checked completed seconds ranges')
+Result = collections.namedtuple('Result', 'counterexample coverage')
+
+# column of the run numbers in the simulated state
+_RUN = '#run'
+
+
+def split(tree):
+    """ (precondition or None, program, postcondition) of [program] post or
+    pre -> [program] post """
+    pre = None
+    if isinstance(tree, nodes.Imply):
+        pre, tree = tree.left, tree.right
+    if not isinstance(tree, nodes.Box):
+        raise TypeError("can only falsify [program] post or pre -> [program] post")
+    return pre, tree.program, tree.body
+
+
+class _Found(Exception):
+    # stops the simulation at the first violation
+    def __init__(self, run):
+        Exception.__init__(self, run)
+        self.run = run
+
+
+class _Checker(object):
+    # observer checking the compiled postcondition in every final state
+    def __init__(self, post):
+        self.post = post
+        self.checked = 0
+        self.ranges = {}
+
+    def __call__(self, state, mask, final):
+        if not final:
+            return
+        count = np.count_nonzero(mask)
+        if not count:
+            return
+        bad = mask & ~self.post(state, rows=len(mask))
+        if bad.any():
+            raise _Found(int(state[_RUN][bad].min()))
+        self.checked += int(count)
+        for name, values in state.items():
+            if name != _RUN:
+                values = values[mask]
+                low, high = self.ranges.get(name, (np.inf, -np.inf))
+                self.ranges[name] = (min(low, np.nanmin(values)), max(high, np.nanmax(values)))
+
+
+class _Recorder(object):
+    # observer recording the states of a single run up to its violation
+    def __init__(self, post, run):
+        self.post = post
+        self.run = run
+        self.trace = []
+
+    def __call__(self, state, mask, final):
+        rows = np.flatnonzero(mask & (state[_RUN] == self.run))
+        if not len(rows):
+            return
+        row = rows[0]
+        current = dict((name, float(values[row])) for name, values in state.items()
+                       if name != _RUN)
+        # the end of an iteration is also the end of the last statement of its body
+        if not self.trace or self.trace[-1] != current:
+            self.trace.append(current)
+        if final and not self.post(dict((name, values[rows]) for name, values in state.items()),
+                                   rows=1)[0]:
+            raise _Found(self.run)
+
+
+def _simulator(tree, seed, number, size, ranges, options, observer):
+    # initial state and simulator of a batch, the batch seed decides both
+    pre, program, post = split(tree)
+    rng = np.random.default_rng([seed, number, 0])
+    initial = {}
+    for name, value in ranges.items():
+        if isinstance(value, (tuple, list)):
+            initial[name] = rng.uniform(value[0], value[1], size)
+        else:
+            initial[name] = np.full(size, float(value))
+    initial[_RUN] = np.arange(size, dtype=float)
+    if pre is not None:
+        program = nodes.Seq(nodes.Test(pre), program)
+    sim = simulate.Simulator(program, seed=[seed, number, 1], observer=observer(numeval.compile_formula(post)),
+                             **options)
+    return initial, sim
+
+def _batch(tree, seed, number, size, ranges, options):
+    # (failed run or None, checked, completed, ranges) of a batch
+    initial, sim = _simulator(tree, seed, number, size, ranges, options, _Checker)
+    try:
+        runs = sim.run(initial, size)
+    except _Found as found:
+        return found.run, sim.observer.checked, 0, sim.observer.ranges
+    return None, sim.observer.checked, int(np.count_nonzero(runs.alive)), sim.observer.ranges
+
+def replay(tree, seed, number, size, ranges, run, options=None):
+    """ Counterexample of the failed run of a batch """
+    recorder = lambda post: _Recorder(post, run)
+    initial, sim = _simulator(tree, seed, number, size, ranges, options or {}, recorder)
+    start = dict((name, float(values[run])) for name, values in initial.items()
+                 if name != _RUN)
+    try:
+        sim.run(initial, size)
+    except _Found:
+        trace = sim.observer.trace
+        return Counterexample(start, trace, trace[-1])
+    raise ValueError("run %d of batch %d does not fail" % (run, number))
+
+
+def falsify(tree, ranges, budget=None, max_runs=100000, batch=10000, workers=0, seed=0,
+            **options):
+    """ Result of searching a counterexample to the box modality tree
+
+    - ranges maps the variables to (low, high) ranges or fixed values of
+      their initial states
+    - budget is the wall clock budget in seconds, max_runs the most runs
+      (None for no limit)
+    - batch is the number of runs simulated together
+    - workers is the number of processes, 0 to simulate in the calling
+      process and None for os.cpu_count()
+    - options are passed to simulate.Simulator (dt, horizon, repeat,
+      max_loops)
+    """
+    split(tree)
+    start = time.perf_counter()
+    deadline = None if budget is None else start + budget
+    stats = {'runs': 0, 'batches': 0, 'checked': 0, 'completed': 0, 'ranges': {}}
+    failed = None
+
+    def more():
+        # another batch can start
+        return failed is None and (deadline is None or time.perf_counter() < deadline) and \
+            (max_runs is None or number * batch < max_runs)
+
+    def record(number, result):
+        run, checked, completed, seen = result
+        stats['runs'] += batch
+        stats['batches'] += 1
+        stats['checked'] += checked
+        stats['completed'] += completed
+        for name, (low, high) in seen.items():
+            old_low, old_high = stats['ranges'].get(name, (np.inf, -np.inf))
+            stats['ranges'][name] = (float(min(low, old_low)), float(max(high, old_high)))
+        return None if run is None else (number, run)
+
+    number = 0
+    if workers == 0:
+        while more():
+            failed = record(number, _batch(tree, seed, number, batch, ranges, options))
+            number += 1
+    else:
+        workers = workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(workers)
+        try:
+            pending = {}
+            while pending or more():
+                while more() and len(pending) < 2 * workers:
+                    future = pool.submit(_batch, tree, seed, number, batch, ranges, options)
+                    pending[future] = number
+                    number += 1
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=pending.get):
+                    found = record(pending.pop(future), future.result())
+                    if found is not None and (failed is None or found < failed):
+                        failed = found
+                if failed is not None:
+                    # only the earlier batches can still find the first
+                    # violation, the later ones are dropped
+                    for future, later in list(pending.items()):
+                        if later > failed[0]:
+                            future.cancel()
+                            del pending[future]
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    counterexample = None
+    if failed is not None:
+        counterexample = replay(tree, seed, failed[0], batch, ranges, failed[1], options)
+    coverage = Coverage(stats['runs'], stats['batches'], stats['checked'], stats['completed'],
+                        time.perf_counter() - start, stats['ranges'])
+    return Result(counterexample, coverage)
@@ -1,9 +1,10 @@
 # Parser for formula expression in KeYmaera X using ply
 # advanced material(predicate symbol) of formula expression has to be added
-import ply.lex as lex
-import ply.yacc as yacc
 import sys
 
+import nodes
+import parsing
+
 tokens = (
     'TRUE', 'FALSE',
     'OR', 'AND', 'NOT',
@@ -56,11 +57,9 @@ def t_newline(t):
     t.lexer.lineno += t.value.count('\n')
 
 def t_error(t):
-    print("illegal character '%s'" % t.value[0])
+    parsing.trace(t.lexer, 'illegal', t.value[0])
     t.lexer.skip(1)
 
-lexer = lex.lex()
-
 precedence = (
     ('nonassoc', 'BIMPLY'),
     ('right', 'LIMPLY'), ('left', 'RIMPLY'),
@@ -80,8 +79,6 @@ def p_formulas(p):
     formulas : formula
     """
     p[0] = p[1]
-    # uncomment to test
-    print(p[0])
 
 def p_formula(p):
     """
@@ -100,7 +97,7 @@ def p_formula_arithmetic(p):
                        | terms LEQ terms
                        | terms LESS terms
     """
-    p[0] = (p[2], p[1], p[3])
+    p[0] = nodes.Compare(p[2], p[1], p[3])
 
 def p_formula_logic(p):
     """
@@ -108,15 +105,15 @@ def p_formula_logic(p):
             | formula AND formula
             | NOT formula
     """
-    if p[1] == '!': p[0] = ('!', p[2])
-    else:   p[0] = (p[2], p[1], p[3])
+    if p[1] == '!': p[0] = nodes.Not('!', p[2])
+    else:   p[0] = nodes.Logic(p[2], p[1], p[3])
 
 def p_formula_quantifier(p):
     """
     formula : FORALL terms formula
             | EXISTS terms formula
     """
-    p[0] = (p[1], p[2], p[3])
+    p[0] = nodes.Quantifier(p[1], p[2], p[3])
 
 # change ID to programs after writing parsing for HP
 # greater sign same as right diamond sign
@@ -125,8 +122,8 @@ def p_formula_modality(p):
     formula : LBOX ID RBOX formula
             | LDIA ID GREATER formula
     """
-    if p[2] == '[': p[0] = ('box', p[2], p[4])
-    else:   p[0] = ('dia', p[2], p[4])
+    if p[1] == '[': p[0] = nodes.Box(p[2], p[4])
+    else:   p[0] = nodes.Diamond(p[2], p[4])
 
 def p_formula_implication(p):
     """
@@ -134,15 +131,15 @@ def p_formula_implication(p):
             | formula RIMPLY formula
             | formula LIMPLY formula
     """
-    if p[2] == '->': p[0] = ('imply', p[1], p[3])
-    elif p[2] == '<-':  p[0] = ('imply', p[3], p[1])
-    else:   ('iff', p[1], p[3])
+    if p[2] == '->': p[0] = nodes.Imply(p[1], p[3])
+    elif p[2] == '<-':  p[0] = nodes.Imply(p[3], p[1])
+    else:   p[0] = nodes.Iff(p[1], p[3])
 
 def p_formula_differential(p):
     """
     formula : LPAREN formula RPAREN PRIME
     """
-    p[0] = ('differential', p[2])
+    p[0] = nodes.Differential(p[2])
 
 def p_terms(p):
     """
@@ -152,7 +149,7 @@ def p_terms(p):
     """
     #when empty
     if len(p) == 1:
-        p[0] = []
+        p[0] = nodes.EMPTY
     else:
         p[0] = p[1]
 
@@ -162,8 +159,8 @@ def p_function(p):
     function : ID LPAREN RPAREN
              | ID LPAREN term RPAREN
     """
-    if p[3] == ')': p[0] = ('Constant Symbol', p[1]+'()')
-    else:   p[0] = ('function', p[1]+p[2]+str(p[3])+p[4])
+    if p[3] == ')': p[0] = nodes.Func(p[1], nodes.EMPTY)
+    else:   p[0] = nodes.Func(p[1], p[3])
 
 def p_term(p):
     """
@@ -173,11 +170,9 @@ def p_term(p):
          | term DIVIDE term
          | term POWER term
     """
-    if p[2] == '/':
-        if p[3] != 0:   p[0] = (p[2], p[1], p[3])
-        else:
-            raise  ZeroDivisionError("cannot divide by zero")
-    else:   p[0] = (p[2], p[1], p[3])
+    if p[2] == '/' and p[3] == '0':
+        raise  ZeroDivisionError("cannot divide by zero")
+    p[0] = nodes.BinOp(p[2], p[1], p[3])
 
 
 # unary minus
@@ -186,14 +181,14 @@ def p_term_uminus(p):
     """
     term : MINUS term %prec UMINUS
     """
-    p[0] = ('*', p[2], '-1')
+    p[0] = nodes.BinOp('*', p[2], nodes.Num('-1'))
 
 def p_term_group(p):
     """
     term : LPAREN term RPAREN
          | LPAREN term COMMA term RPAREN
     """
-    if p[3] == ',':   p[0] = '('+str(p[2]) +','+ str(p[4])+')'
+    if p[3] == ',':   p[0] = nodes.Pair(p[2], p[4])
     else:   p[0] = p[2]
 
 def p_differential(p):
@@ -201,39 +196,49 @@ def p_differential(p):
     term : term PRIME
          | LPAREN term RPAREN PRIME
     """
-    if p[1] == '(': p[0] = ('differential', p[2])
-    else:   p[0] = ('differential', p[1])
+    if p[1] == '(': p[0] = nodes.Differential(p[2])
+    else:   p[0] = nodes.Differential(p[1])
 
 def p_term_numeric_value(p):
     """
     term : NUM
     """
-    p[0] = p[1]
+    p[0] = nodes.Num(p[1])
 
 def p_term_value(p):
     """
     term : ID
     """
-    p[0] = ('IDENTIFIER', p[1])
+    p[0] = nodes.Var(p[1])
 
 def p_formula_value(p):
     """
     formula : TRUE
             | FALSE
     """
-    if p[1] == 'true': p[0] == True
-    else:   p[0] == False
+    p[0] = p[1] == 'True'
+
+# error productions, only used by Parser.parse_recover: a malformed
+# parenthesized formula becomes a nodes.Error and parsing goes on after it
+def p_formula_error(p):
+    """
+    formula : LPAREN error RPAREN
+    """
+    p.parser.errok()
+    p[0] = nodes.Error()
 
 def p_error(p):
-    print("p_error {}".format(p))
-    raise TypeError("unknown text at %r" % (p.value))
-
-parser = yacc.yacc()
-
-#uncomment below to test on the terminal
-while True:
-    try:
-        s = input('')
-    except EOFError:
-        break
-    parser.parse(s)
+    raise parsing.syntax_error(p)
+
+parser = parsing.Parser(sys.modules[__name__], 'formulas_parser')
+
+
+def __getattr__(name):
+    # the lexer is loaded with the parser tables on first use
+    if name == 'lexer':
+        return parser.lexer
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if __name__ == '__main__':
+    parser.repl()
@@ -0,0 +1,66 @@
+# Random terms, formulas and hybrid programs in KeYmaera X syntax for tests
+# and benchmarks
+import random
+
+VARIABLES = ('x', 'y', 'z', 'v', 'a', 'b', 't')
+COMPARISONS = ('=', '!=', '>', '>=', '<=')
+
+
+def term(rng, depth):
+    """ Random term with operators nested up to depth """
+    if depth <= 0 or rng.random() < 0.2:
+        if rng.random() < 0.6:
+            return rng.choice(VARIABLES)
+        # no zero, the grammars reject division by a literal 0
+        return str(rng.randint(1, 99))
+    r = rng.random()
+    if r < 0.1:
+        return '-' + term(rng, depth - 1)
+    if r < 0.2:
+        return '(' + term(rng, depth - 1) + ')'
+    return '%s %s %s' % (term(rng, depth - 1), rng.choice('+-*/^'), term(rng, depth - 1))
+
+def comparison(rng, depth):
+    return '%s %s %s' % (term(rng, depth), rng.choice(COMPARISONS), term(rng, depth))
+
+def formula(rng, depth, connectives='&|'):
+    """ Random quantifier free formula with connectives nested up to depth """
+    if depth <= 0 or rng.random() < 0.3:
+        return comparison(rng, 2)
+    c = rng.choice(connectives)
+    if c == '!':
+        return '!' + formula(rng, depth - 1, connectives)
+    return '%s %s %s' % (formula(rng, depth - 1, connectives), c,
+                         formula(rng, depth - 1, connectives))
+
+def corpus(n, kind=formula, depth=4, seed=0, **kw):
+    """ List of n random inputs produced by kind """
+    rng = random.Random(seed)
+    return [kind(rng, depth, **kw) for _ in range(n)]
+
+def ode(rng, depth=2):
+    """ Random continuous evolution of one or two variables """
+    x, y = rng.sample(VARIABLES, 2)
+    system = "%s' = %s" % (x, term(rng, depth))
+    if rng.random() < 0.5:
+        system += ", %s' = %s" % (y, term(rng, depth))
+    return '{%s & %s}' % (system, comparison(rng, 1))
+
+def program(rng, depth):
+    """ Random hybrid program with statements nested up to depth """
+    r = rng.random()
+    if depth <= 0 or r < 0.4:
+        return '%s := %s;' % (rng.choice(VARIABLES), term(rng, 2))
+    if r < 0.5:
+        return '?%s;' % formula(rng, 1)
+    if r < 0.6:
+        return ode(rng)
+    if r < 0.7:
+        return '{%s}*' % program(rng, depth - 1)
+    if r < 0.8:
+        return '{%s ++ %s}' % (program(rng, depth - 1), program(rng, depth - 1))
+    return '%s %s' % (program(rng, depth - 1), program(rng, depth - 1))
+
+def model(rng, size):
+    """ Random hybrid program of size top level statements, one per line """
+    return '\n'.join(program(rng, 3) for _ in range(size))
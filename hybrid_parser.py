@@ -1,9 +1,17 @@
 # Parser for hybrid program expressions in KeYmaera X using ply
 # advanced material(predicate symbol) of formula expression has to be added
-import ply.lex as lex
-import ply.yacc as yacc
 import sys
 
+import nodes
+import parsing
+from hybrid_rules import (
+    p_differential_programs, p_differential_program, p_programs, p_program, p_program_form,
+    p_program_conditional, p_program_assignment, p_program_error,
+    p_formulas, p_formula, p_formula_arithmetic, p_formula_logic, p_formula_quantifier,
+    p_formula_implication, p_formula_differential, p_formula_value, p_formula_error,
+    p_terms, p_function, p_term, p_term_uminus, p_term_group, p_differential,
+    p_term_numeric_value, p_term_value, p_error)
+
 tokens = (
     'TRUE', 'FALSE',
     'OR', 'AND', 'NOT',
@@ -64,11 +72,9 @@ def t_newline(t):
     t.lexer.lineno += t.value.count('\n')
 
 def t_error(t):
-    print("illegal character '%s'" % t.value[0])
+    parsing.trace(t.lexer, 'illegal', t.value[0])
     t.lexer.skip(1)
 
-lexer = lex.lex()
-
 precedence = (
     ('right', 'COMMA'),
     ('right', 'CHOICE'),
@@ -83,230 +89,32 @@ precedence = (
     ('left', 'EQ', 'NEQ', 'GREATER', 'GEQ', 'LESS', 'LEQ'),
     ('left', 'PLUS', 'MINUS'),
     ('right', 'UMINUS'),
-    ('left', 'MULTIPLY', 'DIVIDE'),
+    ('left', 'STAR', 'DIVIDE'),
     ('right', 'POWER')
 )
 
-def p_differential_programs(p):
-    """
-    d_programs : d_program
-               | d_program COMMA d_program
-    """
-    if p[2] == ',': p[0] = (p[1], p[3])
-
-def p_differential_program(p):
-    """
-    d_program : NUM
-              | ID PRIME EQ terms
-    """
-    if p[2] == "'": p[0] = ('differential', p[1], p[4])
-    else:   p[0] = p[1]
-
-def p_programs(p):
-    """
-    programs : program
-    """
-    p[0] = p[1]
-    # uncomment to test
-    print(p[0])
-
-
-def p_program(p):
-    """
-    program : TEST program SEMICOLON
-            | LCURL d_programs AND formulas RCURL
-            | LCURL program RCURL STAR
-            | program CHOICE program
-    """
-    if p[1] == '?': p[0] = (p[1], p[2])
-    elif p[3] == '&': p[0] = ('continuous_ev', p[2], p[4])
-    elif p[4] == '*': p[0] = ('repetition', p[2])
-    elif p[2] == '++': p[0] = ('choice', p[1], p[3])
-
-def p_program_form(p):
-    """
-    program : program program
-            | LCURL program RCURL
-    """
-    if p[1] == '{': p[0] = p[2]
-    else: p[0] = (p[1], p[2])
-
-def p_program_conditional(p):
-    """
-    program : IF LPAREN formulas RPAREN LCURL program RCURL ELSE LCURL program RCURL
-            | if LPAREN formulas RPAREN LCURL program RCURL
-    """
-
-
-# ambiguity on the documentation P ::= a;
-# not sure what 'a' is
-# put 'a' as a variable name for now
-def p_program_assigntment(p):
-    """
-    program : ID SEMICOLON
-            | ID DEFINE term SEMICOLON
-            | ID PRIME DEFINE term SEMICOLON
-    """
-    if p[2] == ';': p[0] = p[1]
-    elif p[2] == ':': p[0] = ('define', p[1], p[3])
-    else:   p[0] = ('differential', p[1], p[4])
-
-
-def p_formulas(p):
-    """
-    formulas : formula
-    """
-    p[0] = p[1]
-
-def p_formula(p):
-    """
-    formula : arithmetic_formula
-            | LPAREN formula RPAREN
-    """
-    if p[1] == '(': p[0] = p[2]
-    else:   p[0] = p[1]
-
-def p_formula_arithmetic(p):
-    """
-    arithmetic_formula : terms EQ terms
-                       | terms NEQ terms
-                       | terms GEQ terms
-                       | terms GREATER terms
-                       | terms LEQ terms
-                       | terms LESS terms
-    """
-    p[0] = (p[2], p[1], p[3])
-
-def p_formula_logic(p):
-    """
-    formula : formula OR formula
-            | formula AND formula
-            | NOT formula
-    """
-    if p[1] == '!': p[0] = ('!', p[2])
-    else:   p[0] = (p[2], p[1], p[3])
-
-def p_formula_quantifier(p):
-    """
-    formula : FORALL terms formula
-            | EXISTS terms formula
-    """
-    p[0] = (p[1], p[2], p[3])
+# d_programs is only used inside continuous evolution, parsing starts at programs
+start = 'programs'
 
+# the rules are shared with dl_grammar, see hybrid_rules; only the
+# modalities differ: a diamond opens with LDIA here
 def p_formula_modality(p):
     """
     formula : LBOX programs RBOX formula
             | LDIA programs GREATER formula
     """
-    if p[2] == '[': p[0] = ('box', p[2], p[4])
-    else:   p[0] = ('dia', p[2], p[4])
-
-def p_formula_implication(p):
-    """
-    formula : formula BIMPLY formula
-            | formula RIMPLY formula
-            | formula LIMPLY formula
-    """
-    if p[2] == '->': p[0] = ('imply', p[1], p[3])
-    elif p[2] == '<-':  p[0] = ('imply', p[3], p[1])
-    else:   ('iff', p[1], p[3])
-
-def p_formula_differential(p):
-    """
-    formula : LPAREN formula RPAREN PRIME
-    """
-    p[0] = ('differential', p[2])
-
-def p_terms(p):
-    """
-    terms :
-          | term
-          | function
-    """
-    #when empty
-    if len(p) == 1:
-        p[0] = []
-    else:
-        p[0] = p[1]
-
-# interpreted functions have to be added
-def p_function(p):
-    """
-    function : ID LPAREN RPAREN
-             | ID LPAREN term RPAREN
-    """
-    if p[3] == ')': p[0] = ('Constant Symbol', p[1]+'()')
-    else:   p[0] = ('function', p[1]+p[2]+str(p[3])+p[4])
-
-def p_term(p):
-    """
-    term : term PLUS term
-         | term MINUS term
-         | term MULTIPLY term
-         | term DIVIDE term
-         | term POWER term
-    """
-    if p[2] == '/':
-        if p[3] != 0:   p[0] = (p[2], p[1], p[3])
-        else:
-            raise  ZeroDivisionError("cannot divide by zero")
-    else:   p[0] = (p[2], p[1], p[3])
-
-
-# unary minus
-# probably better way to write
-def p_term_uminus(p):
-    """
-    term : MINUS term %prec UMINUS
-    """
-    p[0] = ('*', p[2], '-1')
-
-def p_term_group(p):
-    """
-    term : LPAREN term RPAREN
-         | LPAREN term COMMA term RPAREN
-    """
-    if p[3] == ',':   p[0] = (p[2], p[4])
-    else:   p[0] = p[2]
-
-def p_differential(p):
-    """
-    term : term PRIME
-         | LPAREN term RPAREN PRIME
-    """
-    if p[1] == '(': p[0] = ('differential', p[2])
-    else:   p[0] = ('differential', p[1])
+    if p[1] == '[': p[0] = nodes.Box(p[2], p[4])
+    else:   p[0] = nodes.Diamond(p[2], p[4])
 
-def p_term_numeric_value(p):
-    """
-    term : NUM
-    """
-    p[0] = p[1]
+parser = parsing.Parser(sys.modules[__name__], 'hybrid_parser')
 
-def p_term_value(p):
-    """
-    term : ID
-    """
-    p[0] = ('IDENTIFIER', p[1])
-
-def p_formula_value(p):
-    """
-    formula : TRUE
-            | FALSE
-    """
-    if p[1] == 'true': p[0] == True
-    else:   p[0] == False
 
-def p_error(p):
-    print("p_error {}".format(p))
-    raise TypeError("unknown text at %r" % (p.value))
+def __getattr__(name):
+    # the lexer is loaded with the parser tables on first use
+    if name == 'lexer':
+        return parser.lexer
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
-parser = yacc.yacc()
 
-#uncomment below to test on the terminal
-while True:
-    try:
-        s = input('')
-    except EOFError:
-        break
-    parser.parse(s)
+if __name__ == '__main__':
+    parser.repl()
@@ -0,0 +1,235 @@
+# Grammar rules of terms, formulas and hybrid programs
+#
+#     from hybrid_rules import p_program, p_formula, ...
+#
+# hybrid_parser and dl_grammar parse the same language with different
+# lexers, so they import their rules from here. Each module defines its own
+# tokens, precedence, start symbol and the rule of the modalities, which
+# open a diamond with LDIA in hybrid_parser and with LESS in dl_grammar.
+import nodes
+import parsing
+
+def p_differential_programs(p):
+    """
+    d_programs : d_program
+               | d_program COMMA d_program
+    """
+    if len(p) == 2: p[0] = p[1]
+    else:   p[0] = nodes.Pair(p[1], p[3])
+
+def p_differential_program(p):
+    """
+    d_program : NUM
+              | ID PRIME EQ terms
+    """
+    if len(p) == 2: p[0] = nodes.Num(p[1])
+    else:   p[0] = nodes.DiffEq(p[1], p[4])
+
+def p_programs(p):
+    """
+    programs : program
+    """
+    p[0] = p[1]
+
+
+def p_program(p):
+    """
+    program : TEST formulas SEMICOLON
+            | LCURL d_programs AND formulas RCURL
+            | LCURL program RCURL STAR %prec REPET
+            | program CHOICE program
+    """
+    if p[1] == '?': p[0] = nodes.Test(p[2])
+    elif len(p) == 6: p[0] = nodes.ODE(p[2], p[4])
+    elif len(p) == 5: p[0] = nodes.Loop(p[2])
+    else:   p[0] = nodes.Choice(p[1], p[3])
+
+def p_program_form(p):
+    """
+    program : program program
+            | LCURL program RCURL
+    """
+    if p[1] == '{': p[0] = p[2]
+    else: p[0] = nodes.Seq(p[1], p[2])
+
+def p_program_conditional(p):
+    """
+    program : IF LPAREN formulas RPAREN LCURL program RCURL ELSE LCURL program RCURL
+            | IF LPAREN formulas RPAREN LCURL program RCURL
+    """
+    if len(p) == 12: p[0] = nodes.If(p[3], p[6], p[10])
+    else:   p[0] = nodes.If(p[3], p[6], None)
+
+
+# ambiguity on the documentation P ::= a;
+# not sure what 'a' is
+# put 'a' as a variable name for now
+def p_program_assignment(p):
+    """
+    program : ID SEMICOLON
+            | ID DEFINE term SEMICOLON
+            | ID PRIME DEFINE term SEMICOLON
+    """
+    if p[2] == ';': p[0] = p[1]
+    elif p[2] == ':=': p[0] = nodes.Assign(p[1], p[3])
+    else:   p[0] = nodes.DiffAssign(p[1], p[4])
+
+
+def p_formulas(p):
+    """
+    formulas : formula
+    """
+    p[0] = p[1]
+
+def p_formula(p):
+    """
+    formula : arithmetic_formula
+            | LPAREN formula RPAREN
+    """
+    if p[1] == '(': p[0] = p[2]
+    else:   p[0] = p[1]
+
+# the left side of < is never empty, a formula starting with < is a diamond
+# in dl_grammar (hybrid_parser never lexes LESS); allowing it would give
+# every state that starts a formula a shift/reduce conflict on LESS
+def p_formula_arithmetic(p):
+    """
+    arithmetic_formula : terms EQ terms
+                       | terms NEQ terms
+                       | terms GEQ terms
+                       | terms GREATER terms
+                       | terms LEQ terms
+                       | term LESS terms
+                       | function LESS terms
+    """
+    p[0] = nodes.Compare(p[2], p[1], p[3])
+
+def p_formula_logic(p):
+    """
+    formula : formula OR formula
+            | formula AND formula
+            | NOT formula
+    """
+    if p[1] == '!': p[0] = nodes.Not('!', p[2])
+    else:   p[0] = nodes.Logic(p[2], p[1], p[3])
+
+def p_formula_quantifier(p):
+    """
+    formula : FORALL terms formula
+            | EXISTS terms formula
+    """
+    p[0] = nodes.Quantifier(p[1], p[2], p[3])
+
+def p_formula_implication(p):
+    """
+    formula : formula BIMPLY formula
+            | formula RIMPLY formula
+            | formula LIMPLY formula
+    """
+    if p[2] == '->': p[0] = nodes.Imply(p[1], p[3])
+    elif p[2] == '<-':  p[0] = nodes.Imply(p[3], p[1])
+    else:   p[0] = nodes.Iff(p[1], p[3])
+
+def p_formula_differential(p):
+    """
+    formula : LPAREN formula RPAREN PRIME
+    """
+    p[0] = nodes.Differential(p[2])
+
+def p_terms(p):
+    """
+    terms :
+          | term
+          | function
+    """
+    #when empty
+    if len(p) == 1:
+        p[0] = nodes.EMPTY
+    else:
+        p[0] = p[1]
+
+# interpreted functions have to be added
+def p_function(p):
+    """
+    function : ID LPAREN RPAREN
+             | ID LPAREN term RPAREN
+    """
+    if p[3] == ')': p[0] = nodes.Func(p[1], nodes.EMPTY)
+    else:   p[0] = nodes.Func(p[1], p[3])
+
+def p_term(p):
+    """
+    term : term PLUS term
+         | term MINUS term
+         | term STAR term
+         | term DIVIDE term
+         | term POWER term
+    """
+    if p[2] == '/' and p[3] == '0':
+        raise  ZeroDivisionError("cannot divide by zero")
+    p[0] = nodes.BinOp(p[2], p[1], p[3])
+
+
+# unary minus
+# probably better way to write
+def p_term_uminus(p):
+    """
+    term : MINUS term %prec UMINUS
+    """
+    p[0] = nodes.BinOp('*', p[2], nodes.Num('-1'))
+
+def p_term_group(p):
+    """
+    term : LPAREN term RPAREN
+         | LPAREN term COMMA term RPAREN
+    """
+    if p[3] == ',':   p[0] = nodes.Pair(p[2], p[4])
+    else:   p[0] = p[2]
+
+def p_differential(p):
+    """
+    term : term PRIME
+         | LPAREN term RPAREN PRIME
+    """
+    if p[1] == '(': p[0] = nodes.Differential(p[2])
+    else:   p[0] = nodes.Differential(p[1])
+
+def p_term_numeric_value(p):
+    """
+    term : NUM
+    """
+    p[0] = nodes.Num(p[1])
+
+def p_term_value(p):
+    """
+    term : ID
+    """
+    p[0] = nodes.Var(p[1])
+
+def p_formula_value(p):
+    """
+    formula : TRUE
+            | FALSE
+    """
+    p[0] = p[1] == 'True'
+
+# error productions, only used by Parser.parse_recover: a malformed
+# statement, block or parenthesized formula becomes a nodes.Error and
+# parsing goes on after its SEMICOLON, RCURL or RPAREN
+def p_program_error(p):
+    """
+    program : error SEMICOLON
+            | LCURL error RCURL
+    """
+    p.parser.errok()
+    p[0] = nodes.Error()
+
+def p_formula_error(p):
+    """
+    formula : LPAREN error RPAREN
+    """
+    p.parser.errok()
+    p[0] = nodes.Error()
+
+def p_error(p):
+    raise parsing.syntax_error(p)
@@ -0,0 +1,156 @@
+# Incremental reparsing of hybrid programs
+#
+#     doc = hybrid_parser.parser.parse_incremental(src)
+#     doc = doc.edit(offset, deleted_len, inserted_text)
+#     doc.tree
+#
+# A hybrid program is a sequence of top level units, statements like
+# x := 1; or {...}* and choices a ++ b between them, and its tree is
+# Seq(u1, Seq(u2, ...)) of the trees of its units. A Parsed result keeps the
+# source span and tree of every unit. An edit re-lexes and re-parses only
+# the units it touches, growing that region while it does not end on a unit
+# boundary, and shifts the spans of the units after it.
+#
+# Nodes are interned, so the trees of untouched units and every subtree that
+# comes out of the reparse unchanged are the same objects as before. When an
+# edit cannot be handled locally (a syntax error, or units that do not split
+# cleanly) the whole source is parsed again, which raises the same errors as
+# Parser.parse.
+from bisect import bisect_left, bisect_right
+
+import nodes
+
+# a unit ends after one of these tokens at nesting depth 0, unless the next
+# token continues it; STAR only ends a unit after a RCURL (a loop)
+_ENDS = frozenset(('SEMICOLON', 'RCURL', 'STAR'))
+_CONTINUES = frozenset(('STAR', 'CHOICE', 'ELSE'))
+_OPEN = frozenset(('LPAREN', 'LCURL', 'LBOX'))
+_CLOSE = frozenset(('RPAREN', 'RCURL', 'RBOX'))
+
+
+def split(types):
+    """ (start, stop) token ranges of the complete units of a list of token
+    types and the index of the incomplete rest """
+    units = []
+    depth = 0
+    first = 0
+    last = len(types) - 1
+    for i, kind in enumerate(types):
+        if kind in _OPEN:
+            depth += 1
+        elif kind in _CLOSE:
+            depth -= 1
+            if depth < 0:
+                break
+        if depth == 0 and kind in _ENDS and (i == last or types[i + 1] not in _CONTINUES) \
+                and (kind != 'STAR' or (i > 0 and types[i - 1] == 'RCURL')):
+            units.append((first, i + 1))
+            first = i + 1
+    return units, first
+
+
+class Parsed(object):
+    """ Result of an incremental parse of source
+
+    - tree is the tree of the whole source
+    - starts, ends and trees are the spans and trees of the top level units
+    - damaged is the (start, end) span of the source that was lexed again by
+      the edit that produced this result
+    """
+
+    def __init__(self, parser, source, starts, ends, trees, folds, damaged):
+        self.parser = parser
+        self.source = source
+        self.starts = starts
+        self.ends = ends
+        self.trees = trees
+        # folds[i] is the tree of units i and after
+        self.folds = folds
+        self.tree = folds[0]
+        self.damaged = damaged
+
+    def __repr__(self):
+        return '<Parsed of %d units>' % len(self.trees)
+
+    def edit(self, offset, deleted, inserted):
+        """ Parsed result of the source with deleted characters at offset
+        replaced by inserted, see reparse() """
+        return reparse(self, (offset, deleted, inserted))
+
+
+def _fold(trees, folds, stop):
+    # folds of trees[:stop] in front of folds, the folds of trees[stop:]
+    result = [None] * stop + folds
+    tail = folds[0] if folds else None
+    for i in range(stop - 1, -1, -1):
+        tail = trees[i] if tail is None else nodes.Seq(trees[i], tail)
+        result[i] = tail
+    return result
+
+def _whole(parser, source, stream):
+    # the source as a single unit, raises the errors of the full parse
+    tree = parser.parse(stream)
+    return Parsed(parser, source, [0], [len(source)], [tree], [tree], (0, len(source)))
+
+def parse(parser, source):
+    """ Parsed result of source """
+    stream = parser.lex(source)
+    units, rest = split(stream.types())
+    if not units or rest != len(stream):
+        return _whole(parser, source, stream)
+    try:
+        trees = [parser.parse(stream.slice(start, stop)) for start, stop in units]
+    except (TypeError, ZeroDivisionError):
+        return _whole(parser, source, stream)
+    starts = [stream.starts[start] for start, _ in units]
+    ends = [stream.ends[stop - 1] for _, stop in units]
+    return Parsed(parser, source, starts, ends, trees, _fold(trees, [], len(trees)),
+                  (0, len(source)))
+
+def reparse(previous, edit):
+    """ Parsed result of applying edit to the source of previous
+
+    edit is (offset, deleted_len, inserted_text). Only the units touching the
+    edited text are parsed again, previous itself is left unchanged.
+    """
+    offset, deleted, inserted = edit
+    old = previous.source
+    if offset < 0 or deleted < 0 or offset + deleted > len(old):
+        raise ValueError("edit %r outside of the source" % (edit,))
+    parser = previous.parser
+    source = old[:offset] + inserted + old[offset + deleted:]
+    delta = len(inserted) - deleted
+    starts, ends = previous.starts, previous.ends
+    n = len(starts)
+
+    # units touching the edit, or both neighbours of an edit between units
+    lo = bisect_left(ends, offset)
+    hi = bisect_right(starts, offset + deleted) - 1
+    lo, hi = max(min(lo, hi), 0), min(max(lo, hi), n - 1)
+    while True:
+        start = min(starts[lo], offset) if lo > 0 else 0
+        stop = (max(ends[hi], offset + deleted) if hi < n - 1 else len(old)) + delta
+        stream = parser.lex(source[start:stop])
+        types = stream.types()
+        units, rest = split(types)
+        if lo > 0 and types and types[0] in _CONTINUES:
+            lo -= 1
+        elif rest != len(types) and hi < n - 1:
+            hi += 1
+        else:
+            break
+
+    if rest != len(types) or (not units and n == hi - lo + 1):
+        return parse(parser, source)
+    try:
+        trees = [parser.parse(stream.slice(a, b)) for a, b in units]
+    except (TypeError, ZeroDivisionError):
+        return parse(parser, source)
+
+    trees = previous.trees[:lo] + trees + previous.trees[hi + 1:]
+    folds = _fold(trees, previous.folds[hi + 1:], lo + len(units))
+    starts = starts[:lo] + [start + stream.starts[a] for a, _ in units] + \
+        [s + delta for s in starts[hi + 1:]]
+    ends = ends[:lo] + [start + stream.ends[b - 1] for _, b in units] + \
+        [e + delta for e in ends[hi + 1:]]
+    return Parsed(parser, source, starts, ends, trees, folds, (start, stop))
@@ -0,0 +1,116 @@
+# Resource limits of a parse
+#
+# A Parser made with limits, or a parse given them, stops with a LimitError
+# as soon as the input exceeds one of them, instead of tying up the process
+# with a pathological input:
+#
+#     parser = hybrid_parser.parser.clone(limits=limits.Limits(tokens=100000,
+#                                                              depth=500, seconds=1.0))
+#     try:
+#         tree = parser.parse(src)
+#     except limits.LimitError as e:
+#         ...
+#
+# - tokens is the most tokens of the input, checked as they are read, or at
+#   once for a TokenStream
+# - depth is the most nested productions, so the term (x) is 2 deep: it
+#   bounds the depth of the tree and how far code walking it recurses
+# - seconds is the most time from the start of the parse, checked as every
+#   token is read
+#
+# Any of them may be None for no limit. The depth is recorded by the grammar
+# actions, wrapped with tables.wrap_productions: every reduction stores on
+# its symbol one more than the deepest symbol it was reduced from, and the
+# offset of its first token. A result taken from the cache of the parser is
+# returned without checks, it was parsed under the limits of the parser; a
+# parse given limits of its own does not use the cache.
+import collections
+import time
+
+import tables
+
+
+class LimitError(Exception):
+    """ A parse exceeded one of its limits
+
+    limit is the name of the field of Limits and value its bound; offset,
+    line and column are where the parse stopped, or None.
+    """
+
+    limit = None
+
+    def __init__(self, message, value, offset=None):
+        Exception.__init__(self, message)
+        self.value = value
+        self.offset = offset
+        self.line = self.column = None
+
+
+class TokenLimit(LimitError):
+    limit = 'tokens'
+
+
+class DepthLimit(LimitError):
+    limit = 'depth'
+
+
+class TimeLimit(LimitError):
+    limit = 'seconds'
+
+
+def _measure(action):
+    def measure(p):
+        action(p)
+        depth, offset = 0, None
+        for sym in p.slice[1:]:
+            depth = max(depth, getattr(sym, 'depth', 0))
+            if offset is None:
+                offset = getattr(sym, 'lexpos', None)
+        depth += 1
+        if depth > p.parser.depth_limit:
+            raise DepthLimit("nested deeper than %d" % p.parser.depth_limit,
+                             p.parser.depth_limit, offset)
+        # the offset of a nonterminal is the offset of its first token
+        sym = p.slice[0]
+        sym.depth, sym.lexpos = depth, offset
+    return measure
+
+
+class Limits(collections.namedtuple('Limits', 'tokens depth seconds')):
+    """ Limits of a parse, see the module comment """
+    __slots__ = ()
+
+    def __new__(cls, tokens=None, depth=None, seconds=None):
+        return super(Limits, cls).__new__(cls, tokens, depth, seconds)
+
+    @staticmethod
+    def productions(productions):
+        """ Copy of productions whose actions check the depth limit in the
+        depth_limit attribute of the parser """
+        return tables.wrap_productions(productions, _measure)
+
+    def check_tokens(self, stream):
+        """ Raise a TokenLimit if stream has more tokens than allowed """
+        if self.tokens is not None and len(stream) > self.tokens:
+            raise TokenLimit("more than %d tokens" % self.tokens, self.tokens,
+                             stream.starts[self.tokens])
+
+    def checked(self, tokens, started):
+        """ Iterator over tokens raising a TokenLimit at the first token over
+        the limit and a TimeLimit once seconds have passed since the
+        perf_counter time started """
+        if self.tokens is None and self.seconds is None:
+            return tokens
+        return self._checked(tokens, started)
+
+    def _checked(self, tokens, started):
+        most = self.tokens
+        end = None if self.seconds is None else started + self.seconds
+        now = time.perf_counter
+        for count, tok in enumerate(tokens, 1):
+            if most is not None and count > most:
+                raise TokenLimit("more than %d tokens" % most, most, tok.lexpos)
+            if end is not None and now() > end:
+                raise TimeLimit("no result within %g seconds" % self.seconds,
+                                self.seconds, tok.lexpos)
+            yield tok
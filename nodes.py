@@ -0,0 +1,298 @@
+# Hash-consed AST nodes
+#
+# The grammar actions build their results from the classes below instead of
+# ad-hoc tuples. Nodes are tuples (with empty __slots__, so they have no
+# instance dict) laid out exactly like the tuples the parsers produced
+# before, e.g. Var('x') == ('IDENTIFIER', 'x') and
+# BinOp('*', t, Num('-1')) == ('*', t, '-1'), so code indexing into results
+# keeps working.
+#
+# Every node is interned: constructing a node equal to an existing one
+# returns the existing object. Equal subtrees are therefore shared and two
+# interned nodes are equal exactly when they are the same object, so
+# comparing and hashing an interned node never looks further than its direct
+# children. Nodes still compare and hash by their structure: a node that is
+# no longer interned equals a new node built from the same source, it is
+# only slower to compare. The tables keep the nodes alive, so a long running
+# process interns within a scope,
+#
+#     with nodes.scope():
+#         tree = parser.parse(src)
+#         ...
+#
+# which drops the nodes interned in the block again when it is left, or
+# calls clear() when none of the nodes created so far are used anymore. A
+# tree kept past either is still valid, but no longer shared with the trees
+# built after it.
+import contextlib
+from operator import itemgetter
+
+# intern tables of Num and of every Node class, every node is its own key.
+# Children are interned, so hashing and comparing a node only looks at the
+# identity of its children and interning a node is O(1).
+_tables = []
+
+# hash of every interned node by its id, nodes have no room for it. A node
+# is interned exactly when it has an entry: the entries are made and
+# dropped together with the ones of the intern tables.
+_hashes = {}
+_tables.append(_hashes)
+
+# value of a missing term, e.g. the empty 'terms' production
+EMPTY = ()
+
+
+def clear():
+    """ Drop the interned nodes, nodes created before are no longer shared """
+    for table in _tables:
+        table.clear()
+
+def size():
+    """ Number of interned nodes """
+    return sum(len(table) for table in _tables)
+
+@contextlib.contextmanager
+def scope():
+    """ Drop the nodes interned in the with block when it is left
+
+    The nodes interned before stay shared. The tables keep their entries in
+    the order they were interned, so the nodes of the block are the last
+    ones of every table; nodes other threads intern meanwhile are dropped
+    with them. Scopes nest.
+    """
+    marks = [len(table) for table in _tables]
+    try:
+        yield
+    finally:
+        # tables of classes defined in the block start out empty
+        marks.extend([0] * (len(_tables) - len(marks)))
+        for table, mark in zip(_tables, marks):
+            for _ in range(len(table) - mark):
+                table.popitem()
+
+
+class Num(str):
+    """ Numeric literal, kept as the string of the source """
+    __slots__ = ()
+    _interned = {}
+    _tables.append(_interned)
+
+    def __new__(cls, value):
+        # Num hashes and compares like its string value
+        try:
+            return cls._interned[value]
+        except KeyError:
+            num = str.__new__(cls, value)
+            return cls._interned.setdefault(num, num)
+
+    def __reduce__(self):
+        return (self.__class__, (str(self),))
+
+
+class Node(tuple):
+    """ Base class of the interned nodes
+
+    - tag is the first item of the tuple, None for nodes whose first item
+      is an operator or a field
+    - fields name the remaining items, they are available as attributes
+    """
+    __slots__ = ()
+    tag = None
+    fields = ()
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        offset = 0 if cls.tag is None else 1
+        for i, name in enumerate(cls.fields):
+            setattr(cls, name, property(itemgetter(i + offset)))
+        cls._interned = {}
+        _tables.append(cls._interned)
+
+    def __new__(cls, *args):
+        if cls.tag is not None:
+            args = (cls.tag,) + args
+        node = tuple.__new__(cls, args)
+        # the new node is dropped again when an equal one is interned already,
+        # setdefault is atomic so two threads creating the same node share it
+        interned = cls._interned.setdefault(node, node)
+        if interned is node:
+            _hashes[id(node)] = _hash(node)
+        return interned
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Node):
+            return tuple.__eq__(self, other)
+        return _equal(self, other)
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def __hash__(self):
+        h = _hashes.get(id(self))
+        return _hash(self) if h is None else h
+
+    def __reduce__(self):
+        args = tuple(self)
+        if self.tag is not None:
+            args = args[1:]
+        return (self.__class__, args)
+
+    def __repr__(self):
+        return tuple.__repr__(self)
+
+    @property
+    def children(self):
+        """ Items of the node after its tag or operator """
+        if self.tag is not None or self.fields[0] == 'op':
+            return self[1:]
+        return tuple(self)
+
+
+def _hash(tree):
+    # hash of the items of tree, with the hashes of its nodes in place of
+    # them, computed bottom-up for the nodes that are not interned
+    hashes = {}
+    stack = [(tree, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            hashes[id(node)] = hash(tuple(
+                _hashes.get(id(a), hashes.get(id(a))) if isinstance(a, Node) else a
+                for a in node))
+        elif id(node) not in hashes:
+            stack.append((node, True))
+            stack.extend((a, False) for a in node
+                         if isinstance(a, Node) and id(a) not in _hashes)
+    return hashes[id(tree)]
+
+def _equal(a, b):
+    # structural equality of the nodes a and b, without recursion
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        if a is b:
+            continue
+        if isinstance(a, Node) and isinstance(b, Node):
+            if type(a) is not type(b) or len(a) != len(b):
+                return False
+            # two interned nodes are equal only when they are the same object
+            if id(a) in _hashes and id(b) in _hashes:
+                return False
+            stack.extend(zip(a, b))
+        elif a != b:
+            return False
+    return True
+
+
+# terms
+
+class Var(Node):
+    tag = 'IDENTIFIER'
+    fields = ('name',)
+
+class BinOp(Node):
+    """ op is one of + - * / ^, unary minus is BinOp('*', t, Num('-1')) """
+    fields = ('op', 'left', 'right')
+
+class Differential(Node):
+    tag = 'differential'
+    fields = ('arg',)
+
+class Pair(Node):
+    """ (first, second) of a term group and of a differential equation system """
+    fields = ('first', 'second')
+
+class Func(Node):
+    """ Function application, arg is EMPTY for constant symbols f() """
+    tag = 'function'
+    fields = ('name', 'arg')
+
+# formulas
+
+class Compare(Node):
+    """ op is one of = != > >= < <= """
+    fields = ('op', 'left', 'right')
+
+class Not(Node):
+    fields = ('op', 'arg')
+
+class Logic(Node):
+    """ op is & or | (and or for boolean_parser) """
+    fields = ('op', 'left', 'right')
+
+class Imply(Node):
+    tag = 'imply'
+    fields = ('left', 'right')
+
+class Iff(Node):
+    tag = 'iff'
+    fields = ('left', 'right')
+
+class Quantifier(Node):
+    """ op is \\forall or \\exists """
+    fields = ('op', 'vars', 'body')
+
+class Box(Node):
+    tag = 'box'
+    fields = ('program', 'body')
+
+class Diamond(Node):
+    tag = 'dia'
+    fields = ('program', 'body')
+
+# hybrid programs
+
+class Test(Node):
+    tag = '?'
+    fields = ('cond',)
+
+class Assign(Node):
+    tag = 'define'
+    fields = ('var', 'term')
+
+class DiffAssign(Node):
+    tag = 'differential'
+    fields = ('var', 'term')
+
+class DiffEq(Node):
+    """ var' = term in a differential equation system """
+    tag = 'differential'
+    fields = ('var', 'term')
+
+class ODE(Node):
+    tag = 'continuous_ev'
+    fields = ('system', 'domain')
+
+class Choice(Node):
+    tag = 'choice'
+    fields = ('left', 'right')
+
+class Seq(Node):
+    fields = ('first', 'second')
+
+class Loop(Node):
+    tag = 'repetition'
+    fields = ('body',)
+
+class If(Node):
+    """ other is None without an else branch """
+    tag = 'if'
+    fields = ('cond', 'then', 'other')
+
+# recovery
+
+class Error(Node):
+    """ Placeholder of source that failed to parse, see Parser.parse_recover """
+    tag = 'error'
+
+
+def to_tuple(node):
+    """ Plain nested tuples and strings equal to node, without sharing """
+    if isinstance(node, Num):
+        return str(node)
+    if isinstance(node, tuple):
+        return tuple(to_tuple(n) for n in node)
+    return node
@@ -0,0 +1,335 @@
+# Batched evaluation of terms and formulas with NumPy
+#
+#     f = numeval.compile_term(terms_parser.parser.parse('v^2 / (2*b) + x'))
+#     f({'v': vs, 'b': bs, 'x': xs})    # one value per row
+#
+#     safe = numeval.compile_formula(formulas_parser.parser.parse('x > 0 & v <= 2*b'))
+#     safe({'x': xs, 'v': vs, 'b': bs}) # boolean mask of the rows
+#
+# compile_term turns a term into a short register program of NumPy ufunc
+# calls, once. Literals are folded into constants at compile time, so a
+# subterm without variables costs nothing per row. A call evaluates the
+# program over the rows of the columns in chunks of CHUNK rows: every
+# intermediate result is written into a chunk sized scratch buffer with the
+# out= argument of its ufunc, so the buffers stay in cache, no temporary
+# arrays are allocated and the last instruction writes straight into the
+# result.
+#
+# compile_formula compiles every comparison of a quantifier free formula
+# into such a program with the comparison as its last instruction, and
+# combines their masks with the connectives. & and | short-circuit: the
+# right operand is only evaluated at the rows the left one left undecided,
+# gathered into shorter columns when fewer than half of the rows remain.
+# Chains of the same connective are flattened, so long conjunctions do not
+# nest.
+#
+# Arithmetic is IEEE floating point like NumPy's: division by zero gives inf
+# or nan instead of raising, and no warnings are printed for it.
+import numpy as np
+
+import nodes
+import postfix
+
+# rows per chunk, a scratch buffer of a chunk takes 128 KiB and fits in L2
+CHUNK = 16384
+
+_UFUNCS = {
+    postfix.ADD: np.add,
+    postfix.SUB: np.subtract,
+    postfix.MUL: np.multiply,
+    postfix.DIV: np.true_divide,
+    postfix.POW: np.power,
+}
+
+_FOLD = {
+    postfix.ADD: lambda a, b: a + b,
+    postfix.SUB: lambda a, b: a - b,
+    postfix.MUL: lambda a, b: a * b,
+    postfix.DIV: lambda a, b: np.true_divide(a, b),
+    postfix.POW: lambda a, b: np.power(a, b),
+}
+
+_COMPARISONS = {
+    '=': np.equal,
+    '!=': np.not_equal,
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '<': np.less,
+    '<=': np.less_equal,
+}
+
+_CONNECTIVES = {'&': 'and', 'and': 'and', '|': 'or', 'or': 'or'}
+
+# operand kinds of the register program
+_CONST, _COLUMN, _TEMP, _OUT = range(4)
+
+
+def _columns(names, env, rows):
+    # float columns of the names in env and their number of rows
+    columns = [np.asarray(env[name], dtype=float) for name in names]
+    counts = set(len(column) for column in columns)
+    if len(counts) > 1:
+        raise ValueError("columns of different lengths %r" % sorted(counts))
+    if counts:
+        return columns, counts.pop()
+    if rows is None:
+        raise ValueError("rows is needed without variables")
+    return columns, rows
+
+
+class _Compiler(object):
+    """ Translates terms to register programs, see compile_term
+
+    The operands on the stack are (kind, value): a constant, a column of the
+    input, a scratch buffer or the result. names is shared by the programs
+    of a formula, so their columns are indexed alike.
+    """
+
+    def __init__(self, names=None):
+        self.names = [] if names is None else names
+        self.code = []
+        self.temps = 0
+        self._free = []
+
+    def column(self, name):
+        if name not in self.names:
+            self.names.append(name)
+        return (_COLUMN, self.names.index(name))
+
+    def temp(self, *operands):
+        """ Scratch buffer for the result of an instruction on operands,
+        reusing the buffer of an operand, whose value is consumed """
+        temps = [value for kind, value in operands if kind == _TEMP]
+        if temps:
+            self._free.extend(temps[1:])
+            return (_TEMP, temps[0])
+        if self._free:
+            return (_TEMP, self._free.pop())
+        self.temps += 1
+        return (_TEMP, self.temps - 1)
+
+    def binary(self, op, a, b):
+        """ Operand of op applied to operands a and b """
+        if a[0] == _CONST and b[0] == _CONST:
+            with np.errstate(all='ignore'):
+                return (_CONST, float(_FOLD[op](a[1], b[1])))
+        dest = self.temp(a, b)
+        self.code.append((_UFUNCS[op], a, b, dest))
+        return dest
+
+    def term(self, tree):
+        """ Operand of the value of the term tree """
+        if tree is nodes.EMPTY:
+            raise TypeError("cannot evaluate an empty term")
+        code = postfix.encode(tree)
+        stack = []
+        for op, arg in zip(code.ops, code.args):
+            if op == postfix.VAR:
+                stack.append(self.column(code.names[arg]))
+            elif op == postfix.NUM:
+                stack.append((_CONST, code.consts[arg]))
+            elif op in _UFUNCS:
+                b = stack.pop()
+                stack.append(self.binary(op, stack.pop(), b))
+            else:
+                raise TypeError("cannot evaluate %s in a term" % postfix.OPNAMES[op])
+        return stack.pop()
+
+    def columns(self):
+        """ Indexes of the columns the code reads """
+        return frozenset(value for _, a, b, _ in self.code
+                         for kind, value in (a, b) if kind == _COLUMN)
+
+    def finish(self, result):
+        """ Program whose result is the operand result """
+        code = list(self.code)
+        if code and code[-1][3] == result:
+            # the last instruction writes into the result
+            ufunc, a, b, _ = code[-1]
+            code[-1] = (ufunc, a, b, (_OUT, 0))
+            result = (_OUT, 0)
+        return Program(self.names, code, self.temps, result)
+
+
+class Program(object):
+    """ Compiled batched evaluator of a term, call it with a mapping from the
+    variable names to equally long 1-D arrays or sequences
+
+    - names are the variables the program reads
+    - code is its list of (ufunc, operand, operand, destination)
+    - temps is the number of scratch buffers it needs
+    """
+
+    def __init__(self, names, code, temps, result):
+        self.names = names
+        self.code = code
+        self.temps = temps
+        self.result = result
+
+    def __repr__(self):
+        return '<Program of %d instructions over %r>' % (len(self.code), self.names)
+
+    def __call__(self, env, rows=None, chunk=CHUNK):
+        """ Array of the value of every row of env, rows is needed when the
+        term has no variables """
+        columns, count = _columns(self.names, env, rows)
+        out = np.empty(count)
+        kind, value = self.result
+        if kind == _CONST:
+            out.fill(value)
+        elif kind == _COLUMN:
+            out[:] = columns[value]
+        else:
+            self.run(columns, out, chunk)
+        return out
+
+    def run(self, columns, out, chunk=CHUNK):
+        """ Evaluate the code into out over the rows of columns, indexed like
+        names; the columns the code does not read may be None """
+        count = len(out)
+        buffers = [np.empty(min(chunk, count)) for _ in range(self.temps)]
+        code = self.code
+        with np.errstate(all='ignore'):
+            for start in range(0, count, chunk):
+                stop = min(start + chunk, count)
+                regs = ([None], [c if c is None else c[start:stop] for c in columns],
+                        [b[:stop - start] for b in buffers], [out[start:stop]])
+                for ufunc, a, b, dest in code:
+                    ufunc(a[1] if a[0] == _CONST else regs[a[0]][a[1]],
+                          b[1] if b[0] == _CONST else regs[b[0]][b[1]],
+                          out=regs[dest[0]][dest[1]])
+
+
+def compile_term(tree):
+    """ Program evaluating the term tree over batches of states
+
+    Terms are built from variables, numbers and + - * / ^, unary minus
+    included; other items raise a TypeError.
+    """
+    compiler = _Compiler()
+    return compiler.finish(compiler.term(tree))
+
+
+# A compiled formula is a tuple (kind, columns it reads, ...):
+#   ('const', _, value), ('atom', _, program), ('not', _, f),
+#   ('and', _, [f, ...]), ('or', _, [f, ...]), ('imply', _, f, g), ('iff', _, f, g)
+
+def _chain(tree, op):
+    # operands of a chain of op, iteratively as chains nest on the right
+    operands = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, nodes.Logic) and _CONNECTIVES[node.op] == op:
+            stack.append(node.right)
+            stack.append(node.left)
+        else:
+            operands.append(node)
+    return operands
+
+def _formula(tree, names):
+    if tree is True or tree is False:
+        return ('const', frozenset(), tree)
+    if isinstance(tree, nodes.Compare):
+        compiler = _Compiler(names)
+        a = compiler.term(tree.left)
+        b = compiler.term(tree.right)
+        if a[0] == _CONST and b[0] == _CONST:
+            return ('const', frozenset(), bool(_COMPARISONS[tree.op](a[1], b[1])))
+        compiler.code.append((_COMPARISONS[tree.op], a, b, (_OUT, 0)))
+        return ('atom', compiler.columns(), Program(names, compiler.code, compiler.temps, (_OUT, 0)))
+    if isinstance(tree, nodes.Not):
+        f = _formula(tree.arg, names)
+        return ('not', f[1], f)
+    if isinstance(tree, nodes.Logic):
+        op = _CONNECTIVES[tree.op]
+        operands = [_formula(node, names) for node in _chain(tree, op)]
+        return (op, frozenset().union(*[f[1] for f in operands]), operands)
+    if isinstance(tree, (nodes.Imply, nodes.Iff)):
+        f = _formula(tree.left, names)
+        g = _formula(tree.right, names)
+        return ('imply' if isinstance(tree, nodes.Imply) else 'iff', f[1] | g[1], f, g)
+    if isinstance(tree, nodes.Quantifier):
+        raise TypeError("cannot compile the quantifier %s, only quantifier free formulas"
+                        % tree.op)
+    if isinstance(tree, (nodes.Box, nodes.Diamond)):
+        raise TypeError("cannot compile a modality, only quantifier free formulas")
+    raise TypeError("cannot compile %r as a formula" % (tree,))
+
+def _evaluate(f, columns, count, chunk):
+    # boolean mask of the compiled formula f over columns of count rows
+    kind = f[0]
+    if kind == 'const':
+        return np.full(count, f[2])
+    if kind == 'atom':
+        out = np.empty(count, dtype=bool)
+        f[2].run(columns, out, chunk)
+        return out
+    if kind == 'not':
+        return np.logical_not(_evaluate(f[2], columns, count, chunk))
+    if kind == 'iff':
+        return np.equal(_evaluate(f[2], columns, count, chunk),
+                        _evaluate(f[3], columns, count, chunk))
+    if kind == 'imply':
+        # f -> g is !f | g
+        kind, operands = 'or', [('not', f[2][1], f[2]), f[3]]
+    else:
+        operands = f[2]
+    result = _evaluate(operands[0], columns, count, chunk)
+    for g in operands[1:]:
+        # the rows still undecided: true rows of a conjunction, false rows of
+        # a disjunction
+        undecided = result if kind == 'and' else ~result
+        left = np.count_nonzero(undecided)
+        if not left:
+            break
+        if 2 * left >= count:
+            # too many rows left to gather them, evaluate g at every row
+            if kind == 'and':
+                result &= _evaluate(g, columns, count, chunk)
+            else:
+                result |= _evaluate(g, columns, count, chunk)
+        else:
+            rows = np.flatnonzero(undecided)
+            gathered = [c[rows] if i in g[1] else None for i, c in enumerate(columns)]
+            result[rows] = _evaluate(g, gathered, left, chunk)
+    return result
+
+
+class Predicate(object):
+    """ Compiled batched evaluator of a quantifier free formula, called like
+    a Program it returns a boolean mask of the rows
+
+    - names are the variables the formula reads
+    - formula is the compiled formula, see _evaluate
+    """
+
+    def __init__(self, names, formula):
+        self.names = names
+        self.formula = formula
+
+    def __repr__(self):
+        return '<Predicate over %r>' % (self.names,)
+
+    def __call__(self, env, rows=None, chunk=CHUNK):
+        """ Boolean array of the value of the formula at every row of env,
+        rows is needed when the formula has no variables """
+        columns, count = _columns(self.names, env, rows)
+        out = np.empty(count, dtype=bool)
+        for start in range(0, count, chunk):
+            stop = min(start + chunk, count)
+            out[start:stop] = _evaluate(self.formula, [c[start:stop] for c in columns],
+                                        stop - start, chunk)
+        return out
+
+
+def compile_formula(tree):
+    """ Predicate evaluating the quantifier free formula tree over batches of
+    states
+
+    Formulas are comparisons of terms (see compile_term), True and False
+    combined with ! & | -> <- and <->; quantifiers, modalities and other
+    items raise a TypeError.
+    """
+    names = []
+    return Predicate(names, _formula(tree, names))
@@ -1,9 +1,10 @@
 # Simple parser using ply
 # logic operator syntax from KeYmaera X
-import ply.lex as lex
-import ply.yacc as yacc
 import sys
 
+import nodes
+import parsing
+
 reserved = {
     'true' : 'TRUE',
     'false' : 'FALSE',
@@ -51,18 +52,15 @@ def t_newline(t):
     t.lexer.lineno += t.value.count('\n')
 
 def t_error(t):
-    print("illegal character '%s'" % t.value[0])
+    parsing.trace(t.lexer, 'illegal', t.value[0])
     t.lexer.skip(1)
 
+# parses run on their own lexer clones, this only resets the lexer that is
+# used directly
 def reset():
+    lexer = parser.lexer
     lexer.lineno = 1
-    if lexer.lexdata is None:
-        return
-    tok = lexer.token()
-    while (tok is not None):
-        tok = lexer.token()
-
-lexer = lex.lex()
+    lexer.input('')
 
 precedence = (
     ('right', 'OR'),
@@ -82,7 +80,8 @@ def p_formula_logic(p):
             | formula OR formula
             | formula AND formula
     """
-    p[0] = ('=', ('IDENTIFIER' ,p[1]), p[3])
+    if p[1] == '!': p[0] = nodes.Not('!', p[2])
+    else:   p[0] = nodes.Logic(p[2], p[1], p[3])
 
 def p_comparison(p):
     """
@@ -93,7 +92,7 @@ def p_comparison(p):
             | terms LESS terms
             | terms LEQ terms
     """
-    p[0] = (p[2], p[1], p[3])
+    p[0] = nodes.Compare(p[2], p[1], p[3])
 
 def p_boolean_value(p):
     """
@@ -108,7 +107,7 @@ def p_term(p):
     terms :
           | term
     """
-    if len(p) == 1: p[0] = p[1]
+    if len(p) == 1: p[0] = nodes.EMPTY
     else:   p[0] = p[1]
 
 def p_arithmetic(p):
@@ -119,12 +118,9 @@ def p_arithmetic(p):
          | term DIVIDE term
          | term POWER term
     """
-    if p[1] == '!': p[0] = ('!', p[2])
-    elif p[2] == '/':
-        if p[3] != '0':   p[0] = (p[2], p[1], p[3])
-        else:
-            raise  ZeroDivisionError("cannot divide by zero")
-    else:   p[0] = (p[2], p[1], p[3])
+    if p[2] == '/' and p[3] == '0':
+        raise  ZeroDivisionError("cannot divide by zero")
+    p[0] = nodes.BinOp(p[2], p[1], p[3])
 
 # assigning negative value instead of subtracting
 # probably better way to write
@@ -132,13 +128,13 @@ def p_uminus(p):
     """
     term : MINUS term %prec UMINUS
     """
-    p[0] = ('*', p[2], '-1')
+    p[0] = nodes.BinOp('*', p[2], nodes.Num('-1'))
 
 def p_term_differential(p):
     """
     term : LPAREN term RPAREN PRIME
     """
-    p[0] = ('DIFFERENTIAL', p[2])
+    p[0] = nodes.Differential(p[2])
 
 def p_term_group(p):
     """
@@ -146,31 +142,33 @@ def p_term_group(p):
          | LPAREN term COMMA term RPAREN
     """
     if p[3] == ')': p[0] = p[2]
-    else:   p[0] = (p[2], p[4])
+    else:   p[0] = nodes.Pair(p[2], p[4])
 
 def p_numeric_term(p):
     """
     term : NUM
     """
-    p[0] = p[1]
+    p[0] = nodes.Num(p[1])
 
 def p_variable_term(p):
     """
     term : ID
     """
-    p[0] = ('IDENTIFIER', p[1])
+    p[0] = nodes.Var(p[1])
 
 
 def p_error(p):
-    print("p_error {}".format(p))
-    raise TypeError("unknown text at %r" % (p.value))
-
-parser = yacc.yacc()
-
-# TODO: Here we need to define a parse class, not start parsing right away!
-# while True:
-#     try:
-#         s = input('')
-#     except EOFError:
-#         break
-#     parser.parse(s)
+    raise parsing.syntax_error(p)
+
+parser = parsing.Parser(sys.modules[__name__], 'parser')
+
+
+def __getattr__(name):
+    # the lexer is loaded with the parser tables on first use
+    if name == 'lexer':
+        return parser.lexer
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if __name__ == '__main__':
+    parser.repl()
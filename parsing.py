@@ -0,0 +1,368 @@
+# Parser objects for the grammar modules
+#
+# Every grammar module exposes a Parser as its module level 'parser'. Its
+# tables are loaded on first use, so importing a grammar module has no side
+# effects. Nothing is printed while parsing; results, errors and illegal
+# characters are reported to an optional trace hook instead.
+#
+# PLY keeps the state of a parse in the lexer and in the LRParser object, so
+# neither can be shared by two parses running at the same time. Every parse
+# checks out its own lexer clone and LRParser copy from a pool of idle
+# states and returns it afterwards, which makes Parser.parse reentrant and
+# safe to call from several threads.
+import collections
+import copy
+import itertools
+import sys
+import threading
+import time
+
+import ply.lex as lex
+
+import archive
+import bulk
+import cache
+import incremental
+import limits as limits_module
+import postfix
+import pratt
+import recover
+import serialize
+import spans
+import symbols
+import tables
+import tokenstream
+
+
+def trace(lexer, event, value):
+    """ Report event to the trace hook of the parse using lexer, if any """
+    hook = getattr(lexer, 'trace', None)
+    if hook is not None:
+        hook(event, value)
+
+def syntax_error(p):
+    """ TypeError for the p_error rule of a grammar at token p
+
+    The error has the offset and line of the token, or None at the end of
+    the input, Parser.parse adds the column.
+    """
+    if p is None:
+        error = TypeError("unexpected end of input")
+        error.offset = error.line = None
+    else:
+        error = TypeError("unknown text at %r" % (p.value,))
+        error.offset, error.line = p.lexpos, p.lineno
+    return error
+
+def _locate(error, s):
+    # line and column of a syntax or limit error in s, a string or a TokenStream
+    offset = getattr(error, 'offset', None)
+    if offset is None:
+        return
+    if isinstance(s, tokenstream.TokenStream):
+        error.line, error.column = s.position(offset)
+    else:
+        if getattr(error, 'line', None) is None:
+            error.line = s.count('\n', 0, offset) + 1
+        error.column = offset - s.rfind('\n', 0, offset)
+
+
+_MISSING = object()
+
+def _sentinel(start):
+    # empty token of type start at the beginning of the input
+    tok = lex.LexToken()
+    tok.type = tok.value = start
+    tok.lineno = 1
+    tok.lexpos = tok.lexend = 0
+    return tok
+
+
+class Parser(object):
+    """ Parser for the grammar defined in module
+
+    - name is the name of the grammar in the _tables package
+    - trace is called as trace(event, value) for every 'result' of a parse
+      and every 'illegal' character skipped by the lexer
+    - cache_size enables a cache.LRUCache of the results of that many
+      distinct token streams, available as the cache attribute
+    - engine is 'lalr' for PLY's LRParser or 'pratt' for the faster
+      pratt.Pratt engine of the grammars in pratt.DIALECTS
+    - cache_dir enables a serialize.DiskCache of the trees of the files
+      parse_file() parsed, available as the disk_cache attribute; a parser
+      with limits does not use it
+    - limits is a limits.Limits on the tokens, depth and time of every parse,
+      which raises a limits.LimitError when exceeded
+    - symbols computes the symbols.Symbols of every node of a tree as part
+      of its parse
+    """
+
+    def __init__(self, module, name, trace=None, cache_size=None, engine='lalr',
+                 cache_dir=None, limits=None, symbols=False):
+        self.module = module
+        self.name = name
+        self.trace = trace
+        self.cache = cache.LRUCache(cache_size) if cache_size else None
+        self.disk_cache = serialize.DiskCache(cache_dir) if cache_dir else None
+        if engine == 'pratt':
+            self._pratt = pratt.engine(module, name)
+        elif engine == 'lalr':
+            self._pratt = None
+        else:
+            raise ValueError("unknown engine %r" % (engine,))
+        self.engine = engine
+        self.limits = limits
+        self.symbols = symbols
+        self._lexer = None
+        self._yacc = None
+        self._span_productions = None
+        # productions with wrapped actions by (depth limit, symbols)
+        self._wrapped = {}
+        self._lock = threading.Lock()
+        # idle (lexer, LRParser) pairs, deque.append and pop are atomic
+        self._idle = collections.deque()
+
+    @property
+    def lexer(self):
+        """ Lexer of the grammar, parses use their own clones of it """
+        if self._lexer is None:
+            self.load()
+        return self._lexer
+
+    @property
+    def yacc(self):
+        """ LRParser of the grammar, parses use their own copies of it """
+        if self._yacc is None:
+            self.load()
+        return self._yacc
+
+    def load(self):
+        """ Load the tables now instead of on the first parse """
+        with self._lock:
+            if self._yacc is None:
+                self._lexer = tables.lexer(self.module, self.name)
+                self._yacc = tables.parser(self.module, self.name)
+        return self
+
+    def clone(self, trace=None, cache_size=None, engine=None, cache_dir=None, limits=None,
+              symbols=None):
+        """ New Parser for the same grammar sharing the loaded tables """
+        other = Parser(self.module, self.name, trace if trace is not None else self.trace,
+                       cache_size, engine or self.engine, cache_dir,
+                       limits if limits is not None else self.limits,
+                       symbols if symbols is not None else self.symbols)
+        self.load()
+        other._lexer = self._lexer.clone()
+        other._yacc = copy.copy(self._yacc)
+        return other
+
+    def _checkout(self):
+        try:
+            return self._idle.pop()
+        except IndexError:
+            # the copies share the tables, only the parse state is private
+            return self.lexer.clone(), copy.copy(self.yacc)
+
+    def lex(self, s, trace=None):
+        """ tokenstream.TokenStream of s, which parse() accepts instead of s """
+        if trace is None:
+            trace = self.trace
+        state = self._checkout()
+        lexer = state[0]
+        lexer.lineno = 1
+        lexer.trace = trace
+        try:
+            return tokenstream.lex(lexer, s)
+        finally:
+            lexer.trace = None
+            self._idle.append(state)
+
+    def parse(self, s, trace=None, start=None, limits=None):
+        """ Tree of s, a string or a TokenStream of the grammar
+
+        start is a token type fed to the parser before the tokens of s, for
+        grammars that select what to parse with sentinel tokens (see
+        dl_grammar). limits replaces the limits of the parser for this parse,
+        which then does not use the cache: its results were parsed under the
+        limits of the parser.
+        """
+        if trace is None:
+            trace = self.trace
+        cached = self.cache is not None and (limits is None or limits == self.limits)
+        if limits is None:
+            limits = self.limits
+        started = time.perf_counter()
+        state = self._checkout()
+        lexer, yacc = state
+        lexer.lineno = 1
+        lexer.trace = trace
+        stream = None
+        depth = limits.depth if limits is not None else None
+        productions = self._productions(depth is not None)
+        if productions is not None:
+            yacc.productions = productions
+            yacc.depth_limit = depth
+        try:
+            if isinstance(s, tokenstream.TokenStream):
+                if s.names != tokenstream.names(lexer):
+                    raise ValueError("token stream of another grammar")
+                stream = s
+            elif cached or self._pratt is not None or start is not None:
+                stream = tokenstream.lex(lexer, s)
+            if stream is None and limits is None:
+                result = yacc.parse(s, lexer=lexer)
+            elif stream is None:
+                lexer.input(s)
+                tokens = limits.checked(iter(lexer.token, None), started)
+                result = yacc.parse(lexer=lexer, tokenfunc=lambda: next(tokens, None))
+            else:
+                result = self._parse_stream(stream, lexer, yacc, start, limits, started,
+                                            cached)
+        except (TypeError, limits_module.LimitError) as e:
+            _locate(e, stream or s)
+            raise
+        finally:
+            if productions is not None:
+                yacc.productions = self.yacc.productions
+                yacc.depth_limit = None
+            lexer.trace = None
+            self._idle.append(state)
+        if self.symbols:
+            # the actions did not run for a cached result or the pratt engine
+            symbols.symbols(result)
+        if trace is not None:
+            trace('result', result)
+        return result
+
+    def _parse_stream(self, stream, lexer, yacc, start=None, limits=None, started=None,
+                      cached=True):
+        # the stream gives the cache key, the parser reads it on a miss
+        if limits is not None:
+            limits.check_tokens(stream)
+        if self.cache is None or not cached:
+            return self._parse_tokens(stream, lexer, yacc, start, limits, started)
+        key = cache.token_key(stream)
+        if start is not None:
+            key = start + ' ' + key
+        result = self.cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = self._parse_tokens(stream, lexer, yacc, start, limits, started)
+            self.cache.put(key, result)
+        return result
+
+    def _parse_tokens(self, stream, lexer, yacc, start=None, limits=None, started=None):
+        if self._pratt is not None:
+            if start is not None:
+                raise ValueError("the pratt engine has no start tokens")
+            if limits is not None and (limits.depth is not None or limits.seconds is not None):
+                raise ValueError("the pratt engine has no depth or time limits")
+            try:
+                return self._pratt.parse(stream)
+            except RecursionError:
+                # nested deeper than the recursion limit, the LRParser
+                # builds the same tree without recursing
+                pass
+            except ZeroDivisionError:
+                # the LRParser runs the division action only once it has read
+                # the token after the divisor, the input may be a syntax
+                # error before that
+                pass
+        tokens = stream.lextokens()
+        if limits is not None:
+            tokens = limits.checked(tokens, started)
+        if start is not None:
+            tokens = itertools.chain([_sentinel(start)], tokens)
+        return yacc.parse(lexer=lexer, tokenfunc=lambda: next(tokens, None))
+
+    def _productions(self, depth):
+        # productions whose actions check the depth limit and compute the
+        # symbols as asked, None for the plain ones
+        if not depth and not self.symbols:
+            return None
+        key = (depth, self.symbols)
+        productions = self._wrapped.get(key)
+        if productions is None:
+            productions = self.yacc.productions
+            if self.symbols:
+                productions = symbols.productions(productions)
+            if depth:
+                productions = limits_module.Limits.productions(productions)
+            self._wrapped[key] = productions
+        return productions
+
+    def parse_spans(self, s):
+        """ (tree, spans.Spans) of s, the source span of every item of the
+        tree in postfix order """
+        state = self._checkout()
+        lexer, yacc = state
+        lexer.lineno = 1
+        stream = s if isinstance(s, tokenstream.TokenStream) else tokenstream.lex(lexer, s)
+        if self._span_productions is None:
+            self._span_productions = spans.productions(self.yacc)
+        tokens = stream.lextokens()
+        yacc.productions = self._span_productions
+        try:
+            tree = yacc.parse(lexer=lexer, tokenfunc=lambda: next(tokens, None))
+            return tree, spans.flatten(tree, yacc.shadow)
+        except TypeError as e:
+            _locate(e, stream)
+            raise
+        finally:
+            yacc.productions = self.yacc.productions
+            yacc.shadow = None
+            self._idle.append(state)
+
+    def parse_recover(self, s, trace=None):
+        """ (tree, diagnostics) of s, going on after syntax errors, see recover
+
+        The parts of s that fail to parse are nodes.Error in the tree and
+        every error is a recover.Diagnostic.
+        """
+        if trace is None:
+            trace = self.trace
+        state = self._checkout()
+        lexer, yacc = state
+        lexer.lineno = 1
+        errorfunc = yacc.errorfunc
+        try:
+            result = recover.parse(s, lexer, yacc, trace)
+        finally:
+            yacc.errorfunc = errorfunc
+            lexer.trace = None
+            self._idle.append(state)
+        if trace is not None:
+            trace('result', result[0])
+        return result
+
+    def parse_file(self, path, trace=None):
+        """ Tree of the file at path, lexed over a memory map of it, or
+        loaded from the disk cache when it was parsed before """
+        return archive.parse_file(self, path, trace)
+
+    def parse_archive(self, path):
+        """ archive.Archive of the .kyx file at path, its entries are parsed
+        on demand """
+        return archive.Archive(self, path)
+
+    def parse_incremental(self, s):
+        """ incremental.Parsed result of s, which edits reparse in part """
+        return incremental.parse(self, s)
+
+    def parse_postfix(self, s, trace=None):
+        """ Parse s into a flat postfix.Postfix program instead of a tree """
+        return postfix.encode(self.parse(s, trace))
+
+    def parse_many(self, iterable, workers=None, chunksize=64, ordered=True):
+        """ Parse every string of iterable on a process pool, see bulk.parse_many """
+        return bulk.parse_many(self, iterable, workers, chunksize, ordered)
+
+    def repl(self, stdin=None, stdout=None):
+        """ Parse every line of stdin and print the result """
+        stdin = stdin or sys.stdin
+        stdout = stdout or sys.stdout
+        for line in stdin:
+            try:
+                result = self.parse(line.rstrip('\n'))
+            except (TypeError, ZeroDivisionError) as e:
+                result = e
+            print(result, file=stdout)
@@ -0,0 +1,235 @@
+# Flat postfix encoding of parsed terms, formulas and programs
+#
+# A Postfix holds the tree in postfix order as an array('i') of opcodes with
+# a parallel array('i') of operands. The operand of VAR and STR is an index
+# into the string table 'names', the operand of NUM an index into 'consts'
+# (the value) and 'literals' (the source text, so decoding is lossless).
+# Passes over a Postfix iterate linearly, without recursion:
+#
+#     for op, arg in zip(code.ops, code.args):
+#         ...
+#
+# encode() and decode() are iterative as well, deeply nested trees do not
+# hit the recursion limit.
+from array import array
+
+import nodes
+
+# name, class, operator and number of children of every opcode
+_OPCODES = (
+    # leaves
+    ('VAR', nodes.Var, None, 0),
+    ('NUM', nodes.Num, None, 0),
+    ('STR', str, None, 0),
+    ('TRUE', bool, True, 0),
+    ('FALSE', bool, False, 0),
+    ('EMPTY', tuple, None, 0),
+    ('NONE', type(None), None, 0),
+    ('ERROR', nodes.Error, None, 0),
+    # terms
+    ('ADD', nodes.BinOp, '+', 2),
+    ('SUB', nodes.BinOp, '-', 2),
+    ('MUL', nodes.BinOp, '*', 2),
+    ('DIV', nodes.BinOp, '/', 2),
+    ('POW', nodes.BinOp, '^', 2),
+    ('DIFFERENTIAL', nodes.Differential, None, 1),
+    ('PAIR', nodes.Pair, None, 2),
+    ('FUNC', nodes.Func, None, 2),
+    # formulas
+    ('EQ', nodes.Compare, '=', 2),
+    ('NEQ', nodes.Compare, '!=', 2),
+    ('GREATER', nodes.Compare, '>', 2),
+    ('GEQ', nodes.Compare, '>=', 2),
+    ('LESS', nodes.Compare, '<', 2),
+    ('LEQ', nodes.Compare, '<=', 2),
+    ('NOT', nodes.Not, '!', 1),
+    ('AND', nodes.Logic, '&', 2),
+    ('OR', nodes.Logic, '|', 2),
+    ('BOOL_NOT', nodes.Not, 'not', 1),
+    ('BOOL_AND', nodes.Logic, 'and', 2),
+    ('BOOL_OR', nodes.Logic, 'or', 2),
+    ('IMPLY', nodes.Imply, None, 2),
+    ('IFF', nodes.Iff, None, 2),
+    ('FORALL', nodes.Quantifier, '\\forall', 2),
+    ('EXISTS', nodes.Quantifier, '\\exists', 2),
+    ('BOX', nodes.Box, None, 2),
+    ('DIA', nodes.Diamond, None, 2),
+    # hybrid programs
+    ('TEST', nodes.Test, None, 1),
+    ('ASSIGN', nodes.Assign, None, 2),
+    ('DIFF_ASSIGN', nodes.DiffAssign, None, 2),
+    ('DIFF_EQ', nodes.DiffEq, None, 2),
+    ('ODE', nodes.ODE, None, 2),
+    ('CHOICE', nodes.Choice, None, 2),
+    ('SEQ', nodes.Seq, None, 2),
+    ('LOOP', nodes.Loop, None, 1),
+    ('IF', nodes.If, None, 3),
+)
+
+OPNAMES = tuple(entry[0] for entry in _OPCODES)
+ARITY = tuple(entry[3] for entry in _OPCODES)
+
+# opcodes, in the order of _OPCODES
+(VAR, NUM, STR, TRUE, FALSE, EMPTY, NONE, ERROR,
+ ADD, SUB, MUL, DIV, POW, DIFFERENTIAL, PAIR, FUNC,
+ EQ, NEQ, GREATER, GEQ, LESS, LEQ, NOT, AND, OR, BOOL_NOT, BOOL_AND, BOOL_OR,
+ IMPLY, IFF, FORALL, EXISTS, BOX, DIA,
+ TEST, ASSIGN, DIFF_ASSIGN, DIFF_EQ, ODE, CHOICE, SEQ, LOOP, IF) = range(len(_OPCODES))
+assert all(globals()[name] == code for code, name in enumerate(OPNAMES))
+
+# opcode of a node class and operator
+_CODES = dict(((cls, op), code) for code, (_, cls, op, _) in enumerate(_OPCODES))
+
+
+class Postfix(object):
+    """ Postfix program of a tree, see the module comment """
+    __slots__ = ('ops', 'args', 'names', 'consts', 'literals')
+
+    def __init__(self):
+        self.ops = array('i')
+        self.args = array('i')
+        self.names = []
+        self.consts = array('d')
+        self.literals = []
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __eq__(self, other):
+        if not isinstance(other, Postfix):
+            return NotImplemented
+        return all(getattr(self, a) == getattr(other, a) for a in self.__slots__)
+
+    def __hash__(self):
+        return hash((self.ops.tobytes(), self.args.tobytes(), tuple(self.names),
+                     tuple(self.literals)))
+
+    def __repr__(self):
+        return '<Postfix of %d ops>' % len(self.ops)
+
+
+def _opcode(node):
+    if node is True:
+        return TRUE
+    if node is False:
+        return FALSE
+    if node is None:
+        return NONE
+    if isinstance(node, nodes.Node):
+        op = node[0] if node.tag is None and node.fields[0] == 'op' else None
+        code = _CODES.get((type(node), op))
+        if code is not None:
+            return code
+    elif type(node) is tuple and not node:
+        return EMPTY
+    raise TypeError("cannot encode %r" % (node,))
+
+def encode(tree):
+    """ Postfix program of tree """
+    code = Postfix()
+    ops, args = code.ops, code.args
+    names, consts, literals = {}, {}, code.literals
+
+    # (node, expanded): children are pushed before the node is emitted
+    stack = [(tree, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if isinstance(node, nodes.Num):
+            index = consts.get(node)
+            if index is None:
+                index = consts[node] = len(literals)
+                literals.append(str(node))
+                code.consts.append(float(node))
+            ops.append(NUM)
+            args.append(index)
+        elif isinstance(node, (str, nodes.Var)):
+            name = node if isinstance(node, str) else node.name
+            index = names.get(name)
+            if index is None:
+                index = names[name] = len(code.names)
+                code.names.append(name)
+            ops.append(STR if isinstance(node, str) else VAR)
+            args.append(index)
+        elif expanded or not isinstance(node, nodes.Node):
+            ops.append(_opcode(node))
+            args.append(-1)
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node.children))
+    return code
+
+def decode(code):
+    """ Tree of a Postfix program """
+    stack = []
+    names, literals = code.names, code.literals
+    for op, arg in zip(code.ops, code.args):
+        if op == VAR:
+            stack.append(nodes.Var(names[arg]))
+        elif op == NUM:
+            stack.append(nodes.Num(literals[arg]))
+        elif op == STR:
+            stack.append(names[arg])
+        elif op == TRUE:
+            stack.append(True)
+        elif op == FALSE:
+            stack.append(False)
+        elif op == EMPTY:
+            stack.append(nodes.EMPTY)
+        elif op == NONE:
+            stack.append(None)
+        elif op == ERROR:
+            stack.append(nodes.Error())
+        else:
+            arity = ARITY[op]
+            children = stack[-arity:]
+            del stack[-arity:]
+            stack.append(build(op, children))
+    if len(stack) != 1:
+        raise ValueError("malformed postfix program")
+    return stack[0]
+
+def build(op, children):
+    """ Node of the opcode op of a node with the list of its children """
+    _, cls, operator, _ = _OPCODES[op]
+    if operator is not None:
+        children.insert(0, operator)
+    return cls(*children)
+
+
+_BINARY = {
+    ADD: lambda a, b: a + b,
+    SUB: lambda a, b: a - b,
+    MUL: lambda a, b: a * b,
+    DIV: lambda a, b: a / b,
+    POW: lambda a, b: a ** b,
+    EQ: lambda a, b: a == b,
+    NEQ: lambda a, b: a != b,
+    GREATER: lambda a, b: a > b,
+    GEQ: lambda a, b: a >= b,
+    LESS: lambda a, b: a < b,
+    LEQ: lambda a, b: a <= b,
+    AND: lambda a, b: a and b,
+    OR: lambda a, b: a or b,
+    IMPLY: lambda a, b: not a or b,
+    IFF: lambda a, b: a == b,
+}
+
+def evaluate(code, env):
+    """ Value of a term or quantifier free formula for the values in env """
+    stack = []
+    names, consts = code.names, code.consts
+    for op, arg in zip(code.ops, code.args):
+        if op == VAR:
+            stack.append(env[names[arg]])
+        elif op == NUM:
+            stack.append(consts[arg])
+        elif op == TRUE or op == FALSE:
+            stack.append(op == TRUE)
+        elif op == NOT:
+            stack.append(not stack.pop())
+        elif op in _BINARY:
+            b = stack.pop()
+            stack.append(_BINARY[op](stack.pop(), b))
+        else:
+            raise ValueError("cannot evaluate %s" % OPNAMES[op])
+    return stack.pop()
@@ -0,0 +1,205 @@
+# Precedence climbing (Pratt) engine for terms and quantifier free formulas
+#
+# Parser(..., engine='pratt') parses with the functions below instead of
+# PLY's table driven LRParser. Binding powers come from the precedence
+# tuple of the grammar module and follow the way yacc resolves the
+# conflicts of that grammar, so both engines produce identical trees:
+#
+# - a binary operator of level p takes a right operand that continues with
+#   operators above p, or at p itself when the level is right associative
+# - the operand of unary minus continues with operators at or above UMINUS,
+#   so -x*y is -(x*y) but -x+y is (-x)+y
+# - PRIME has no precedence, so yacc reduces every operator before it and a
+#   postfix prime applies to the whole term up to the enclosing parenthesis:
+#   x + y' is (x + y)'
+#
+# Two grammars are supported: the terms of terms_parser and the quantifier
+# free formulas of parser. The recursion depth grows with the nesting of
+# the input, which is fine for hand written input; Parser.parse falls back
+# to the LALR engine for input nested deeper than the recursion limit, and
+# for a division by zero, which the LALR engine reports only if the input
+# parses up to the division action.
+import nodes
+
+TERM_OPERATORS = ('PLUS', 'MINUS', 'MULTIPLY', 'DIVIDE', 'POWER')
+COMPARISONS = ('EQ', 'NEQ', 'GREATER', 'GEQ', 'LESS', 'LEQ')
+CONNECTIVES = ('AND', 'OR')
+TERM_START = ('NUM', 'ID', 'MINUS', 'LPAREN')
+
+
+class Pratt(object):
+    """ Pratt parser for the grammar module of the given dialect
+
+    - 'terms' is the terms_parser grammar: an optional term or a function
+      application, with postfix primes
+    - 'formula' is the parser grammar: comparisons of optional terms combined
+      with ! & |, primes only on parenthesized terms
+    """
+
+    def __init__(self, module, dialect):
+        if dialect not in ('terms', 'formula'):
+            raise ValueError("unknown pratt dialect %r" % (dialect,))
+        self.dialect = dialect
+        self.postfix_prime = dialect == 'terms'
+        levels = {}
+        for level, entry in enumerate(module.precedence, 1):
+            for name in entry[1:]:
+                levels[name] = (level, entry[0] == 'right')
+        # level of the operand of every operator, see the module comment
+        self.binary = dict((name, (levels[name][0], levels[name][0] + (not levels[name][1])))
+                           for name in TERM_OPERATORS)
+        self.connectives = dict((name, (levels[name][0], levels[name][0] + (not levels[name][1])))
+                                for name in CONNECTIVES if name in levels)
+        self.uminus = levels['UMINUS'][0]
+        self.negation = levels['NOT'][0] if 'NOT' in levels else None
+
+    def parse(self, stream):
+        """ Tree of a tokenstream.TokenStream """
+        run = _Run(self, stream)
+        if self.dialect == 'terms':
+            result = run.terms()
+        else:
+            result = run.formula(0)
+        run.end()
+        return result
+
+
+class _Run(object):
+    # state of a single parse, types ends with None for the end of input
+
+    def __init__(self, pratt, stream):
+        self.pratt = pratt
+        self.stream = stream
+        self.types = stream.types()
+        self.types.append(None)
+        self.pos = 0
+
+    def next(self):
+        # type of the next token, the parse only needs the value of some
+        kind = self.types[self.pos]
+        if kind is None:
+            error = TypeError("unexpected end of input")
+            error.offset = error.line = None
+            raise error
+        self.pos += 1
+        return kind
+
+    def error(self, pos):
+        # Parser.parse adds the line and column like for the LALR engine
+        error = TypeError("unknown text at %r" % (self.stream.value(pos),))
+        error.offset = self.stream.starts[pos]
+        raise error
+
+    def expect(self, kind):
+        if self.next() != kind:
+            self.error(self.pos - 1)
+
+    def end(self):
+        if self.types[self.pos] is not None:
+            self.error(self.pos)
+
+    def term(self, min_level):
+        kind = self.next()
+        if kind == 'NUM':
+            left = nodes.Num(self.stream.value(self.pos - 1))
+        elif kind == 'ID':
+            left = nodes.Var(self.stream.value(self.pos - 1))
+        elif kind == 'MINUS':
+            left = nodes.BinOp('*', self.term(self.pratt.uminus), nodes.Num('-1'))
+        elif kind == 'LPAREN':
+            left = self.term(0)
+            kind = self.next()
+            if kind == 'COMMA':
+                left = nodes.Pair(left, self.term(0))
+                self.expect('RPAREN')
+            elif kind != 'RPAREN':
+                self.error(self.pos - 1)
+            elif not self.pratt.postfix_prime and self.types[self.pos] == 'PRIME':
+                self.pos += 1
+                left = nodes.Differential(left)
+        else:
+            self.error(self.pos - 1)
+
+        binary = self.pratt.binary
+        types = self.types
+        prime = self.pratt.postfix_prime and min_level == 0
+        while True:
+            kind = types[self.pos]
+            if kind == 'PRIME' and prime:
+                self.pos += 1
+                left = nodes.Differential(left)
+                continue
+            if kind not in binary:
+                return left
+            level, operand = binary[kind]
+            if level < min_level:
+                return left
+            op = self.stream.value(self.pos)
+            self.pos += 1
+            right = self.term(operand)
+            if op == '/' and right == '0':
+                raise ZeroDivisionError("cannot divide by zero")
+            left = nodes.BinOp(op, left, right)
+
+    def optional_term(self):
+        if self.types[self.pos] in TERM_START:
+            return self.term(0)
+        return nodes.EMPTY
+
+    def terms(self):
+        # terms : | term | function
+        types = self.types
+        if types[0] is None:
+            return nodes.EMPTY
+        if types[0] == 'ID' and types[1] == 'LPAREN':
+            name = self.stream.value(0)
+            self.pos = 2
+            if types[2] == 'RPAREN':
+                self.pos = 3
+                return nodes.Func(name, nodes.EMPTY)
+            arg = self.term(0)
+            self.expect('RPAREN')
+            return nodes.Func(name, arg)
+        return self.term(0)
+
+    def formula(self, min_level):
+        kind = self.types[self.pos]
+        if kind == 'NOT':
+            self.pos += 1
+            left = nodes.Not('!', self.formula(self.pratt.negation))
+        elif kind in ('TRUE', 'FALSE'):
+            left = self.stream.value(self.pos) == 'true'
+            self.pos += 1
+        else:
+            lhs = self.optional_term()
+            if self.next() not in COMPARISONS:
+                self.error(self.pos - 1)
+            op = self.stream.value(self.pos - 1)
+            left = nodes.Compare(op, lhs, self.optional_term())
+
+        connectives = self.pratt.connectives
+        while True:
+            kind = self.types[self.pos]
+            if kind not in connectives:
+                return left
+            level, operand = connectives[kind]
+            if level < min_level:
+                return left
+            op = self.stream.value(self.pos)
+            self.pos += 1
+            left = nodes.Logic(op, left, self.formula(operand))
+
+
+# dialect of the grammars with a Pratt engine
+DIALECTS = {
+    'terms_parser': 'terms',
+    'parser': 'formula',
+}
+
+def engine(module, name):
+    """ Pratt parser for the grammar name defined in module """
+    try:
+        dialect = DIALECTS[name]
+    except KeyError:
+        raise ValueError("no pratt engine for %r, use engine='lalr'" % (name,))
+    return Pratt(module, dialect)
@@ -0,0 +1,88 @@
+# Error recovering parses
+#
+#     tree, diagnostics = hybrid_parser.parser.parse_recover(src)
+#
+# Parser.parse stops at the first syntax error. parse_recover goes on and
+# returns a Diagnostic for every error in the source, with its span, next to
+# a partial tree in which the parts that failed to parse are nodes.Error
+# placeholders, which is enough to index a file that is being edited.
+#
+# The grammars have error productions for this: hybrid_parser skips a
+# malformed statement or block up to its SEMICOLON or RCURL, hybrid_parser
+# and formulas_parser skip a malformed parenthesized formula up to its
+# RPAREN. For the parse the p_error rule is replaced by one that records the
+# error and lets PLY recover with those productions instead of raising.
+# PLY gives up when an error reaches the end of the input, so the source is
+# cut into its top level units first (see incremental.split) and every unit
+# is parsed on its own; a unit that cannot be recovered becomes one Error.
+# Grammars without error productions still report their first error, with
+# an Error as the tree.
+import collections
+
+import incremental
+import nodes
+import tokenstream
+
+Diagnostic = collections.namedtuple('Diagnostic', 'message start end line column')
+
+
+def _diagnostic(stream, message, start, end):
+    line, column = stream.position(start)
+    return Diagnostic(message, start, end, line, column)
+
+def parse(stream, lexer, yacc, trace=None):
+    """ (tree, diagnostics) of stream, a TokenStream or a string, with the
+    lexer and LRParser of a parse
+
+    The errorfunc and trace of yacc and lexer are changed, the caller
+    restores them.
+    """
+    diagnostics = []
+
+    def illegal(event, value):
+        # t_error rules report the character before skipping it
+        if event == 'illegal':
+            diagnostics.append((lexer.lexpos, 'illegal character %r' % (value,), 1))
+        if trace is not None:
+            trace(event, value)
+
+    if not isinstance(stream, tokenstream.TokenStream):
+        lexer.trace = illegal
+        stream = tokenstream.lex(lexer, stream)
+    elif stream.names != tokenstream.names(lexer):
+        raise ValueError("token stream of another grammar")
+    lexer.trace = trace
+    diagnostics = [_diagnostic(stream, message, start, start + length)
+                   for start, message, length in diagnostics]
+
+    n = len(stream)
+    units, rest = incremental.split(stream.types())
+    if rest < n or not units:
+        units.append((rest, n))
+    trees = []
+    for start, stop in units:
+        unit = stream.slice(start, stop)
+        # end of input of the unit
+        end = unit.ends[-1] if len(unit) else len(stream.source)
+
+        def error(tok):
+            if tok is None:
+                diagnostics.append(_diagnostic(stream, "unexpected end of input", end, end))
+            else:
+                diagnostics.append(_diagnostic(stream, "unknown text at %r" % (tok.value,),
+                                               tok.lexpos, tok.lexend))
+
+        yacc.errorfunc = error
+        tokens = unit.lextokens()
+        try:
+            tree = yacc.parse(lexer=lexer, tokenfunc=lambda: next(tokens, None))
+        except ZeroDivisionError as e:
+            diagnostics.append(_diagnostic(stream, str(e), unit.starts[0], end))
+            tree = None
+        trees.append(nodes.Error() if tree is None else tree)
+
+    tree = trees[-1]
+    for unit_tree in reversed(trees[:-1]):
+        tree = nodes.Seq(unit_tree, tree)
+    diagnostics.sort(key=lambda d: d.start)
+    return tree, diagnostics
@@ -0,0 +1,398 @@
+# Versioned binary files of parsed trees and an on-disk cache of them
+#
+#     serialize.dump(tree, 'model.kyb')
+#     with serialize.Loaded('model.kyb') as loaded:
+#         tree = loaded.tree()                  # every node
+#         for statement in loaded.root.children:  # or only what is needed
+#             statement.node()
+#
+#     parser = hybrid_parser.parser.clone(cache_dir='~/.cache/kyx')
+#     parser.parse_file('model.kyx')            # parsed once per content
+#
+# A file holds the postfix.Postfix program of the tree (see postfix.py):
+#
+#     header   magic, FORMAT_VERSION, byte order and the section lengths
+#     ops      uint8 opcode of every item, in postfix order
+#     args     operand of every item plus one: 0 or a string or literal index
+#     starts   position of the first item of the subtree of every item
+#     strings  uint32 offsets into the UTF-8 blob of the string table, which
+#              holds the names and the literals that are no plain integers
+#     values   int64 value of every numeric literal
+#     texts    int32 string of every literal, -1 when it is str(value)
+#     blob     the UTF-8 text of the strings
+#
+# args and starts are unsigned integers of 1, 2 or 4 bytes, the fewest that
+# hold their largest value, so small trees take small files.
+#
+# Loaded maps the file and reads the sections as memoryviews of the mapping,
+# without copying them. Nodes are only built when asked for: node(i) builds
+# the subtree ending at item i, finding its children through starts, and
+# keeps every node it built, so the whole tree is never decoded to reach a
+# part of it. Views of items (root, View.children) navigate the tree
+# without building any node.
+#
+# DiskCache stores the file of every parsed source under the SHA-256 of the
+# source, the grammar hashes of its precompiled tables and FORMAT_VERSION.
+# An unchanged source is loaded instead of parsed, a changed one gets a new
+# key. Bump FORMAT_VERSION when the layout or the nodes the grammar actions
+# build change.
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+import threading
+
+from array import array
+
+import archive
+import nodes
+import postfix
+import tables
+
+FORMAT_VERSION = 1
+
+MAGIC = b'KYXB'
+
+# magic, version, byte order ('<' or '>'), typecodes of args and starts,
+# items, strings, literals, blob bytes
+_HEADER = struct.Struct('<4sHccc3xIIII4x')
+
+_INT64 = (-2 ** 63, 2 ** 63)
+
+
+def _pad(n):
+    # bytes up to the next multiple of 8
+    return -n % 8
+
+def _typecode(maximum):
+    # smallest unsigned array typecode holding maximum
+    for typecode in 'BHI':
+        if maximum < 1 << 8 * array(typecode).itemsize:
+            return typecode
+    raise ValueError("tree too large")
+
+
+def dumps(tree):
+    """ bytes of the binary file of tree """
+    code = postfix.encode(tree)
+    strings = list(code.names)
+    values = array('q')
+    texts = array('i')
+    for literal in code.literals:
+        try:
+            value = int(literal)
+        except ValueError:
+            value = None
+        if value is not None and _INT64[0] <= value < _INT64[1]:
+            values.append(value)
+            texts.append(-1 if str(value) == literal else len(strings))
+        else:
+            values.append(0)
+            texts.append(len(strings))
+        if texts[-1] != -1:
+            strings.append(literal)
+
+    # first item of the subtree of every item
+    starts = []
+    stack = []
+    for i, op in enumerate(code.ops):
+        arity = postfix.ARITY[op]
+        start = stack[-arity] if arity else i
+        if arity:
+            del stack[-arity:]
+        stack.append(start)
+        starts.append(start)
+
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = array('I', [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    blob = b''.join(encoded)
+
+    args = [arg + 1 for arg in code.args]
+    args = array(_typecode(max(args or [0])), args)
+    starts = array(_typecode(len(starts)), starts)
+    order = b'<' if sys.byteorder == 'little' else b'>'
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, order, args.typecode.encode(),
+                          starts.typecode.encode(), len(code.ops), len(strings), len(values),
+                          len(blob))]
+    for section in (array('B', code.ops).tobytes(), args.tobytes(), starts.tobytes(),
+                    offsets.tobytes(), values.tobytes(), texts.tobytes(), blob):
+        parts.append(section)
+        parts.append(b'\0' * _pad(len(section)))
+    return b''.join(parts)
+
+def dump(tree, path):
+    """ Write the binary file of tree to path, atomically """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(dumps(tree))
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+class View(object):
+    """ Item i of a Loaded file, nodes are only built by node() """
+    __slots__ = ('loaded', 'index')
+
+    def __init__(self, loaded, index):
+        self.loaded = loaded
+        self.index = index
+
+    def __repr__(self):
+        return '<View of %s at %d>' % (self.opname, self.index)
+
+    @property
+    def opname(self):
+        return postfix.OPNAMES[self.loaded.ops[self.index]]
+
+    @property
+    def children(self):
+        return [View(self.loaded, i) for i in self.loaded.children(self.index)]
+
+    def node(self):
+        return self.loaded.node(self.index)
+
+
+class Loaded(object):
+    """ Memory-mapped binary file of a tree, see the module comment
+
+    Use it as a context manager or call close() to unmap the file. data can
+    be given instead of path to read bytes of dumps().
+    """
+
+    def __init__(self, path=None, data=None):
+        self.path = path
+        self._map = archive.map_file(path) if data is None else data
+        self._views = []
+        try:
+            layout = self._layout()
+        except ValueError:
+            self.close()
+            raise
+        view = memoryview(self._map)
+        for typecode, start, end, swap in layout:
+            section = view[start:end]
+            if swap:
+                # written on a machine of the other byte order
+                swapped = array(typecode, section.tobytes())
+                swapped.byteswap()
+                section.release()
+                section = memoryview(swapped)
+            self._views.append(section.cast(typecode))
+            section.release()
+        view.release()
+        self.ops, self._args, self.starts, self._offsets, self._values, self._texts, \
+            self._blob = self._views
+        self._strings = {}
+        # built nodes by the position of their last item
+        self._nodes = {}
+
+    def _layout(self):
+        # (typecode, start, end, swap) of every section after the header
+        if len(self._map) < _HEADER.size:
+            raise ValueError("truncated tree file")
+        magic, version, order, args, starts, count, strings, literals, blob = \
+            _HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError("not a tree file")
+        if version != FORMAT_VERSION:
+            raise ValueError("tree file has version %d, expected %d" % (version, FORMAT_VERSION))
+        swap = order != (b'<' if sys.byteorder == 'little' else b'>')
+        layout = []
+        pos = _HEADER.size
+        for typecode, n in (('B', count), (args.decode(), count), (starts.decode(), count),
+                            ('I', strings + 1), ('q', literals), ('i', literals), ('B', blob)):
+            if typecode not in 'BHIiq':
+                raise ValueError("malformed tree file")
+            size = array(typecode).itemsize
+            end = pos + size * n
+            layout.append((typecode, pos, end, swap and size > 1))
+            pos = end + _pad(end - pos)
+        if layout[-1][2] > len(self._map):
+            raise ValueError("truncated tree file")
+        return layout
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """ Release the mapping, the nodes built so far stay valid """
+        for view in self._views:
+            view.release()
+        self._views = []
+        if hasattr(self._map, 'close'):
+            self._map.close()
+
+    @property
+    def root(self):
+        """ View of the whole tree """
+        return View(self, len(self.ops) - 1)
+
+    def string(self, index):
+        """ String index of the string table """
+        try:
+            return self._strings[index]
+        except KeyError:
+            data = self._blob[self._offsets[index]:self._offsets[index + 1]]
+            s = self._strings[index] = str(data, 'utf-8')
+            return s
+
+    def literal(self, index):
+        """ Num of literal index """
+        text = self._texts[index]
+        return nodes.Num(str(self._values[index]) if text == -1 else self.string(text))
+
+    def children(self, i):
+        """ Positions of the last items of the children of item i """
+        children = []
+        end = i - 1
+        for _ in range(postfix.ARITY[self.ops[i]]):
+            children.append(end)
+            end = self.starts[end] - 1
+        children.reverse()
+        return children
+
+    def _leaf(self, op, arg):
+        if op == postfix.VAR:
+            return nodes.Var(self.string(arg))
+        if op == postfix.NUM:
+            return self.literal(arg)
+        if op == postfix.STR:
+            return self.string(arg)
+        if op == postfix.TRUE or op == postfix.FALSE:
+            return op == postfix.TRUE
+        if op == postfix.EMPTY:
+            return nodes.EMPTY
+        if op == postfix.NONE:
+            return None
+        if op == postfix.ERROR:
+            return nodes.Error()
+        raise ValueError("malformed tree file, opcode %d" % op)
+
+    def node(self, i):
+        """ Tree of the subtree ending at item i """
+        built = self._nodes
+        if i in built:
+            return built[i]
+        ops = self.ops
+        # (position, expanded): the children are built before their node
+        stack = [(i, False)]
+        while stack:
+            j, expanded = stack.pop()
+            if j in built:
+                continue
+            op = ops[j]
+            if not postfix.ARITY[op]:
+                built[j] = self._leaf(op, self._args[j] - 1)
+            elif expanded:
+                built[j] = postfix.build(op, [built[k] for k in self.children(j)])
+            else:
+                stack.append((j, True))
+                stack.extend((k, False) for k in self.children(j))
+        return built[i]
+
+    def tree(self):
+        """ The whole tree """
+        last = len(self.ops) - 1
+        if last < 0:
+            raise ValueError("empty tree file")
+        if last not in self._nodes:
+            # one pass in postfix order, faster than node() when nothing is
+            # built yet
+            stack = []
+            leaves = {}
+            arity, build = postfix.ARITY, postfix.build
+            for op, arg in zip(self.ops, self._args):
+                n = arity[op]
+                if n:
+                    children = stack[-n:]
+                    del stack[-n:]
+                    stack.append(build(op, children))
+                else:
+                    key = (op, arg)
+                    if key not in leaves:
+                        leaves[key] = self._leaf(op, arg - 1)
+                    stack.append(leaves[key])
+            if len(stack) != 1:
+                raise ValueError("malformed tree file")
+            self._nodes[last] = stack[0]
+        return self._nodes[last]
+
+
+def load(path):
+    """ Tree of the binary file at path """
+    with Loaded(path) as loaded:
+        return loaded.tree()
+
+def loads(data):
+    """ Tree of bytes of dumps() """
+    with Loaded(data=data) as loaded:
+        return loaded.tree()
+
+
+class DiskCache(object):
+    """ Binary files of parsed sources in directory, keyed by content
+
+    hits and misses count the lookups, like cache.LRUCache.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, parser, source):
+        """ Hex key of source, bytes or a buffer, parsed by parser """
+        h = hashlib.sha256()
+        h.update(repr((FORMAT_VERSION, parser.name, tables.grammar_hashes(parser.name))).encode())
+        h.update(source)
+        return h.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.kyb')
+
+    def get(self, key):
+        """ Tree stored under key, None when there is none """
+        try:
+            tree = load(self.path(key))
+        except Exception:
+            # missing, written by another version or corrupt: whatever the
+            # decoder raises, the source is parsed again
+            tree = None
+        with self._lock:
+            if tree is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return tree
+
+    def put(self, key, tree):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        dump(tree, path)
+
+    def clear(self):
+        """ Remove every file of the cache """
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith('.kyb'):
+                    os.unlink(os.path.join(root, name))
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
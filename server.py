@@ -0,0 +1,320 @@
+# Parse service speaking newline delimited JSON over a Unix socket or stdio
+#
+#     python -m server --socket /tmp/kyx.sock --workers 4
+#     python -m server --stdio
+#
+# Every request is a line holding a JSON object,
+#
+#     {"id": 7, "kind": "formula", "src": "x > 0 & [x := x + 1;]x > 1"}
+#
+# where kind is term, formula or program (the entry points of dl_grammar),
+# id is optional and echoed, and "format": "postfix" asks for the flat
+# postfix.Postfix program instead of nested lists. Every response is a line,
+#
+#     {"id": 7, "ok": true, "tree": ["&", [">", ["IDENTIFIER", "x"], "0"], ...]}
+#     {"id": 8, "ok": false, "error": {"type": "syntax", "message": "...",
+#                                      "offset": 4, "line": 1, "column": 5}}
+#
+# with error types request, syntax, limit, timeout and too_deep. A limit
+# error names the limits.Limits field the request exceeded in "limit", a
+# parse running out of the seconds of the limits is a timeout.
+#
+# The tables are loaded once per worker of a bounded process pool, which
+# every connection shares. A client may pipeline: send any number of requests
+# without waiting, the responses come back in the order of the requests.
+# Backpressure keeps the memory bounded: at most max_pending requests are on
+# the pool at a time, and a connection with pipeline responses outstanding
+# is not read from until the oldest one is written, so a fast client is
+# slowed down by the socket instead of queueing without limit. A request
+# not answered within timeout seconds of being read gets a timeout error.
+# Its parse keeps its slot until the worker is done with it, so a timeout
+# never puts more than max_pending requests on the pool. The seconds of the
+# limits of the server default to the timeout, so a parse that already
+# started stops in its worker as well instead of holding the slot. A worker
+# parses every request in a nodes.scope(), it keeps none of the nodes of a
+# response.
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import dl_grammar
+import limits as limits_module
+import nodes
+import postfix
+
+KINDS = {
+    'term': dl_grammar.START_TERM,
+    'formula': dl_grammar.START_FORMULA,
+    'program': None,
+}
+
+# longest request line in bytes
+LIMIT = 16 * 1024 * 1024
+
+
+def _init():
+    dl_grammar.parser.load()
+
+def tree_json(tree):
+    """ Nested lists of tree like nodes.to_tuple, built iteratively """
+    done = {}
+    stack = [(tree, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if not isinstance(node, nodes.Node) or id(node) in done:
+            continue
+        if expanded:
+            done[id(node)] = [done[id(item)] if isinstance(item, nodes.Node) else item
+                              for item in node]
+        else:
+            stack.append((node, True))
+            stack.extend((item, False) for item in node if isinstance(item, nodes.Node))
+    return done.get(id(tree), tree)
+
+def postfix_json(tree):
+    """ Flat JSON object of the postfix program of tree """
+    code = postfix.encode(tree)
+    return {'ops': [postfix.OPNAMES[op] for op in code.ops], 'args': list(code.args),
+            'names': code.names, 'literals': code.literals}
+
+def _parse(kind, src, format, limits=None):
+    # JSON text of the response fields, run in a worker
+    with nodes.scope():
+        return _response_fields(kind, src, format, limits)
+
+def _response_fields(kind, src, format, limits):
+    try:
+        tree = dl_grammar.parser.parse(src, start=KINDS[kind], limits=limits)
+    except limits_module.TimeLimit as e:
+        return _error('timeout', str(e))
+    except (TypeError, ZeroDivisionError, limits_module.LimitError) as e:
+        error = {'type': 'syntax', 'message': str(e)}
+        if isinstance(e, limits_module.LimitError):
+            error.update(type='limit', limit=e.limit)
+        for name in ('offset', 'line', 'column'):
+            if getattr(e, name, None) is not None:
+                error[name] = getattr(e, name)
+        return '"ok": false, "error": ' + json.dumps(error)
+    try:
+        if format == 'postfix':
+            return '"ok": true, "postfix": ' + json.dumps(postfix_json(tree))
+        return '"ok": true, "tree": ' + json.dumps(tree_json(tree))
+    except RecursionError:
+        return '"ok": false, "error": ' + json.dumps(
+            {'type': 'too_deep', 'message': "tree too deep for nested lists, "
+                                            "ask for \"format\": \"postfix\""})
+
+
+def _error(type, message):
+    return '"ok": false, "error": ' + json.dumps({'type': type, 'message': message})
+
+# start of the fields of a timeout response
+_TIMEOUT = '"ok": false, "error": {"type": "timeout",'
+
+
+class Server(object):
+    """ Parse service, see the module comment
+
+    - workers is the number of processes, os.cpu_count() by default and 0
+      for a thread of the serving process
+    - max_pending is the most requests on the pool, 4 per worker by default
+    - pipeline is the most outstanding responses of a connection
+    - timeout is the seconds a request may take, None for no limit
+    - limits is a limits.Limits of every parse, its seconds default to
+      the timeout
+
+    served, errors and timeouts count the responses.
+    """
+
+    def __init__(self, workers=None, max_pending=None, pipeline=64, timeout=10.0,
+                 limits=None):
+        if workers == 0:
+            _init()
+            self.pool = ThreadPoolExecutor(1)
+        else:
+            workers = workers or os.cpu_count() or 1
+            self.pool = ProcessPoolExecutor(workers, initializer=_init)
+        self.workers = workers
+        self.max_pending = max_pending or 4 * (workers or 1)
+        self.pipeline = pipeline
+        self.timeout = timeout
+        if timeout is not None and (limits is None or limits.seconds is None):
+            limits = (limits or limits_module.Limits())._replace(seconds=timeout)
+        self.limits = limits
+        self.served = self.errors = self.timeouts = 0
+        self._pending = None
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    async def request(self, line):
+        """ Response line of a request line """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request is a JSON object")
+        except ValueError as e:
+            return self._response(None, _error('request', str(e)))
+        ident = request.get('id')
+        kind, src, format = request.get('kind'), request.get('src'), request.get('format', 'tree')
+        if kind not in KINDS:
+            return self._response(ident, _error('request', "kind must be one of %s"
+                                                % ', '.join(sorted(KINDS))))
+        if not isinstance(src, str):
+            return self._response(ident, _error('request', "src must be a string"))
+        if format not in ('tree', 'postfix'):
+            return self._response(ident, _error('request', "format must be tree or postfix"))
+        try:
+            fields = await asyncio.wait_for(self._run(kind, src, format), self.timeout)
+        except asyncio.TimeoutError:
+            fields = _error('timeout', "no result within %g seconds" % self.timeout)
+        if fields.startswith(_TIMEOUT):
+            self.timeouts += 1
+        return self._response(ident, fields)
+
+    async def _run(self, kind, src, format):
+        if self._pending is None:
+            # created in the loop of the server
+            self._pending = asyncio.Semaphore(self.max_pending)
+        await self._pending.acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            job = loop.run_in_executor(self.pool, _parse, kind, src, format, self.limits)
+        except BaseException:
+            self._pending.release()
+            raise
+        # the slot is the worker's until the job is done, also when the
+        # request times out before: shielded, a timeout leaves the job running
+        job.add_done_callback(self._done)
+        return await asyncio.shield(job)
+
+    def _done(self, job):
+        self._pending.release()
+        if not job.cancelled():
+            # the result of a request that timed out goes nowhere
+            job.exception()
+
+    def _response(self, ident, fields):
+        self.served += 1
+        if fields.startswith('"ok": false'):
+            self.errors += 1
+        return ('{"id": %s, %s}\n' % (json.dumps(ident), fields)).encode()
+
+    async def handle(self, reader, writer):
+        """ Serve the requests of a connection until it is closed """
+        responses = asyncio.Queue(self.pipeline)
+
+        async def write():
+            closed = False
+            while True:
+                task = await responses.get()
+                if task is None:
+                    return
+                if closed:
+                    # the client is gone, the reader sees its end soon
+                    task.cancel()
+                    continue
+                try:
+                    writer.write(await task)
+                    await writer.drain()
+                except ConnectionError:
+                    closed = True
+
+        writing = asyncio.ensure_future(write())
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # longer than the limit of the reader, the rest of the
+                    # line cannot be told from the next request
+                    task = asyncio.get_running_loop().create_future()
+                    task.set_result(self._response(None, _error('request', "request too long")))
+                    await responses.put(task)
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    # waits while pipeline responses are outstanding
+                    await responses.put(asyncio.ensure_future(self.request(line)))
+            await responses.put(None)
+            await writing
+        except asyncio.CancelledError:
+            # the server is shutting down, the responses still pending are lost
+            writing.cancel()
+        finally:
+            writer.close()
+
+    async def serve_unix(self, path):
+        """ Serve connections to the Unix socket at path until cancelled """
+        server = await asyncio.start_unix_server(self.handle, path, limit=LIMIT)
+        async with server:
+            await server.serve_forever()
+
+    async def serve_stdio(self, stdin=None, stdout=None):
+        """ Serve the requests of stdin until its end """
+        stdin, stdout = stdin or sys.stdin, stdout or sys.stdout
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=LIMIT)
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), stdin)
+        except ValueError:
+            # a regular file, which the loop cannot watch
+            reader.feed_data(await loop.run_in_executor(None, stdin.buffer.read))
+            reader.feed_eof()
+        try:
+            transport, protocol = await loop.connect_write_pipe(
+                asyncio.streams.FlowControlMixin, stdout)
+            writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+        except ValueError:
+            writer = _FileWriter(stdout.buffer)
+        await self.handle(reader, writer)
+
+
+class _FileWriter(object):
+    # blocking stand-in of a StreamWriter for a regular file
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, data):
+        self.file.write(data)
+        self.file.flush()
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def main(argv=None):
+    args = argparse.ArgumentParser(description="Parse service speaking newline delimited JSON")
+    where = args.add_mutually_exclusive_group(required=True)
+    where.add_argument('--socket', help="path of the Unix socket to listen on")
+    where.add_argument('--stdio', action='store_true', help="serve stdin and stdout")
+    args.add_argument('--workers', type=int, default=None)
+    args.add_argument('--max-pending', type=int, default=None)
+    args.add_argument('--pipeline', type=int, default=64)
+    args.add_argument('--timeout', type=float, default=10.0)
+    args.add_argument('--max-tokens', type=int, default=None)
+    args.add_argument('--max-depth', type=int, default=None)
+    args = args.parse_args(argv)
+    server = Server(args.workers, args.max_pending, args.pipeline, args.timeout,
+                    limits_module.Limits(args.max_tokens, args.max_depth))
+    try:
+        if args.stdio:
+            asyncio.run(server.serve_stdio())
+        else:
+            asyncio.run(server.serve_unix(args.socket))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+# Constant folding and algebraic simplification of parsed trees
+#
+#     tree = simplify.simplify(hybrid_parser.parser.parse(src))
+#
+# Numeric subterms are folded exactly with Fraction: an integer result is a
+# Num, a rational one the division of two Nums and a negative one a Num
+# with a sign, like the Num('-1') of unary minus. x*1, 1*x, x+0, 0+x, x-0,
+# x/1 and x^1 become x. Unary minus stays BinOp('*', t, Num('-1')), but a
+# negated negation is dropped, a negated constant is folded and adding or
+# subtracting a negation becomes a subtraction or an addition. Comparisons
+# of constants become True or False and the connectives drop the constants
+# they do not depend on, as does a double ! . Everything else, programs
+# included, is rebuilt from its simplified children.
+#
+# Nodes are interned, so a subtree occurring many times is the same object
+# every time, and the memo maps every node simplified so far to its result:
+# a shared subtree is simplified only once per memo, however often it
+# occurs. The walk is iterative, deep trees do not hit the recursion limit.
+from fractions import Fraction
+
+import nodes
+
+# folded powers are exact, but only up to results of this many bits
+MAX_BITS = 4096
+
+_ARITHMETIC = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+}
+
+_COMPARISONS = {
+    '=': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+}
+
+
+def value(tree):
+    """ Fraction of a folded constant, None for other trees and for a
+    division by a zero the grammar let through, such as 1/0.0 """
+    if isinstance(tree, nodes.Num):
+        return Fraction(str(tree))
+    if isinstance(tree, nodes.BinOp) and tree.op == '/' and \
+            isinstance(tree.left, nodes.Num) and isinstance(tree.right, nodes.Num):
+        denominator = Fraction(str(tree.right))
+        if denominator == 0:
+            return None
+        return Fraction(str(tree.left)) / denominator
+    return None
+
+def constant(fraction):
+    """ Tree of a Fraction """
+    if fraction.denominator == 1:
+        return nodes.Num(str(fraction.numerator))
+    return nodes.BinOp('/', nodes.Num(str(fraction.numerator)),
+                       nodes.Num(str(fraction.denominator)))
+
+def _negated(tree):
+    # t of a negation t*-1, None for other trees
+    if isinstance(tree, nodes.BinOp) and tree.op == '*' and tree.right == '-1':
+        return tree.left
+    return None
+
+def _power(base, exponent):
+    # exact power, None when it is not rational or too large
+    if exponent.denominator != 1 or (base == 0 and exponent < 0):
+        return None
+    bits = max(base.numerator.bit_length(), base.denominator.bit_length())
+    if bits * abs(exponent.numerator) > MAX_BITS:
+        return None
+    return base ** exponent.numerator
+
+def _arithmetic(op, left, right):
+    a, b = value(left), value(right)
+    if a is not None and b is not None:
+        if op in _ARITHMETIC:
+            return constant(_ARITHMETIC[op](a, b))
+        if op == '/' and b != 0:
+            return constant(a / b)
+        if op == '^':
+            result = _power(a, b)
+            if result is not None:
+                return constant(result)
+        return nodes.BinOp(op, left, right)
+    if op == '*' and b == -1:
+        # unary minus, of a negation or of a product with a constant
+        inner = _negated(left)
+        if inner is not None:
+            return inner
+        if isinstance(left, nodes.BinOp) and left.op == '*' and value(left.right) is not None:
+            return _arithmetic('*', left.left, constant(-value(left.right)))
+        return nodes.BinOp('*', left, nodes.Num('-1'))
+    if (op == '*' and b == 1) or (op in '+-' and b == 0) or (op in '/^' and b == 1):
+        return left
+    if (op == '*' and a == 1) or (op == '+' and a == 0):
+        return right
+    if op == '*' and a == -1:
+        return _arithmetic('*', right, nodes.Num('-1'))
+    if op in '+-':
+        inner = _negated(right)
+        if inner is not None:
+            return nodes.BinOp('-' if op == '+' else '+', left, inner)
+    return nodes.BinOp(op, left, right)
+
+def _logic(op, left, right):
+    # & and |, with the names of boolean_parser
+    absorbing = op in ('|', 'or')
+    if left is absorbing or right is absorbing:
+        return absorbing
+    if left is (not absorbing):
+        return right
+    if right is (not absorbing):
+        return left
+    return nodes.Logic(op, left, right)
+
+def _rebuild(node, children):
+    # simplified node from its simplified children
+    cls = type(node)
+    if cls is nodes.BinOp:
+        return _arithmetic(node.op, *children)
+    if cls is nodes.Compare:
+        a, b = value(children[0]), value(children[1])
+        if a is not None and b is not None:
+            return _COMPARISONS[node.op](a, b)
+        return nodes.Compare(node.op, *children)
+    if cls is nodes.Not:
+        arg = children[0]
+        if isinstance(arg, bool):
+            return not arg
+        if isinstance(arg, nodes.Not):
+            return arg.arg
+        return nodes.Not(node.op, arg)
+    if cls is nodes.Logic:
+        return _logic(node.op, *children)
+    if cls is nodes.Imply:
+        left, right = children
+        if left is False or right is True:
+            return True
+        if left is True:
+            return right
+        return nodes.Imply(left, right)
+    if node.tag is None and node.fields[0] == 'op':
+        return cls(node[0], *children)
+    return cls(*children)
+
+
+def simplify(tree, memo=None):
+    """ Simplified tree, see the module comment
+
+    memo maps the nodes simplified so far to their results, pass the same
+    dict to simplify several trees sharing subtrees.
+    """
+    if memo is None:
+        memo = {}
+    # (node, expanded): the children are simplified before their node
+    stack = [(tree, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if not isinstance(node, nodes.Node) or isinstance(node, nodes.Var) or node in memo:
+            continue
+        children = node.children
+        if expanded:
+            memo[node] = _rebuild(node, [memo.get(child, child) if isinstance(child, nodes.Node)
+                                         else child for child in children])
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in children)
+    if isinstance(tree, nodes.Node):
+        return memo.get(tree, tree)
+    return tree
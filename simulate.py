@@ -0,0 +1,271 @@
+# Batched Monte Carlo simulation of hybrid programs with NumPy
+#
+#     sim = simulate.Simulator(hybrid_parser.parser.parse(src), seed=0)
+#     runs = sim.run({'x': xs, 'v': 0.0}, n=1000000)
+#     runs.state['x'][runs.alive]
+#
+# A Simulator advances n independent runs of a program at once, the state
+# of the runs is a float array per variable. Terms and tests are compiled
+# with numeval, once per node. Nondeterminism is resolved by sampling from a
+# seeded generator, so a seed reproduces the same runs:
+#
+# - a choice a ++ b takes either branch with probability 1/2
+# - a loop {a}* runs its body again with probability repeat, at most
+#   max_loops times
+# - a continuous evolution {x' = f & Q} runs for a duration drawn uniformly
+#   from [0, horizon], integrated with fixed RK4 steps of dt, and stops
+#   early at the last step inside the domain Q
+#
+# A run that fails a test, or starts an evolution outside of its domain, is
+# dead: it has no successor state. Dead runs are not advanced anymore, their
+# state is the state they died in. Statements compute all rows and only
+# store the live ones, the branches of choices, loops and ifs only compute
+# the rows of the runs taking them, gathered into shorter arrays.
+#
+# An observer, if any, is called as observer(state, mask, final) with the
+# state of the rows of mask after every statement, every iteration of a loop
+# and every step of an evolution. final is true when the program may end in
+# that state: at the end of the program, but also after any iteration of a
+# final loop and at any step of a final evolution. The state seen by an
+# observer can be a subset of the runs, gathered together with all their
+# variables, so observers that need to know the runs add a column with
+# their numbers to the initial state.
+import collections
+
+import numpy as np
+
+import nodes
+import numeval
+
+Runs = collections.namedtuple('Runs', 'state alive')
+
+
+def _sequence(program):
+    # statements of a chain of Seq, iteratively as chains nest on the right
+    statements = []
+    while isinstance(program, nodes.Seq):
+        statements.append(program.first)
+        program = program.second
+    statements.append(program)
+    return statements
+
+def _equations(system):
+    # (variable, term) of the differential equations of an ODE
+    equations = []
+    stack = [system]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, nodes.Pair):
+            stack.append(node.second)
+            stack.append(node.first)
+        elif isinstance(node, nodes.DiffEq):
+            equations.append((node.var, node.term))
+        else:
+            raise TypeError("cannot simulate the differential program %r" % (node,))
+    return equations
+
+def _gather(state, rows):
+    return dict((name, values[rows]) for name, values in state.items())
+
+def _scatter(state, sub, rows, n):
+    # write the rows of sub back, variables first assigned in sub are nan elsewhere
+    for name, values in sub.items():
+        if name not in state:
+            state[name] = np.full(n, np.nan)
+        state[name][rows] = values
+
+
+class Simulator(object):
+    """ Batched simulator of the hybrid program tree, see the module comment
+
+    - seed seeds the generator resolving the nondeterminism
+    - dt is the step and horizon the longest duration of evolutions
+    - repeat is the probability of another iteration of a loop, and
+      max_loops the most iterations
+    - observer is called with the intermediate states of the runs
+    """
+
+    def __init__(self, tree, seed=None, dt=0.01, horizon=1.0, repeat=0.5, max_loops=100,
+                 observer=None):
+        self.tree = tree
+        self.rng = np.random.default_rng(seed)
+        self.dt = dt
+        self.horizon = horizon
+        self.repeat = repeat
+        self.max_loops = max_loops
+        self.observer = observer
+        # compiled terms and formulas by node, nodes are interned
+        self._terms = {}
+        self._formulas = {}
+
+    def term(self, tree):
+        program = self._terms.get(tree)
+        if program is None:
+            program = self._terms[tree] = numeval.compile_term(tree)
+        return program
+
+    def formula(self, tree):
+        predicate = self._formulas.get(tree)
+        if predicate is None:
+            predicate = self._formulas[tree] = numeval.compile_formula(tree)
+        return predicate
+
+    def run(self, initial, n=None):
+        """ Runs from the initial state, a mapping from the variables to
+        arrays of n values or to single values shared by every run """
+        if n is None:
+            n = max([np.size(value) for value in initial.values()] or [1])
+        state = dict((name, np.broadcast_to(np.asarray(value, dtype=float), (n,)).copy())
+                     for name, value in initial.items())
+        alive = np.ones(n, dtype=bool)
+        self.execute(self.tree, state, alive, n, True)
+        return Runs(state, alive)
+
+    def execute(self, program, state, alive, n, final=False):
+        """ Advance the n runs of state, whose alive mask is updated in place,
+        final when the program ends the whole program """
+        statements = _sequence(program)
+        for i, statement in enumerate(statements, 1):
+            if not alive.any():
+                return
+            last = final and i == len(statements)
+            self.statement(statement, state, alive, n, last)
+            if self.observer is not None:
+                self.observer(state, alive, last)
+
+    def branch(self, program, state, alive, n, mask, final):
+        # execute program for the live runs of mask only
+        rows = np.flatnonzero(mask & alive)
+        if not len(rows):
+            return
+        sub, sub_alive = _gather(state, rows), np.ones(len(rows), dtype=bool)
+        self.execute(program, sub, sub_alive, len(rows), final)
+        _scatter(state, sub, rows, n)
+        alive[rows] = sub_alive
+
+    def assign(self, var, values, state, alive, n):
+        if alive.all():
+            state[var] = values
+        else:
+            # dead runs keep their state
+            target = state.setdefault(var, np.full(n, np.nan))
+            np.copyto(target, values, where=alive)
+
+    def statement(self, program, state, alive, n, final=False):
+        # statements compute every row, dead runs included, and only change
+        # the state of the live ones
+        if isinstance(program, nodes.Assign):
+            self.assign(program.var, self.term(program.term)(state, rows=n), state, alive, n)
+        elif isinstance(program, nodes.DiffAssign):
+            self.assign(program.var + "'", self.term(program.term)(state, rows=n),
+                        state, alive, n)
+        elif isinstance(program, nodes.Test):
+            alive &= self.formula(program.cond)(state, rows=n)
+        elif isinstance(program, nodes.Choice):
+            left = self.rng.random(n) < 0.5
+            self.branch(program.left, state, alive, n, left, final)
+            self.branch(program.right, state, alive, n, ~left, final)
+        elif isinstance(program, nodes.If):
+            cond = self.formula(program.cond)(state, rows=n)
+            self.branch(program.then, state, alive, n, cond, final)
+            if program.other is not None:
+                self.branch(program.other, state, alive, n, ~cond, final)
+        elif isinstance(program, nodes.Loop):
+            if self.observer is not None:
+                # a loop may not iterate at all
+                self.observer(state, alive, final)
+            again = alive.copy()
+            for _ in range(self.max_loops):
+                # a run that stopped iterating does not start again
+                again &= alive & (self.rng.random(n) < self.repeat)
+                if not again.any():
+                    break
+                self.branch(program.body, state, alive, n, again, False)
+                if self.observer is not None:
+                    self.observer(state, again & alive, final)
+        elif isinstance(program, nodes.ODE):
+            self.evolve(program, state, alive, n, final)
+        elif isinstance(program, nodes.Seq):
+            self.execute(program, state, alive, n, final)
+        else:
+            raise TypeError("cannot simulate %r" % (program,))
+
+    def evolve(self, ode, state, alive, n, final=False):
+        """ Follow the ODE with RK4 steps until the sampled duration ends or
+        the next step leaves the domain """
+        equations = [(var, self.term(term)) for var, term in _equations(ode.system)]
+        domain = self.formula(ode.domain)
+        for var, _ in equations:
+            if var not in state:
+                raise KeyError("evolution of %r, which has no value" % (var,))
+        alive &= domain(state, rows=n)
+        if self.observer is not None:
+            # an evolution may take no time at all
+            self.observer(state, alive, final)
+        duration = self.rng.uniform(0, self.horizon, n)
+        names = set(var for var, _ in equations) | set(domain.names)
+        for _, program in equations:
+            names.update(program.names)
+        if self.observer is not None:
+            # observers see every variable
+            names.update(state)
+        # chunks of runs of similar durations are integrated to the end one
+        # after the other, so their arrays stay in cache
+        rows = np.flatnonzero(alive)
+        rows = rows[np.argsort(duration[rows])]
+        for start in range(0, len(rows), numeval.CHUNK):
+            chunk = rows[start:start + numeval.CHUNK]
+            env = dict((name, state[name][chunk]) for name in names)
+            self.integrate(equations, domain, env, duration[chunk], final)
+            for var, _ in equations:
+                state[var][chunk] = env[var]
+
+    def integrate(self, equations, domain, env, duration, final=False):
+        """ Integrate the rows of env, the columns the evolution reads, in
+        place for their duration """
+        m = len(duration)
+        result = env
+        rows = np.arange(m)
+        elapsed = np.zeros(m)
+        active = elapsed < duration
+
+        def slopes(env):
+            return [program(env, rows=m) for _, program in equations]
+
+        def shifted(env, k, h):
+            env = dict(env)
+            for (var, _), slope in zip(equations, k):
+                env[var] = env[var] + h * slope
+            return env
+
+        while True:
+            # finished rows take steps of 0 until fewer than half of the rows
+            # are left, which are then compacted
+            count = np.count_nonzero(active)
+            if 2 * count < m:
+                if env is not result:
+                    for var, _ in equations:
+                        result[var][rows] = env[var]
+                if not count:
+                    return
+                keep = np.flatnonzero(active)
+                rows, duration, elapsed = rows[keep], duration[keep], elapsed[keep]
+                env = dict((name, values[keep]) for name, values in env.items())
+                active = np.ones(count, dtype=bool)
+                m = count
+            h = np.where(active, np.minimum(self.dt, duration - elapsed), 0.0)
+            k1 = slopes(env)
+            k2 = slopes(shifted(env, k1, h / 2))
+            k3 = slopes(shifted(env, k2, h / 2))
+            k4 = slopes(shifted(env, k3, h))
+            step = dict(env)
+            for i, (var, _) in enumerate(equations):
+                step[var] = env[var] + h / 6 * (k1[i] + 2 * k2[i] + 2 * k3[i] + k4[i])
+            # runs leaving the domain stay at their last state inside it
+            moved = active & domain(step, rows=m)
+            for var, _ in equations:
+                np.copyto(env[var], step[var], where=moved)
+            elapsed += h * moved
+            active = moved & (elapsed < duration)
+            if self.observer is not None:
+                self.observer(env, moved, final)
@@ -0,0 +1,138 @@
+# Source spans of parsed trees
+#
+# Nodes are interned and shared, so a node cannot carry the span of one of
+# its occurrences. Parser.parse_spans returns a Spans next to the tree
+# instead: the (start, end) offsets of every item of the tree in postfix
+# order, the order of postfix.encode(tree), in two arrays.
+#
+#     tree, spans = hybrid_parser.parser.parse_spans(src)
+#     for node, start, end in spans.walk(tree):
+#         ...
+#
+# The spans are recorded while parsing by wrapping the grammar actions of a
+# private copy of the productions (tables.wrap_productions): every reduction
+# keeps a shadow of its value with the span of the symbols it was reduced
+# from and the shadows of the children it took from them. Items that do not
+# come from the source (the Num('-1') of unary minus, the EMPTY of an empty
+# production) get the span of their parent, a tree reduced from no source
+# at all spans (0, 0).
+from array import array
+
+import ply.lex
+
+import nodes
+import tables
+
+
+class _Shadow(object):
+    # span of a value and the shadows of its children, None if unknown
+    __slots__ = ('value', 'start', 'end', 'children')
+
+    def __init__(self, value, start, end, children):
+        self.value = value
+        self.start = start
+        self.end = end
+        self.children = children
+
+
+def _children(value):
+    # items of value that postfix.encode visits, see postfix.encode
+    if isinstance(value, nodes.Node) and not isinstance(value, nodes.Var):
+        return value.children
+    return ()
+
+def _record(action):
+    def record(p):
+        action(p)
+        syms = p.slice
+        shadows = []
+        for sym in syms[1:]:
+            if isinstance(sym, ply.lex.LexToken):
+                shadows.append(_Shadow(sym.value, sym.lexpos, sym.lexend, None))
+            else:
+                shadows.append(sym.shadow)
+        value = syms[0].value
+        known = [s for s in shadows if s.start is not None]
+        start = known[0].start if known else None
+        end = known[-1].end if known else None
+        # the parser keeps the shadow of the last reduction, the whole tree
+        for shadow in shadows:
+            if shadow.value is value and shadow.start is not None:
+                # passed through, e.g. a parenthesized term spans the parentheses
+                syms[0].shadow = p.parser.shadow = \
+                    _Shadow(value, start, end, shadow.children)
+                return
+        # take the shadow of every child from the first unused symbol holding
+        # it; names and operators are plain strings of the tokens, which an
+        # interned node built by an earlier parse holds other copies of
+        unused = list(shadows)
+        children = []
+        for child in _children(value):
+            plain = type(child) is str
+            for i, shadow in enumerate(unused):
+                if shadow.value is child or plain and shadow.value == child:
+                    children.append(shadow)
+                    del unused[i]
+                    break
+            else:
+                children.append(None)
+        syms[0].shadow = p.parser.shadow = _Shadow(value, start, end, children)
+    return record
+
+def productions(yacc):
+    """ Copy of the productions of yacc whose actions record shadows """
+    return tables.wrap_productions(yacc.productions, _record)
+
+
+class Spans(object):
+    """ Spans of the items of a tree in postfix order, see the module comment """
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self):
+        self.starts = array('I')
+        self.ends = array('I')
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, i):
+        return self.starts[i], self.ends[i]
+
+    def walk(self, tree):
+        """ (item, start, end) of every item of tree in postfix order """
+        i = 0
+        stack = [(tree, False)]
+        while stack:
+            node, expanded = stack.pop()
+            children = _children(node)
+            if expanded or not children:
+                yield node, self.starts[i], self.ends[i]
+                i += 1
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(children))
+
+
+def flatten(tree, shadow):
+    """ Spans of tree from the shadow of its parse """
+    spans = Spans()
+    starts, ends = spans.starts, spans.ends
+    if shadow.start is None:
+        # nothing of the source was reduced, e.g. the empty input
+        shadow = _Shadow(tree, 0, 0, None)
+    # (item, shadow, parent shadow, expanded)
+    stack = [(tree, shadow, shadow, False)]
+    while stack:
+        node, shadow, parent, expanded = stack.pop()
+        if shadow is None or shadow.start is None:
+            shadow = parent
+        children = _children(node)
+        if expanded or not children:
+            starts.append(shadow.start)
+            ends.append(shadow.end)
+        else:
+            stack.append((node, shadow, parent, True))
+            shadows = shadow.children or [None] * len(children)
+            stack.extend((child, child_shadow, shadow, False)
+                         for child, child_shadow in zip(reversed(children), reversed(shadows)))
+    return spans
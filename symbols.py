@@ -0,0 +1,204 @@
+# Free, bound and assigned variables of parsed trees
+#
+#     parser = hybrid_parser.parser.clone(symbols=True)
+#     tree = parser.parse(src)
+#     symbols.free_vars(tree)        # frozenset({'x', 'v'}), O(1)
+#     symbols.assigned_vars(tree.first)
+#
+# The Symbols of a node are
+#
+# - free: the variables whose value the node reads, x' for x in a
+#   differential (t)' and for x in the free variables of t
+# - bound: the variables bound by a \forall or \exists in the node
+# - assigned: the variables a program in the node may write, x for x := t,
+#   x' for x' := t, and x and x' for every x' = t of an evolution
+# - must: the variables a program writes on every run, which are not free
+#   in what follows it: x is not free in x := 1; x > 0 or in [x := 1;]x > 0
+#
+# Nodes are interned tuples without room for attributes, so the Symbols live
+# in a side table by node, computed bottom-up from the Symbols of the
+# children: every distinct node once. A Parser made with symbols=True
+# computes them as part of every reduction, in grammar actions wrapped with
+# tables.wrap_productions, so the queries below are a table lookup after
+# the parse. For other trees they are computed on the first query. The
+# table is one of the intern tables: nodes.clear() clears it and a
+# nodes.scope() drops the entries stored in it.
+#
+# The sets are frozensets shared as far as they go: a node whose set is
+# the one of a child reuses it, so a long sequence of assignments to the
+# same variables holds few sets.
+import collections
+
+import nodes
+import tables
+
+Symbols = collections.namedtuple('Symbols', 'free bound assigned must')
+
+NONE = Symbols(frozenset(), frozenset(), frozenset(), frozenset())
+
+# (node, Symbols) by id of the node, the node keeps its id from being reused
+_table = {}
+nodes._tables.append(_table)
+
+# marks the end of the children of a node on the stack of compute
+_EXIT = object()
+
+
+def symbols(node):
+    """ Symbols of node, NONE for literals and names """
+    entry = _table.get(id(node))
+    if entry is not None and entry[0] is node:
+        return entry[1]
+    if not isinstance(node, nodes.Node):
+        return NONE
+    return compute(node)
+
+def free_vars(node):
+    """ frozenset of the free variables of node """
+    return symbols(node).free
+
+def bound_vars(node):
+    """ frozenset of the variables bound by the quantifiers of node """
+    return symbols(node).bound
+
+def assigned_vars(node):
+    """ frozenset of the variables the programs of node may write """
+    return symbols(node).assigned
+
+def compute(tree):
+    """ Symbols of tree, stored for every node of it without them """
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node is _EXIT:
+            node = stack.pop()
+            _table[id(node)] = (node, _RULES.get(type(node), _union_of)(node))
+            continue
+        entry = _table.get(id(node))
+        if not isinstance(node, nodes.Node) or entry is not None and entry[0] is node:
+            continue
+        stack.append(node)
+        stack.append(_EXIT)
+        stack.extend(child for child in node.children if isinstance(child, nodes.Node))
+    return symbols(tree)
+
+
+def _union(a, b):
+    # a | b, a or b itself when it holds the other
+    if not b or a is b:
+        return a
+    if not a:
+        return b
+    if len(a) >= len(b):
+        return a if b <= a else a | b
+    return b if a <= b else a | b
+
+def _minus(a, b):
+    # a - b, a itself when they are disjoint
+    if not a or not b or a.isdisjoint(b):
+        return a
+    return a - b
+
+def _primed(names):
+    return frozenset(name + "'" for name in names)
+
+def _of(node):
+    # Symbols of a child, stored already unless an action built it
+    entry = _table.get(id(node))
+    if entry is not None:
+        return entry[1]
+    return compute(node) if isinstance(node, nodes.Node) else NONE
+
+def _union_of(node):
+    # the union of the Symbols of the children
+    free = bound = assigned = must = frozenset()
+    for child in node.children:
+        if isinstance(child, nodes.Node):
+            child = _of(child)
+            free = _union(free, child.free)
+            bound = _union(bound, child.bound)
+            assigned = _union(assigned, child.assigned)
+            must = _union(must, child.must)
+    return Symbols(free, bound, assigned, must)
+
+def _var(node):
+    return Symbols(frozenset([node.name]), frozenset(), frozenset(), frozenset())
+
+def _differential(node):
+    arg = _of(node.arg)
+    return arg._replace(free=_union(arg.free, _primed(arg.free)))
+
+def _quantifier(node):
+    variables, body = _of(node.vars), _of(node.body)
+    return Symbols(_minus(body.free, variables.free),
+                   _union(_union(body.bound, variables.bound), variables.free),
+                   body.assigned, frozenset())
+
+def _assignment(target):
+    def assignment(node):
+        term = _of(node.term)
+        written = frozenset([target(node.var)])
+        return Symbols(term.free, term.bound, written, written)
+    return assignment
+
+def _diff_eq(node):
+    term = _of(node.term)
+    written = frozenset([node.var, node.var + "'"])
+    return Symbols(_union(term.free, frozenset([node.var])), term.bound, written, written)
+
+def _optional(node):
+    # a test writes nothing, a loop may run its body no time
+    return _union_of(node)._replace(must=frozenset())
+
+def _modality(node):
+    program, body = _of(node.program), _of(node.body)
+    return Symbols(_union(program.free, _minus(body.free, program.must)),
+                   _union(program.bound, body.bound), _union(program.assigned, body.assigned),
+                   frozenset())
+
+def _seq(node):
+    first, second = _of(node.first), _of(node.second)
+    return Symbols(_union(first.free, _minus(second.free, first.must)),
+                   _union(first.bound, second.bound), _union(first.assigned, second.assigned),
+                   _union(first.must, second.must))
+
+def _choice(node):
+    left, right = _of(node.left), _of(node.right)
+    return _union_of(node)._replace(must=left.must & right.must)
+
+def _if(node):
+    # without else, nothing is written on every run
+    must = frozenset()
+    if node.other is not None:
+        must = _of(node.then).must & _of(node.other).must
+    return _union_of(node)._replace(must=must)
+
+_RULES = {
+    nodes.Var: _var,
+    nodes.Differential: _differential,
+    nodes.Quantifier: _quantifier,
+    nodes.Assign: _assignment(lambda var: var),
+    nodes.DiffAssign: _assignment(lambda var: var + "'"),
+    nodes.DiffEq: _diff_eq,
+    nodes.Test: _optional,
+    nodes.Loop: _optional,
+    nodes.Box: _modality,
+    nodes.Diamond: _modality,
+    nodes.Seq: _seq,
+    nodes.Choice: _choice,
+    nodes.If: _if,
+}
+
+
+def _record(action):
+    def record(p):
+        action(p)
+        value = p.slice[0].value
+        if isinstance(value, nodes.Node) and id(value) not in _table:
+            # the children are reduced, their Symbols are stored
+            _table[id(value)] = (value, _RULES.get(type(value), _union_of)(value))
+    return record
+
+def productions(productions):
+    """ Copy of productions whose actions store the Symbols of their nodes """
+    return tables.wrap_productions(productions, _record)
@@ -0,0 +1,171 @@
+# Precompiled lex and LALR tables for the grammar modules
+#
+# Calling lex.lex() and yacc.yacc() at import time analyzes the grammar
+# again (or rewrites parsetab.py/parser.out in the working directory) every
+# time a process starts. Instead the tables of every grammar are generated
+# once with
+#
+#     python -m tables
+#
+# into the _tables package, which is shipped together with the sources.
+# Loading them does not run any grammar analysis. The tables are stored with
+# a hash of the grammar they were built from and loading fails loudly when
+# the grammar module changed in the meantime.
+import copy
+import hashlib
+import importlib
+import os
+import sys
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+# bump when the layout of the generated table files changes
+TABLES_VERSION = 1
+
+GRAMMARS = (
+    'parser',
+    'boolean_parser',
+    'terms_parser',
+    'formulas_parser',
+    'hybrid_parser',
+    'dl_grammar',
+)
+
+TABLE_PACKAGE = '_tables'
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), TABLE_PACKAGE)
+
+# set while build() runs, the grammar modules then generate their tables
+_building = False
+
+
+class TableError(RuntimeError):
+    """ The precompiled tables are missing or do not match the grammar """
+
+
+def _table_name(name, kind):
+    return '%s.%s_%s' % (TABLE_PACKAGE, name, kind)
+
+def lex_hash(module):
+    """ Hash of the lexer specification (tokens and t_ rules) of module """
+    ldict = vars(module)
+    h = hashlib.sha256()
+    h.update(repr((TABLES_VERSION, lex.__tabversion__)).encode())
+    h.update(repr(tuple(ldict.get('tokens', ()))).encode())
+    strings = sorted((k, v) for k, v in ldict.items()
+                     if k.startswith('t_') and isinstance(v, str))
+    h.update(repr(strings).encode())
+    # function rules are tried in definition order, so the order matters
+    # but not the line numbers themselves
+    funcs = sorted((v.__code__.co_firstlineno, k, v.__doc__) for k, v in ldict.items()
+                   if k.startswith('t_') and callable(v))
+    h.update(repr([f[1:] for f in funcs]).encode())
+    return h.hexdigest()
+
+def yacc_hash(module):
+    """ Hash of the grammar (start, precedence, tokens and rules) of module """
+    pdict = dict(vars(module))
+    pinfo = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+    pinfo.get_all()
+    h = hashlib.sha256()
+    h.update(repr((TABLES_VERSION, yacc.__tabversion__)).encode())
+    h.update(pinfo.signature().encode())
+    return h.hexdigest()
+
+def _manifest(name):
+    try:
+        manifest = importlib.import_module(TABLE_PACKAGE)
+        hashes = manifest.GRAMMARS[name]
+    except (ImportError, AttributeError, KeyError):
+        raise TableError("no precompiled tables for %r, run 'python -m tables'" % name)
+    if manifest.TABLES_VERSION != TABLES_VERSION:
+        raise TableError("tables for %r have version %r, expected %r, run 'python -m tables'"
+                         % (name, manifest.TABLES_VERSION, TABLES_VERSION))
+    return hashes
+
+def grammar_hashes(name):
+    """ (lexer, grammar) hashes the precompiled tables of name were built
+    from, they change with the grammar """
+    return _manifest(name)
+
+def _table(name, kind, tabversion):
+    try:
+        table = importlib.import_module(_table_name(name, kind))
+    except ImportError:
+        raise TableError("missing %s for %r, run 'python -m tables'" % (kind, name))
+    if table._tabversion != tabversion:
+        raise TableError("%s for %r was generated by another PLY version, run 'python -m tables'"
+                         % (kind, name))
+    return table
+
+def lexer(module, name):
+    """ Lexer of the grammar module from its precompiled table """
+    if _building:
+        lexobj = lex.lex(module=module)
+        lexobj.writetab(_table_name(name, 'lextab'), TABLE_DIR)
+        return lexobj
+
+    if _manifest(name)[0] != lex_hash(module):
+        raise TableError("lexer of %r changed since its table was built, run 'python -m tables'" % name)
+    return lex.lex(module=module, optimize=True,
+                   lextab=_table(name, 'lextab', lex.__tabversion__))
+
+def parser(module, name):
+    """ LALR parser of the grammar module from its precompiled table """
+    if _building:
+        return yacc.yacc(module=module, tabmodule=_table_name(name, 'parsetab'),
+                         outputdir=TABLE_DIR, debug=False)
+
+    if _manifest(name)[1] != yacc_hash(module):
+        raise TableError("grammar of %r changed since its table was built, run 'python -m tables'" % name)
+    return yacc.yacc(module=module, optimize=True, write_tables=False, debug=False,
+                     tabmodule=_table(name, 'parsetab', yacc.__tabversion__))
+
+def wrap_productions(productions, wrapper):
+    """ Copy of productions whose actions are wrapper(action)
+
+    The copies of a parser share its productions, so a parse that runs
+    code along the grammar actions, see spans, limits and symbols, swaps in
+    such a copy instead of changing the actions in place.
+    """
+    result = []
+    for prod in productions:
+        prod = copy.copy(prod)
+        if prod.callable is not None:
+            prod.callable = wrapper(prod.callable)
+        result.append(prod)
+    return result
+
+def build(names=GRAMMARS):
+    """ Generate the tables of the grammar modules and write the manifest """
+    global _building
+
+    if not os.path.isdir(TABLE_DIR):
+        os.makedirs(TABLE_DIR)
+    try:
+        hashes = dict(importlib.import_module(TABLE_PACKAGE).GRAMMARS)
+    except (ImportError, AttributeError):
+        hashes = {}
+    _building = True
+    try:
+        for name in names:
+            sys.modules.pop(name, None)
+            module = importlib.import_module(name)
+            module.parser.load()
+            hashes[name] = (lex_hash(module), yacc_hash(module))
+    finally:
+        _building = False
+
+    with open(os.path.join(TABLE_DIR, '__init__.py'), 'w') as f:
+        f.write("# Precompiled parser tables, generated by 'python -m tables'. Don't edit!\n")
+        f.write('TABLES_VERSION = %r\n' % TABLES_VERSION)
+        f.write('GRAMMARS = {\n')
+        for name in sorted(hashes):
+            f.write('    %r: (\n        %r,\n        %r,\n    ),\n' % ((name,) + hashes[name]))
+        f.write('}\n')
+
+
+if __name__ == '__main__':
+    # the grammar modules import tables, not __main__
+    import tables
+    tables.build(sys.argv[1:] or GRAMMARS)
@@ -1,8 +1,9 @@
 # Term parser for terms in KeYmaera's differential dynamic logic using ply
-import ply.lex as lex
-import ply.yacc as yacc
 import sys
 
+import nodes
+import parsing
+
 tokens = (
     'ID', 'NUM',
     'PLUS', 'MINUS', 'MULTIPLY', 'DIVIDE', 'POWER',
@@ -33,11 +34,9 @@ def t_newline(t):
     t.lexer.lineno += t.value.count('\n')
 
 def t_error(t):
-    print("illegal character '%s'" % t.value[0])
+    parsing.trace(t.lexer, 'illegal', t.value[0])
     t.lexer.skip(1)
 
-lexer = lex.lex()
-
 precedence = (
     ('left', 'PLUS', 'MINUS'),
     ('right', 'UMINUS'),
@@ -53,11 +52,9 @@ def p_terms(p):
     """
     #when empty
     if len(p) == 1:
-        p[0] = []
+        p[0] = nodes.EMPTY
     else:
         p[0] = p[1]
-    #uncomment to test on terminal
-    print(p[0])
 
 # interpreted functions have to be added
 def p_function(p):
@@ -65,8 +62,8 @@ def p_function(p):
     function : ID LPAREN RPAREN
              | ID LPAREN term RPAREN
     """
-    if p[3] == ')': p[0] = ('Constant Symbol', p[1]+'()')
-    else:   p[0] = ('function', p[1]+p[2]+str(p[3])+p[4])
+    if p[3] == ')': p[0] = nodes.Func(p[1], nodes.EMPTY)
+    else:   p[0] = nodes.Func(p[1], p[3])
 
 def p_term(p):
     """
@@ -76,11 +73,9 @@ def p_term(p):
          | term DIVIDE term
          | term POWER term
     """
-    if p[2] == '/':
-        if p[3] != 0:   p[0] = (p[2], p[1], p[3])
-        else:
-            raise  ZeroDivisionError("cannot divide by zero")
-    else:   p[0] = (p[2], p[1], p[3])
+    if p[2] == '/' and p[3] == '0':
+        raise  ZeroDivisionError("cannot divide by zero")
+    p[0] = nodes.BinOp(p[2], p[1], p[3])
 
 
 # unary minus
@@ -89,14 +84,14 @@ def p_term_uminus(p):
     """
     term : MINUS term %prec UMINUS
     """
-    p[0] = ('*', p[2], '-1')
+    p[0] = nodes.BinOp('*', p[2], nodes.Num('-1'))
 
 def p_term_group(p):
     """
     term : LPAREN term RPAREN
          | LPAREN term COMMA term RPAREN
     """
-    if p[3] == ',':   p[0] = '('+str(p[2]) +','+ str(p[4])+')'
+    if p[3] == ',':   p[0] = nodes.Pair(p[2], p[4])
     else:   p[0] = p[2]
 
 def p_differential(p):
@@ -104,32 +99,34 @@ def p_differential(p):
     term : term PRIME
          | LPAREN term RPAREN PRIME
     """
-    if p[1] == '(': p[0] = ('differential', p[2])
-    else:   p[0] = ('differential', p[1])
+    if p[1] == '(': p[0] = nodes.Differential(p[2])
+    else:   p[0] = nodes.Differential(p[1])
 
 def p_numeric_value(p):
     """
     term : NUM
     """
-    p[0] = p[1]
+    p[0] = nodes.Num(p[1])
 
 def p_value(p):
     """
     term : ID
     """
-    p[0] = ('IDENTIFIER', p[1])
+    p[0] = nodes.Var(p[1])
 
 
 def p_error(p):
-    print("p_error {}".format(p))
-    raise TypeError("unknown text at %r" % (p.value))
-
-parser = yacc.yacc()
-
-#uncomment below to test on the terminal
-while True:
-    try:
-        s = input('')
-    except EOFError:
-        break
-    parser.parse(s)
+    raise parsing.syntax_error(p)
+
+parser = parsing.Parser(sys.modules[__name__], 'terms_parser')
+
+
+def __getattr__(name):
+    # the lexer is loaded with the parser tables on first use
+    if name == 'lexer':
+        return parser.lexer
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if __name__ == '__main__':
+    parser.repl()
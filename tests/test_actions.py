@@ -0,0 +1,80 @@
+""" Test the grammar actions that never gave their intended result
+
+The result an action gave before is in the comment of every test.
+"""
+
+import unittest
+
+import formulas_parser
+import hybrid_parser
+import parser
+import terms_parser
+
+
+class TestActions(unittest.TestCase):
+    def test_modalities(self):
+        # both were ('dia', ...), the action tested p[2] for the bracket
+        self.assertEqual(formulas_parser.parser.parse("[a] x > 0"),
+                         ('box', 'a', ('>', ('IDENTIFIER', 'x'), '0')))
+        self.assertEqual(formulas_parser.parser.parse("<a> x > 0"),
+                         ('dia', 'a', ('>', ('IDENTIFIER', 'x'), '0')))
+        self.assertEqual(hybrid_parser.parser.parse("?[x := 1;] x > 0;")[1][0], 'box')
+
+    def test_iff(self):
+        # None, the action built the tuple without assigning it
+        iff = ('iff', ('>', ('IDENTIFIER', 'x'), '0'), ('>', ('IDENTIFIER', 'y'), '0'))
+        self.assertEqual(formulas_parser.parser.parse("x > 0 <-> y > 0"), iff)
+        self.assertEqual(hybrid_parser.parser.parse("?x > 0 <-> y > 0;"), ('?', iff))
+
+    def test_logic(self):
+        # ('=', ('IDENTIFIER', left), right) for every connective of parser
+        self.assertEqual(parser.parser.parse("x > 0 | !y > 0"),
+                         ('|', ('>', ('IDENTIFIER', 'x'), '0'),
+                          ('!', ('>', ('IDENTIFIER', 'y'), '0'))))
+
+    def test_truth_values(self):
+        # None, the action compared p[0] instead of assigning it; True and
+        # False lex as identifiers in these grammars, so call the action
+        for module in (formulas_parser, hybrid_parser):
+            for text, value in (('True', True), ('False', False)):
+                p = [None, text]
+                module.p_formula_value(p)
+                self.assertIs(p[0], value)
+
+    def test_programs(self):
+        # a choice raised IndexError, x := t gave ('differential', 'x', ';'),
+        # a test took a program instead of a formula and a single
+        # differential equation raised IndexError
+        p = hybrid_parser.parser
+        self.assertEqual(p.parse("a; ++ b;"), ('choice', 'a', 'b'))
+        self.assertEqual(p.parse("x := 1;"), ('define', 'x', '1'))
+        self.assertEqual(p.parse("x' := 1;"), ('differential', 'x', '1'))
+        self.assertEqual(p.parse("?x > 0;"), ('?', ('>', ('IDENTIFIER', 'x'), '0')))
+        self.assertEqual(p.parse("{x' = 1 & x > 0}"),
+                         ('continuous_ev', ('differential', 'x', '1'),
+                          ('>', ('IDENTIFIER', 'x'), '0')))
+
+    def test_conditional(self):
+        # None, the action had no body; if lexes as an identifier in
+        # hybrid_parser, so call the action
+        cond, then, other = ('IDENTIFIER', 'c'), ('define', 'x', '1'), ('define', 'x', '2')
+        p = [None, 'if', '(', cond, ')', '{', then, '}', 'else', '{', other, '}']
+        hybrid_parser.p_program_conditional(p)
+        self.assertEqual(p[0], ('if', cond, then, other))
+        p = p[:8]
+        hybrid_parser.p_program_conditional(p)
+        self.assertEqual(p[0], ('if', cond, then, None))
+
+    def test_division(self):
+        # a division by the literal 0 passed, the action compared with the int 0
+        for p, src in ((terms_parser.parser, "x / 0"), (formulas_parser.parser, "x / 0 > 1")):
+            with self.assertRaises(ZeroDivisionError):
+                p.parse(src)
+
+    def test_empty_terms(self):
+        # IndexError in parser, the action read p[1] of the empty production
+        self.assertEqual(parser.parser.parse("> 1"), ('>', (), '1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
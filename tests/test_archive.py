@@ -0,0 +1,75 @@
+""" Test memory-mapped files and lazily parsed .kyx archives
+
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+import generate
+import hybrid_parser
+import nodes
+
+ENTRY = '''ArchiveEntry "%s"
+  ProgramVariables Real x; End.
+  Problem
+%s
+  End.
+  Tactic "auto" auto End.
+End.
+
+'''
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        rng = random.Random(0)
+        self.models = [generate.model(rng, 10) for _ in range(4)]
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.dir.name, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_parse_file(self):
+        p = hybrid_parser.parser
+        path = self.write('model.txt', self.models[0])
+        self.assertIs(p.parse_file(path), p.parse(self.models[0]))
+        with self.assertRaises(TypeError):
+            p.parse_file(self.write('empty.txt', ''))
+
+    def test_entries(self):
+        p = hybrid_parser.parser
+        text = ''.join(ENTRY % ('entry %d' % i, m) for i, m in enumerate(self.models))
+        with p.parse_archive(self.write('models.kyx', text)) as archive:
+            self.assertEqual(len(archive), 4)
+            self.assertEqual([e.name for e in archive], ['entry 0', 'entry 1', 'entry 2', 'entry 3'])
+            for entry, model in zip(archive, self.models):
+                self.assertIs(entry.parse(), p.parse(model))
+            self.assertEqual(bytes(archive['entry 2'].source('ProgramVariables')), b' Real x; ')
+            self.assertIsNone(archive[0].block('Definitions'))
+            with self.assertRaises(KeyError):
+                archive['entry 4']
+
+    def test_parse_all(self):
+        p = hybrid_parser.parser
+        text = ''.join(ENTRY % ('entry %d' % i, m) for i, m in enumerate(self.models))
+        text += 'Lemma "no problem"\n  Tactic "auto" auto End.\nEnd.\n'
+        size = nodes.size()
+        with p.parse_archive(self.write('models.kyx', text)) as archive:
+            found = []
+            for (entry, tree), model in zip(archive.parse_all(), self.models):
+                self.assertIs(tree, p.parse(model))
+                found.append(entry.name)
+        self.assertEqual(found, ['entry 0', 'entry 1', 'entry 2', 'entry 3'])
+        # the trees were interned only while the loop had them
+        self.assertEqual(nodes.size(), size)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+""" Test bulk parsing on a process pool
+
+"""
+
+import unittest
+
+import bulk
+import generate
+import parser
+
+
+class TestParseMany(unittest.TestCase):
+    def setUp(self):
+        corpus = generate.corpus(200, generate.formula)
+        # a syntax error and a division by zero in the middle of the corpus
+        corpus[50] = 'x >= 1)'
+        corpus[120] = 'x / 0 = 1'
+        self.corpus = corpus
+
+    def _expected(self):
+        expected = []
+        for s in self.corpus:
+            try:
+                expected.append((parser.parser.parse(s), None))
+            except Exception as e:
+                expected.append((None, type(e)))
+        return expected
+
+    def _check(self, results):
+        results = sorted(results)
+        self.assertEqual([res.index for res in results], list(range(len(self.corpus))))
+        self.assertEqual([(res.value, res.error and type(res.error)) for res in results],
+                         self._expected())
+
+    def test_in_process(self):
+        results = list(bulk.parse_many('parser', self.corpus, workers=0, chunksize=16))
+        self.assertEqual(results[50].error.__class__, TypeError)
+        self.assertEqual(results[120].error.__class__, ZeroDivisionError)
+        self._check(results)
+
+    def test_ordered(self):
+        results = list(parser.parser.parse_many(iter(self.corpus), workers=2, chunksize=16))
+        self.assertEqual([res.index for res in results], list(range(len(self.corpus))))
+        self._check(results)
+
+    def test_unordered(self):
+        self._check(bulk.parse_many('parser', self.corpus, workers=2, chunksize=7, ordered=False))
+
+    def test_close(self):
+        # stopping early must not hang on the pending chunks
+        results = bulk.parse_many('parser', self.corpus * 10, workers=2, chunksize=4)
+        self.assertEqual(next(results).index, 0)
+        results.close()
@@ -0,0 +1,48 @@
+""" Test the LRU cache of parse results
+
+"""
+
+import unittest
+
+import cache
+import hybrid_parser
+import parser
+
+
+class TestCache(unittest.TestCase):
+    def test_lru(self):
+        lru = cache.LRUCache(2)
+        lru.put('a', 1)
+        lru.put('b', 2)
+        self.assertEqual(lru.get('a'), 1)
+        lru.put('c', 3)
+        self.assertNotIn('b', lru)
+        self.assertEqual(lru.get('b', 0), 0)
+        self.assertEqual(lru.stats(), {'size': 2, 'hits': 1, 'misses': 1, 'evictions': 1})
+        with self.assertRaises(ValueError):
+            cache.LRUCache(0)
+
+    def test_whitespace(self):
+        p = parser.parser.clone(cache_size=8)
+        res = p.parse("x+1>=0")
+        self.assertEqual(res, parser.parser.parse("x+1>=0"))
+        self.assertIs(p.parse("x + 1 >= 0"), res)
+        self.assertIs(p.parse("x +\n 1 >=0"), res)
+        self.assertEqual((p.cache.hits, p.cache.misses), (2, 1))
+
+        # different token streams do not share an entry
+        self.assertNotEqual(p.parse("x+1>0"), res)
+        self.assertEqual(len(p.cache), 2)
+
+    def test_errors(self):
+        p = hybrid_parser.parser.clone(cache_size=8)
+        for _ in range(2):
+            with self.assertRaises(TypeError):
+                p.parse("x := ;")
+        self.assertEqual(len(p.cache), 0)
+
+    def test_eviction(self):
+        p = parser.parser.clone(cache_size=2)
+        for s in ("x = 1", "x = 2", "x = 3", "x = 1"):
+            p.parse(s)
+        self.assertEqual(p.cache.stats(), {'size': 2, 'hits': 0, 'misses': 4, 'evictions': 2})
@@ -0,0 +1,77 @@
+""" Test the traversals of distinct subtrees
+
+"""
+
+import random
+import unittest
+
+import dag
+import formulas_parser
+import generate
+import hybrid_parser
+import nodes
+import terms_parser
+
+
+def nested(depth):
+    # x + x, (x + x) * (x + x), ... with 2^depth leaves and depth + 1 nodes
+    tree = nodes.Var('x')
+    for i in range(depth):
+        tree = nodes.BinOp('+*'[i % 2], tree, tree)
+    return tree
+
+
+class TestUnique(unittest.TestCase):
+    def test_order(self):
+        tree = terms_parser.parser.parse('(x + 1) * (x + 1) - x')
+        order = list(dag.unique(tree))
+        self.assertEqual(len(order), len(set(map(id, order))))
+        self.assertEqual(order, [nodes.Var('x'), nodes.Num('1'), tree.left.left,
+                                 tree.left, tree])
+
+    def test_shared(self):
+        self.assertEqual(len(list(dag.unique(nested(200)))), 201)
+        self.assertEqual(dag.stats(nested(10)), dag.Stats(2 ** 11 - 1, 11))
+
+    def test_deep(self):
+        tree = nodes.Var('x')
+        for i in range(20000):
+            tree = nodes.BinOp('+', tree, nodes.Num(str(i)))
+        self.assertEqual(dag.stats(tree), dag.Stats(40001, 40001))
+
+    def test_fold(self):
+        depth = dag.fold(nested(300), lambda node, children: 1 + max(children or [0]))
+        self.assertEqual(depth, 301)
+        calls = []
+        dag.fold(nested(30), lambda node, children: calls.append(node))
+        self.assertEqual(len(calls), 31)
+
+    def test_program(self):
+        tree = hybrid_parser.parser.parse("{x' = v, v' = 2 & v >= 2} ?[x := 2;]x > v;")
+        self.assertEqual(dag.stats(tree), dag.Stats(17, 13))
+        self.assertIsNone(dag.fold(True, lambda node, children: 1))
+
+
+class TestShare(unittest.TestCase):
+    def test_plain_tuples(self):
+        for i in range(10):
+            tree = hybrid_parser.parser.parse(generate.model(random.Random(i), 20))
+            self.assertIs(dag.share(nodes.to_tuple(tree)), tree)
+        for s in generate.corpus(50, depth=3, seed=4):
+            tree = formulas_parser.parser.parse(s)
+            self.assertIs(dag.share(nodes.to_tuple(tree)), tree)
+        for s in ("x := (1, y);", "x' := 2; {x' = 1 & x > 0}", "?\\forall x x > 0;"):
+            tree = hybrid_parser.parser.parse(s)
+            self.assertIs(dag.share(nodes.to_tuple(tree)), tree)
+
+    def test_after_clear(self):
+        old = terms_parser.parser.parse('x*y + x*y')
+        nodes.clear()
+        new = terms_parser.parser.parse('x*y + x*y')
+        self.assertIsNot(old, new)
+        self.assertIs(dag.share(old), new)
+        self.assertIs(dag.share(new), new)
+
+
+if __name__ == '__main__':
+    unittest.main()
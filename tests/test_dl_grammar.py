@@ -0,0 +1,75 @@
+""" Test the unified grammar and its entry points
+
+"""
+
+import random
+import unittest
+
+import dl_grammar
+import formulas_parser
+import generate
+import hybrid_parser
+import nodes
+import terms_parser
+
+
+class TestEntryPoints(unittest.TestCase):
+    def test_same_trees(self):
+        for s in generate.corpus(100, generate.term, depth=4, seed=1):
+            self.assertIs(dl_grammar.parse_term(s), terms_parser.parser.parse(s))
+        for s in generate.corpus(100, depth=3, seed=2):
+            self.assertIs(dl_grammar.parse_formula(s), formulas_parser.parser.parse(s))
+        for i in range(10):
+            s = generate.model(random.Random(i), 20)
+            self.assertIs(dl_grammar.parse_program(s), hybrid_parser.parser.parse(s))
+            self.assertIs(dl_grammar.parser.parse(s), hybrid_parser.parser.parse(s))
+
+    def test_kinds(self):
+        with self.assertRaises(TypeError) as cm:
+            dl_grammar.parse_term('x > 1')
+        self.assertEqual((cm.exception.offset, cm.exception.column), (2, 3))
+        with self.assertRaises(TypeError):
+            dl_grammar.parse_formula('x := 1;')
+        with self.assertRaises(TypeError):
+            dl_grammar.parse_program('x > 1')
+        self.assertIs(dl_grammar.parse_term(''), nodes.EMPTY)
+
+    def test_reserved_words(self):
+        tree = dl_grammar.parse_program('if (x > 0) {x := 1;} else {x := 2;}')
+        self.assertIs(tree, nodes.If(dl_grammar.parse_formula('x > 0'),
+                                     dl_grammar.parse_program('x := 1;'),
+                                     dl_grammar.parse_program('x := 2;')))
+        self.assertIs(dl_grammar.parse_formula('True & x > 1').left, True)
+        self.assertIs(dl_grammar.parse_term('iffy'), nodes.Var('iffy'))
+
+    def test_less(self):
+        # < is a comparison after a term and opens a diamond before a program
+        self.assertIs(dl_grammar.parse_formula('x < 1'),
+                      nodes.Compare('<', nodes.Var('x'), nodes.Num('1')))
+        tree = dl_grammar.parse_formula('<x := 1;>x < 2 & y <= 0')
+        self.assertIs(tree.left, nodes.Diamond(dl_grammar.parse_program('x := 1;'),
+                                               dl_grammar.parse_formula('x < 2')))
+        self.assertIs(tree.right, nodes.Compare('<=', nodes.Var('y'), nodes.Num('0')))
+        self.assertIs(dl_grammar.parse_program('?x < y;').cond,
+                      dl_grammar.parse_formula('x < y'))
+
+    def test_decimals(self):
+        self.assertIs(dl_grammar.parse_term('1.5 * x'), nodes.BinOp('*', nodes.Num('1.5'),
+                                                                     nodes.Var('x')))
+
+    def test_trace(self):
+        events = []
+        dl_grammar.parse_term('x', lambda event, value: events.append((event, value)))
+        self.assertEqual(events, [('result', nodes.Var('x'))])
+
+    def test_cache(self):
+        # the start token is part of the cache key
+        parser = dl_grammar.parser.clone(cache_size=10)
+        self.assertIs(parser.parse('x', start=dl_grammar.START_TERM), nodes.Var('x'))
+        with self.assertRaises(TypeError):
+            parser.parse('x', start=dl_grammar.START_FORMULA)
+        self.assertEqual(parser.cache.misses, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
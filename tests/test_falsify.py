@@ -0,0 +1,76 @@
+""" Test the falsification of box modalities by simulation
+
+"""
+
+import unittest
+
+try:
+    import numpy as np
+    import falsify
+except ImportError:
+    np = None
+
+import hybrid_parser
+import nodes
+
+
+def box(src):
+    # box modalities are formulas, parsed as the condition of a test
+    return hybrid_parser.parser.parse('?%s;' % src).cond
+
+BRAKING = box("[{x' = v, v' = -b & v >= 0}] x <= 10")
+
+
+@unittest.skipIf(np is None, "needs numpy")
+class TestFalsify(unittest.TestCase):
+    def test_safe(self):
+        # the stopping distance v^2/2b is at most 4.5
+        result = falsify.falsify(BRAKING, {'x': (0, 5), 'v': (0, 3), 'b': 1},
+                                 max_runs=20000, batch=5000, horizon=5, dt=0.05)
+        self.assertIsNone(result.counterexample)
+        coverage = result.coverage
+        self.assertEqual((coverage.runs, coverage.batches, coverage.completed), (20000, 4, 20000))
+        self.assertGreater(coverage.checked, coverage.runs)
+        low, high = coverage.ranges['x']
+        self.assertTrue(0 <= low and 9 < high <= 10)
+
+    def test_counterexample(self):
+        ranges = {'x': (0, 5), 'v': (0, 5), 'b': 1}
+        result = falsify.falsify(BRAKING, ranges, max_runs=20000, batch=5000, horizon=5, dt=0.05)
+        example = result.counterexample
+        self.assertGreater(example.state['x'], 10)
+        self.assertEqual(example.initial['b'], 1)
+        self.assertEqual(example.trace[-1], example.state)
+        # the trace follows the evolution from the initial state
+        self.assertAlmostEqual(example.trace[0]['x'], example.initial['x'])
+        self.assertTrue(all(a['x'] <= b['x'] for a, b in zip(example.trace, example.trace[1:])))
+        # the same seed finds the same counterexample on a process pool
+        again = falsify.falsify(BRAKING, ranges, max_runs=20000, batch=5000, workers=2,
+                                horizon=5, dt=0.05)
+        self.assertEqual(again.counterexample, example)
+
+    def test_precondition(self):
+        safe = nodes.Imply(hybrid_parser.parser.parse('?v <= 3;').cond, BRAKING)
+        result = falsify.falsify(safe, {'x': (0, 5), 'v': (0, 5), 'b': 1},
+                                 max_runs=10000, batch=5000, horizon=5, dt=0.05)
+        self.assertIsNone(result.counterexample)
+        self.assertAlmostEqual(result.coverage.completed / 10000.0, 0.6, delta=0.05)
+
+    def test_loops(self):
+        # the loop may end after any iteration, not only after the last one
+        tree = box("[{x := x + 1;}*] x <= 2")
+        result = falsify.falsify(tree, {'x': 0}, max_runs=100, batch=100, repeat=0.9)
+        self.assertEqual(result.counterexample.state['x'], 3)
+        self.assertEqual([state['x'] for state in result.counterexample.trace], [0, 1, 2, 3])
+
+    def test_budget(self):
+        result = falsify.falsify(BRAKING, {'x': (0, 5), 'v': (0, 3), 'b': 1},
+                                 budget=0.5, max_runs=None, batch=1000, horizon=5, dt=0.05)
+        self.assertIsNone(result.counterexample)
+        self.assertLess(result.coverage.seconds, 2)
+        with self.assertRaises(TypeError):
+            falsify.falsify(BRAKING.body, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
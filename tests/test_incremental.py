@@ -0,0 +1,63 @@
+""" Test incremental reparsing against parsing the edited source again
+
+"""
+
+import random
+import unittest
+
+import generate
+import hybrid_parser
+
+# pieces of inserted text, many of them break the program
+PIECES = ('x', ':=', '1', ';', '{', '}', '*', '++', '?', '>', ' ', '\n', "'", '=', '&',
+          'if', '(', ')', 'else', '0', '/', 'y := 2;', '{x := 1;}*', ' ++ ', '[x:=1;]',
+          '<x:=1;>', 'true')
+
+
+def outcome(parse, *args):
+    try:
+        return parse(*args)
+    except (TypeError, ZeroDivisionError):
+        return TypeError
+
+
+class TestIncremental(unittest.TestCase):
+    def test_edits(self):
+        p = hybrid_parser.parser
+        rng = random.Random(0)
+        for _ in range(40):
+            doc = p.parse_incremental(generate.model(rng, rng.randint(1, 15)))
+            self.assertIs(doc.tree, p.parse(doc.source))
+            for _ in range(20):
+                src = doc.source
+                offset = rng.randint(0, len(src))
+                deleted = rng.randint(0, min(4, len(src) - offset))
+                inserted = ''.join(rng.choice(PIECES) for _ in range(rng.randint(0, 2)))
+                edited = outcome(lambda *edit: doc.edit(*edit).tree, offset, deleted, inserted)
+                new = src[:offset] + inserted + src[offset + deleted:]
+                # the reparse gives the tree of a full parse of the edited source,
+                # single identifiers are plain strings, not interned nodes
+                self.assertEqual(edited, outcome(p.parse, new), (src, new))
+                if edited is not TypeError:
+                    doc = doc.edit(offset, deleted, inserted)
+
+    def test_local(self):
+        p = hybrid_parser.parser
+        src = ''.join('x%d := %d;\n' % (i, i) for i in range(100))
+        doc = p.parse_incremental(src)
+        self.assertEqual(len(doc.trees), 100)
+        offset = src.index('x50 := 50;') + len('x50 := ')
+        edited = doc.edit(offset, 2, 'y + 1')
+        self.assertIs(edited.tree, p.parse(edited.source))
+        self.assertLess(edited.damaged[1] - edited.damaged[0], 20)
+        # the trees of the other units are the same objects
+        self.assertTrue(all(a is b for a, b in zip(edited.trees[:50], doc.trees[:50])))
+        self.assertEqual(edited.starts[51], doc.starts[51] + 3)
+        # the previous result is unchanged
+        self.assertIs(doc.tree, p.parse(src))
+        with self.assertRaises(ValueError):
+            doc.edit(len(src), 1, '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+""" Test the token, depth and time limits of a parse
+
+"""
+
+import random
+import unittest
+
+import formulas_parser
+import generate
+import hybrid_parser
+import limits
+import parser
+import terms_parser
+
+
+class TestLimits(unittest.TestCase):
+    def test_within(self):
+        for i in range(5):
+            s = generate.model(random.Random(i), 50)
+            self.assertIs(hybrid_parser.parser.parse(s, limits=limits.Limits(100000, 1000, 60)),
+                          hybrid_parser.parser.parse(s))
+        self.assertIs(parser.parser.parse('(x) = 1', limits=limits.Limits(depth=4)),
+                      parser.parser.parse('(x) = 1'))
+
+    def test_tokens(self):
+        with self.assertRaises(limits.TokenLimit) as cm:
+            hybrid_parser.parser.parse('x := 1;\ny := 2;', limits=limits.Limits(tokens=4))
+        e = cm.exception
+        self.assertEqual((e.limit, e.value), ('tokens', 4))
+        self.assertEqual((e.offset, e.line, e.column), (8, 2, 1))
+        hybrid_parser.parser.parse('x := 1;\ny := 2;', limits=limits.Limits(tokens=8))
+
+    def test_depth(self):
+        # x is a term and terms, the parenthesis adds one
+        self.assertIs(terms_parser.parser.parse('(x)', limits=limits.Limits(depth=3)),
+                      terms_parser.parser.parse('x'))
+        with self.assertRaises(limits.DepthLimit):
+            terms_parser.parser.parse('(x)', limits=limits.Limits(depth=2))
+        nested = '(' * 1000 + 'x > 1' + ')' * 1000
+        with self.assertRaises(limits.DepthLimit) as cm:
+            formulas_parser.parser.parse(nested, limits=limits.Limits(depth=100))
+        self.assertEqual(cm.exception.limit, 'depth')
+        # at the innermost parenthesis that is too deep
+        self.assertEqual(nested[cm.exception.offset], '(')
+        with self.assertRaises(limits.DepthLimit):
+            hybrid_parser.parser.parse('x := 1;' * 500, limits=limits.Limits(depth=100))
+
+    def test_time(self):
+        with self.assertRaises(limits.TimeLimit) as cm:
+            hybrid_parser.parser.parse('{x := 1;}*' * 1000, limits=limits.Limits(seconds=0))
+        self.assertEqual((cm.exception.limit, cm.exception.offset), ('seconds', 0))
+
+    def test_parser_limits(self):
+        # the limits of the parser apply to every parse, parse() may replace them
+        limited = hybrid_parser.parser.clone(limits=limits.Limits(depth=10))
+        with self.assertRaises(limits.DepthLimit):
+            limited.parse('x := 1;' * 20)
+        limited.parse('x := 1;' * 20, limits=limits.Limits(depth=100))
+        self.assertEqual(limited.clone().limits, limits.Limits(depth=10))
+        # the parser is usable after a limit error
+        self.assertIs(limited.parse('x := 1;'), hybrid_parser.parser.parse('x := 1;'))
+
+    def test_cache(self):
+        # a cached result does not pass over stricter limits given to parse()
+        cached = hybrid_parser.parser.clone(cache_size=8)
+        tree = cached.parse('x := 1;' * 20)
+        with self.assertRaises(limits.DepthLimit):
+            cached.parse('x := 1;' * 20, limits=limits.Limits(depth=10))
+        self.assertIs(cached.parse('x := 1;' * 20), tree)
+        self.assertEqual(len(cached.cache), 1)
+
+    def test_pratt(self):
+        pratt = terms_parser.parser.clone(engine='pratt')
+        with self.assertRaises(limits.TokenLimit):
+            pratt.parse('x + y', limits=limits.Limits(tokens=2))
+        with self.assertRaises(ValueError):
+            pratt.parse('x + y', limits=limits.Limits(depth=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+""" Test the hash-consed AST nodes
+
+"""
+
+import pickle
+import unittest
+
+import nodes
+from nodes import Assign, BinOp, Box, Num, Seq, Var
+
+import formulas_parser
+import hybrid_parser
+import terms_parser
+
+
+class TestNodes(unittest.TestCase):
+    def test_tuple_layout(self):
+        t = BinOp('*', Var('x'), Num('-1'))
+        self.assertEqual(t, ('*', ('IDENTIFIER', 'x'), '-1'))
+        self.assertEqual(('*', ('IDENTIFIER', 'x'), '-1'), t)
+        self.assertEqual((t.op, t.left.name, t.right), ('*', 'x', '-1'))
+        self.assertEqual(Assign('x', t), ('define', 'x', t))
+
+    def test_interned(self):
+        self.assertIs(BinOp('+', Var('x'), Num('1')), BinOp('+', Var('x'), Num('1')))
+        self.assertIsNot(BinOp('+', Var('x'), Num('1')), BinOp('+', Var('x'), Num('2')))
+        self.assertNotEqual(BinOp('+', Var('x'), Num('1')), BinOp('+', Var('x'), Num('2')))
+        self.assertEqual(len({Var('x'), Var('x'), Var('y')}), 2)
+
+    def test_shared_subterms(self):
+        res = terms_parser.parser.parse("(x*y + 1) ^ (x*y + 1)")
+        self.assertIs(res.left, res.right)
+        self.assertIs(res.left.left, terms_parser.parser.parse("x * y"))
+
+    def test_pickle(self):
+        res = hybrid_parser.parser.parse("x := 1; ?x >= 0;")
+        self.assertIsInstance(res, Seq)
+        self.assertIs(pickle.loads(pickle.dumps(res)), res)
+
+    def test_parsers(self):
+        res = formulas_parser.parser.parse("[a] x > 0 -> y >= 0")
+        self.assertEqual(res, ('imply', ('box', 'a', ('>', ('IDENTIFIER', 'x'), '0')),
+                               ('>=', ('IDENTIFIER', 'y'), '0')))
+        self.assertIsInstance(res.left, Box)
+
+        res = hybrid_parser.parser.parse("{x' = v, v' = -1 & v >= 0}")
+        self.assertEqual(res, ('continuous_ev',
+                               (('differential', 'x', ('IDENTIFIER', 'v')),
+                                ('differential', 'v', ('*', '1', '-1'))),
+                               ('>=', ('IDENTIFIER', 'v'), '0')))
+
+    def test_scope(self):
+        before = hybrid_parser.parser.parse("x := 1;")
+        size = nodes.size()
+        with nodes.scope():
+            tree = hybrid_parser.parser.parse("x := 1; scoped := x + 1;")
+            with nodes.scope():
+                hybrid_parser.parser.parse("inner := 2;")
+            self.assertIs(tree.first, before)
+            self.assertIs(hybrid_parser.parser.parse("scoped := x + 1;"), tree.second)
+        self.assertEqual(nodes.size(), size)
+        # the nodes from before stay interned, the ones of the block do not
+        self.assertIs(hybrid_parser.parser.parse("x := 1;"), before)
+        self.assertIsNot(hybrid_parser.parser.parse("scoped := x + 1;"), tree.second)
+
+    def test_structural(self):
+        # a node from an exited scope equals and hashes like a new one
+        src = "x := y + 1; z := x;"
+        with nodes.scope():
+            a = hybrid_parser.parser.parse(src)
+        b = hybrid_parser.parser.parse(src)
+        self.assertIsNot(a, b)
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b}), 1)
+        self.assertNotEqual(a, hybrid_parser.parser.parse("x := y + 2; z := x;"))
+
+        with nodes.scope():
+            a = hybrid_parser.parser.parse("x := 1;" * 20000)
+        b = hybrid_parser.parser.parse("x := 1;" * 20000)
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+
+    def test_to_tuple(self):
+        res = terms_parser.parser.parse("x + x")
+        plain = nodes.to_tuple(res)
+        self.assertEqual(plain, res)
+        self.assertIs(type(plain), tuple)
+        self.assertIsNot(plain[1], plain[2])
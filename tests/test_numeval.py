@@ -0,0 +1,123 @@
+""" Test the batched NumPy evaluation of terms and formulas
+
+"""
+
+import random
+import unittest
+
+try:
+    import numpy as np
+    import numeval
+except ImportError:
+    np = None
+
+import boolean_parser
+import formulas_parser
+import generate
+import hybrid_parser
+import nodes
+import parser
+import postfix
+import terms_parser
+
+
+@unittest.skipIf(np is None, "needs numpy")
+class TestTerms(unittest.TestCase):
+    def test_random(self):
+        rng = np.random.default_rng(0)
+        env = dict((name, rng.uniform(0.5, 1.5, 50)) for name in generate.VARIABLES)
+        for s in generate.corpus(100, generate.term, depth=3, seed=2):
+            tree = terms_parser.parser.parse(s)
+            code = postfix.encode(tree)
+            result = numeval.compile_term(tree)(env, rows=50, chunk=16)
+            for i in range(50):
+                try:
+                    expected = postfix.evaluate(code, dict((k, float(v[i])) for k, v in env.items()))
+                except OverflowError:
+                    continue
+                self.assertTrue(np.isclose(result[i], expected, equal_nan=True), s)
+
+    def test_folding(self):
+        program = numeval.compile_term(terms_parser.parser.parse('(2*3 + 1)*x - -4^2'))
+        self.assertEqual(program.names, ['x'])
+        self.assertEqual(len(program.code), 2)
+        self.assertEqual(list(program({'x': [1.0, 2.0]})), [23.0, 30.0])
+        program = numeval.compile_term(terms_parser.parser.parse('2^3/4'))
+        self.assertEqual(program.code, [])
+        self.assertEqual(list(program({}, rows=3)), [2.0] * 3)
+
+    def test_scratch_buffers(self):
+        # three products are live at once, the sums reuse their buffers
+        program = numeval.compile_term(terms_parser.parser.parse('(x*y + z*v) * (x*y + z*v)'))
+        self.assertEqual(program.temps, 3)
+        x = np.arange(10.0)
+        env = {'x': x, 'y': x, 'z': x, 'v': x}
+        self.assertEqual(list(program(env, chunk=3)), list((2 * x * x) ** 2))
+        self.assertEqual(list(numeval.compile_term(terms_parser.parser.parse('x'))(env)), list(x))
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            numeval.compile_term(terms_parser.parser.parse("x'"))
+        with self.assertRaises(TypeError):
+            numeval.compile_term(terms_parser.parser.parse(''))
+        program = numeval.compile_term(terms_parser.parser.parse('x + y'))
+        with self.assertRaises(ValueError):
+            program({'x': [1, 2], 'y': [1]})
+        # IEEE semantics instead of ZeroDivisionError
+        self.assertEqual(list(numeval.compile_term(terms_parser.parser.parse('1/x'))({'x': [0]})),
+                         [float('inf')])
+
+
+
+@unittest.skipIf(np is None, "needs numpy")
+class TestFormulas(unittest.TestCase):
+    def test_random(self):
+        rng = np.random.default_rng(1)
+        env = dict((name, rng.integers(-3, 4, 500).astype(float)) for name in generate.VARIABLES)
+        for s in generate.corpus(200, generate.formula, depth=4, seed=3, connectives='&|!'):
+            if '^' in s:
+                continue
+            tree = parser.parser.parse(s)
+            code = postfix.encode(tree)
+            # small chunks, so that the short-circuits gather rows
+            result = numeval.compile_formula(tree)(env, rows=500, chunk=64)
+            for i in range(0, 500, 7):
+                try:
+                    expected = postfix.evaluate(code, dict((k, float(v[i])) for k, v in env.items()))
+                except ZeroDivisionError:
+                    continue
+                self.assertEqual(result[i], bool(expected), s)
+
+    def test_connectives(self):
+        env = {'x': [-1, 1, 1, 1], 'y': [1, 1, 0, 1], 'z': [0, 5, 0, 5]}
+        for s, expected in (('x > 0 -> (y = 1 <-> !(z >= 2))', [True, False, False, False]),
+                            ('x > 0 & y = 1 & z != 0', [False, True, False, True]),
+                            ('x = 1 | y = 1 | z = 1', [True, True, True, True]),
+                            ('2 > 1 & 1 = 1', [True] * 4)):
+            predicate = numeval.compile_formula(formulas_parser.parser.parse(s))
+            self.assertEqual(list(predicate(env, rows=4)), expected, s)
+        predicate = numeval.compile_formula(boolean_parser.parser.parse('True & !False'))
+        self.assertEqual(predicate.names, [])
+        self.assertEqual(list(predicate({}, rows=2)), [True, True])
+
+    def test_chains(self):
+        # a long conjunction is flattened instead of nested
+        s = ' & '.join('x > %d' % i for i in range(3000))
+        predicate = numeval.compile_formula(parser.parser.parse(s))
+        self.assertEqual(len(predicate.formula[2]), 3000)
+        self.assertEqual(list(predicate({'x': [0, 5000, 2999]})), [False, True, False])
+
+    def test_errors(self):
+        with self.assertRaises(TypeError) as cm:
+            numeval.compile_formula(formulas_parser.parser.parse('\\forall x x > 0'))
+        self.assertIn('quantifier', str(cm.exception))
+        box = hybrid_parser.parser.parse('?[x := 1;] x > 0;').cond
+        with self.assertRaises(TypeError) as cm:
+            numeval.compile_formula(nodes.Logic('&', box, True))
+        self.assertIn('modality', str(cm.exception))
+        with self.assertRaises(TypeError):
+            numeval.compile_formula(terms_parser.parser.parse('x + 1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,15 +2,23 @@
 
 """
 
+import importlib
 import logging
+import os
+import subprocess
+import sys
 import unittest
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from io import StringIO
 
 from ply.lex import LexToken
 import ply.yacc as yacc
 
 from parser import lexer, reset, parser
+import generate
+import parsing
 
 
 class TestLexer(unittest.TestCase):
@@ -103,3 +111,61 @@ class TestParser(unittest.TestCase):
 
         # Not a complete expression - parsing must fail
         _must_fail(parser, "true + false")
+
+
+class TestGrammars(unittest.TestCase):
+    def test_import(self):
+        # importing must neither block on stdin nor load the tables
+        names = ('boolean_parser', 'terms_parser', 'formulas_parser', 'hybrid_parser')
+        code = "import %s; print([m.parser._yacc for m in (%s)])" % (', '.join(names), ', '.join(names))
+        res = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(parsing.__file__),
+                             stdin=subprocess.PIPE, capture_output=True, text=True, timeout=30)
+        self.assertEqual(res.stdout, '[None, None, None, None]\n')
+
+    def test_trace(self):
+        import terms_parser
+
+        events = []
+        out = StringIO()
+        with redirect_stdout(out):
+            res = terms_parser.parser.parse("x ^ 2", trace=lambda *e: events.append(e))
+            terms_parser.parser.parse("x ^ 2")
+        self.assertEqual(res, ('^', ('IDENTIFIER', 'x'), '2'))
+        self.assertEqual(events, [('result', res)])
+        self.assertEqual(out.getvalue(), '')
+
+    def test_repl(self):
+        import boolean_parser
+
+        out = StringIO()
+        boolean_parser.parser.repl(StringIO("True & !False\nTrue &\n"), out)
+        self.assertEqual(out.getvalue().splitlines(),
+                         ["('and', True, ('not', False))", "unexpected end of input"])
+
+    def test_threads(self):
+        import terms_parser
+
+        corpus = generate.corpus(400, generate.term)
+        expected = [terms_parser.parser.parse(s) for s in corpus]
+        with ThreadPoolExecutor(8) as pool:
+            self.assertEqual(list(pool.map(terms_parser.parser.parse, corpus)), expected)
+
+    def test_reentrant(self):
+        import terms_parser
+
+        # parse again from the trace hook while the outer parse is running
+        inner = []
+        def trace(event, value):
+            if event == 'illegal':
+                inner.append(terms_parser.parser.parse("y"))
+
+        res = terms_parser.parser.parse("x # + 1", trace=trace)
+        self.assertEqual(res, ('+', ('IDENTIFIER', 'x'), '1'))
+        self.assertEqual(inner, [('IDENTIFIER', 'y')])
+
+    def test_clone(self):
+        import terms_parser
+
+        clone = terms_parser.parser.clone()
+        self.assertIsNot(clone.lexer, terms_parser.parser.lexer)
+        self.assertEqual(clone.parse("x'"), ('differential', ('IDENTIFIER', 'x')))
@@ -0,0 +1,63 @@
+""" Test the flat postfix encoding
+
+"""
+
+import random
+import unittest
+
+import generate
+import postfix
+
+import formulas_parser
+import hybrid_parser
+import terms_parser
+
+
+class TestPostfix(unittest.TestCase):
+    def _roundtrip(self, parser, corpus):
+        for s in corpus:
+            tree = parser.parse(s)
+            code = parser.parse_postfix(s)
+            self.assertEqual(code, postfix.encode(tree))
+            self.assertIs(postfix.decode(code), tree, s)
+
+    def test_roundtrip(self):
+        self._roundtrip(terms_parser.parser, generate.corpus(200, generate.term))
+        self._roundtrip(formulas_parser.parser, generate.corpus(200, generate.formula, connectives='&|!'))
+        self._roundtrip(hybrid_parser.parser, generate.corpus(200, generate.program))
+        self._roundtrip(formulas_parser.parser, ["\\forall x [a] x' >= f()", "<b> x = 1 <-> y != 2"])
+
+    def test_deep(self):
+        # far deeper than the recursion limit
+        tree = terms_parser.parser.parse('-' * 20000 + 'x')
+        code = postfix.encode(tree)
+        self.assertEqual(len(code), 1 + 2 * 20000)
+        self.assertIs(postfix.decode(code), tree)
+        self.assertEqual(postfix.evaluate(code, {'x': 3}), 3)
+
+    def test_tables(self):
+        code = hybrid_parser.parser.parse_postfix("x := x + 15; y := x * 15;")
+        self.assertEqual(code.names, ['x', 'y'])
+        self.assertEqual(list(code.consts), [15])
+        self.assertEqual(code.literals, ['15'])
+        self.assertEqual(len(code.ops), len(code.args))
+
+    def test_evaluate(self):
+        rng = random.Random(1)
+        for s in generate.corpus(200, generate.comparison, depth=3):
+            if '^' in s:
+                # integer powers in eval() below get huge
+                continue
+            env = dict((v, rng.uniform(1, 2)) for v in generate.VARIABLES)
+            code = formulas_parser.parser.parse_postfix(s)
+            py = s.replace('^', '**').replace('!=', '<>').replace('=', '==')
+            py = py.replace('<>', '!=').replace('>==', '>=').replace('<==', '<=')
+            try:
+                expected = eval(py, {}, env)
+            except ZeroDivisionError:
+                continue
+            self.assertEqual(postfix.evaluate(code, env), expected, s)
+
+    def test_not_encodable(self):
+        with self.assertRaises(TypeError):
+            postfix.encode(('+', 1, 2))
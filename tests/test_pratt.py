@@ -0,0 +1,73 @@
+""" Test the Pratt engine against the LALR engine of the same grammar
+
+"""
+
+import random
+import unittest
+
+import generate
+import hybrid_parser
+import parser
+import terms_parser
+
+# tokens of both grammars, characters a grammar does not know are skipped
+TOKENS = ('x', 'y', '1', '0', '2.5', 'f', 'true', 'false', '+', '-', '*', '/', '^',
+          '(', ')', ',', "'", '=', '!=', '>', '>=', '<=', '&', '|', '!')
+
+
+def outcome(p, s):
+    try:
+        return p.parse(s)
+    except (TypeError, ZeroDivisionError) as e:
+        return type(e)
+
+
+class TestPratt(unittest.TestCase):
+    def check(self, module, inputs):
+        fast = module.parser.clone(engine='pratt')
+        for s in inputs:
+            # nodes are interned, equal trees are the same object
+            self.assertIs(outcome(fast, s), outcome(module.parser, s), s)
+
+    def test_examples(self):
+        self.check(terms_parser, ["", "x", "-x*y", "-x+y", "x-y-z", "x^y^z", "-x^2",
+                                  "x+y'", "(x)'", "x''", "(x, y)'", "-x'", "f()",
+                                  "f(x+1)", "f(x)'", "x/0", "x/(0)", "(x, y, z)", "x y"])
+        self.check(parser, ["x=1", "= 1", "x =", "!x=1 & y=2", "a=1|b=2&c=3",
+                            "true & !false", "(x)' > 0", "(x)'' > 0", "x = 1 = 2",
+                            "(x = 1)", "", "!", "x > 0 |", "x / 0 > 1", "x > 0 & y / 0 > 1"])
+        # syntax errors right after the division, the LALR engine reports
+        # them before it runs the division action
+        self.check(terms_parser, ['y < / 0 & true', 'x / 0 y'])
+        self.check(parser, ["( 0 / 0 ' != , y false 0 <"])
+
+    def test_generated(self):
+        self.check(terms_parser, generate.corpus(500, generate.term, depth=6))
+        self.check(parser, generate.corpus(500, generate.formula, connectives='&|!'))
+
+    def test_random_tokens(self):
+        rng = random.Random(0)
+        for module in (terms_parser, parser):
+            self.check(module, [' '.join(rng.choice(TOKENS) for _ in range(rng.randint(0, 10)))
+                                for _ in range(3000)])
+
+    def test_deep(self):
+        # nested deeper than the recursion limit, parsed by the LALR engine
+        self.check(terms_parser, ['(' * 2000 + 'x' + ')' * 2000])
+        self.check(parser, ['(' * 2000 + 'x' + ')' * 2000 + ' > 1',
+                            '(' * 2000 + 'x' + ')' * 1999 + ' > 1'])
+
+    def test_engines(self):
+        fast = parser.parser.clone(engine='pratt', cache_size=4)
+        self.assertEqual(fast.engine, 'pratt')
+        self.assertIs(fast.parse("x+1>0"), fast.parse("x + 1 > 0"))
+        self.assertEqual(fast.cache.hits, 1)
+        self.assertEqual(fast.clone().engine, 'pratt')
+        with self.assertRaises(ValueError):
+            hybrid_parser.parser.clone(engine='pratt')
+        with self.assertRaises(ValueError):
+            parser.parser.clone(engine='earley')
+
+
+if __name__ == '__main__':
+    unittest.main()
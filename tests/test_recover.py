@@ -0,0 +1,65 @@
+""" Test the error recovering parses
+
+"""
+
+import random
+import unittest
+
+import formulas_parser
+import generate
+import hybrid_parser
+import nodes
+import parser
+
+
+class TestRecover(unittest.TestCase):
+    def test_valid(self):
+        rng = random.Random(0)
+        src = generate.model(rng, 50)
+        tree, diagnostics = hybrid_parser.parser.parse_recover(src)
+        self.assertIs(tree, hybrid_parser.parser.parse(src))
+        self.assertEqual(diagnostics, [])
+
+    def test_statements(self):
+        src = "x := 1;\ny := ;\n{z := +;}*\nw := 2;"
+        tree, diagnostics = hybrid_parser.parser.parse_recover(src)
+        self.assertIs(tree.first, hybrid_parser.parser.parse("x := 1;"))
+        self.assertIs(tree.second.first, nodes.Error())
+        self.assertIs(tree.second.second.first, nodes.Loop(nodes.Error()))
+        self.assertEqual([(d.start, d.end, d.line, d.column) for d in diagnostics],
+                         [(13, 14, 2, 6), (21, 22, 3, 7)])
+        self.assertEqual(diagnostics[1].message, "unknown text at '+'")
+        # the same errors are the first error of a normal parse
+        with self.assertRaises(TypeError) as cm:
+            hybrid_parser.parser.parse(src)
+        self.assertEqual(cm.exception.offset, diagnostics[0].start)
+
+    def test_end_of_input(self):
+        tree, diagnostics = hybrid_parser.parser.parse_recover("x := 1; y := 2")
+        self.assertIs(tree, nodes.Seq(nodes.Assign('x', nodes.Num('1')), nodes.Error()))
+        self.assertEqual([d.message for d in diagnostics], ["unexpected end of input"])
+        self.assertEqual(diagnostics[0].start, 14)
+
+    def test_other_errors(self):
+        tree, diagnostics = hybrid_parser.parser.parse_recover("x := 1/0; y := 1; # z := 2;")
+        self.assertIs(tree.first, nodes.Error())
+        self.assertEqual([(d.message, d.start) for d in diagnostics],
+                         [("cannot divide by zero", 0), ("illegal character '#'", 18)])
+
+    def test_formulas(self):
+        tree, diagnostics = formulas_parser.parser.parse_recover("x > 0 & (y <) | z = 1")
+        self.assertIs(tree.left.right, nodes.Error())
+        self.assertEqual([d.start for d in diagnostics], [11])
+        # without error productions only the first error is reported
+        tree, diagnostics = parser.parser.parse_recover("x + * 2")
+        self.assertIs(tree, nodes.Error())
+        self.assertEqual(len(diagnostics), 1)
+
+    def test_state_restored(self):
+        hybrid_parser.parser.parse_recover("x := ;")
+        with self.assertRaises(TypeError):
+            hybrid_parser.parser.parse("x := ;")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+""" Test the binary tree files and the disk cache of parse_file
+
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+import formulas_parser
+import generate
+import hybrid_parser
+import limits
+import nodes
+import serialize
+import symbols
+
+
+class TestFiles(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'model.kyb')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_roundtrip(self):
+        for i in range(10):
+            tree = hybrid_parser.parser.parse(generate.model(random.Random(i), 30))
+            self.assertIs(serialize.loads(serialize.dumps(tree)), tree)
+        for s in generate.corpus(50, depth=3, seed=6):
+            tree = formulas_parser.parser.parse(s)
+            self.assertIs(serialize.loads(serialize.dumps(tree)), tree)
+
+    def test_literals(self):
+        # numbers that are no int64 or not in canonical form keep their text
+        tree = formulas_parser.parser.parse('x > 99999999999999999999999 & y = 007 - 5')
+        self.assertIs(serialize.loads(serialize.dumps(tree)), tree)
+        tree = nodes.Pair(nodes.Num('-1'), nodes.Func('f', nodes.EMPTY))
+        self.assertIs(serialize.loads(serialize.dumps(tree)), tree)
+
+    def test_after_clear(self):
+        src = generate.model(random.Random(0), 30)
+        data = serialize.dumps(hybrid_parser.parser.parse(src))
+        nodes.clear()
+        self.assertIs(serialize.loads(data), hybrid_parser.parser.parse(src))
+
+    def test_lazy(self):
+        tree = hybrid_parser.parser.parse("x := 1; {y := x*2; ++ ?y > 1;} z := 3;")
+        serialize.dump(tree, self.path)
+        with serialize.Loaded(self.path) as loaded:
+            root = loaded.root
+            self.assertEqual(root.opname, 'SEQ')
+            first, rest = root.children
+            self.assertIs(first.node(), tree.first)
+            # only the subtree of the first statement was built
+            self.assertEqual(len(loaded._nodes), 3)
+            choice = rest.children[0]
+            self.assertEqual([v.opname for v in choice.children], ['ASSIGN', 'TEST'])
+            self.assertIs(choice.node(), tree.second.first)
+            self.assertIs(loaded.tree(), tree)
+
+    def test_deep(self):
+        tree = nodes.Var('x')
+        for i in range(20000):
+            tree = nodes.BinOp('+', tree, nodes.Num(str(i)))
+        serialize.dump(tree, self.path)
+        with serialize.Loaded(self.path) as loaded:
+            self.assertIs(loaded.root.children[0].node(), tree.left)
+        self.assertIs(serialize.load(self.path), tree)
+
+    def test_errors(self):
+        data = serialize.dumps(formulas_parser.parser.parse('x > 1'))
+        for bad in (data[:10], b'XXXX' + data[4:], data[:-9]):
+            with open(self.path, 'wb') as f:
+                f.write(bad)
+            with self.assertRaises(ValueError):
+                serialize.load(self.path)
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.parser = hybrid_parser.parser.clone(cache_dir=os.path.join(self.dir.name, 'cache'))
+        self.path = os.path.join(self.dir.name, 'model.txt')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+
+    def test_parse_file(self):
+        cache = self.parser.disk_cache
+        src = generate.model(random.Random(0), 20)
+        self.write(src)
+        tree = self.parser.parse_file(self.path)
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 1})
+        nodes.clear()
+        self.assertIs(self.parser.parse_file(self.path), hybrid_parser.parser.parse(src))
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1})
+        # a changed source is parsed again
+        self.write(src + '\nx := 1;')
+        self.assertIsNot(self.parser.parse_file(self.path), tree)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 2})
+
+    def test_other_grammar(self):
+        self.write('x > 1')
+        other = formulas_parser.parser.clone(cache_dir=self.parser.disk_cache.directory)
+        self.assertIs(other.parse_file(self.path), formulas_parser.parser.parse('x > 1'))
+        self.assertNotEqual(other.disk_cache.key(other, b'x > 1'),
+                            self.parser.disk_cache.key(self.parser, b'x > 1'))
+
+    def test_errors_not_cached(self):
+        self.write('x := ;')
+        for _ in range(2):
+            with self.assertRaises(TypeError):
+                self.parser.parse_file(self.path)
+        self.assertEqual(self.parser.disk_cache.misses, 2)
+
+    def test_corrupt(self):
+        # a file the decoder fails on in any way is a miss
+        self.write('x := 1;')
+        cache = self.parser.disk_cache
+        key = cache.key(self.parser, b'x := 1;')
+        self.parser.parse_file(self.path)
+        with open(cache.path(key), 'rb') as f:
+            data = f.read()
+        # empty, truncated, a bad byte order (TypeError) and a bad string
+        # count (IndexError)
+        for broken in (b'', data[:len(data) // 2], data[:6] + b'\xff' + data[7:],
+                       data[:16] + b'\x00' + data[17:]):
+            with open(cache.path(key), 'wb') as f:
+                f.write(broken)
+            self.assertIs(self.parser.parse_file(self.path), hybrid_parser.parser.parse('x := 1;'))
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 5})
+
+    def test_limits(self):
+        # the cached tree was not parsed under the limits
+        self.write('x := 1; y := 2;')
+        self.parser.parse_file(self.path)
+        limited = self.parser.clone(cache_dir=self.parser.disk_cache.directory,
+                                    limits=limits.Limits(tokens=4))
+        with self.assertRaises(limits.TokenLimit):
+            limited.parse_file(self.path)
+        self.assertEqual(limited.disk_cache.hits, 0)
+
+    def test_symbols(self):
+        self.write('x := y;')
+        self.parser.parse_file(self.path)
+        nodes.clear()
+        parser = self.parser.clone(cache_dir=self.parser.disk_cache.directory, symbols=True)
+        tree = parser.parse_file(self.path)
+        self.assertEqual(parser.disk_cache.hits, 1)
+        self.assertIn(id(tree), symbols._table)
+        self.assertEqual(symbols.free_vars(tree), frozenset({'y'}))
+
+    def test_trace(self):
+        self.write('x := 1;')
+        events = []
+        for _ in range(2):
+            self.parser.parse_file(self.path, lambda event, value: events.append(event))
+        self.assertEqual(events, ['result', 'result'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+""" Test the newline delimited JSON parse service
+
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import dl_grammar
+import limits
+import nodes
+import server
+
+
+async def exchange(srv, requests):
+    # responses to requests sent at once over a Unix socket served by srv
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'socket')
+        serving = asyncio.ensure_future(srv.serve_unix(path))
+        while not os.path.exists(path):
+            await asyncio.sleep(0.01)
+        reader, writer = await asyncio.open_unix_connection(path)
+        for request in requests:
+            if not isinstance(request, str):
+                request = json.dumps(request)
+            writer.write(request.encode() + b'\n')
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in requests]
+        writer.close()
+        serving.cancel()
+        try:
+            await serving
+        except asyncio.CancelledError:
+            pass
+    return responses
+
+def run(requests, **options):
+    srv = server.Server(**options)
+    try:
+        return asyncio.run(exchange(srv, requests)), srv
+    finally:
+        srv.close()
+
+
+class TestServer(unittest.TestCase):
+    def test_kinds(self):
+        responses, srv = run([{'id': 1, 'kind': 'term', 'src': 'x + 1'},
+                              {'id': 'a', 'kind': 'formula', 'src': 'x > 0 & True'},
+                              {'kind': 'program', 'src': 'x := 1;', 'format': 'postfix'}],
+                             workers=0)
+        self.assertEqual(responses[0], {'id': 1, 'ok': True,
+                                        'tree': ['+', ['IDENTIFIER', 'x'], '1']})
+        self.assertEqual(responses[1]['tree'], ['&', ['>', ['IDENTIFIER', 'x'], '0'], True])
+        self.assertEqual(responses[2]['postfix']['ops'], ['STR', 'NUM', 'ASSIGN'])
+        self.assertEqual((srv.served, srv.errors), (3, 0))
+
+    def test_errors(self):
+        responses, srv = run(['not json', '[1]', {'kind': 'proof', 'src': 'x'},
+                              {'kind': 'term'}, {'id': 5, 'kind': 'term', 'src': 'x > 1'},
+                              {'kind': 'program', 'src': 'x := 1;' * 3000}], workers=0)
+        self.assertEqual([r['error']['type'] for r in responses],
+                         ['request'] * 4 + ['syntax', 'too_deep'])
+        self.assertEqual(responses[4]['id'], 5)
+        self.assertEqual((responses[4]['error']['offset'], responses[4]['error']['column']),
+                         (2, 3))
+        self.assertEqual(srv.errors, 6)
+
+    def test_limits(self):
+        responses, _ = run([{'kind': 'term', 'src': '(' * 50 + 'x' + ')' * 50},
+                            {'kind': 'program', 'src': 'x := 1;' * 100},
+                            {'kind': 'term', 'src': '(x)'}],
+                           workers=0, limits=limits.Limits(tokens=200, depth=20))
+        self.assertEqual([r['error']['limit'] for r in responses[:2]], ['depth', 'tokens'])
+        self.assertEqual(responses[0]['error']['type'], 'limit')
+        self.assertEqual(responses[1]['error']['column'], 351)
+        self.assertEqual(responses[2]['tree'], ['IDENTIFIER', 'x'])
+
+    def test_default_limits(self):
+        # a parse stops in its worker once its request timed out
+        srv = server.Server(workers=0, timeout=2.0)
+        self.assertEqual(srv.limits, limits.Limits(seconds=2.0))
+        srv.close()
+        srv = server.Server(workers=0, timeout=2.0, limits=limits.Limits(depth=20))
+        self.assertEqual(srv.limits, limits.Limits(depth=20, seconds=2.0))
+        srv.close()
+        srv = server.Server(workers=0, timeout=None)
+        self.assertIsNone(srv.limits)
+        srv.close()
+        fields = server._parse('program', 'x := 1;' * 100, 'tree', limits.Limits(seconds=0))
+        self.assertEqual(json.loads('{%s}' % fields)['error']['type'], 'timeout')
+
+    def test_scope(self):
+        # a worker keeps none of the nodes of the requests it parsed
+        size = nodes.size()
+        for i in range(20):
+            server._parse('program', 'x%d := y%d + 1;' % (i, i), 'tree')
+        self.assertEqual(nodes.size(), size)
+
+    def test_pipelining(self):
+        # more requests than the pipeline and the pool take at once, in order
+        requests = [{'id': i, 'kind': 'formula', 'src': 'x > %d' % i} for i in range(50)]
+        for workers in (0, 1):
+            responses, _ = run(requests, workers=workers, max_pending=2, pipeline=3)
+            self.assertEqual([r['id'] for r in responses], list(range(50)))
+            self.assertEqual(responses[7]['tree'], ['>', ['IDENTIFIER', 'x'], '7'])
+
+    def test_timeout(self):
+        slow = {'kind': 'program', 'src': 'x := 1;' * 20000, 'format': 'postfix'}
+        responses, srv = run([slow, {'kind': 'term', 'src': 'x'}], workers=0, timeout=0.01)
+        self.assertEqual(responses[0]['error']['type'], 'timeout')
+        self.assertGreaterEqual(srv.timeouts, 1)
+
+    def test_timeout_slot(self):
+        # a request that timed out keeps its slot until its parse is done
+        slow = {'kind': 'program', 'src': 'x := 1;' * 20000, 'format': 'postfix'}
+        srv = server.Server(workers=0, max_pending=1, timeout=0.01,
+                            limits=limits.Limits(seconds=60))
+
+        async def check():
+            responses = await exchange(srv, [slow])
+            held = srv._pending.locked()
+            while srv._pending.locked():
+                await asyncio.sleep(0.01)
+            return responses, held
+
+        try:
+            responses, held = asyncio.run(check())
+        finally:
+            srv.close()
+        self.assertEqual(responses[0]['error']['type'], 'timeout')
+        self.assertTrue(held)
+
+    def test_stdio(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        requests = ''.join(json.dumps({'id': i, 'kind': 'term', 'src': 'x + %d' % i}) + '\n'
+                           for i in range(3))
+        out = subprocess.run([sys.executable, '-m', 'server', '--stdio', '--workers', '0'],
+                             input=requests.encode(), stdout=subprocess.PIPE, cwd=root,
+                             timeout=60, check=True).stdout
+        responses = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual([r['tree'] for r in responses],
+                         [server.tree_json(dl_grammar.parse_term('x + %d' % i)) for i in range(3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+""" Test the constant folding and algebraic simplification
+
+"""
+
+import math
+import random
+import unittest
+
+from fractions import Fraction
+
+import dl_grammar
+import formulas_parser
+import generate
+import hybrid_parser
+import nodes
+import postfix
+import simplify
+import terms_parser
+
+
+def term(s):
+    return simplify.simplify(terms_parser.parser.parse(s))
+
+def formula(s):
+    return simplify.simplify(formulas_parser.parser.parse(s))
+
+
+class TestTerms(unittest.TestCase):
+    def test_folding(self):
+        self.assertIs(term('2*3 + 1/2'), nodes.BinOp('/', nodes.Num('13'), nodes.Num('2')))
+        self.assertIs(term('2^3^2'), nodes.Num('512'))
+        self.assertIs(term('4/2'), nodes.Num('2'))
+        self.assertIs(term('-(3)'), nodes.Num('-3'))
+        self.assertEqual(simplify.value(term('1/3 + 1/6')), Fraction(1, 2))
+
+    def test_unfoldable(self):
+        # irrational and huge powers are kept
+        self.assertIs(term('2^(1/2)'), terms_parser.parser.parse('2^(1/2)'))
+        self.assertIsInstance(term('9^99^99'), nodes.BinOp)
+
+    def test_zero_denominator(self):
+        # the grammars only reject the literal 0, a division by 0.0 is kept
+        for src in ('1/0.0 + x', '(1/0.0)^2', '-(1/0.0)'):
+            tree = dl_grammar.parse_term(src)
+            self.assertIs(simplify.simplify(tree), tree)
+        self.assertIsNone(simplify.value(dl_grammar.parse_term('1/0.0')))
+
+    def test_identities(self):
+        x = nodes.Var('x')
+        for s in ('x*1', '1*x', 'x+0', '0+x', 'x-0', 'x/1', 'x^1', 'x*1+0', '- -x', '(x)'):
+            self.assertIs(term(s), x, s)
+        self.assertIs(term('x*(2-1)'), x)
+
+    def test_negation(self):
+        x, y = nodes.Var('x'), nodes.Var('y')
+        self.assertIs(term('-x'), nodes.BinOp('*', x, nodes.Num('-1')))
+        self.assertIs(term('x + -y'), nodes.BinOp('-', x, y))
+        self.assertIs(term('x - -y'), nodes.BinOp('+', x, y))
+        self.assertIs(term('-(x*3)'), nodes.BinOp('*', x, nodes.Num('-3')))
+
+    def test_random(self):
+        rng = random.Random(0)
+        for s in generate.corpus(300, generate.term, depth=4, seed=5):
+            tree = terms_parser.parser.parse(s)
+            simple = simplify.simplify(tree)
+            self.assertLessEqual(len(postfix.encode(simple).ops), len(postfix.encode(tree).ops))
+            env = dict((name, rng.uniform(0.5, 1.5)) for name in generate.VARIABLES)
+            try:
+                expected = postfix.evaluate(postfix.encode(tree), env)
+            except (ArithmeticError, ValueError):
+                continue
+            result = postfix.evaluate(postfix.encode(simple), env)
+            if isinstance(expected, complex) or isinstance(result, complex):
+                continue
+            self.assertTrue(math.isclose(result, expected, rel_tol=1e-9), s)
+
+
+class TestFormulas(unittest.TestCase):
+    def test_constants(self):
+        self.assertIs(formula('1 > 0 & x > 1'), formulas_parser.parser.parse('x > 1'))
+        self.assertIs(formula('2 = 3 | x = 1*y'), formulas_parser.parser.parse('x = y'))
+        self.assertIs(formula('1 > 2 & x > 1'), False)
+        self.assertIs(formula('2 >= 1 | x > 1'), True)
+        self.assertIs(formula('!!(x > 0)'), formulas_parser.parser.parse('x > 0'))
+        self.assertIs(formula('!(1 = 1)'), False)
+
+    def test_program(self):
+        tree = hybrid_parser.parser.parse("x := x*1 + 2*3; {x' = v*1, v' = -(-a) & v >= 0+0}")
+        expected = hybrid_parser.parser.parse("x := x + 6; {x' = v, v' = a & v >= 0}")
+        self.assertIs(simplify.simplify(tree), expected)
+
+
+class TestMemo(unittest.TestCase):
+    def test_shared(self):
+        tree = terms_parser.parser.parse('(x*1 + 2*3) * (x*1 + 2*3)')
+        memo = {}
+        simple = simplify.simplify(tree, memo)
+        self.assertIs(simple.left, simple.right)
+        self.assertIs(memo[tree.left], simple.left)
+        # only the root of the second tree is new, its shared subtree is reused
+        count = len(memo)
+        other = terms_parser.parser.parse('y + (x*1 + 2*3)')
+        simplify.simplify(other, memo)
+        self.assertEqual(len(memo), count + 1)
+
+    def test_deep(self):
+        tree = nodes.Var('x')
+        for _ in range(5000):
+            tree = nodes.BinOp('+', tree, nodes.Num('0'))
+        self.assertIs(simplify.simplify(tree), nodes.Var('x'))
+
+    def test_not_a_node(self):
+        self.assertIs(simplify.simplify(True), True)
+
+
+if __name__ == '__main__':
+    unittest.main()
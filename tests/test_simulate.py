@@ -0,0 +1,75 @@
+""" Test the batched simulation of hybrid programs
+
+"""
+
+import unittest
+
+try:
+    import numpy as np
+    import simulate
+except ImportError:
+    np = None
+
+import hybrid_parser
+
+
+def simulator(src, **kw):
+    return simulate.Simulator(hybrid_parser.parser.parse(src), **kw)
+
+
+@unittest.skipIf(np is None, "needs numpy")
+class TestSimulate(unittest.TestCase):
+    def test_discrete(self):
+        runs = simulator("x := x + 1; y := 2*x; ?y > 4; x := 0;").run({'x': [0, 1, 2, 3]})
+        self.assertEqual(list(runs.alive), [False, False, True, True])
+        # dead runs keep the state they died in
+        self.assertEqual(list(runs.state['x']), [1, 2, 0, 0])
+        self.assertEqual(list(runs.state['y']), [2, 4, 6, 8])
+
+    def test_choice(self):
+        runs = simulator("{x := 1; ++ x := 2;}", seed=0).run({'x': 0}, n=10000)
+        self.assertTrue(runs.alive.all())
+        self.assertAlmostEqual((runs.state['x'] == 1).mean(), 0.5, delta=0.03)
+        again = simulator("{x := 1; ++ x := 2;}", seed=0).run({'x': 0}, n=10000)
+        self.assertTrue((again.state['x'] == runs.state['x']).all())
+
+    def test_loop(self):
+        runs = simulator("{x := x + 1;}*", seed=1, repeat=0.5).run({'x': 0}, n=20000)
+        # the number of iterations is geometric
+        self.assertAlmostEqual(runs.state['x'].mean(), 1.0, delta=0.05)
+        self.assertEqual(runs.state['x'].max() <= 100, True)
+        runs = simulator("{x := x + 1;}*", repeat=1, max_loops=7).run({'x': 0}, n=10)
+        self.assertEqual(list(runs.state['x']), [7] * 10)
+
+    def test_evolution(self):
+        # exponential growth against a clock, the domain bounds the duration
+        runs = simulator("{x' = x, t' = 1 & t <= 1}", seed=2, dt=0.01, horizon=5).run(
+            {'x': 1, 't': 0}, n=1000)
+        t = runs.state['t']
+        self.assertTrue((t <= 1).all())
+        self.assertGreater((t > 0.99).mean(), 0.7)
+        self.assertTrue(np.allclose(runs.state['x'], np.exp(t), rtol=1e-8))
+        # runs starting outside of the domain die
+        runs = simulator("{x' = 1, t' = 1 & t <= 1}").run({'x': 0, 't': [0, 2]})
+        self.assertEqual(list(runs.alive), [True, False])
+        self.assertEqual(runs.state['t'][1], 2)
+
+    def test_branches(self):
+        runs = simulator("{{x' = v, v' = -1 & v >= 0} ++ ?x > 100;} y := x;", seed=3,
+                         horizon=10).run({'x': 0, 'v': 2}, n=2000)
+        # the failed test only kills the runs of its branch
+        self.assertAlmostEqual(runs.alive.mean(), 0.5, delta=0.05)
+        x = runs.state['x'][runs.alive]
+        self.assertTrue((x <= 2 + 1e-9).all())
+        self.assertTrue((runs.state['y'][runs.alive] == x).all())
+        self.assertTrue(np.isnan(runs.state['y'][~runs.alive]).all())
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            simulator("a;").run({})
+        with self.assertRaises(KeyError):
+            simulator("{x' = 1, t' = 1 & t <= 1}").run({'t': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+""" Test the newline index of token streams and the spans of parsed trees
+
+"""
+
+import random
+import unittest
+
+import boolean_parser
+import generate
+import hybrid_parser
+import nodes
+import parser
+import postfix
+import terms_parser
+
+
+class TestSpans(unittest.TestCase):
+    def test_position(self):
+        stream = hybrid_parser.parser.lex("x := 1;\n\ny := 2;\n")
+        self.assertEqual(list(stream.lines), [7, 8, 16])
+        self.assertEqual(stream.position(0), (1, 1))
+        self.assertEqual(stream.position(7), (1, 8))
+        self.assertEqual(stream.position(9), (3, 1))
+        self.assertEqual([tok.lineno for tok in stream.lextokens()], [1] * 4 + [3] * 4)
+
+    def test_leaves(self):
+        rng = random.Random(0)
+        src = generate.model(rng, 50)
+        tree, spans = hybrid_parser.parser.parse_spans(src)
+        self.assertIs(tree, hybrid_parser.parser.parse(src))
+        self.assertEqual(len(spans), len(postfix.encode(tree)))
+        for item, start, end in spans.walk(tree):
+            # the span of a parenthesized item includes the parentheses
+            if isinstance(item, nodes.Var):
+                self.assertEqual(src[start:end].strip('()'), item.name)
+            elif isinstance(item, str) and item != '-1':
+                self.assertEqual(src[start:end].strip('()'), item)
+            self.assertLessEqual(start, end)
+
+    def test_nesting(self):
+        src = "y := -x + (2*x);\n{x := x + 1;}*"
+        tree, spans = hybrid_parser.parser.parse_spans(src)
+        found = dict((item, src[start:end]) for item, start, end in spans.walk(tree))
+        self.assertEqual(found[tree.first.term.right], '(2*x)')
+        self.assertEqual(found[tree.first.term], '-x + (2*x)')
+        self.assertEqual(found[tree.second], '{x := x + 1;}*')
+        self.assertEqual(found[tree], src)
+
+    def test_names(self):
+        # the interned statement of an earlier parse holds another 'xyz' string
+        hybrid_parser.parser.parse("xyz := 1; {abc' = xyz & abc >= 0}")
+        src = "y := 2;\nxyz := 1; {abc' = xyz & abc >= 0}"
+        tree, spans = hybrid_parser.parser.parse_spans(src)
+        found = [(item, src[start:end]) for item, start, end in spans.walk(tree)]
+        self.assertIn(('xyz', 'xyz'), found)
+        self.assertIn(('abc', 'abc'), found)
+        self.assertIn((tree.second.first, 'xyz := 1;'), found)
+        for item, text in found:
+            if type(item) is str:
+                self.assertEqual(text, item)
+
+    def test_empty(self):
+        for p in (terms_parser.parser, boolean_parser.parser):
+            tree, spans = p.parse_spans('')
+            self.assertIs(tree, p.parse(''))
+            self.assertEqual(list(spans.walk(tree)), [(tree, 0, 0)])
+
+    def test_errors(self):
+        for p, src, column in ((hybrid_parser.parser, "x := 1;\n  y := ;", 8),
+                               (parser.parser.clone(engine='pratt'), "x > 0 &\n  & y", 3)):
+            for parse in (p.parse, p.parse_spans, lambda s: p.parse(p.lex(s))):
+                with self.assertRaises(TypeError) as cm:
+                    parse(src)
+                self.assertEqual((cm.exception.line, cm.exception.column), (2, column))
+        with self.assertRaises(TypeError) as cm:
+            parser.parser.parse("x > 0 &")
+        self.assertIsNone(cm.exception.offset)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+""" Test the free, bound and assigned variables of parsed trees
+
+"""
+
+import random
+import unittest
+
+import dl_grammar
+import generate
+import hybrid_parser
+import nodes
+import symbols
+
+
+def program(s):
+    return dl_grammar.parse_program(s)
+
+def formula(s):
+    return dl_grammar.parse_formula(s)
+
+
+class TestSymbols(unittest.TestCase):
+    def test_programs(self):
+        cases = [
+            ('x := x + 1; y := x;', {'x'}, {'x', 'y'}),
+            ('x := 1; ?x > y;', {'y'}, {'x'}),
+            ("{x' = v, v' = -a & x >= 0}", {'x', 'v', 'a'}, {'x', "x'", 'v', "v'"}),
+            ('{x := y;}* ?x > 0;', {'x', 'y'}, {'x'}),
+            ('if (z > 0) {x := 1;} else {x := 2;} ?x > w;', {'z', 'w'}, {'x'}),
+            ('if (z > 0) {x := 1;} ?x > w;', {'z', 'x', 'w'}, {'x'}),
+            ('{x := 1; ++ y := 1;} ?x + y > 0;', {'x', 'y'}, {'x', 'y'}),
+            ("v' := 3;", set(), {"v'"}),
+        ]
+        for s, free, assigned in cases:
+            tree = program(s)
+            self.assertEqual(symbols.free_vars(tree), free, s)
+            self.assertEqual(symbols.assigned_vars(tree), assigned, s)
+
+    def test_formulas(self):
+        cases = [
+            ('\\forall x x > y & [x := 1;]x > z', {'y', 'z'}, {'x'}),
+            ('\\exists (x, y) x + y > w', {'w'}, {'x', 'y'}),
+            ("(x + y)' = f()", {'x', "x'", 'y', "y'"}, set()),
+            ('[x := x + 1;]x > 0', {'x'}, set()),
+            ('<{x := 1;}*>x > 0 | True', {'x'}, set()),
+        ]
+        for s, free, bound in cases:
+            tree = formula(s)
+            self.assertEqual(symbols.free_vars(tree), free, s)
+            self.assertEqual(symbols.bound_vars(tree), bound, s)
+        self.assertEqual(symbols.symbols(True), symbols.NONE)
+        self.assertEqual(symbols.symbols(nodes.Num('1')), symbols.NONE)
+
+    def test_parse(self):
+        # a parser with symbols stores them for every node as it reduces
+        parser = hybrid_parser.parser.clone(symbols=True)
+        tree = parser.parse('x := y; ?x > z;')
+        for node in (tree, tree.first, tree.second, tree.first.term):
+            self.assertIn(id(node), symbols._table)
+        self.assertEqual(symbols.free_vars(tree), {'y', 'z'})
+        self.assertTrue(parser.clone().symbols)
+
+    def test_same_as_computed(self):
+        parser = hybrid_parser.parser.clone(symbols=True)
+        for i in range(5):
+            src = generate.model(random.Random(i), 30)
+            nodes.clear()
+            stored = symbols.symbols(parser.parse(src))
+            nodes.clear()
+            self.assertEqual(symbols.symbols(hybrid_parser.parser.parse(src)), stored)
+
+    def test_shared_sets(self):
+        tree = program('x := x + 1; x := x * 2; x := x - 1;')
+        seq = tree.second
+        self.assertIs(symbols.free_vars(seq), symbols.free_vars(seq.first))
+        self.assertIs(symbols.assigned_vars(tree), symbols.assigned_vars(tree.first))
+
+    def test_deep(self):
+        tree = hybrid_parser.parser.parse('x := y;' * 20000 + '?x > z;')
+        self.assertEqual(symbols.free_vars(tree), {'y', 'z'})
+
+    def test_clear(self):
+        symbols.free_vars(program('x := y;'))
+        nodes.clear()
+        self.assertEqual(symbols._table, {})
+
+    def test_scope(self):
+        parser = hybrid_parser.parser.clone(symbols=True)
+        kept = parser.parse('x := y;')
+        size = len(symbols._table)
+        with nodes.scope():
+            tree = parser.parse('x := y; z := x + w;')
+            self.assertEqual(symbols.free_vars(tree), {'y', 'w'})
+        self.assertEqual(len(symbols._table), size)
+        self.assertEqual(symbols.free_vars(kept), {'y'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+""" Test the precompiled parser tables
+
+"""
+
+import importlib
+import types
+import unittest
+
+import _tables
+import tables
+
+import parser
+
+
+class TestTables(unittest.TestCase):
+    def _copy(self, module):
+        # a stand-in module with the same grammar, to be modified by the test
+        copy = types.ModuleType(module.__name__)
+        copy.__dict__.update(vars(module))
+        return copy
+
+    def test_up_to_date(self):
+        # fails when a grammar was changed without running 'python -m tables'
+        self.assertEqual(_tables.TABLES_VERSION, tables.TABLES_VERSION)
+        for name in tables.GRAMMARS:
+            module = importlib.import_module(name)
+            self.assertEqual(_tables.GRAMMARS[name],
+                             (tables.lex_hash(module), tables.yacc_hash(module)), name)
+
+    def test_load(self):
+        lexer = tables.lexer(parser, 'parser')
+        lexer.input('x <= 1')
+        self.assertEqual([tok.type for tok in lexer], ['ID', 'LEQ', 'NUM'])
+
+        result = tables.parser(parser, 'parser').parse('x <= 1', lexer=lexer)
+        self.assertEqual(result, ('<=', ('IDENTIFIER', 'x'), '1'))
+
+    def test_grammar_changed(self):
+        module = self._copy(parser)
+        module.precedence = module.precedence[:-1]
+        with self.assertRaises(tables.TableError):
+            tables.parser(module, 'parser')
+
+    def test_lexer_changed(self):
+        module = self._copy(parser)
+        module.t_NUM = r'[0-9]+\.?[0-9]*'
+        with self.assertRaises(tables.TableError):
+            tables.lexer(module, 'parser')
+
+    def test_missing(self):
+        with self.assertRaises(tables.TableError):
+            tables.parser(parser, 'no_such_grammar')
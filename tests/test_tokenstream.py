@@ -0,0 +1,62 @@
+""" Test the compact token streams against the PLY lexers
+
+"""
+
+import random
+import unittest
+
+import formulas_parser
+import hybrid_parser
+import parser
+import terms_parser
+import tokenstream
+
+CHARS = "xy1 0.5\t\n+-*/^()[]{}<>=!&|,;:?'\\# TrueFalse if true"
+
+
+def ply_tokens(lexer, s):
+    lexer.input(s)
+    return [(tok.type, tok.value, tok.lexpos) for tok in lexer]
+
+
+class TestTokenStream(unittest.TestCase):
+    def test_random(self):
+        rng = random.Random(0)
+        for module in (parser, terms_parser, formulas_parser, hybrid_parser):
+            lexer = module.parser.lexer.clone()
+            for _ in range(1000):
+                s = ''.join(rng.choice(CHARS) for _ in range(rng.randint(0, 30)))
+                stream = tokenstream.lex(lexer, s)
+                self.assertEqual(list(zip(stream.types(), stream.values(), stream.starts)),
+                                 ply_tokens(lexer, s), s)
+
+    def test_bytes(self):
+        s = "x := 1;\n{x' = -x & x >= 0}\n?true;"
+        stream = hybrid_parser.parser.lex(s)
+        for source in (s.encode(), memoryview(s.encode())):
+            other = hybrid_parser.parser.lex(source)
+            self.assertEqual(other.types(), stream.types())
+            self.assertEqual(other.values(), stream.values())
+        self.assertEqual([tok.lineno for tok in stream.lextokens()][-3:], [3, 3, 3])
+        self.assertEqual(len(stream.codes.tobytes()) + len(stream.starts.tobytes()) +
+                         len(stream.ends.tobytes()), 9 * len(stream))
+
+    def test_illegal(self):
+        events = []
+        stream = parser.parser.lex("x # 1 > 0", trace=lambda event, value: events.append(value))
+        self.assertEqual(events, ['#'])
+        self.assertEqual(stream.types(), ['ID', 'NUM', 'GREATER', 'NUM'])
+
+    def test_parse(self):
+        for module, s in ((parser, "x + 1 >= 0 & true"), (terms_parser, "f(x')"),
+                          (hybrid_parser, "x := 1; {x' = -x & x >= 0}")):
+            stream = module.parser.lex(s)
+            self.assertIs(module.parser.parse(stream), module.parser.parse(s))
+        fast = parser.parser.clone(engine='pratt')
+        self.assertIs(fast.parse(parser.parser.lex("x > 0")), parser.parser.parse("x > 0"))
+        with self.assertRaises(ValueError):
+            hybrid_parser.parser.parse(parser.parser.lex("x > 0"))
+
+
+if __name__ == '__main__':
+    unittest.main()
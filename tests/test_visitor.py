@@ -0,0 +1,138 @@
+""" Test the iterative visitors and transformers
+
+"""
+
+import unittest
+
+import dl_grammar
+import hybrid_parser
+import nodes
+import terms_parser
+import visitor
+
+# every node kind of the grammars
+MODEL = ("{x' = v, v' = -1 & x >= 0} ++ if (x > 1) {?x > 2;} else {v := -v;} "
+         "{x := (x, 1); v' := 1;}* ?[x := 1;]x > 0 & <v := 2;>True -> "
+         "\\forall y y > 0 | !(x != 1) <-> (x + y)' = f();")
+
+
+class Recorder(visitor.Visitor):
+    def __init__(self):
+        self.events = []
+
+    def enter(self, node):
+        self.events.append(('enter', node))
+
+    def leave(self, node):
+        self.events.append(('leave', node))
+
+
+class Kinds(visitor.Visitor):
+    def __init__(self):
+        self.kinds = set()
+        self.vars = []
+
+    def enter(self, node):
+        self.kinds.add(type(node).__name__)
+
+    def enter_Var(self, node):
+        self.kinds.add('Var')
+        self.vars.append(node.name)
+
+
+class TestVisitor(unittest.TestCase):
+    def test_order(self):
+        tree = terms_parser.parser.parse('x + 1')
+        x, one = tree.left, tree.right
+        self.assertEqual(Recorder().visit(tree).events,
+                         [('enter', tree), ('enter', x), ('leave', x), ('enter', one),
+                          ('leave', one), ('leave', tree)])
+
+    def test_kinds(self):
+        tree = dl_grammar.parse_program(MODEL)
+        kinds = Kinds().visit(tree).kinds
+        self.assertEqual(kinds, {'Assign', 'BinOp', 'Box', 'Choice', 'Compare', 'Diamond',
+                                 'DiffAssign', 'DiffEq', 'Differential', 'Func', 'If', 'Iff',
+                                 'Imply', 'Logic', 'Loop', 'Not', 'Num', 'ODE', 'Pair',
+                                 'Quantifier', 'Seq', 'Test', 'Var', 'bool'})
+        tree, _ = hybrid_parser.parser.parse_recover('x := ;')
+        self.assertEqual(Kinds().visit(tree).kinds, {'Error'})
+
+    def test_shared(self):
+        tree = terms_parser.parser.parse('(x + y) * (x + y)')
+        self.assertEqual(Kinds().visit(tree).vars, ['x', 'y'])
+        every = Kinds()
+        every.unique = False
+        self.assertEqual(every.visit(tree).vars, ['x', 'y', 'x', 'y'])
+
+    def test_skip(self):
+        class Outer(Recorder):
+            def enter_Box(self, node):
+                self.events.append(('enter', node))
+                return False
+
+        tree = dl_grammar.parse_formula('[x := 1;]x > 0 & y > 0')
+        events = Outer().visit(tree).events
+        self.assertIn(('leave', tree.left), events)
+        self.assertNotIn(('enter', tree.left.program), events)
+        self.assertIn(('enter', tree.right.left), events)
+
+    def test_deep(self):
+        tree = hybrid_parser.parser.parse('x := 1; y := x;' * 50000)
+        self.assertEqual(len(Recorder().visit(tree).events), 2 * (2 * 50000 - 1 + 4))
+        every = Kinds()
+        every.unique = False
+        self.assertEqual(len(every.visit(tree).vars), 50000)
+
+
+class Rename(visitor.Transformer):
+    def __init__(self, memo=None):
+        visitor.Transformer.__init__(self, memo)
+        self.calls = 0
+
+    def leave_Var(self, node, children):
+        self.calls += 1
+        return nodes.Var(node.name.upper())
+
+
+class TestTransformer(unittest.TestCase):
+    def test_identity(self):
+        tree = dl_grammar.parse_program(MODEL)
+        self.assertIs(visitor.Transformer().transform(tree), tree)
+
+    def test_rebuild(self):
+        tree = dl_grammar.parse_formula("\\forall x x' + 1 > y & !True")
+        self.assertIs(Rename().transform(tree),
+                      dl_grammar.parse_formula("\\forall X X' + 1 > Y & !True"))
+
+    def test_enter(self):
+        class Cut(visitor.Transformer):
+            def enter_Loop(self, node):
+                return nodes.Test(True)
+
+            def leave_bool(self, node, children):
+                return not node
+
+        tree = dl_grammar.parse_program('{x := 1;}* ?True;')
+        self.assertIs(Cut().transform(tree),
+                      nodes.Seq(nodes.Test(True), nodes.Test(False)))
+
+    def test_memo(self):
+        # a shared subtree is transformed once, also across transforms
+        # sharing the memo
+        memo = {}
+        rename = Rename(memo)
+        tree = rename.transform(terms_parser.parser.parse('(x + y) * (x + y) - x'))
+        self.assertIs(tree, terms_parser.parser.parse('(X + Y) * (X + Y) - X'))
+        self.assertEqual(rename.calls, 2)
+        again = Rename(memo)
+        again.transform(terms_parser.parser.parse('x + y'))
+        self.assertEqual(again.calls, 0)
+
+    def test_deep(self):
+        tree = hybrid_parser.parser.parse('x := y;' * 100000)
+        self.assertIs(Rename().transform(tree), hybrid_parser.parser.parse('x := Y;' * 100000))
+
+
+if __name__ == '__main__':
+    unittest.main()
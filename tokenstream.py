@@ -0,0 +1,190 @@
+# Compact token streams
+#
+# lex() tokenizes a whole buffer in one pass with the rules of a grammar's PLY
+# lexer, but instead of a LexToken per token it fills three parallel arrays:
+# the type code of every token and its start and end offset in the buffer.
+# The text of a token is only sliced out of the buffer when it is asked for,
+# e.g. by a grammar action, so a stream takes 9 bytes per token.
+#
+# The buffer is a str or any bytes-like object (bytes, mmap, memoryview); for
+# bytes the offsets are byte offsets and values are decoded as UTF-8. Rules
+# that are functions (t_ID with reserved words, t_newline) are still called,
+# with a scratch token, and may change the type of a token or drop it, but
+# not its value.
+#
+# lex() also records the offset of every newline of the buffer, so the line
+# and column of an offset are found with a binary search.
+import re
+from array import array
+from bisect import bisect_left
+
+import ply.lex
+
+
+class TokenStream(object):
+    """ Tokens of source, see the module comment
+
+    - names maps type codes to token types
+    - codes, starts and ends are the type code, start and end offset of every
+      token
+    - lines are the offsets of the newlines of source
+    """
+    __slots__ = ('source', 'names', 'codes', 'starts', 'ends', 'lines')
+
+    def __init__(self, source, names):
+        self.source = source
+        self.names = names
+        self.codes = array('B')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.lines = array('I')
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __repr__(self):
+        return '<TokenStream of %d tokens>' % len(self.codes)
+
+    def type(self, i):
+        return self.names[self.codes[i]]
+
+    def types(self):
+        """ List of the token types """
+        names = self.names
+        return [names[code] for code in self.codes]
+
+    def value(self, i):
+        """ Text of token i """
+        text = self.source[self.starts[i]:self.ends[i]]
+        return text if isinstance(text, str) else bytes(text).decode('utf-8')
+
+    def values(self):
+        return [self.value(i) for i in range(len(self.codes))]
+
+    def slice(self, start, stop):
+        """ Stream of tokens start to stop, sharing the source """
+        other = TokenStream(self.source, self.names)
+        other.codes = self.codes[start:stop]
+        other.starts = self.starts[start:stop]
+        other.ends = self.ends[start:stop]
+        other.lines = self.lines
+        return other
+
+    def position(self, offset):
+        """ (line, column) of offset in the source, both counted from 1 """
+        line = bisect_left(self.lines, offset)
+        return line + 1, offset - (self.lines[line - 1] if line else -1)
+
+    def lextokens(self):
+        """ LexTokens of the stream, created one at a time for yacc """
+        names, lines = self.names, self.lines
+        for i, code in enumerate(self.codes):
+            tok = ply.lex.LexToken()
+            tok.type = names[code]
+            tok.value = self.value(i)
+            tok.lexpos = self.starts[i]
+            tok.lexend = self.ends[i]
+            tok.lineno = bisect_left(lines, tok.lexpos) + 1
+            yield tok
+
+
+_NEWLINE = re.compile('\n')
+_BYTES_NEWLINE = re.compile(b'\n')
+
+# master regex and its groups by lexer rules and buffer type
+_masters = {}
+
+def _master(lexer, binary):
+    # PLY splits the rules into several regexes tried in order, joined into
+    # one alternation they match the same. The groups are (function, code) by
+    # group index, code is None for ignored rules.
+    key = (tuple(regex.pattern for regex, _ in lexer.lexre), binary)
+    master = _masters.get(key)
+    if master is None:
+        names = tuple(sorted(lexer.lextokens))
+        codes = dict((name, code) for code, name in enumerate(names))
+        groups = [None]
+        for _, rules in lexer.lexre:
+            groups.extend(None if rule is None else (rule[0], codes.get(rule[1]))
+                          for rule in rules[1:])
+        pattern = '|'.join(key[0])
+        flags = lexer.lexre[0][0].flags
+        if binary:
+            pattern, flags = pattern.encode('utf-8'), flags & ~re.UNICODE
+        master = _masters[key] = (re.compile(pattern, flags), groups, names, codes)
+    return master
+
+def names(lexer):
+    """ Token types of the type codes of streams of lexer """
+    return _master(lexer, False)[2]
+
+def lex(lexer, source):
+    """ TokenStream of source with the rules of lexer
+
+    lexer is a PLY lexer of the grammar, its t_error rule is called for
+    illegal characters like when lexing with PLY.
+    """
+    binary = not isinstance(source, str)
+    regex, groups, names, codes = _master(lexer, binary)
+    stream = TokenStream(source, names)
+    newline = _BYTES_NEWLINE if binary else _NEWLINE
+    stream.lines = array('I', [m.start() for m in newline.finditer(source)])
+    ignore = lexer.lexignore
+    if binary:
+        ignore = set(ignore.encode('utf-8'))
+    append_code, append_start, append_end = \
+        stream.codes.append, stream.starts.append, stream.ends.append
+    scratch = None
+    pos, end = 0, len(source)
+
+    while pos < end:
+        for m in regex.finditer(source, pos):
+            start = m.start()
+            if start != pos:
+                # skip ignored characters before the match, otherwise restart
+                # after the error rule handled an illegal character
+                while pos < start and source[pos] in ignore:
+                    pos += 1
+                if pos < start:
+                    pos = _illegal(lexer, source, pos, binary)
+                    break
+            pos = m.end()
+            func, code = groups[m.lastindex]
+            if func is not None:
+                if scratch is None:
+                    scratch = ply.lex.LexToken()
+                lexer.lexdata, lexer.lexpos, lexer.lexmatch = source, pos, m
+                scratch.type, scratch.lineno, scratch.lexpos, scratch.lexer = \
+                    None, lexer.lineno, start, lexer
+                scratch.value = m.group()
+                if binary:
+                    scratch.value = scratch.value.decode('utf-8')
+                tok = func(scratch)
+                if tok is None:
+                    continue
+                code = codes[tok.type]
+            elif code is None:
+                continue
+            append_code(code)
+            append_start(start)
+            append_end(pos)
+        else:
+            # no more matches, the rest is ignored or illegal
+            while pos < end and source[pos] in ignore:
+                pos += 1
+            if pos < end:
+                pos = _illegal(lexer, source, pos, binary)
+    return stream
+
+def _illegal(lexer, source, pos, binary):
+    # call the error rule like PLY does, it moves lexer.lexpos past the character
+    lexer.lexdata, lexer.lexpos = source, pos
+    tok = ply.lex.LexToken()
+    tok.type, tok.lineno, tok.lexpos, tok.lexer = 'error', lexer.lineno, pos, lexer
+    tok.value = source[pos:pos + 80]
+    if binary:
+        tok.value = bytes(tok.value).decode('utf-8', 'replace')
+    lexer.lexerrorf(tok)
+    if lexer.lexpos == pos:
+        raise ply.lex.LexError("scanning error, illegal character at %d" % pos, tok.value)
+    return lexer.lexpos
@@ -0,0 +1,193 @@
+# Visitors and transformers of parsed trees, without recursion
+#
+#     class Variables(visitor.Visitor):
+#         def __init__(self):
+#             self.names = set()
+#
+#         def enter_Var(self, node):
+#             self.names.add(node.name)
+#
+#     names = Variables().visit(tree).names
+#
+#     class Swap(visitor.Transformer):
+#         def leave_Logic(self, node, children):
+#             return nodes.Logic(node.op, children[1], children[0])
+#
+#     tree = Swap().transform(tree)
+#
+# The hooks of a node are looked up by the name of its class: enter_Box is
+# called before the children of a Box and leave_Box after them. A class
+# without its own hooks gets the generic enter and leave. Every nodes.Node
+# class is visited, and so are the literals of a tree: Num and the True and
+# False of formulas (enter_bool). Names, operators, EMPTY and the None of an
+# If without else are not, their parents hold them.
+#
+# Walks keep an explicit stack, so deep trees (a long ; sequence, a chain of
+# &) do not hit the recursion limit, and the hooks are resolved once per
+# class instead of per node. Nodes are interned, so a tree is a DAG (see
+# dag): a Visitor with unique set enters every distinct subtree only once,
+# and a Transformer transforms a shared subtree once, keeping its result in
+# the memo.
+from operator import is_
+
+import nodes
+
+# marks the end of the children of a node on the stack of a walk
+_EXIT = object()
+
+
+# the items of a tree a walk visits, with bool
+_ITEMS = (nodes.Node, nodes.Num)
+
+
+def _is_item(value):
+    return isinstance(value, _ITEMS) or type(value) is bool
+
+def rebuild(node, children):
+    """ node with its children replaced by the list children, node itself
+    when they are the same """
+    old = node.children
+    if len(old) == len(children) and all(map(is_, old, children)):
+        return node
+    cls = type(node)
+    if cls.tag is None and cls.fields[0] == 'op':
+        return cls(node[0], *children)
+    return cls(*children)
+
+
+class Visitor(object):
+    """ Walk calling enter_<class> before and leave_<class> after the
+    children of every node of a tree, see the module comment
+
+    An enter hook returning False skips the children of its node, the leave
+    hook is still called. With unique set, the default, a shared subtree is
+    walked once; clear it to walk every occurrence.
+    """
+
+    unique = True
+
+    def enter(self, node):
+        pass
+
+    def leave(self, node):
+        pass
+
+    def visit(self, tree):
+        """ Walk tree and return the visitor """
+        hooks = _hooks(type(self), Visitor)
+        seen = set()
+        unique = self.unique
+        stack = [tree] if _is_item(tree) else []
+        push, pop = stack.append, stack.pop
+        while stack:
+            node = pop()
+            if node is _EXIT:
+                node = pop()
+                leave = hooks[type(node)][1]
+                if leave is not None:
+                    leave(self, node)
+                continue
+            if unique:
+                if id(node) in seen:
+                    continue
+                seen.add(id(node))
+            enter, leave = hooks[type(node)]
+            if enter is not None and enter(self, node) is False or \
+                    not isinstance(node, nodes.Node) or type(node) is nodes.Var:
+                if leave is not None:
+                    leave(self, node)
+                continue
+            if leave is not None:
+                push(node)
+                push(_EXIT)
+            for child in reversed(node.children):
+                if isinstance(child, _ITEMS) or type(child) is bool:
+                    push(child)
+        return self
+
+class Transformer(object):
+    """ Bottom-up rewrite of a tree, see the module comment
+
+    leave_<class>(node, children) returns what replaces node, given the
+    list of the results of its children; the generic leave rebuilds node
+    from them. An enter_<class>(node) hook returning anything but None
+    replaces node without transforming its children.
+
+    memo holds the result of every distinct node transformed so far, as
+    (node, result) by id(node), pass the same dict to transformers that
+    should share it. Nodes are kept by their entries, so the id of a node in
+    the memo is not reused, even after nodes.clear().
+    """
+
+    def __init__(self, memo=None):
+        self.memo = {} if memo is None else memo
+
+    def enter(self, node):
+        return None
+
+    def leave(self, node, children):
+        return rebuild(node, children) if isinstance(node, nodes.Node) else node
+
+    def transform(self, tree):
+        """ Result of tree """
+        hooks = _hooks(type(self), Transformer)
+        memo = self.memo
+        stack = [tree] if _is_item(tree) else []
+        push, pop = stack.append, stack.pop
+        while stack:
+            node = pop()
+            if node is _EXIT:
+                node = pop()
+                children = [memo[id(child)][1] if id(child) in memo else child
+                            for child in node.children]
+                leave = hooks[type(node)][1]
+                memo[id(node)] = (node, rebuild(node, children) if leave is None
+                                  else leave(self, node, children))
+                continue
+            if id(node) in memo:
+                continue
+            enter, leave = hooks[type(node)]
+            if enter is not None:
+                result = enter(self, node)
+                if result is not None:
+                    memo[id(node)] = (node, result)
+                    continue
+            if isinstance(node, nodes.Node) and type(node) is not nodes.Var:
+                push(node)
+                push(_EXIT)
+                for child in reversed(node.children):
+                    if (isinstance(child, _ITEMS) or type(child) is bool) and id(child) not in memo:
+                        push(child)
+            elif leave is None:
+                memo[id(node)] = (node, node)
+            else:
+                children = list(node.children) if isinstance(node, nodes.Node) else []
+                memo[id(node)] = (node, leave(self, node, children))
+        return memo[id(tree)][1] if id(tree) in memo else tree
+
+class _Hooks(dict):
+    # (enter, leave) functions by node class, None where the visitor class
+    # only has the base class hook, which does nothing
+    def __init__(self, cls, base):
+        self.cls = cls
+        self.base = base
+
+    def __missing__(self, node_class):
+        name = 'bool' if node_class is bool else node_class.__name__
+        hooks = []
+        for kind in ('enter', 'leave'):
+            hook = getattr(self.cls, kind + '_' + name, None)
+            if hook is None and getattr(self.cls, kind) is not getattr(self.base, kind):
+                hook = getattr(self.cls, kind)
+            hooks.append(hook)
+        self[node_class] = hooks = tuple(hooks)
+        return hooks
+
+_hooks_cache = {}
+
+def _hooks(cls, base):
+    # the hooks of a visitor class, resolved once per class of node
+    hooks = _hooks_cache.get(cls)
+    if hooks is None:
+        hooks = _hooks_cache[cls] = _Hooks(cls, base)
+    return hooks